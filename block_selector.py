@@ -7,23 +7,146 @@
 2. select_line_by_index(para, line_index) - 문단 내 n번째 줄 선택
 3. select_line_by_pos(para, pos) - 문단 내 pos가 속한 줄 선택
 4. select_lines_range(para, start, end) - n번째~m번째 줄 선택 (없으면 마지막까지)
-5. select_sentence(para, sentence_index) - 문단 내 n번째 문장 선택
+5. select_sentence(para, sentence_index) - 문단 내 n번째 문장 선택 (sentence_segmenter 규칙)
 6. select_sentences_range(para, start, end) - n번째~m번째 문장 선택 (없으면 마지막까지)
 7. select_sentence_in_line(para, pos) - pos가 속한 줄 내 문장만 선택 (줄 넘김 X)
+
+문단 형상 캐시:
+- 줄 시작 pos, 문단 끝, 문자→pos 매핑, 문장 경계, 범위 텍스트를 (list_id, para_id)별로 저장
+- 문단을 편집한 쪽(자간 변경 등)에서 invalidate(para_id)로 해당 문단만 무효화
+- verify=True면 조회 때마다 문단 끝 pos + 텍스트 해시를 비교해 바깥 편집도 감지
+- 문자→pos 매핑은 텍스트에서 계산 후 샘플 확인, 맞지 않을 때만 문자마다 이동
 """
 
-import win32com.client as win32
+import zlib
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from sentence_segmenter import iter_sentence_spans
+
+
+@dataclass
+class ParaGeometry:
+    """문단 형상 캐시 항목 (None이면 아직 측정 전)"""
+    list_id: int
+    para_id: int
+    stamp: Optional[Tuple[int, int]] = None          # (문단 끝 pos, 텍스트 해시) - verify 모드에서만
+    line_starts: Optional[List[int]] = None
+    para_end: Optional[int] = None
+    pos_map: Optional[Tuple[list, str, int]] = None   # _get_pos_map 반환값
+    sentences: Optional[Tuple[list, str]] = None      # _get_sentences 반환값
+    texts: Dict[Tuple[int, int], str] = field(default_factory=dict)   # (시작, 끝) -> GetTextFile 원문
+
+
+def _pos_width(ch):
+    """글자 하나가 차지하는 HWP pos 수 (UTF-16 단위: 서로게이트 쌍 문자는 2)"""
+    return 2 if ord(ch) > 0xFFFF else 1
+
+
+def _text_pos_map(para_text, start=0):
+    """
+    내보낸 문단 텍스트로 각 문자의 HWP pos 계산
+
+    텍스트에 보이는 문자는 UTF-16 단위 수만큼 pos를 차지한다고 보고 누적합니다.
+    NUL 등 텍스트 내보내기에 나오지 않는 컨트롤 문자가 있으면 계산할 수 없으므로 None을 반환합니다.
+    """
+    pos_list = []
+    pos = start
+    for ch in para_text:
+        if ord(ch) < 0x20 and ch != '\t':
+            return None
+        pos_list.append(pos)
+        pos += _pos_width(ch)
+    return pos_list
 
 
 class BlockSelector:
     """한글 블록 선택 클래스"""
 
-    def __init__(self, hwp):
+    def __init__(self, hwp, cache: bool = True, verify: bool = False):
         """
         Args:
             hwp: 한글 인스턴스
+            cache: 문단 형상 캐시 사용 여부
+            verify: 캐시 조회 때마다 문단 텍스트 해시로 바깥 편집 확인 (조회당 COM 호출 몇 번 추가)
         """
         self.hwp = hwp
+        self.use_cache = cache
+        self.verify = verify
+        self._geometry: Dict[Tuple[int, int], ParaGeometry] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.pos_map_walks = 0     # 텍스트 계산이 맞지 않아 문자마다 이동한 횟수
+
+    # ------------------------------------------------------------------
+    # 문단 형상 캐시
+    # ------------------------------------------------------------------
+
+    def _para_stamp(self, list_id, para_id):
+        """(문단 끝 pos, 텍스트 해시) - 커서 위치는 호출자가 복원"""
+        self.hwp.SetPos(list_id, para_id, 0)
+        self.hwp.HAction.Run("MoveParaEnd")
+        para_end = self.hwp.GetPos()[2]
+        self.hwp.SelectText(para_id, 0, para_id, para_end)
+        text = self.hwp.GetTextFile("TEXT", "saveblock") or ""
+        self.hwp.HAction.Run("Cancel")
+        return para_end, zlib.crc32(text.encode('utf-8'))
+
+    def _entry(self, para_id) -> Optional[ParaGeometry]:
+        """현재 리스트의 문단 캐시 항목 (캐시 미사용이면 None)"""
+        if not self.use_cache:
+            return None
+        saved = self._save_pos()
+        key = (saved[0], para_id)
+        entry = self._geometry.get(key)
+
+        if self.verify:
+            stamp = self._para_stamp(saved[0], para_id)
+            self._restore_pos(saved)
+            if entry is not None and entry.stamp != stamp:
+                entry = None
+            if entry is None:
+                entry = ParaGeometry(saved[0], para_id, stamp=stamp)
+                self._geometry[key] = entry
+        elif entry is None:
+            entry = ParaGeometry(saved[0], para_id)
+            self._geometry[key] = entry
+        return entry
+
+    def invalidate(self, para_id=None, list_id=None):
+        """
+        문단 형상 캐시 무효화
+
+        Args:
+            para_id: 편집한 문단 (None이면 리스트 전체)
+            list_id: 리스트 ID (None이면 현재 리스트, para_id도 None이면 모든 리스트)
+        """
+        if para_id is None and list_id is None:
+            self._geometry.clear()
+            return
+        if list_id is None:
+            list_id = self._save_pos()[0]
+        if para_id is None:
+            for key in [k for k in self._geometry if k[0] == list_id]:
+                del self._geometry[key]
+        else:
+            self._geometry.pop((list_id, para_id), None)
+
+    def get_cached_text(self, para_id, start, end):
+        """캐시된 범위 텍스트 (GetTextFile 원문, 없으면 None)"""
+        entry = self._entry(para_id)
+        if entry is None:
+            return None
+        text = entry.texts.get((start, end))
+        if text is not None:
+            self.cache_hits += 1
+        return text
+
+    def cache_text(self, para_id, start, end, text):
+        """범위 텍스트 저장 (get_cached_text로 조회)"""
+        entry = self._entry(para_id)
+        if entry is not None and text is not None:
+            entry.texts[(start, end)] = text
 
     def _save_pos(self):
         """현재 위치 저장"""
@@ -34,7 +157,28 @@ class BlockSelector:
         self.hwp.SetPos(pos[0], pos[1], pos[2])
 
     def _get_line_starts(self, para_id):
-        """문단 내 모든 줄의 시작 pos 목록 반환"""
+        """문단 내 모든 줄의 시작 pos 목록 반환 (캐시 사용)"""
+        entry = self._entry(para_id)
+        if entry is not None and entry.line_starts is not None:
+            self.cache_hits += 1
+            return list(entry.line_starts), entry.para_end
+
+        self.cache_misses += 1
+        line_starts, para_end = self._measure_line_starts(para_id)
+        if entry is not None:
+            entry.line_starts, entry.para_end = list(line_starts), para_end
+        return line_starts, para_end
+
+    def cached_line_starts(self, para_id):
+        """이미 측정한 (줄 시작 pos 목록, 문단 끝 pos) - 캐시에 없으면 측정하지 않고 None"""
+        entry = self._entry(para_id)
+        if entry is None or entry.line_starts is None:
+            return None
+        self.cache_hits += 1
+        return list(entry.line_starts), entry.para_end
+
+    def _measure_line_starts(self, para_id):
+        """문단 내 모든 줄의 시작 pos 목록 측정 (MoveLineDown, 캐시 미사용)"""
         saved = self._save_pos()
 
         # 해당 문단으로 이동
@@ -63,7 +207,26 @@ class BlockSelector:
         return sorted(line_starts), para_end
 
     def _get_pos_map(self, para_id):
-        """문단 내 각 문자의 실제 HWP pos 매핑 반환"""
+        """문단 내 각 문자의 실제 HWP pos 매핑 반환 (캐시 사용)"""
+        entry = self._entry(para_id)
+        if entry is not None and entry.pos_map is not None:
+            self.cache_hits += 1
+            pos_list, para_text, para_end_pos = entry.pos_map
+            return list(pos_list), para_text, para_end_pos
+
+        self.cache_misses += 1
+        pos_list, para_text, para_end_pos = self._measure_pos_map(para_id)
+        if entry is not None:
+            entry.pos_map = (list(pos_list), para_text, para_end_pos)
+        return pos_list, para_text, para_end_pos
+
+    def _measure_pos_map(self, para_id):
+        """
+        문단 내 각 문자의 실제 HWP pos 측정 (캐시 미사용)
+
+        내보낸 텍스트에서 pos를 계산하고(_text_pos_map) 문단 끝 pos와 샘플 몇 글자로 확인합니다.
+        맞지 않으면(텍스트에 나오지 않는 컨트롤이 있는 문단) 문자마다 MoveRight로 측정합니다.
+        """
         saved = self._save_pos()
         self.hwp.SetPos(saved[0], para_id, 0)
 
@@ -83,7 +246,14 @@ class BlockSelector:
 
         para_text = para_text.replace('\r\n', '').replace('\r', '').replace('\n', '')
 
-        # 각 문자의 HWP pos 수집
+        pos_list = _text_pos_map(para_text, start[2])
+        if pos_list is not None and self._check_pos_map(para_id, para_text, pos_list, para_end_pos):
+            self._restore_pos(saved)
+            return pos_list, para_text, para_end_pos
+
+        # 각 문자의 HWP pos 수집 (컨트롤이 있는 문단)
+        self.pos_map_walks += 1
+        self.hwp.SetPos(saved[0], para_id, 0)
         self.hwp.HAction.Run("MoveParaBegin")
         pos_list = []
         for _ in range(len(para_text)):
@@ -93,49 +263,55 @@ class BlockSelector:
         self._restore_pos(saved)
         return pos_list, para_text, para_end_pos
 
+    def _check_pos_map(self, para_id, para_text, pos_list, para_end_pos, samples=3):
+        """
+        텍스트로 계산한 pos 확인
+
+        1. 마지막 글자 다음 pos == 문단 끝 pos (숨은 컨트롤이 있으면 어긋남)
+        2. 샘플 글자(처음/가운데/끝)를 SelectText로 읽어 같은 글자인지 확인
+        """
+        if not pos_list:
+            return False
+        if pos_list[-1] + _pos_width(para_text[-1]) != para_end_pos:
+            return False
+
+        count = len(para_text)
+        indices = sorted({count * k // samples for k in range(samples)} | {count - 1})
+        for i in indices:
+            pos = pos_list[i]
+            self.hwp.SelectText(para_id, pos, para_id, pos + _pos_width(para_text[i]))
+            text = self.hwp.GetTextFile("TEXT", "saveblock") or ""
+            self.hwp.HAction.Run("Cancel")
+            if text.replace('\r\n', '').replace('\r', '').replace('\n', '') != para_text[i]:
+                return False
+        return True
+
     def _get_sentences(self, para_id):
-        """문단 내 문장 경계 목록 반환 (HWP pos 기반)"""
+        """문단 내 문장 경계 목록 반환 (HWP pos 기반, 캐시 사용)"""
+        entry = self._entry(para_id)
+        if entry is not None and entry.sentences is not None:
+            self.cache_hits += 1
+            sentences, para_text = entry.sentences
+            return [dict(s) for s in sentences], para_text
+
+        sentences, para_text = self._split_sentences(para_id)
+        if entry is not None:
+            entry.sentences = ([dict(s) for s in sentences], para_text)
+        return sentences, para_text
+
+    def _split_sentences(self, para_id):
+        """문장 경계 계산 (sentence_segmenter 규칙, 문자 인덱스 -> HWP pos)"""
         pos_list, para_text, para_end_pos = self._get_pos_map(para_id)
 
         if not para_text:
             return [], ""
 
         sentences = []
-        sentence_index = 1
-        sentence_start_idx = 0
-        i = 0
-
-        while i < len(para_text):
-            if para_text[i] == '.':
-                sentences.append({
-                    'index': sentence_index,
-                    'start': pos_list[sentence_start_idx],
-                    'end': pos_list[i]
-                })
-
-                next_idx = i + 1
-                skip_count = 0
-                while next_idx < len(para_text) and skip_count < 3:
-                    if para_text[next_idx] == ' ':
-                        next_idx += 1
-                        skip_count += 1
-                    else:
-                        break
-
-                if next_idx >= len(para_text) or (skip_count >= 3 and para_text[next_idx] == ' '):
-                    break
-
-                sentence_index += 1
-                sentence_start_idx = next_idx
-                i = next_idx
-            else:
-                i += 1
-
-        if sentence_start_idx < len(para_text) and (not sentences or sentences[-1]['end'] < pos_list[-1]):
+        for index, (start, end, closed) in enumerate(iter_sentence_spans(para_text), 1):
             sentences.append({
-                'index': sentence_index,
-                'start': pos_list[sentence_start_idx],
-                'end': para_end_pos
+                'index': index,
+                'start': pos_list[start],
+                'end': pos_list[end] if closed else para_end_pos
             })
 
         return sentences, para_text
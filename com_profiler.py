@@ -0,0 +1,352 @@
+# -*- coding: utf-8 -*-
+"""
+HWP COM 호출 프로파일러
+
+get_hwp_instance()가 반환한 객체를 감싸서 모든 COM 메서드/속성 호출의
+횟수, 누적 시간, p50/p99 지연을 기록합니다.
+- HAction.Run/GetDefault/Execute는 액션 이름별로 구분 (예: "HAction.Run:MoveParaBegin")
+- 호출마다 프로젝트 함수 스택을 따라가 호출한 함수에 귀속 (예: "TableGrid.build_grid")
+- 결과는 JSON 또는 flame graph용 collapsed stack 파일로 저장
+
+사용 예시:
+    from cursor import get_hwp_instance
+    from com_profiler import get_profiler
+
+    hwp = get_hwp_instance(profile=True)
+    ...
+    profiler = get_profiler(hwp)
+    profiler.print_summary()
+    profiler.save_json("logs/com_profile.json")
+    profiler.save_collapsed("logs/com_profile.folded")  # flamegraph.pl / speedscope
+
+환경 변수 HWP_PROFILE을 설정하면 get_hwp_instance()가 자동으로 감싸고
+종료 시 <HWP_PROFILE>.json / <HWP_PROFILE>.folded 로 저장합니다 (값이 "1"이면 logs/com_profile).
+"""
+
+import atexit
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT = os.path.join("logs", "com_profile")
+
+# 값 그대로 반환하는 타입 (그 외 반환값은 COM 객체로 보고 다시 감쌈)
+_PLAIN_TYPES = (type(None), bool, int, float, str, bytes, tuple, list, dict)
+
+# 같은 종류의 객체를 돌려주는 속성은 하나의 이름으로 묶음 (ctrl.Next.Next... 방지)
+_OBJECT_NAMES = {
+    'HeadCtrl': 'Ctrl', 'LastCtrl': 'Ctrl', 'ParentCtrl': 'Ctrl',
+    'CurSelectedCtrl': 'Ctrl', 'Next': 'Ctrl', 'Prev': 'Ctrl',
+    'HSet': 'HSet',
+}
+
+# 액션 이름을 호출 이름에 붙이는 메서드
+_ACTION_METHODS = ('Run', 'GetDefault', 'Execute')
+
+# 반환 객체 이름을 첫 인자로 정하는 메서드 (CellShape.Item("Cell") -> "Cell")
+_NAMED_BY_ARG = ('Item', 'CreateAction')
+
+_NO_CALLER = '<module>'
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    """정렬된 값의 q 분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(round(q * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+@dataclass
+class MethodStats:
+    """COM 메서드/속성별 지연 기록"""
+    durations: List[float] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return len(self.durations)
+
+    @property
+    def total(self) -> float:
+        return sum(self.durations)
+
+    def summary(self) -> Dict[str, float]:
+        values = sorted(self.durations)
+        return {
+            'count': len(values),
+            'total': sum(values),
+            'mean': sum(values) / len(values) if values else 0.0,
+            'p50': _percentile(values, 0.50),
+            'p99': _percentile(values, 0.99),
+            'max': values[-1] if values else 0.0,
+        }
+
+
+@dataclass
+class CallerStats:
+    """프로젝트 함수별 COM 호출 귀속"""
+    count: int = 0
+    total: float = 0.0
+    methods: Dict[str, int] = field(default_factory=dict)
+
+
+class ComProfiler:
+    """COM 호출 기록기"""
+
+    def __init__(self, attribute: bool = True, max_depth: int = 32):
+        """
+        Args:
+            attribute: True면 호출마다 프로젝트 함수 스택을 수집 (호출 귀속, collapsed stack)
+            max_depth: 수집할 최대 스택 깊이
+        """
+        self.attribute = attribute
+        self.max_depth = max_depth
+        self.enabled = True
+        self.methods: Dict[str, MethodStats] = {}
+        self.callers: Dict[str, CallerStats] = {}
+        self.stacks: Dict[Tuple[str, ...], float] = {}
+        self._frame_names: Dict[Any, Optional[str]] = {}
+
+    def wrap(self, hwp):
+        """HWP COM 객체를 프로파일링 프록시로 감싸기"""
+        if hwp is None or isinstance(hwp, ProfiledObject):
+            return hwp
+        return ProfiledObject(hwp, self, "")
+
+    def reset(self):
+        """기록 초기화"""
+        self.methods.clear()
+        self.callers.clear()
+        self.stacks.clear()
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+
+    def _frame_name(self, frame) -> Optional[str]:
+        """프로젝트 코드 프레임이면 "Class.func" 이름, 아니면 None"""
+        code = frame.f_code
+        cached = self._frame_names.get(code, False)
+        if cached is not False:
+            return cached
+        filename = os.path.abspath(code.co_filename)
+        name = None
+        if filename.startswith(PROJECT_ROOT) and filename != os.path.abspath(__file__):
+            name = getattr(code, 'co_qualname', code.co_name)
+            if name == code.co_name and 'self' in frame.f_locals:
+                name = f"{type(frame.f_locals['self']).__name__}.{name}"
+            if name == '<module>':
+                name = os.path.splitext(os.path.basename(filename))[0]
+        self._frame_names[code] = name
+        return name
+
+    def _project_stack(self) -> Tuple[str, ...]:
+        """현재 호출 스택의 프로젝트 함수 이름 (바깥쪽부터)"""
+        names = []
+        frame = sys._getframe(1)
+        while frame is not None and len(names) < self.max_depth:
+            name = self._frame_name(frame)
+            if name:
+                names.append(name)
+            frame = frame.f_back
+        names.reverse()
+        return tuple(names)
+
+    def record(self, name: str, elapsed: float):
+        """COM 호출 1회 기록"""
+        if not self.enabled:
+            return
+        stats = self.methods.get(name)
+        if stats is None:
+            stats = MethodStats()
+            self.methods[name] = stats
+        stats.durations.append(elapsed)
+
+        if not self.attribute:
+            return
+        stack = self._project_stack()
+        caller = stack[-1] if stack else _NO_CALLER
+        info = self.callers.get(caller)
+        if info is None:
+            info = CallerStats()
+            self.callers[caller] = info
+        info.count += 1
+        info.total += elapsed
+        info.methods[name] = info.methods.get(name, 0) + 1
+
+        key = stack + (name,)
+        self.stacks[key] = self.stacks.get(key, 0.0) + elapsed
+
+    # ------------------------------------------------------------------
+    # 보고서
+    # ------------------------------------------------------------------
+
+    @property
+    def total_calls(self) -> int:
+        return sum(s.count for s in self.methods.values())
+
+    @property
+    def total_time(self) -> float:
+        return sum(s.total for s in self.methods.values())
+
+    def to_dict(self) -> Dict:
+        """JSON 직렬화용 딕셔너리 (시간 단위: 초)"""
+        methods = sorted(self.methods.items(), key=lambda x: -x[1].total)
+        callers = sorted(self.callers.items(), key=lambda x: -x[1].total)
+        return {
+            'total_calls': self.total_calls,
+            'total_time': self.total_time,
+            'methods': {name: s.summary() for name, s in methods},
+            'callers': {
+                name: {'count': c.count, 'total': c.total,
+                       'methods': dict(sorted(c.methods.items(), key=lambda x: -x[1]))}
+                for name, c in callers
+            },
+        }
+
+    def save_json(self, path: str):
+        """통계를 JSON 파일로 저장"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+    def save_collapsed(self, path: str):
+        """flame graph용 collapsed stack 파일 저장 ("a;b;c 마이크로초" 한 줄씩)"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, elapsed in sorted(self.stacks.items()):
+                frames = [s.replace(';', ':').replace(' ', '_') for s in stack]
+                f.write(f"{';'.join(frames)} {max(1, int(elapsed * 1_000_000))}\n")
+
+    def print_summary(self, top: int = 20):
+        """호출 통계 출력"""
+        print(f"=== COM 호출: {self.total_calls}회, {self.total_time * 1000:.1f}ms ===")
+        print(f"  {'메서드':<40} {'횟수':>8} {'합계(ms)':>10} {'p50(us)':>9} {'p99(us)':>9}")
+        methods = sorted(self.methods.items(), key=lambda x: -x[1].total)
+        for name, s in methods[:top]:
+            info = s.summary()
+            print(f"  {name:<40} {info['count']:>8} {info['total'] * 1000:>10.2f} "
+                  f"{info['p50'] * 1e6:>9.1f} {info['p99'] * 1e6:>9.1f}")
+        if self.callers:
+            print("\n  [호출 함수별]")
+            callers = sorted(self.callers.items(), key=lambda x: -x[1].total)
+            for name, c in callers[:top]:
+                print(f"  {name:<40} {c.count:>8} {c.total * 1000:>10.2f}")
+
+
+class ProfiledObject:
+    """COM 객체 프록시 (속성 조회/메서드 호출 시간 기록)"""
+
+    __slots__ = ('_target', '_profiler', '_path')
+
+    def __init__(self, target, profiler: ComProfiler, path: str):
+        object.__setattr__(self, '_target', target)
+        object.__setattr__(self, '_profiler', profiler)
+        object.__setattr__(self, '_path', path)
+
+    def _name(self, attr: str) -> str:
+        return f"{self._path}.{attr}" if self._path else attr
+
+    def _wrap_result(self, attr: str, value, path: str = None):
+        if isinstance(value, _PLAIN_TYPES) or isinstance(value, ProfiledObject):
+            return value
+        return ProfiledObject(value, self._profiler, path or _OBJECT_NAMES.get(attr, attr))
+
+    def __getattr__(self, attr: str):
+        target = self._target
+        start = time.perf_counter()
+        value = getattr(target, attr)
+        elapsed = time.perf_counter() - start
+
+        if callable(value) and not hasattr(value, '_oleobj_'):
+            return _ProfiledMethod(self, attr, value)
+        self._profiler.record(self._name(attr), elapsed)
+        return self._wrap_result(attr, value)
+
+    def __setattr__(self, attr: str, value):
+        start = time.perf_counter()
+        setattr(self._target, attr, _unwrap(value))
+        self._profiler.record(self._name(attr) + '=', time.perf_counter() - start)
+
+    def __bool__(self) -> bool:
+        return bool(self._target)
+
+    def __eq__(self, other) -> bool:
+        return self._target == _unwrap(other)
+
+    def __hash__(self) -> int:
+        return hash(self._target)
+
+    def __repr__(self) -> str:
+        return f"<ProfiledObject {self._path or 'hwp'}: {self._target!r}>"
+
+
+class _ProfiledMethod:
+    """프록시 객체의 메서드 (호출 시간 기록)"""
+
+    __slots__ = ('_owner', '_attr', '_method')
+
+    def __init__(self, owner: ProfiledObject, attr: str, method):
+        self._owner = owner
+        self._attr = attr
+        self._method = method
+
+    def __call__(self, *args):
+        owner = self._owner
+        name = owner._name(self._attr)
+        if self._attr in _ACTION_METHODS and args and isinstance(args[0], str):
+            name = f"{name}:{args[0]}"
+        start = time.perf_counter()
+        try:
+            value = self._method(*[_unwrap(a) for a in args])
+        finally:
+            owner._profiler.record(name, time.perf_counter() - start)
+        path = args[0] if self._attr in _NAMED_BY_ARG and args and isinstance(args[0], str) else None
+        return owner._wrap_result(self._attr, value, path)
+
+
+def _unwrap(value):
+    """COM 메서드 인자로 넘길 때 프록시를 원래 객체로 되돌림"""
+    if isinstance(value, ProfiledObject):
+        return object.__getattribute__(value, '_target')
+    return value
+
+
+def get_profiler(hwp) -> Optional[ComProfiler]:
+    """프록시로 감싼 hwp의 ComProfiler (감싸지 않았으면 None)"""
+    if isinstance(hwp, ProfiledObject):
+        return object.__getattribute__(hwp, '_profiler')
+    return None
+
+
+def profile_hwp(hwp, attribute: bool = True):
+    """hwp를 새 ComProfiler로 감싸서 반환"""
+    return ComProfiler(attribute=attribute).wrap(hwp)
+
+
+def profile_from_env(hwp):
+    """
+    HWP_PROFILE 환경 변수가 있으면 hwp를 감싸고 종료 시 보고서 저장
+
+    HWP_PROFILE=1 -> logs/com_profile.json, logs/com_profile.folded
+    HWP_PROFILE=경로 -> 경로.json, 경로.folded
+    """
+    output = os.environ.get('HWP_PROFILE')
+    if not output or hwp is None:
+        return hwp
+    if output == '1':
+        output = DEFAULT_OUTPUT
+    wrapped = profile_hwp(hwp)
+    profiler = get_profiler(wrapped)
+
+    def _dump():
+        profiler.save_json(output + '.json')
+        profiler.save_collapsed(output + '.folded')
+
+    atexit.register(_dump)
+    return wrapped
@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+"""pytest 설정 - 한글(Windows)이 있어야 하는 통합 스크립트는 수집하지 않음"""
+
+collect_ignore = [
+    "converter_excel/test_export.py",   # 실행 중인 한글 + openpyxl 필요 (cmd.exe에서 직접 실행)
+]
@@ -52,11 +52,14 @@ from .extract_data_hwp import (
     CellStyleData,
     CellMatchResult,
     extract_cell_style,
+    extract_cell_styles,
     get_cell_text,
+    get_cell_texts,
     # 필드
     FieldInfo,
     generate_field_names,
     get_cell_bookmark,
+    build_bookmark_index,
     set_cell_field_names,
     generate_random_field_name,
 )
@@ -77,6 +80,10 @@ from .apply_excel import (
     apply_cell_style_to_excel_cell,
     # 필드
     write_field_info_to_sheet,
+    # 스트리밍 (write-only)
+    apply_to_excel_stream,
+    create_main_sheet_stream,
+    StreamingExcelWriter,
 )
 
 # =============================================================================
@@ -18,6 +18,11 @@ from .cell import (
     apply_cell_style_to_excel_cell,
 )
 from .field import write_field_info_to_sheet
+from .stream import (
+    apply_to_excel_stream,
+    create_main_sheet_stream,
+    StreamingExcelWriter,
+)
 
 __all__ = [
     # apply.py
@@ -32,4 +37,8 @@ __all__ = [
     'apply_cell_style_to_excel_cell',
     # field.py
     'write_field_info_to_sheet',
+    # stream.py
+    'apply_to_excel_stream',
+    'create_main_sheet_stream',
+    'StreamingExcelWriter',
 ]
@@ -5,7 +5,7 @@
 
 주요 기능:
 - create_main_sheet: 메인 표 시트 생성
-- apply_to_excel: 추출 데이터를 엑셀로 저장 (통합 함수)
+- apply_to_excel: 추출 데이터를 엑셀로 저장 (통합 함수, streaming=True면 write-only 모드)
 """
 
 import os
@@ -73,25 +73,7 @@ def create_main_sheet(ws: 'Worksheet',
     cfg = config or get_default_config()
 
     # 페이지 설정 적용
-    if cfg.page.enabled and page_result.success:
-        meta = page_result.page_meta
-
-        if cfg.page.margins.enabled:
-            margins = PageMargins(
-                left=meta.margin.left / HWPUNIT_PER_INCH if cfg.page.margins.left else 0.7,
-                right=meta.margin.right / HWPUNIT_PER_INCH if cfg.page.margins.right else 0.7,
-                top=meta.margin.top / HWPUNIT_PER_INCH if cfg.page.margins.top else 0.75,
-                bottom=meta.margin.bottom / HWPUNIT_PER_INCH if cfg.page.margins.bottom else 0.75,
-            )
-            ws.page_margins = margins
-
-        if cfg.page.orientation:
-            ws.page_setup.orientation = meta.page_size.orientation
-
-        if cfg.page.fit_to_page.enabled:
-            ws.page_setup.fitToPage = True
-            ws.page_setup.fitToWidth = cfg.page.fit_to_page.width
-            ws.page_setup.fitToHeight = cfg.page.fit_to_page.height
+    _apply_page_setup(ws, page_result, cfg)
 
     # 테두리 스타일
     border_style = cfg.style.border.style if cfg.style.border.enabled else None
@@ -181,28 +163,62 @@ def create_main_sheet(ws: 'Worksheet',
         if cfg.size.col_width.enabled:
             for col_idx, width in enumerate(col_widths):
                 col_letter = get_column_letter(col_idx + 1)
-                char_width = max(cfg.size.col_width.min,
-                                min(width / 700, cfg.size.col_width.max))
-                ws.column_dimensions[col_letter].width = char_width
+                ws.column_dimensions[col_letter].width = _col_width_chars(width, cfg)
 
         if cfg.size.row_height.enabled:
             for row_idx, height in enumerate(row_heights):
-                pt_height = max(cfg.size.row_height.min,
-                               min(height / 100, cfg.size.row_height.max))
-                ws.row_dimensions[row_idx + 1].height = pt_height
+                ws.row_dimensions[row_idx + 1].height = _row_height_pt(height, cfg)
 
     # 시트 보호
     if cfg.protection.enabled:
-        ws.protection = SheetProtection(
-            sheet=True,
-            formatCells=not cfg.protection.allow.format_cells,
-            formatColumns=not cfg.protection.allow.format_columns,
-            formatRows=not cfg.protection.allow.format_rows,
-            insertColumns=not cfg.protection.allow.insert_columns,
-            insertRows=not cfg.protection.allow.insert_rows,
-            deleteColumns=not cfg.protection.allow.delete_columns,
-            deleteRows=not cfg.protection.allow.delete_rows,
-        )
+        ws.protection = _sheet_protection(cfg)
+
+
+def _apply_page_setup(ws: 'Worksheet', page_result: PageMatchResult, cfg: ExportConfig):
+    """페이지 설정(여백, 방향, 페이지 맞춤) 적용 (내부 함수)"""
+    if cfg.page.enabled and page_result and page_result.success:
+        meta = page_result.page_meta
+
+        if cfg.page.margins.enabled:
+            margins = PageMargins(
+                left=meta.margin.left / HWPUNIT_PER_INCH if cfg.page.margins.left else 0.7,
+                right=meta.margin.right / HWPUNIT_PER_INCH if cfg.page.margins.right else 0.7,
+                top=meta.margin.top / HWPUNIT_PER_INCH if cfg.page.margins.top else 0.75,
+                bottom=meta.margin.bottom / HWPUNIT_PER_INCH if cfg.page.margins.bottom else 0.75,
+            )
+            ws.page_margins = margins
+
+        if cfg.page.orientation:
+            ws.page_setup.orientation = meta.page_size.orientation
+
+        if cfg.page.fit_to_page.enabled:
+            ws.page_setup.fitToPage = True
+            ws.page_setup.fitToWidth = cfg.page.fit_to_page.width
+            ws.page_setup.fitToHeight = cfg.page.fit_to_page.height
+
+
+def _col_width_chars(width: int, cfg: ExportConfig) -> float:
+    """열 너비 HWPUNIT -> 엑셀 문자 단위 (설정 범위로 제한)"""
+    return max(cfg.size.col_width.min, min(width / 700, cfg.size.col_width.max))
+
+
+def _row_height_pt(height: int, cfg: ExportConfig) -> float:
+    """행 높이 HWPUNIT -> pt (설정 범위로 제한)"""
+    return max(cfg.size.row_height.min, min(height / 100, cfg.size.row_height.max))
+
+
+def _sheet_protection(cfg: ExportConfig) -> 'SheetProtection':
+    """설정에 따른 시트 보호 객체"""
+    return SheetProtection(
+        sheet=True,
+        formatCells=not cfg.protection.allow.format_cells,
+        formatColumns=not cfg.protection.allow.format_columns,
+        formatRows=not cfg.protection.allow.format_rows,
+        insertColumns=not cfg.protection.allow.insert_columns,
+        insertRows=not cfg.protection.allow.insert_rows,
+        deleteColumns=not cfg.protection.allow.delete_columns,
+        deleteRows=not cfg.protection.allow.delete_rows,
+    )
 
 
 def _apply_cell_style(cell, cell_data: CellStyleData, config: ExportConfig):
@@ -222,42 +238,60 @@ def _apply_cell_style(cell, cell_data: CellStyleData, config: ExportConfig):
         cell.fill = PatternFill(start_color=hex_color, end_color=hex_color, fill_type="solid")
 
     # 글꼴
-    if cfg.font.enabled:
-        font_kwargs = {}
+    font_kwargs = _font_kwargs(cell_data, config)
+    if font_kwargs:
+        cell.font = Font(**font_kwargs)
 
-        if cfg.font.name and cell_data.font_name:
-            font_kwargs['name'] = cell_data.font_name
+    # 정렬
+    align_kwargs = _alignment_kwargs(cell_data, config)
+    if align_kwargs:
+        cell.alignment = Alignment(**align_kwargs)
 
-        if cfg.font.size and cell_data.font_size_pt > 0:
-            font_kwargs['size'] = cell_data.font_size_pt
 
-        if cfg.font.bold and cell_data.font_bold:
-            font_kwargs['bold'] = True
+def _font_kwargs(cell_data: CellStyleData, config: ExportConfig) -> Dict[str, Any]:
+    """설정에 따른 Font 인자 (글꼴 비활성화 시 빈 딕셔너리)"""
+    cfg = config.style
+    font_kwargs = {}
+    if not cfg.font.enabled:
+        return font_kwargs
 
-        if cfg.font.italic and cell_data.font_italic:
-            font_kwargs['italic'] = True
+    if cfg.font.name and cell_data.font_name:
+        font_kwargs['name'] = cell_data.font_name
 
-        if cfg.font.underline and cell_data.font_underline:
-            font_kwargs['underline'] = 'single'
+    if cfg.font.size and cell_data.font_size_pt > 0:
+        font_kwargs['size'] = cell_data.font_size_pt
 
-        if cfg.font.color and cell_data.font_color_rgb:
-            r, g, b = cell_data.font_color_rgb
-            font_kwargs['color'] = f"{r:02X}{g:02X}{b:02X}"
+    if cfg.font.bold and cell_data.font_bold:
+        font_kwargs['bold'] = True
 
-        if font_kwargs:
-            cell.font = Font(**font_kwargs)
+    if cfg.font.italic and cell_data.font_italic:
+        font_kwargs['italic'] = True
 
-    # 정렬
-    if cfg.alignment.enabled:
-        h_align_map = {'left': 'left', 'center': 'center', 'right': 'right',
-                      'justify': 'justify', 'distribute': 'distributed'}
-        v_align_map = {'top': 'top', 'center': 'center', 'bottom': 'bottom'}
+    if cfg.font.underline and cell_data.font_underline:
+        font_kwargs['underline'] = 'single'
+
+    if cfg.font.color and cell_data.font_color_rgb:
+        r, g, b = cell_data.font_color_rgb
+        font_kwargs['color'] = f"{r:02X}{g:02X}{b:02X}"
 
-        cell.alignment = Alignment(
-            horizontal=h_align_map.get(cell_data.align_horizontal, 'left') if cfg.alignment.horizontal else 'left',
-            vertical=v_align_map.get(cell_data.align_vertical, 'center') if cfg.alignment.vertical else 'center',
-            wrap_text=cfg.alignment.wrap_text
-        )
+    return font_kwargs
+
+
+def _alignment_kwargs(cell_data: CellStyleData, config: ExportConfig) -> Dict[str, Any]:
+    """설정에 따른 Alignment 인자 (정렬 비활성화 시 빈 딕셔너리)"""
+    cfg = config.style
+    if not cfg.alignment.enabled:
+        return {}
+
+    h_align_map = {'left': 'left', 'center': 'center', 'right': 'right',
+                  'justify': 'justify', 'distribute': 'distributed'}
+    v_align_map = {'top': 'top', 'center': 'center', 'bottom': 'bottom'}
+
+    return {
+        'horizontal': h_align_map.get(cell_data.align_horizontal, 'left') if cfg.alignment.horizontal else 'left',
+        'vertical': v_align_map.get(cell_data.align_vertical, 'center') if cfg.alignment.vertical else 'center',
+        'wrap_text': cfg.alignment.wrap_text,
+    }
 
 
 # =============================================================================
@@ -267,7 +301,8 @@ def _apply_cell_style(cell, cell_data: CellStyleData, config: ExportConfig):
 def apply_to_excel(extracted_data: Dict[str, Any],
                    output_path: str,
                    sheet_name: str = "표",
-                   config: ExportConfig = None) -> bool:
+                   config: ExportConfig = None,
+                   streaming: bool = None) -> bool:
     """추출된 데이터를 엑셀 파일로 저장
 
     Args:
@@ -280,6 +315,7 @@ def apply_to_excel(extracted_data: Dict[str, Any],
         output_path: 출력 파일 경로
         sheet_name: 메인 시트 이름
         config: ExportConfig 설정 객체
+        streaming: True면 write-only 모드로 저장 (None이면 config.output.streaming)
 
     Returns:
         성공 여부
@@ -290,6 +326,10 @@ def apply_to_excel(extracted_data: Dict[str, Any],
 
     cfg = config or get_default_config()
 
+    if cfg.output.streaming if streaming is None else streaming:
+        from .stream import apply_to_excel_stream
+        return apply_to_excel_stream(extracted_data, output_path, sheet_name, cfg)
+
     # 데이터 추출
     cells_data = extracted_data.get('cells', [])
     row_heights = extracted_data.get('row_heights', [])
@@ -28,6 +28,21 @@ from ..extract_data_hwp.cell import CellStyleData
 
 HWPUNIT_PER_CM = 7200 / 2.54  # 약 2834.6
 
+# 셀 정보 시트 열 너비 (문자 단위)
+CELL_INFO_COL_WIDTHS = [
+    8, 5, 5, 7, 7, 7, 7,     # 위치 (7개)
+    8, 8, 8, 8, 8, 8,        # 물리 좌표 (6개)
+    10,                       # 배경색 (1개)
+    7, 7, 7, 7,              # 여백 (4개)
+    12, 8, 5, 5, 10,         # 글꼴 기본: name, size, bold, italic, color (5개)
+    8, 8, 7, 7, 7, 7, 8, 8,  # 글꼴 장식: underline, strikeout, outline, shadow, emboss, engrave, superscript, subscript (8개)
+    10, 10, 10,              # 자간/장평/줄간격 (3개)
+    8, 8,                     # 정렬 (2개)
+    8, 8, 8, 8,              # 테두리 (4개)
+    25,                       # 텍스트 (1개)
+    25, 10                    # 필드: field_name, field_source (2개)
+]
+
 
 # =============================================================================
 # 스타일 헬퍼
@@ -189,20 +204,7 @@ def write_cell_styles_to_sheet(ws: 'Worksheet', cells: List[CellStyleData],
                                         fill_type="solid")
 
     # 열 너비 조정
-    col_widths_excel = [
-        8, 5, 5, 7, 7, 7, 7,     # 위치 (7개)
-        8, 8, 8, 8, 8, 8,        # 물리 좌표 (6개)
-        10,                       # 배경색 (1개)
-        7, 7, 7, 7,              # 여백 (4개)
-        12, 8, 5, 5, 10,         # 글꼴 기본: name, size, bold, italic, color (5개)
-        8, 8, 7, 7, 7, 7, 8, 8,  # 글꼴 장식: underline, strikeout, outline, shadow, emboss, engrave, superscript, subscript (8개)
-        10, 10, 10,              # 자간/장평/줄간격 (3개)
-        8, 8,                     # 정렬 (2개)
-        8, 8, 8, 8,              # 테두리 (4개)
-        25,                       # 텍스트 (1개)
-        25, 10                    # 필드: field_name, field_source (2개)
-    ]
-    for col_idx, width in enumerate(col_widths_excel, 1):
+    for col_idx, width in enumerate(CELL_INFO_COL_WIDTHS, 1):
         ws.column_dimensions[get_column_letter(col_idx)].width = width
 
     # 인쇄 설정
@@ -19,6 +19,10 @@ if TYPE_CHECKING:
 from ..extract_data_hwp.field import FieldInfo
 
 
+# 필드 정보 시트 열 너비 (문자 단위)
+FIELD_INFO_COL_WIDTHS = [8, 5, 5, 30, 10, 30, 20, 5, 5, 20, 5, 5]
+
+
 # =============================================================================
 # 스타일 헬퍼
 # =============================================================================
@@ -92,8 +96,7 @@ def write_field_info_to_sheet(ws: 'Worksheet', fields: List[FieldInfo]):
             cell.border = thin_border
 
     # 열 너비 조정
-    col_widths = [8, 5, 5, 30, 10, 30, 20, 5, 5, 20, 5, 5]
-    for col_idx, width in enumerate(col_widths, 1):
+    for col_idx, width in enumerate(FIELD_INFO_COL_WIDTHS, 1):
         ws.column_dimensions[get_column_letter(col_idx)].width = width
 
     # 인쇄 설정
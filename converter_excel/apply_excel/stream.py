@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""엑셀 스트리밍 저장 모듈 (write-only)
+
+apply_to_excel과 같은 시트를 Workbook(write_only=True)로 행 순서대로 기록합니다.
+셀 수가 많은 표나 여러 표를 한 파일로 저장할 때 메모리 사용량이 표 크기에 비례하지 않습니다.
+
+주요 기능:
+- create_main_sheet_stream: 메인 표 시트를 행 순서대로 기록 (스타일 조합별 1회 생성, 병합은 마지막에 기록)
+- StreamingExcelWriter: 여러 표를 시트로 추가한 뒤 한 번에 저장
+"""
+
+import os
+import sys
+import datetime
+from typing import List, Dict, Any, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from table.table_excel_stream import (
+    HAS_OPENPYXL,
+    StyleCache,
+    RowStreamSheet,
+    GridStreamResult,
+    create_stream_workbook,
+    set_column_widths,
+    stream_grid,
+    style_key,
+)
+
+from ..extract_data_hwp.cell import CellStyleData
+from ..extract_data_hwp.page import PageMatchResult
+from ..config import ExportConfig, get_default_config
+
+from .apply import (
+    _apply_page_setup,
+    _col_width_chars,
+    _row_height_pt,
+    _sheet_protection,
+    _font_kwargs,
+    _alignment_kwargs,
+)
+from .page import write_page_info_to_sheet
+from .cell import write_cell_styles_to_sheet, write_row_col_sizes_to_sheet, CELL_INFO_COL_WIDTHS
+from .field import write_field_info_to_sheet, FIELD_INFO_COL_WIDTHS
+
+
+# =============================================================================
+# 메인 시트
+# =============================================================================
+
+def _locked(cell_data: CellStyleData, cfg: ExportConfig) -> Optional[bool]:
+    """셀 잠금 여부 (None이면 기본값 유지, create_main_sheet와 같은 규칙)"""
+    if not cfg.protection.enabled:
+        return None
+    if cell_data.bg_color_rgb:
+        return True if cfg.protection.lock_rules.with_background else None
+    return bool(cfg.protection.lock_rules.without_background)
+
+
+def _main_style_key(cell_data: CellStyleData, cfg: ExportConfig, covered: bool = False) -> tuple:
+    """메인 시트 셀 스타일 키 (covered: 병합 영역의 나머지 칸)"""
+    border = cfg.style.border.style if cfg.style.border.enabled else None
+    fill = cell_data.bg_color_rgb if cfg.style.enabled and cfg.style.background.enabled else None
+    font = alignment = None
+    if cfg.style.enabled and not covered:
+        font = _font_kwargs(cell_data, cfg)
+        alignment = _alignment_kwargs(cell_data, cfg)
+    return style_key(border, fill, font, alignment, _locked(cell_data, cfg))
+
+
+def create_main_sheet_stream(ws,
+                             cells_data: List[CellStyleData],
+                             row_heights: List[int],
+                             col_widths: List[int],
+                             page_result: PageMatchResult,
+                             config: ExportConfig = None) -> GridStreamResult:
+    """메인 표 시트를 write-only 시트에 기록 (create_main_sheet의 스트리밍 버전)
+
+    Args:
+        ws: write-only Worksheet (아직 행을 쓰지 않은 시트)
+        cells_data: 셀 데이터 리스트
+        row_heights: 행 높이 리스트 (HWPUNIT)
+        col_widths: 열 너비 리스트 (HWPUNIT)
+        page_result: PageMatchResult 객체
+        config: ExportConfig 설정 객체
+
+    Returns:
+        GridStreamResult
+    """
+    if not HAS_OPENPYXL:
+        raise ImportError("openpyxl이 필요합니다: pip install openpyxl")
+
+    cfg = config or get_default_config()
+
+    _apply_page_setup(ws, page_result, cfg)
+
+    # 열 너비는 첫 행보다 먼저 기록됨
+    size_enabled = cfg.size.enabled
+    if size_enabled and cfg.size.col_width.enabled:
+        set_column_widths(ws, [_col_width_chars(w, cfg) for w in col_widths])
+
+    def row_height(row: int) -> Optional[float]:
+        if size_enabled and cfg.size.row_height.enabled and row < len(row_heights):
+            return _row_height_pt(row_heights[row], cfg)
+        return None
+
+    styles = StyleCache(ws)
+    result = stream_grid(
+        ws, cells_data,
+        anchor_cell=lambda c: styles.cell(c.text, _main_style_key(c, cfg)),
+        covered_cell=lambda c: styles.cell(None, _main_style_key(c, cfg, covered=True)),
+        row_count=len(row_heights) if size_enabled and cfg.size.row_height.enabled else 0,
+        row_heights=row_height,
+    )
+
+    if cfg.protection.enabled:
+        ws.protection = _sheet_protection(cfg)
+    return result
+
+
+# =============================================================================
+# 여러 표 저장
+# =============================================================================
+
+class StreamingExcelWriter:
+    """write-only 워크북에 표를 시트 단위로 추가하고 저장
+
+    Example:
+        writer = StreamingExcelWriter(config)
+        writer.add_table(extracted_1, "표1")
+        writer.add_table(extracted_2, "표2")
+        writer.save("output.xlsx")
+    """
+
+    def __init__(self, config: ExportConfig = None):
+        if not HAS_OPENPYXL:
+            raise ImportError("openpyxl이 필요합니다: pip install openpyxl")
+        self.config = config or get_default_config()
+        self.wb = create_stream_workbook()
+        self.sheet_count = 0
+
+    def add_table(self, extracted_data: Dict[str, Any], sheet_name: str = "표"):
+        """추출 데이터 하나를 메인 시트 + 정보 시트로 추가 (apply_to_excel과 같은 구성)"""
+        cfg = self.config
+        cells_data = extracted_data.get('cells', [])
+        row_heights = extracted_data.get('row_heights', [])
+        col_widths = extracted_data.get('col_widths', [])
+        page_result = extracted_data.get('page_result')
+        fields = extracted_data.get('fields', [])
+
+        # ----- 메인 시트 -----
+        if cfg.output.sheets.main:
+            ws_main = self.wb.create_sheet(title=sheet_name)
+            result = create_main_sheet_stream(ws_main, cells_data, row_heights, col_widths,
+                                              page_result, cfg)
+            print(f"    [{sheet_name}] 시트 생성 완료 ({result.rows}행, 병합 {result.merged}개)")
+
+        # ----- 페이지 정보 시트 (작은 시트: 모아서 기록) -----
+        if cfg.output.sheets.page_info and page_result and page_result.success:
+            ws_page = RowStreamSheet(self.wb.create_sheet(title=f"{sheet_name}{cfg.output.suffix.page}"))
+            write_page_info_to_sheet(ws_page, page_result.page_meta)
+            ws_page.flush()
+            print(f"    [{sheet_name}{cfg.output.suffix.page}] 시트 생성 완료")
+
+        # ----- 셀 정보 시트 (셀당 1행: 행 순서대로 바로 기록) -----
+        if cfg.output.sheets.cell_info:
+            ws_cells = self.wb.create_sheet(title=f"{sheet_name}{cfg.output.suffix.cells}")
+            set_column_widths(ws_cells, CELL_INFO_COL_WIDTHS, fit_to_page=True)
+            ws_cells = RowStreamSheet(ws_cells, eager=True)
+            write_cell_styles_to_sheet(ws_cells, cells_data, row_heights, col_widths)
+            ws_cells.flush()
+            print(f"    [{sheet_name}{cfg.output.suffix.cells}] 시트 생성 완료")
+
+        # ----- 크기 정보 시트 (행/열 구역이 나란히 있어 모아서 기록) -----
+        if cfg.output.sheets.size_info:
+            ws_sizes = RowStreamSheet(self.wb.create_sheet(title=f"{sheet_name}{cfg.output.suffix.sizes}"))
+            write_row_col_sizes_to_sheet(ws_sizes, row_heights, col_widths)
+            ws_sizes.flush()
+            print(f"    [{sheet_name}{cfg.output.suffix.sizes}] 시트 생성 완료")
+
+        # ----- 필드 정보 시트 -----
+        if fields and cfg.field.enabled:
+            ws_fields = self.wb.create_sheet(title=f"{sheet_name}_fields")
+            set_column_widths(ws_fields, FIELD_INFO_COL_WIDTHS, fit_to_page=True)
+            ws_fields = RowStreamSheet(ws_fields, eager=True)
+            write_field_info_to_sheet(ws_fields, fields)
+            ws_fields.flush()
+            print(f"    [{sheet_name}_fields] 시트 생성 완료")
+
+        self.sheet_count += 1
+
+    def save(self, output_path: str) -> bool:
+        """저장 (write-only 워크북은 한 번만 저장 가능)
+
+        Returns:
+            성공 여부
+        """
+        try:
+            self.wb.save(output_path)
+            print(f"\n저장 완료: {output_path}")
+            return True
+        except PermissionError:
+            # 파일이 열려 있는 경우 타임스탬프 추가 (시트 기록 전에 파일 열기에서 실패하므로 재시도 가능)
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            base, ext = os.path.splitext(output_path)
+            alt_path = f"{base}_{timestamp}{ext}"
+            self.wb.save(alt_path)
+            print(f"\n[주의] {output_path}이 열려 있어 다른 이름으로 저장:")
+            print(f"저장 완료: {alt_path}")
+            return True
+        except Exception as e:
+            print(f"\n[오류] 저장 실패: {e}")
+            return False
+
+
+def apply_to_excel_stream(extracted_data: Dict[str, Any],
+                          output_path: str,
+                          sheet_name: str = "표",
+                          config: ExportConfig = None) -> bool:
+    """추출된 데이터를 write-only 모드로 엑셀 파일에 저장 (apply_to_excel의 스트리밍 버전)"""
+    if not HAS_OPENPYXL:
+        print("[오류] openpyxl이 필요합니다: pip install openpyxl")
+        return False
+
+    writer = StreamingExcelWriter(config)
+    writer.add_table(extracted_data, sheet_name)
+    return writer.save(output_path)
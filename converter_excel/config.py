@@ -178,6 +178,7 @@ class OutputSuffixConfig:
 class OutputConfig:
     sheets: OutputSheetsConfig = dataclass_field(default_factory=OutputSheetsConfig)
     suffix: OutputSuffixConfig = dataclass_field(default_factory=OutputSuffixConfig)
+    streaming: bool = False     # write-only 모드로 저장 (큰 표/여러 표)
 
 
 @dataclass
@@ -350,6 +351,7 @@ def _dict_to_config(data: Dict[str, Any]) -> ExportConfig:
     # output
     if 'output' in data:
         o = data['output']
+        config.output.streaming = o.get('streaming', False)
 
         if 'sheets' in o:
             sh = o['sheets']
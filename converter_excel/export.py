@@ -198,6 +198,8 @@ def main():
                        help='출력 파일 경로')
     parser.add_argument('--sheet', '-s', type=str, default='표',
                        help='메인 시트 이름')
+    parser.add_argument('--stream', action='store_true',
+                       help='write-only 스트리밍 모드로 저장 (큰 표)')
 
     args = parser.parse_args()
 
@@ -208,6 +210,9 @@ def main():
     else:
         config = get_default_config()
 
+    if args.stream:
+        config.output.streaming = True
+
     # 변환 실행
     exporter = HwpToExcelExporter(config)
     exporter.export(args.output, args.sheet)
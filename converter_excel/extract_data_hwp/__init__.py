@@ -16,14 +16,23 @@ from .extract import (
     extract_fields_only,
 )
 from .page import PageMatchResult, extract_page_info
-from .cell import CellStyleData, CellMatchResult, extract_cell_style, get_cell_text
+from .cell import (
+    CellStyleData,
+    CellMatchResult,
+    extract_cell_style,
+    extract_cell_styles,
+    get_cell_text,
+    get_cell_texts,
+)
 from .field import (
     FieldInfo,
     generate_field_names,
     get_cell_bookmark,
+    build_bookmark_index,
     set_cell_field_names,
     find_left_header_cell,
     find_top_header_cell,
+    HeaderIndex,
     clean_text_for_field_name,
     generate_random_field_name,
 )
@@ -43,15 +52,19 @@ __all__ = [
     'CellStyleData',
     'CellMatchResult',
     'extract_cell_style',
+    'extract_cell_styles',
     'get_cell_text',
+    'get_cell_texts',
 
     # 필드 관련
     'FieldInfo',
     'generate_field_names',
     'get_cell_bookmark',
+    'build_bookmark_index',
     'set_cell_field_names',
     'find_left_header_cell',
     'find_top_header_cell',
+    'HeaderIndex',
     'clean_text_for_field_name',
     'generate_random_field_name',
 ]
@@ -5,8 +5,8 @@
 Excel/openpyxl 관련 코드는 포함하지 않습니다.
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, List, Tuple
+from dataclasses import dataclass, field, replace
+from typing import Optional, List, Tuple, Dict
 
 
 @dataclass
@@ -222,6 +222,49 @@ def extract_cell_style(hwp, list_id: int) -> CellStyleData:
     return style
 
 
+def extract_cell_styles(hwp, cell_ranges: Dict, tolerance: int = 50) -> Dict[int, CellStyleData]:
+    """표 전체 셀 스타일 일괄 추출 (같은 스타일은 한 번만 조회)
+
+    표를 HWPML로 한 번 내보내 셀별 BorderFill / 안 여백 / 첫 문단 ParaShape / 첫 글자 CharShape Id를
+    읽고, 같은 Id 조합의 셀 중 첫 셀에서만 extract_cell_style을 호출한 뒤 나머지 셀에 복사합니다.
+    HWPML을 읽을 수 없거나 주소/너비가 맞지 않는 셀은 셀마다 조회합니다.
+
+    Args:
+        hwp: HWP 객체
+        cell_ranges: list_id -> CellRange (CellPositionResult.cells)
+        tolerance: HWPML 셀 너비와 계산된 너비 비교 허용 오차 (HWPUNIT)
+
+    Returns:
+        list_id -> CellStyleData
+    """
+    from table.table_hwpml import read_table_hwpml
+
+    table = None
+    if cell_ranges:
+        hwp.SetPos(next(iter(cell_ranges)), 0, 0)
+        table = read_table_hwpml(hwp)
+    by_addr = table.by_addr() if table else {}
+
+    styles = {}
+    fetched = {}  # style_key -> 대표 셀에서 조회한 CellStyleData
+    for list_id, cell_range in cell_ranges.items():
+        cell = by_addr.get((cell_range.start_row, cell_range.start_col))
+        width = cell_range.end_x - cell_range.start_x
+        if cell is None or abs(cell.width - width) > tolerance:
+            styles[list_id] = extract_cell_style(hwp, list_id)
+            continue
+
+        base = fetched.get(cell.style_key)
+        if base is None:
+            base = extract_cell_style(hwp, list_id)
+            fetched[cell.style_key] = base
+            styles[list_id] = base
+        else:
+            styles[list_id] = replace(base, list_id=list_id)
+
+    return styles
+
+
 def get_cell_text(hwp, list_id: int) -> str:
     """셀 텍스트 추출 (SelectAll 사용)"""
     try:
@@ -245,6 +288,35 @@ def get_cell_text(hwp, list_id: int) -> str:
         return ""
 
 
+def get_cell_texts(hwp, cell_ranges: Dict, tolerance: int = 50) -> Dict[int, str]:
+    """표 전체 셀 텍스트 일괄 추출 (GetTextFile 1회)
+
+    표를 HWPML로 한 번 내보내 셀 경계로 나눈 뒤 list_id 순서에 맞춥니다.
+    셀 수/너비가 맞지 않으면 셀마다 get_cell_text로 추출합니다.
+
+    Args:
+        hwp: HWP 객체
+        cell_ranges: list_id -> CellRange (CellPositionResult.cells)
+        tolerance: 너비 비교 허용 오차 (HWPUNIT)
+
+    Returns:
+        list_id -> 텍스트 (get_cell_text와 같은 정리 규칙)
+    """
+    from table.table_hwpml import read_table_texts
+
+    if not cell_ranges:
+        return {}
+
+    hwp.SetPos(next(iter(cell_ranges)), 0, 0)
+    widths = {list_id: r.end_x - r.start_x for list_id, r in cell_ranges.items()}
+    texts = read_table_texts(hwp, widths, tolerance)
+    if texts is None:
+        return {list_id: get_cell_text(hwp, list_id) for list_id in cell_ranges}
+
+    return {list_id: text.strip().replace('\r\n', ' ').replace('\r', ' ').replace('\n', ' ')
+            for list_id, text in texts.items()}
+
+
 # ============================================================
 # 테스트
 # ============================================================
@@ -19,12 +19,15 @@ from .cell import (
     CellStyleData,
     CellMatchResult,
     extract_cell_style,
+    extract_cell_styles,
     get_cell_text,
+    get_cell_texts,
 )
 from .field import (
     FieldInfo,
     generate_field_names,
     get_cell_bookmark,
+    build_bookmark_index,
     find_left_header_cell,
     find_top_header_cell,
     clean_text_for_field_name,
@@ -137,9 +140,13 @@ def extract_hwp_data(
             row_heights_set = set()
             col_widths_set = set()
 
+            # 셀 스타일 일괄 추출 (같은 스타일은 한 번만 조회)
+            styles = extract_cell_styles(hwp, calc_result.cells, tolerance)
+            # 셀 텍스트 일괄 추출 (GetTextFile 1회)
+            texts = get_cell_texts(hwp, calc_result.cells, tolerance)
+
             for list_id, cell_range in calc_result.cells.items():
-                # 셀 스타일 추출
-                style = extract_cell_style(hwp, list_id)
+                style = styles[list_id]
 
                 # 위치 정보 설정
                 style.list_id = list_id
@@ -156,8 +163,7 @@ def extract_hwp_data(
                 style.width = cell_range.end_x - cell_range.start_x
                 style.height = cell_range.end_y - cell_range.start_y
 
-                # 텍스트 추출
-                style.text = get_cell_text(hwp, list_id)
+                style.text = texts[list_id]
 
                 cells_data.append(style)
 
@@ -296,11 +302,14 @@ __all__ = [
 
     # 셀 관련
     'extract_cell_style',
+    'extract_cell_styles',
     'get_cell_text',
+    'get_cell_texts',
 
     # 필드 관련
     'generate_field_names',
     'get_cell_bookmark',
+    'build_bookmark_index',
     'find_left_header_cell',
     'find_top_header_cell',
     'clean_text_for_field_name',
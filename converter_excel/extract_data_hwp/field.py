@@ -10,12 +10,15 @@ Excel/openpyxl 관련 코드는 포함하지 않습니다.
    - A: 좌측으로 가서 배경색 있는 셀 (조건: A의 높이 == 현재 셀의 높이)
    - B: 위쪽으로 가서 배경색 있는 셀 (조건: B의 너비 == 현재 셀의 너비)
 3. 랜덤 12자리 영문
+
+A/B 탐색은 HeaderIndex(배경색 셀의 행/열 구간 색인)로 셀마다 이진 탐색합니다.
 """
 
 import random
 import string
+from bisect import bisect_left
 from dataclasses import dataclass
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 
 
 @dataclass
@@ -41,16 +44,57 @@ def generate_random_field_name(length: int = 12) -> str:
     return ''.join(random.choices(string.ascii_lowercase, k=length))
 
 
-def get_cell_bookmark(hwp, list_id: int) -> Optional[str]:
+def build_bookmark_index(hwp) -> Dict[int, str]:
+    """문서 전체 책갈피를 한 번 순회해 list_id -> 책갈피 이름 색인 생성
+
+    같은 list_id에 책갈피가 여럿이면 HeadCtrl 순서상 첫 책갈피를 사용합니다
+    (get_cell_bookmark와 같은 결과).
+
+    Args:
+        hwp: HWP 객체
+
+    Returns:
+        {list_id: 책갈피 이름}
+    """
+    index = {}
+    try:
+        ctrl = hwp.HeadCtrl
+    except:
+        return index
+
+    while ctrl:
+        try:
+            # 책갈피 컨트롤 확인 (bokm: 일반 책갈피, %bmk: 블록 책갈피)
+            if ctrl.CtrlID in ('bokm', '%bmk'):
+                anchor = ctrl.GetAnchorPos(0)
+                if anchor:
+                    ctrl_list_id = anchor.Item("List")
+                    if ctrl_list_id not in index:
+                        props = ctrl.Properties
+                        name = props.Item("Name") if props else None
+                        if name:
+                            index[ctrl_list_id] = str(name)
+        except:
+            pass
+        ctrl = ctrl.Next
+
+    return index
+
+
+def get_cell_bookmark(hwp, list_id: int, bookmark_index: Dict[int, str] = None) -> Optional[str]:
     """셀 내부의 책갈피 이름 가져오기
 
     Args:
         hwp: HWP 객체
         list_id: 셀의 list_id
+        bookmark_index: build_bookmark_index() 결과 (있으면 컨트롤 순회 없이 조회)
 
     Returns:
         책갈피 이름 또는 None
     """
+    if bookmark_index is not None:
+        return bookmark_index.get(list_id)
+
     try:
         # 셀로 이동
         hwp.SetPos(list_id, 0, 0)
@@ -175,6 +219,68 @@ def find_top_header_cell(
     return None
 
 
+class HeaderIndex:
+    """머리글 후보(배경색 있는 셀) 색인
+
+    find_left_header_cell / find_top_header_cell과 같은 결과를 셀 목록 전체 순회 없이 찾습니다.
+    - 좌측 탐색: (덮는 행, 높이 버킷) -> [(col, -순서, 셀)] 정렬 목록
+    - 위쪽 탐색: (덮는 열, 너비 버킷) -> [(row, -순서, 셀)] 정렬 목록
+    버킷 크기는 tolerance + 1이므로 허용 오차 안의 셀은 인접 버킷 3개 안에 있습니다.
+    같은 col(row)이면 cells_data에서 앞선 셀이 우선입니다 (기존 안정 정렬과 동일).
+    """
+
+    def __init__(self, cells_data: List[Any], tolerance: int = 50):
+        self.tolerance = tolerance
+        self._bucket = max(1, tolerance + 1)
+        self._by_row: Dict[Tuple[int, int], List[tuple]] = {}
+        self._by_col: Dict[Tuple[int, int], List[tuple]] = {}
+
+        for order, c in enumerate(cells_data):
+            if not c.bg_color_rgb:
+                continue
+            height_bucket = c.height // self._bucket
+            width_bucket = c.width // self._bucket
+            for r in range(c.row, getattr(c, 'end_row', c.row) + 1):
+                self._by_row.setdefault((r, height_bucket), []).append((c.col, -order, c))
+            for col in range(c.col, getattr(c, 'end_col', c.col) + 1):
+                self._by_col.setdefault((col, width_bucket), []).append((c.row, -order, c))
+
+        for entries in self._by_row.values():
+            entries.sort(key=lambda e: e[:2])
+        for entries in self._by_col.values():
+            entries.sort(key=lambda e: e[:2])
+
+    def _search(self, index: Dict, lines: range, limit: int, size: int, attr: str) -> Optional[Any]:
+        """lines의 각 줄에서 위치 < limit, 크기 허용 오차 안인 셀 중 가장 가까운 셀"""
+        best = None
+        bucket = size // self._bucket
+        for line in lines:
+            for b in (bucket - 1, bucket, bucket + 1):
+                entries = index.get((line, b))
+                if not entries:
+                    continue
+                i = bisect_left(entries, (limit,)) - 1
+                while i >= 0:
+                    entry = entries[i]
+                    if best is not None and entry[:2] <= best[:2]:
+                        break
+                    if abs(getattr(entry[2], attr) - size) <= self.tolerance:
+                        best = entry
+                        break
+                    i -= 1
+        return best[2] if best else None
+
+    def find_left(self, current_cell: Any) -> Optional[Any]:
+        """find_left_header_cell과 같은 결과"""
+        rows = range(current_cell.row, getattr(current_cell, 'end_row', current_cell.row) + 1)
+        return self._search(self._by_row, rows, current_cell.col, current_cell.height, 'height')
+
+    def find_top(self, current_cell: Any) -> Optional[Any]:
+        """find_top_header_cell과 같은 결과"""
+        cols = range(current_cell.col, getattr(current_cell, 'end_col', current_cell.col) + 1)
+        return self._search(self._by_col, cols, current_cell.row, current_cell.width, 'width')
+
+
 def clean_text_for_field_name(text: str) -> str:
     """텍스트를 필드 이름으로 사용할 수 있게 정리
 
@@ -198,7 +304,8 @@ def clean_text_for_field_name(text: str) -> str:
 def generate_field_names(
     hwp,
     cells_data: List[Any],
-    tolerance: int = 50
+    tolerance: int = 50,
+    bookmark_index: Dict[int, str] = None
 ) -> List[FieldInfo]:
     """배경색이 없는 모든 셀에 대해 필드 이름 생성
 
@@ -206,12 +313,17 @@ def generate_field_names(
         hwp: HWP 객체
         cells_data: 모든 셀 데이터 리스트 (CellStyleData)
         tolerance: 크기 비교 허용 오차 (HWPUNIT)
+        bookmark_index: build_bookmark_index() 결과 (None이면 여기서 1회 생성)
 
     Returns:
         FieldInfo 리스트
     """
-    # list_id -> CellStyleData 매핑
-    cells_dict = {c.list_id: c for c in cells_data}
+    # 책갈피 색인 (문서당 컨트롤 순회 1회)
+    if bookmark_index is None:
+        bookmark_index = build_bookmark_index(hwp)
+
+    # 머리글 후보 색인 (표당 1회)
+    header_index = HeaderIndex(cells_data, tolerance)
 
     # 배경색 없는 셀 필터링
     empty_cells = [c for c in cells_data if not c.bg_color_rgb]
@@ -229,7 +341,7 @@ def generate_field_names(
         )
 
         # 1. 책갈피 확인
-        bookmark_name = get_cell_bookmark(hwp, cell.list_id)
+        bookmark_name = bookmark_index.get(cell.list_id)
         if bookmark_name:
             field_info.field_name = bookmark_name
             field_info.source = "bookmark"
@@ -237,8 +349,8 @@ def generate_field_names(
             continue
 
         # 2. A_B 패턴
-        a_cell = find_left_header_cell(cells_data, cells_dict, cell, tolerance)
-        b_cell = find_top_header_cell(cells_data, cells_dict, cell, tolerance)
+        a_cell = header_index.find_left(cell)
+        b_cell = header_index.find_top(cell)
 
         a_text = ""
         b_text = ""
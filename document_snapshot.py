@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+"""
+문서 스냅샷 - 문서 텍스트를 한 번 가져와 (list_id, para_id) 색인으로 읽기 전용 조회
+
+문단 범위, 줄 범위, 커서 위치의 문장/단어 번호, 헤딩 스캔처럼 텍스트만 읽는 조회가
+매번 커서를 옮겨 GetTextFile을 부르는 대신, 스냅샷을 한 번 만들고 메모리에서 답합니다.
+
+수집:
+- 리스트마다 문단 범위를 GetTextFile 한 번으로 내보냄 (표 등으로 줄 수가 맞지 않으면 문단별로)
+- 문단 끝 pos는 텍스트에서 계산 (컨트롤이 있는 문단과 리스트 마지막 문단만 실제 값 사용/지연 측정)
+- 줄 시작 pos는 레이아웃 정보라 처음 조회할 때 문단별로 측정해서 보관
+- 수집/측정 중 옮긴 커서는 항상 원래 위치로 복원
+
+버전:
+- version: 스냅샷을 (다시) 수집하거나 문단을 갱신할 때마다 1씩 증가
+- signature: 수집 시점의 (리스트별 마지막 문단/끝 pos, 페이지 수) - is_stale()로 현재 문서와 비교
+- 문서를 편집한 쪽에서 refresh_para(para_id) 또는 invalidate()로 알려주면 ensure_fresh()가 다시 수집
+
+사용법:
+    from document_snapshot import DocumentSnapshot
+    from hwp_query import get_para_range, get_cursor_index
+
+    snapshot = DocumentSnapshot(hwp)
+    snapshot.para(0, 12).text                  # 12번 문단 텍스트
+    get_para_range(hwp, snapshot=snapshot)     # GetPos 1회
+    get_cursor_index(hwp, snapshot=snapshot)   # GetPos 1회
+
+    hwp.HAction.Run("BreakPara")               # 편집 후
+    snapshot.invalidate()
+    snapshot.ensure_fresh()                    # 다시 수집 (version 증가)
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sentence_segmenter import export_paragraph_texts, split_sentences
+
+
+@dataclass
+class ParaText:
+    """스냅샷의 문단 하나"""
+    list_id: int
+    para_id: int
+    text: str
+    offset: int                               # 스냅샷 전체 텍스트(full_text)에서 문단 시작 위치
+    para_end: Optional[int] = None            # 문단 끝 pos (None이면 처음 조회할 때 측정)
+    line_starts: Optional[List[int]] = None   # 줄 시작 pos (None이면 처음 조회할 때 측정)
+    sentences: Optional[List[Dict]] = None    # split_sentences 결과 (처음 조회할 때 계산)
+
+
+def _text_end_pos(text: str) -> Optional[int]:
+    """텍스트로 문단 끝 pos 계산 (서로게이트 쌍 문자는 2, 컨트롤 문자가 있으면 None)"""
+    end = 0
+    for ch in text:
+        code = ord(ch)
+        if code < 0x20 and ch != '\t':
+            return None
+        end += 2 if code > 0xFFFF else 1
+    return end
+
+
+class DocumentSnapshot:
+    """문서 텍스트 스냅샷 + (list_id, para_id) 색인"""
+
+    def __init__(self, hwp, list_ids: Iterable[int] = (0,), build: bool = True):
+        """
+        Args:
+            hwp: 한글 인스턴스
+            list_ids: 수집할 리스트 (기본: 본문만, 셀은 add_list로 추가)
+            build: True면 바로 수집
+        """
+        self.hwp = hwp
+        self.list_ids: List[int] = list(dict.fromkeys(list_ids))
+        self.version = 0
+        self.signature: Optional[Tuple] = None
+        self.dirty = True
+        self.full_text = ""
+        self._paras: Dict[int, List[ParaText]] = {}
+        self._offsets: List[int] = []
+        self._offset_keys: List[Tuple[int, int]] = []
+        if build:
+            self.build()
+
+    # =========================================================================
+    # 수집 / 버전
+    # =========================================================================
+
+    @property
+    def stamp(self) -> Tuple[int, Optional[Tuple]]:
+        """(version, signature) - 저장해 두었다가 비교하면 스냅샷이 바뀌었는지 알 수 있음"""
+        return self.version, self.signature
+
+    def build(self):
+        """등록된 리스트 전체를 다시 수집"""
+        saved = self.hwp.GetPos()
+        try:
+            list_ends = {list_id: self._list_end(list_id) for list_id in self.list_ids}
+            ctrl_paras = self._ctrl_paras()
+            self._paras = {
+                list_id: self._read_list(list_id, list_ends[list_id], ctrl_paras)
+                for list_id in self.list_ids
+            }
+            self.signature = self._signature(list_ends)
+        finally:
+            self.hwp.SetPos(saved[0], saved[1], saved[2])
+        self._reindex()
+        self.dirty = False
+        self.version += 1
+
+    def add_list(self, list_id: int):
+        """리스트(셀 등)를 스냅샷에 추가 (이미 있으면 무시)"""
+        if list_id in self.list_ids:
+            return
+        self.list_ids.append(list_id)
+        self.build()
+
+    def read_signature(self) -> Tuple:
+        """현재 문서의 시그니처 (리스트별 (마지막 문단, 끝 pos), 페이지 수) - 커서 위치는 복원"""
+        saved = self.hwp.GetPos()
+        try:
+            list_ends = {list_id: self._list_end(list_id) for list_id in self.list_ids}
+        finally:
+            self.hwp.SetPos(saved[0], saved[1], saved[2])
+        return self._signature(list_ends)
+
+    def is_stale(self) -> bool:
+        """
+        스냅샷이 현재 문서와 다른지 (invalidate()되었거나 시그니처가 다름)
+
+        시그니처는 문단 수/마지막 문단 끝/페이지 수만 보므로 문단 안의 글자만 바뀐 편집은
+        감지하지 못합니다. 편집하는 쪽에서 refresh_para()/invalidate()를 함께 호출하세요.
+        """
+        return self.dirty or self.read_signature() != self.signature
+
+    def invalidate(self):
+        """스냅샷 전체를 무효화 (다음 ensure_fresh()에서 다시 수집)"""
+        self.dirty = True
+
+    def ensure_fresh(self, check: bool = True) -> bool:
+        """
+        오래된 스냅샷이면 다시 수집
+
+        Args:
+            check: True면 문서 시그니처까지 확인, False면 invalidate() 여부만 확인
+
+        Returns:
+            다시 수집했으면 True
+        """
+        if self.dirty or (check and self.read_signature() != self.signature):
+            self.build()
+            return True
+        return False
+
+    def invalidate_layout(self, from_para: int = 0, list_id: int = 0):
+        """
+        줄 시작 pos 캐시만 버림 (텍스트는 그대로인 편집 후: 자간/글자 크기 변경 등)
+
+        Args:
+            from_para: 이 문단부터 버림
+            list_id: 리스트 ID
+        """
+        for para in self._paras.get(list_id, [])[from_para:]:
+            para.line_starts = None
+        self.version += 1
+
+    def refresh_para(self, para_id: int, list_id: int = 0):
+        """
+        문단 하나만 다시 읽기 (문단 수가 그대로인 편집 후: 글자 수정, 자간/글자 크기 변경 등)
+
+        문단 수가 바뀌는 편집(문단 나누기/삭제)은 invalidate()를 사용하세요.
+        """
+        paras = self._paras.get(list_id)
+        if not paras or not 0 <= para_id < len(paras):
+            self.invalidate()
+            return
+        saved = self.hwp.GetPos()
+        try:
+            text, para_end = self._read_para(list_id, para_id)
+            list_ends = list(self.signature[0])
+            if para_id == len(paras) - 1:
+                list_ends[self.list_ids.index(list_id)] = (para_id, para_end)
+            # 자간/글자 크기 변경으로 페이지 수가 바뀌었을 수 있음
+            self.signature = tuple(list_ends), self.hwp.PageCount
+        finally:
+            self.hwp.SetPos(saved[0], saved[1], saved[2])
+        paras[para_id] = ParaText(list_id, para_id, text, 0, para_end)
+        self._reindex()
+        self.version += 1
+
+    def _signature(self, list_ends: Dict[int, Tuple[int, int]]) -> Tuple:
+        return tuple(list_ends[list_id] for list_id in self.list_ids), self.hwp.PageCount
+
+    def _list_end(self, list_id: int) -> Tuple[int, int]:
+        """리스트의 (마지막 문단, 문단 끝 pos)"""
+        self.hwp.SetPos(list_id, 0, 0)
+        self.hwp.HAction.Run("MoveListEnd")
+        pos = self.hwp.GetPos()
+        return pos[1], pos[2]
+
+    def _ctrl_paras(self) -> set:
+        """컨트롤(표, 그림, 구역 정의 등)이 있는 (list_id, para_id) - 텍스트로 문단 끝을 계산할 수 없음"""
+        paras = set()
+        ctrl = self.hwp.HeadCtrl
+        while ctrl:
+            try:
+                anchor = ctrl.GetAnchorPos(0)
+                paras.add((anchor.Item("List"), anchor.Item("Para")))
+            except Exception:
+                pass
+            ctrl = ctrl.Next
+        return paras
+
+    def _read_list(self, list_id: int, list_end: Tuple[int, int], ctrl_paras: set) -> List[ParaText]:
+        last_para, last_end = list_end
+        texts = export_paragraph_texts(self.hwp, 0, last_para, list_id)
+        if texts is None:
+            # 표 등으로 줄 수가 맞지 않음 → 문단별로 (끝 pos도 함께 측정)
+            paras = []
+            for para_id in range(last_para + 1):
+                text, para_end = self._read_para(list_id, para_id)
+                paras.append(ParaText(list_id, para_id, text, 0, para_end))
+            return paras
+
+        paras = []
+        for para_id, text in enumerate(texts):
+            if para_id == last_para:
+                para_end = last_end
+            elif (list_id, para_id) in ctrl_paras:
+                para_end = None
+            else:
+                para_end = _text_end_pos(text)
+            paras.append(ParaText(list_id, para_id, text, 0, para_end))
+        return paras
+
+    def _read_para(self, list_id: int, para_id: int) -> Tuple[str, int]:
+        """문단 하나의 (텍스트, 끝 pos) - 커서 복원은 호출하는 쪽에서"""
+        self.hwp.SetPos(list_id, para_id, 0)
+        self.hwp.HAction.Run("MoveParaEnd")
+        para_end = self.hwp.GetPos()[2]
+        self.hwp.SelectText(para_id, 0, para_id, para_end)
+        text = self.hwp.GetTextFile("TEXT", "saveblock") or ""
+        self.hwp.HAction.Run("Cancel")
+        return text.replace('\r\n', '').replace('\r', '').replace('\n', ''), para_end
+
+    def _reindex(self):
+        """문단 offset과 전체 텍스트 다시 계산 (리스트 순서대로, 문단 사이는 '\\n')"""
+        parts = []
+        self._offsets = []
+        self._offset_keys = []
+        offset = 0
+        for list_id in self.list_ids:
+            for para in self._paras.get(list_id, []):
+                para.offset = offset
+                self._offsets.append(offset)
+                self._offset_keys.append((list_id, para.para_id))
+                parts.append(para.text)
+                offset += len(para.text) + 1
+        self.full_text = "\n".join(parts)
+
+    # =========================================================================
+    # 조회 (메모리, 측정이 필요한 값만 처음 한 번 커서 이동 후 복원)
+    # =========================================================================
+
+    def paragraphs(self, list_id: int = 0) -> List[ParaText]:
+        """리스트의 문단 목록"""
+        return self._paras.get(list_id, [])
+
+    def para(self, list_id: int, para_id: int) -> Optional[ParaText]:
+        """(list_id, para_id) 문단 (스냅샷에 없으면 None)"""
+        paras = self._paras.get(list_id)
+        if paras is None or not 0 <= para_id < len(paras):
+            return None
+        return paras[para_id]
+
+    def text(self, list_id: int, para_id: int) -> Optional[str]:
+        """문단 텍스트"""
+        para = self.para(list_id, para_id)
+        return para.text if para else None
+
+    def locate(self, offset: int) -> Optional[Tuple[int, int, int]]:
+        """전체 텍스트 offset → (list_id, para_id, 문단 안 문자 인덱스)"""
+        if not self._offsets or not 0 <= offset <= len(self.full_text):
+            return None
+        i = bisect_right(self._offsets, offset) - 1
+        list_id, para_id = self._offset_keys[i]
+        return list_id, para_id, offset - self._offsets[i]
+
+    def para_end(self, list_id: int, para_id: int) -> Optional[int]:
+        """문단 끝 pos (모르면 측정해서 보관)"""
+        para = self.para(list_id, para_id)
+        if para is None:
+            return None
+        if para.para_end is None:
+            saved = self.hwp.GetPos()
+            try:
+                self.hwp.SetPos(list_id, para_id, 0)
+                self.hwp.HAction.Run("MoveParaEnd")
+                para.para_end = self.hwp.GetPos()[2]
+            finally:
+                self.hwp.SetPos(saved[0], saved[1], saved[2])
+        return para.para_end
+
+    def is_empty(self, list_id: int, para_id: int) -> Optional[bool]:
+        """빈 문단인지 (문단 끝 pos가 1 이하)"""
+        para_end = self.para_end(list_id, para_id)
+        return None if para_end is None else para_end <= 1
+
+    def line_starts(self, list_id: int, para_id: int) -> Optional[List[int]]:
+        """문단 내 줄 시작 pos 목록 (처음 조회할 때 MoveLineDown으로 측정해서 보관)"""
+        para = self.para(list_id, para_id)
+        if para is None:
+            return None
+        if para.line_starts is None:
+            para_end = self.para_end(list_id, para_id)
+            saved = self.hwp.GetPos()
+            try:
+                self.hwp.SetPos(list_id, para_id, 0)
+                line_starts = [0]
+                while True:
+                    self.hwp.HAction.Run("MoveLineDown")
+                    pos = self.hwp.GetPos()
+                    if pos[0] != list_id or pos[1] != para_id or pos[2] in line_starts:
+                        break
+                    line_starts.append(pos[2])
+                    if pos[2] >= para_end:
+                        break
+            finally:
+                self.hwp.SetPos(saved[0], saved[1], saved[2])
+            para.line_starts = sorted(line_starts)
+        return para.line_starts
+
+    def sentences(self, list_id: int, para_id: int) -> Optional[List[Dict]]:
+        """문단 문장 목록 (split_sentences 결과)"""
+        para = self.para(list_id, para_id)
+        if para is None:
+            return None
+        if para.sentences is None:
+            para.sentences = split_sentences(para.text)
+        return para.sentences
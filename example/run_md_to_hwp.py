@@ -56,21 +56,22 @@ def fix_all_pages_para(hwp, debug=False):
     total_pages = hwp.PageCount
     print(f"  전체 페이지 수: {total_pages}")
 
-    fixed_count = 0
-
-    for page in range(1, total_pages + 1):
-        def log_callback(msg):
-            if debug:
-                print(f"    {msg}")
+    def log_callback(msg):
+        print(f"    {msg}")
 
-        result = helper.fix_page(page, log_callback=log_callback if debug else None)
+    # 걸친 문단이 있는 페이지만 처리 (앞 페이지 편집으로 밀린 페이지는 다시 판정)
+    result = helper.fix_document(log_callback=log_callback if debug else None)
 
-        if result.get('success') and result.get('iterations', 0) > 0:
+    fixed_count = 0
+    for page_result in result['results']:
+        if page_result['success'] and page_result['iterations'] > 0:
             fixed_count += 1
-            print(f"  페이지 {page}: 걸침 해소 (반복 {result['iterations']}회)")
+            print(f"  페이지 {page_result['page']}: 걸침 해소 "
+                  f"(반복 {page_result['iterations']}회, {page_result['elapsed']:.1f}초)")
 
-    print(f"[걸친 문단 처리] 완료: {fixed_count}개 페이지 처리됨")
-    return {'pages': total_pages, 'fixed': fixed_count}
+    print(f"[걸친 문단 처리] 완료: {fixed_count}개 페이지 처리됨 "
+          f"(검사 {result['checked']}, 건너뜀 {result['skipped']}, {result['elapsed']:.1f}초)")
+    return {'pages': result['pages'], 'fixed': fixed_count}
 
 
 def render_section_content(hwp, section_content):
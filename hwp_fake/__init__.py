@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+가짜 HWP COM 백엔드 모듈
+
+한글(Windows) 없이 표/쪽 알고리즘을 실행하고 COM 호출 수를 측정하기 위한 패키지입니다.
+- document: 문서 모델 (문단, 표, 셀, 책갈피, 필드) 및 JSON 로더
+- backend: win32com 디스패치 객체를 흉내내는 FakeHwp
+- stats: 호출 횟수/시간 집계 (CallStats)
+- hwpml: GetTextFile("HWPML2X") 출력 생성
+
+사용 예시:
+    from hwp_fake import FakeHwp, load_document
+
+    hwp = FakeHwp(load_document("cell_adjacency.json"))
+    hwp.SetPos(2, 0, 0)
+    hwp.stats.print_summary()
+"""
+
+from hwp_fake.document import (
+    FakeDocument,
+    FakeList,
+    FakeParagraph,
+    FakeTable,
+    FakeCell,
+    FakeBookmark,
+    FakeField,
+    document_from_dict,
+    document_from_adjacency,
+    load_document,
+)
+from hwp_fake.backend import FakeHwp, FakeParameterSet, FakeItemSet, FakeCtrl
+from hwp_fake.stats import CallStats, DEFAULT_CALL_COST
+from hwp_fake.hwpml import HwpmlWriter, to_hwpml
+
+__all__ = [
+    # document
+    'FakeDocument', 'FakeList', 'FakeParagraph', 'FakeTable', 'FakeCell',
+    'FakeBookmark', 'FakeField',
+    'document_from_dict', 'document_from_adjacency', 'load_document',
+    # backend
+    'FakeHwp', 'FakeParameterSet', 'FakeItemSet', 'FakeCtrl',
+    # stats
+    'CallStats', 'DEFAULT_CALL_COST',
+    # hwpml
+    'HwpmlWriter', 'to_hwpml',
+]
@@ -0,0 +1,1094 @@
+# -*- coding: utf-8 -*-
+"""
+가짜 HWP COM 객체 (FakeHwp)
+
+win32com 디스패치 객체 대신 사용할 수 있는 프로세스 내 시뮬레이터입니다.
+프로젝트에서 쓰는 API 부분집합만 구현합니다.
+- GetPos / SetPos / MovePos / SetPosBySet / SelectText
+- HAction.Run / GetDefault / Execute, HParameterSet, CreateAction
+- CellShape / ParaShape / CharShape, KeyIndicator, GetTextFile (TEXT, HWPML2X), PageCount
+- HeadCtrl 체인, ParentCtrl, 필드 (GetFieldList, PutFieldText, ...)
+
+모든 호출은 CallStats에 횟수/시간이 기록됩니다.
+
+사용 예시:
+    from hwp_fake import FakeHwp, load_document
+
+    hwp = FakeHwp(load_document("cell_adjacency.json"))
+    hwp.SetPos(2, 0, 0)
+    info = TableInfo(hwp, scan_mode=SCAN_MODE_SINGLE)
+    info.collect_cells()
+    hwp.stats.print_summary()
+"""
+
+import functools
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from .document import (
+        FakeDocument, FakeList, FakeParagraph, FakeCell, FakeTable, FakeField,
+        CHAR_SHAPE_DEFAULTS, PARA_SHAPE_DEFAULTS, ITEM_ALIASES,
+    )
+    from .stats import CallStats, DEFAULT_CALL_COST
+    from .hwpml import to_hwpml
+except ImportError:
+    from document import (
+        FakeDocument, FakeList, FakeParagraph, FakeCell, FakeTable, FakeField,
+        CHAR_SHAPE_DEFAULTS, PARA_SHAPE_DEFAULTS, ITEM_ALIASES,
+    )
+    from stats import CallStats, DEFAULT_CALL_COST
+    from hwpml import to_hwpml
+
+
+# MovePos ID
+MOVE_MAIN = 0
+MOVE_CUR_LIST = 1
+MOVE_TOP_OF_FILE = 2
+MOVE_BOTTOM_OF_FILE = 3
+MOVE_TOP_OF_LIST = 4
+MOVE_BOTTOM_OF_LIST = 5
+MOVE_START_OF_PARA = 6
+MOVE_END_OF_PARA = 7
+MOVE_NEXT_PARA = 10
+MOVE_PREV_PARA = 11
+MOVE_NEXT_POS = 12
+MOVE_PREV_POS = 13
+MOVE_NEXT_LINE = 20
+MOVE_PREV_LINE = 21
+MOVE_START_OF_LINE = 22
+MOVE_END_OF_LINE = 23
+MOVE_PARENT_LIST = 24
+MOVE_LEFT_OF_CELL = 100
+MOVE_RIGHT_OF_CELL = 101
+MOVE_UP_OF_CELL = 102
+MOVE_DOWN_OF_CELL = 103
+MOVE_START_OF_CELL = 104
+MOVE_END_OF_CELL = 105
+MOVE_TOP_OF_CELL = 106
+MOVE_BOTTOM_OF_CELL = 107
+
+# 하위 파라미터셋으로 취급하는 항목 이름
+SUB_SET_NAMES = ('FillAttr', 'BorderFill', 'ShadowAttr', 'PageDef', 'TabDef', 'Cell')
+
+FIELD_SEPARATOR = '\x02'
+
+
+def _com(name: str = None):
+    """COM 메서드 호출 기록 데코레이터 (self._stats 사용)"""
+    def decorator(func):
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(self, *args):
+            start = time.perf_counter()
+            try:
+                return func(self, *args)
+            finally:
+                self._stats.record(label, time.perf_counter() - start, list(args))
+        return wrapper
+    return decorator
+
+
+def _com_property(name: str = None):
+    """COM 속성 조회 기록 (property + 호출 기록)"""
+    def decorator(func):
+        return property(_com(name or func.__name__)(func))
+    return decorator
+
+
+class FakeItemSet:
+    """Item(name)으로 값을 읽는 집합 (CellShape, ParaShape, GetAnchorPos 결과 등)"""
+
+    def __init__(self, stats: CallStats, set_id: str, items: Dict[str, Any]):
+        self._stats = stats
+        self.SetID = set_id
+        self._items = items
+
+    @_com('ItemSet.Item')
+    def Item(self, name: str):
+        if name in self._items:
+            return self._items[name]
+        return self._items.get(ITEM_ALIASES.get(name, name))
+
+    @_com('ItemSet.SetItem')
+    def SetItem(self, name: str, value):
+        self._items[name] = value
+
+    def ItemExist(self, name: str) -> bool:
+        return name in self._items
+
+
+class FakeParameterSet:
+    """HParameterSet.Hxxx 대응 (속성 접근 = 항목, HSet은 자기 자신)"""
+
+    def __init__(self, stats: CallStats, set_id: str, items: Dict[str, Any] = None):
+        object.__setattr__(self, '_stats', stats)
+        object.__setattr__(self, '_set_id', set_id)
+        object.__setattr__(self, '_items', dict(items or {}))
+
+    @property
+    def HSet(self):
+        return self
+
+    def __getattr__(self, name: str):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        self._stats.record(f'{self._set_id}.{name}', 0.0)
+        items = self._items
+        if name not in items:
+            if name in SUB_SET_NAMES:
+                items[name] = FakeParameterSet(self._stats, name)
+            else:
+                return 0
+        return items[name]
+
+    def __setattr__(self, name: str, value):
+        self._stats.record(f'{self._set_id}.{name}=', 0.0)
+        self._items[name] = value
+
+    def Item(self, name: str):
+        self._stats.record(f'{self._set_id}.Item', 0.0)
+        return self._items.get(name, self._items.get(ITEM_ALIASES.get(name, name)))
+
+    def SetItem(self, name: str, value):
+        self._stats.record(f'{self._set_id}.SetItem', 0.0)
+        self._items[name] = value
+
+    def CreateItemSet(self, name: str, set_id: str):
+        sub = FakeParameterSet(self._stats, set_id)
+        self._items[name] = sub
+        return sub
+
+    def ItemExist(self, name: str) -> bool:
+        return name in self._items
+
+    def Clear(self):
+        self._items.clear()
+
+    def items(self) -> Dict[str, Any]:
+        """설정된 항목 (하위 파라미터셋 제외)"""
+        return {k: v for k, v in self._items.items() if not isinstance(v, FakeParameterSet)}
+
+
+class FakeParameterSets:
+    """hwp.HParameterSet (HCharShape, HParaShape, HInsertText, ...)"""
+
+    def __init__(self, stats: CallStats):
+        self._stats = stats
+        self._sets: Dict[str, FakeParameterSet] = {}
+
+    def __getattr__(self, name: str):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        self._stats.record(f'HParameterSet.{name}', 0.0)
+        if name not in self._sets:
+            self._sets[name] = FakeParameterSet(self._stats, name)
+        return self._sets[name]
+
+
+class FakeHAction:
+    """hwp.HAction"""
+
+    def __init__(self, hwp: 'FakeHwp'):
+        self._hwp = hwp
+        self._stats = hwp._stats
+
+    def Run(self, action: str) -> bool:
+        start = time.perf_counter()
+        try:
+            return self._hwp._run(action)
+        finally:
+            self._stats.record(f'HAction.Run:{action}', time.perf_counter() - start)
+
+    def GetDefault(self, action: str, pset: FakeParameterSet) -> bool:
+        start = time.perf_counter()
+        try:
+            return self._hwp._get_default(action, pset)
+        finally:
+            self._stats.record(f'HAction.GetDefault:{action}', time.perf_counter() - start)
+
+    def Execute(self, action: str, pset: FakeParameterSet) -> bool:
+        start = time.perf_counter()
+        try:
+            return self._hwp._execute(action, pset)
+        finally:
+            self._stats.record(f'HAction.Execute:{action}', time.perf_counter() - start)
+
+
+class FakeAction:
+    """hwp.CreateAction(name) 결과"""
+
+    def __init__(self, hwp: 'FakeHwp', name: str):
+        self._hwp = hwp
+        self._stats = hwp._stats
+        self.ActID = name
+
+    @_com('Action.CreateSet')
+    def CreateSet(self):
+        return FakeParameterSet(self._stats, self.ActID)
+
+    @_com('Action.GetDefault')
+    def GetDefault(self, pset) -> bool:
+        return self._hwp._get_default(self.ActID, pset)
+
+    @_com('Action.Execute')
+    def Execute(self, pset) -> bool:
+        return self._hwp._execute(self.ActID, pset)
+
+    @_com('Action.Run')
+    def Run(self) -> bool:
+        return self._hwp._run(self.ActID)
+
+
+class FakeCtrl:
+    """HeadCtrl 체인의 컨트롤"""
+
+    def __init__(self, stats: CallStats, ctrl_id: str, anchor: Tuple[int, int, int],
+                 props: Dict[str, Any] = None, desc: str = "", table: FakeTable = None):
+        self._stats = stats
+        self._ctrl_id = ctrl_id
+        self._anchor = anchor
+        self._props = props or {}
+        self._desc = desc or ctrl_id
+        self._next: Optional['FakeCtrl'] = None
+        self._prev: Optional['FakeCtrl'] = None
+        self.table = table
+
+    @_com_property('Ctrl.CtrlID')
+    def CtrlID(self):
+        return self._ctrl_id
+
+    @_com_property('Ctrl.Next')
+    def Next(self):
+        return self._next
+
+    @_com_property('Ctrl.Prev')
+    def Prev(self):
+        return self._prev
+
+    @_com_property('Ctrl.UserDesc')
+    def UserDesc(self):
+        return self._desc
+
+    @_com_property('Ctrl.Properties')
+    def Properties(self):
+        return FakeItemSet(self._stats, self._ctrl_id, dict(self._props))
+
+    @_com('Ctrl.GetAnchorPos')
+    def GetAnchorPos(self, option: int = 0):
+        list_id, para, pos = self._anchor
+        return FakeItemSet(self._stats, 'ListParaPos', {'List': list_id, 'Para': para, 'Pos': pos})
+
+
+class _FakeWindow:
+    Visible = False
+
+
+class _FakeWindows:
+    def Item(self, index: int):
+        return _FakeWindow()
+
+
+class FakeHwp:
+    """가짜 한글 COM 객체"""
+
+    def __init__(self, document: FakeDocument = None, call_cost: float = DEFAULT_CALL_COST,
+                 trace: bool = False):
+        """
+        Args:
+            document: 문서 모델 (None이면 빈 문서)
+            call_cost: 실제 COM 호출 1회 추정 비용 (초, stats.virtual_time 계산용)
+            trace: True면 호출 순서(이름, 인자)를 stats.trace에 기록
+        """
+        self.doc = document or FakeDocument()
+        self._stats = CallStats(call_cost=call_cost, trace=[] if trace else None)
+        self._pos = (0, 0, 0)
+        self._anchor: Optional[Tuple[int, int, int]] = None
+        self._cell_row: Optional[int] = None   # rowspan 셀 안에서 현재 행 (MOVE_RIGHT 재방문용)
+        self._pending_shape: Optional[Dict[str, Any]] = None
+        self._selected_ctrl: Optional[FakeCtrl] = None
+        self._param_sets = FakeParameterSets(self._stats)
+        self._haction = FakeHAction(self)
+        self._ctrl_version = None
+        self._ctrl_head: Optional[FakeCtrl] = None
+        self._table_ctrls: Dict[int, FakeCtrl] = {}
+        self.XHwpWindows = _FakeWindows()
+
+    @property
+    def stats(self) -> CallStats:
+        return self._stats
+
+    # ==================================================================
+    # 내부 헬퍼
+    # ==================================================================
+
+    def _list(self, list_id: int = None) -> FakeList:
+        return self.doc.lists[self._pos[0] if list_id is None else list_id]
+
+    def _para(self) -> FakeParagraph:
+        return self._list().paragraphs[self._pos[1]]
+
+    def _cell(self, list_id: int = None) -> Optional[FakeCell]:
+        return self.doc.cell(self._pos[0] if list_id is None else list_id)
+
+    def _set(self, list_id: int, para: int, pos: int):
+        if list_id != self._pos[0]:
+            cell = self.doc.cell(list_id)
+            self._cell_row = cell.row if cell else None
+        self._pos = (list_id, para, pos)
+
+    def _move(self, list_id: int, para: int, pos: int, select: bool = False):
+        """커서 이동 (select=True면 선택 영역 확장)"""
+        if select:
+            if self._anchor is None:
+                self._anchor = self._pos
+        else:
+            self._anchor = None
+        self._set(list_id, para, pos)
+
+    def _selection(self) -> Optional[Tuple[Tuple[int, int], Tuple[int, int]]]:
+        """선택 영역 ((para, pos), (para, pos)) - 같은 list 안에서만"""
+        if self._anchor is None or self._anchor[0] != self._pos[0]:
+            return None
+        a = self._anchor[1:]
+        b = self._pos[1:]
+        if a == b:
+            return None
+        return (a, b) if a < b else (b, a)
+
+    def _iter_range(self, start: Tuple[int, int], end: Tuple[int, int]):
+        """선택 범위의 (para_id, char_index) 순회 (문단 경계를 넘으면 문단 끝 표시 포함)"""
+        paras = self._list().paragraphs
+        for p in range(start[0], end[0] + 1):
+            lo = start[1] if p == start[0] else 0
+            hi = end[1] if p == end[0] else paras[p].end_pos + 1
+            for i in range(lo, min(hi, paras[p].end_pos + 1)):
+                yield p, i
+
+    def _selected_text(self) -> str:
+        sel = self._selection()
+        if sel is None:
+            return ""
+        paras = self._list().paragraphs
+        out = []
+        for p, i in self._iter_range(*sel):
+            text = paras[p].text
+            out.append(text[i] if i < len(text) else "\r\n")
+        return "".join(out)
+
+    def _char_shape_at(self) -> Dict[str, Any]:
+        sel = self._selection()
+        para_id, pos = sel[0] if sel else self._pos[1:]
+        para = self._list().paragraphs[para_id]
+        if not sel and self._pending_shape is not None:
+            return self._pending_shape
+        if not sel and pos > 0:
+            pos -= 1
+        return para.chars[min(pos, para.end_pos)]
+
+    def _insert_text(self, text: str):
+        self._delete_selection()
+        lst = self._list()
+        shape = self._char_shape_at()
+        for i, chunk in enumerate(text.replace('\r\n', '\n').split('\n')):
+            if i > 0:
+                self._break_para()
+            _, para_id, pos = self._pos
+            para = lst.paragraphs[para_id]
+            para.text = para.text[:pos] + chunk + para.text[pos:]
+            para.chars[pos:pos] = [shape] * len(chunk)
+            self._pos = (lst.list_id, para_id, pos + len(chunk))
+        lst.touch()
+
+    def _break_para(self):
+        lst = self._list()
+        _, para_id, pos = self._pos
+        para = lst.paragraphs[para_id]
+        new = FakeParagraph(para.text[pos:], para.chars[pos:], dict(para.para_shape))
+        para.text = para.text[:pos]
+        para.chars = para.chars[:pos] + [para.chars[-1]]
+        lst.paragraphs.insert(para_id + 1, new)
+        self._shift_anchors(lst.list_id, para_id, 1)
+        self._pos = (lst.list_id, para_id + 1, 0)
+        lst.touch()
+
+    def _shift_anchors(self, list_id: int, after_para: int, delta: int):
+        """문단 추가/삭제 시 뒤쪽 표/책갈피 위치 보정"""
+        if list_id == 0:
+            for t in self.doc.tables:
+                if t.anchor_para > after_para:
+                    t.anchor_para += delta
+        for b in self.doc.bookmarks:
+            if b.list_id == list_id and b.para > after_para:
+                b.para += delta
+
+    def _delete_range(self, start: Tuple[int, int], end: Tuple[int, int]):
+        lst = self._list()
+        paras = lst.paragraphs
+        sp, spos = start
+        ep, epos = end
+        first = paras[sp]
+        last = paras[ep]
+        first.text = first.text[:spos] + last.text[epos:]
+        first.chars = first.chars[:spos] + last.chars[epos:]
+        if ep > sp:
+            del paras[sp + 1:ep + 1]
+            self._shift_anchors(lst.list_id, sp, -(ep - sp))
+        self._pos = (lst.list_id, sp, spos)
+        lst.touch()
+
+    def _delete_selection(self) -> bool:
+        sel = self._selection()
+        self._anchor = None
+        if sel is None:
+            return False
+        self._delete_range(*sel)
+        return True
+
+    def _line_move(self, direction: int, select: bool = False) -> bool:
+        """한 줄 위/아래 이동 (줄 안 글자 오프셋 유지)"""
+        list_id, para_id, pos = self._pos
+        lst = self._list()
+        lines = lst.lines(para_id)
+        idx = lst.line_index(para_id, pos)
+        offset = pos - lines[idx].start
+
+        target = None
+        if 0 <= idx + direction < len(lines):
+            target = (para_id, lines[idx + direction])
+        elif direction > 0 and para_id + 1 < len(lst.paragraphs):
+            target = (para_id + 1, lst.lines(para_id + 1)[0])
+        elif direction < 0 and para_id > 0:
+            target = (para_id - 1, lst.lines(para_id - 1)[-1])
+
+        if target is not None:
+            p, line = target
+            last_line = line is lst.lines(p)[-1]
+            limit = line.end if last_line else line.end - 1
+            self._move(list_id, p, min(line.start + offset, max(line.start, limit)), select)
+            return True
+
+        # list 경계: 셀이면 위/아래 셀 또는 표 밖으로
+        cell = self._cell()
+        if cell is None or select:
+            return False
+        table = cell.table
+        if direction > 0:
+            next_id = table.cell_at(cell.end_row + 1, cell.col)
+            if next_id is not None:
+                self._move(next_id, 0, 0)
+            else:
+                body = self.doc.body
+                para = min(table.anchor_para + 1, len(body.paragraphs) - 1)
+                self._move(0, para, 0)
+        else:
+            prev_id = table.cell_at(cell.row - 1, cell.col)
+            if prev_id is not None:
+                prev = self.doc.lists[prev_id]
+                self._move(prev_id, len(prev.paragraphs) - 1, 0)
+            else:
+                self._move(0, table.anchor_para, 0)
+        return True
+
+    def _char_move(self, direction: int, select: bool = False) -> bool:
+        list_id, para_id, pos = self._pos
+        lst = self._list()
+        para = lst.paragraphs[para_id]
+        if direction > 0:
+            if pos < para.end_pos:
+                self._move(list_id, para_id, pos + 1, select)
+            elif para_id + 1 < len(lst.paragraphs):
+                self._move(list_id, para_id + 1, 0, select)
+            else:
+                return False
+        else:
+            if pos > 0:
+                self._move(list_id, para_id, pos - 1, select)
+            elif para_id > 0:
+                self._move(list_id, para_id - 1, lst.paragraphs[para_id - 1].end_pos, select)
+            else:
+                return False
+        return True
+
+    def _cell_move(self, move_id: int) -> bool:
+        """셀 이동 (MovePos 100~107)"""
+        cell = self._cell()
+        if cell is None:
+            return False
+        table = cell.table
+        row = self._cell_row if self._cell_row is not None else cell.row
+        target_row = row
+
+        if move_id in (MOVE_RIGHT_OF_CELL, MOVE_LEFT_OF_CELL):
+            order = table.visit_order
+            idx = order.index((row, cell.list_id))
+            idx += 1 if move_id == MOVE_RIGHT_OF_CELL else -1
+            if not 0 <= idx < len(order):
+                return False
+            target_row, target = order[idx]
+        elif move_id == MOVE_UP_OF_CELL:
+            target = table.cell_at(cell.row - 1, cell.col)
+        elif move_id == MOVE_DOWN_OF_CELL:
+            target = table.cell_at(cell.end_row + 1, cell.col)
+        elif move_id == MOVE_START_OF_CELL:
+            target = table.row_cells(row)[0]
+        elif move_id == MOVE_END_OF_CELL:
+            target = table.row_cells(row)[-1]
+        elif move_id == MOVE_TOP_OF_CELL:
+            target = table.cell_at(0, cell.col)
+        else:
+            target = table.cell_at(table.row_count - 1, cell.col)
+
+        if target is None:
+            return False
+        self._move(target, 0, 0)
+        if move_id not in (MOVE_START_OF_CELL, MOVE_END_OF_CELL,
+                           MOVE_RIGHT_OF_CELL, MOVE_LEFT_OF_CELL):
+            target_row = table.cells[target].row
+        self._cell_row = target_row
+        return True
+
+    # ==================================================================
+    # 액션
+    # ==================================================================
+
+    def _run(self, action: str) -> bool:
+        select = action.startswith('MoveSel')
+        name = 'Move' + action[7:] if select else action
+        list_id, para_id, pos = self._pos
+        lst = self._list()
+        para = lst.paragraphs[para_id]
+
+        if name == 'MoveParaBegin':
+            self._move(list_id, para_id, 0, select)
+        elif name == 'MoveParaEnd':
+            self._move(list_id, para_id, para.end_pos, select)
+        elif name in ('MoveLineBegin', 'MoveLineEnd'):
+            lines = lst.lines(para_id)
+            idx = lst.line_index(para_id, pos)
+            line = lines[idx]
+            if name == 'MoveLineBegin':
+                target = line.start
+            else:
+                target = line.end if idx == len(lines) - 1 else line.end - 1
+            self._move(list_id, para_id, target, select)
+        elif name in ('MoveLineDown', 'MoveDown'):
+            return self._line_move(1, select)
+        elif name in ('MoveLineUp', 'MoveUp'):
+            return self._line_move(-1, select)
+        elif name == 'MoveRight':
+            return self._char_move(1, select)
+        elif name == 'MoveLeft':
+            return self._char_move(-1, select)
+        elif name == 'MoveNextParaBegin':
+            if para_id + 1 < len(lst.paragraphs):
+                self._move(list_id, para_id + 1, 0, select)
+            elif select:
+                self._move(list_id, para_id, para.end_pos, select)
+            else:
+                return False
+        elif name == 'MovePrevParaBegin':
+            if pos == 0 and para_id == 0:
+                return False
+            self._move(list_id, para_id - 1 if pos == 0 else para_id, 0, select)
+        elif name in ('MoveTopOfList', 'MoveListBegin'):
+            self._move(list_id, 0, 0, select)
+        elif name in ('MoveBottomOfList', 'MoveListEnd'):
+            last = len(lst.paragraphs) - 1
+            self._move(list_id, last, lst.paragraphs[last].end_pos, select)
+        elif name == 'MoveDocBegin':
+            self._move(0, 0, 0, select and list_id == 0)
+        elif name == 'MoveDocEnd':
+            body = self.doc.body
+            last = len(body.paragraphs) - 1
+            self._move(0, last, body.paragraphs[last].end_pos, select and list_id == 0)
+        elif action == 'SelectAll':
+            self._anchor = (list_id, 0, 0)
+            last = len(lst.paragraphs) - 1
+            self._pos = (list_id, last, lst.paragraphs[last].end_pos)
+        elif action == 'Cancel':
+            self._anchor = None
+            self._selected_ctrl = None
+        elif action == 'TableCellBlock':
+            if self._cell() is None:
+                return False
+            self._run('SelectAll')
+        elif action == 'MoveParentList':
+            cell = self._cell()
+            if cell is None:
+                return False
+            self._move(0, cell.table.anchor_para, 0)
+        elif action in ('SelectCtrlFront', 'SelectCtrlReverse'):
+            table = self.doc.table_at_para(para_id) if list_id == 0 else None
+            if table is None:
+                return False
+            self._ensure_ctrls()
+            self._selected_ctrl = self._table_ctrls[table.index]
+        elif action == 'ShapeObjTableSelCell':
+            ctrl = self._selected_ctrl
+            if ctrl is None or ctrl.table is None:
+                return False
+            first = ctrl.table.visit_order[0][1]
+            self._selected_ctrl = None
+            self._move(first, 0, 0)
+        elif action == 'BreakPara':
+            self._delete_selection()
+            self._break_para()
+        elif action == 'DeleteLine':
+            lines = lst.lines(para_id)
+            line = lines[lst.line_index(para_id, pos)]
+            if para.end_pos == 0 and len(lst.paragraphs) > 1:
+                end = (para_id + 1, 0) if para_id + 1 < len(lst.paragraphs) else None
+                if end is None:
+                    self._delete_range((para_id - 1, lst.paragraphs[para_id - 1].end_pos), (para_id, 0))
+                else:
+                    self._delete_range((para_id, 0), end)
+            else:
+                self._delete_range((para_id, line.start), (para_id, line.end))
+        elif action == 'Delete':
+            if not self._delete_selection():
+                if pos < para.end_pos:
+                    self._delete_range((para_id, pos), (para_id, pos + 1))
+                elif para_id + 1 < len(lst.paragraphs):
+                    self._delete_range((para_id, pos), (para_id + 1, 0))
+        elif action == 'DeleteBack':
+            if not self._delete_selection() and self._char_move(-1):
+                self._run('Delete')
+        elif action in ('CharShapeBold', 'CharShapeItalic'):
+            key = 'Bold' if action == 'CharShapeBold' else 'Italic'
+            current = self._char_shape_at().get(key, 0)
+            self._apply_char_shape({key: 0 if current else 1})
+        elif action == 'CharShapeNormal':
+            self._apply_char_shape({'Bold': 0, 'Italic': 0, 'UnderlineType': 0})
+        # 그 외 액션은 기록만 하고 성공으로 처리
+        return True
+
+    def _apply_char_shape(self, changes: Dict[str, Any]):
+        sel = self._selection()
+        lst = self._list()
+        if sel is None:
+            base = self._char_shape_at()
+            self._pending_shape = {**base, **changes}
+            para = self._para()
+            if para.end_pos == 0:
+                para.chars = [self._pending_shape]
+                lst.touch()
+            return
+        paras = lst.paragraphs
+        cache: Dict[int, Dict[str, Any]] = {}
+        for p, i in self._iter_range(*sel):
+            old = paras[p].chars[i]
+            new = cache.get(id(old))
+            if new is None:
+                new = {**old, **changes}
+                cache[id(old)] = new
+            paras[p].chars[i] = new
+        lst.touch()
+
+    def _get_default(self, action: str, pset: FakeParameterSet) -> bool:
+        pset.Clear()
+        items = pset._items
+        if action == 'CharShape':
+            items.update(self._char_shape_at())
+        elif action == 'ParagraphShape':
+            items.update(self._para().para_shape)
+        elif action == 'InsertText':
+            items['Text'] = ""
+        elif action == 'CellBorderFill':
+            cell = self._cell()
+            if cell is None:
+                return False
+            fill = FakeParameterSet(self._stats, 'FillAttr', {
+                'WinBrushFaceColor': cell.bg_color if cell.bg_color is not None else 4294967295,
+                'InsideMarginLeft': cell.margin[0],
+                'InsideMarginRight': cell.margin[1],
+                'InsideMarginTop': cell.margin[2],
+                'InsideMarginBottom': cell.margin[3],
+            })
+            items['FillAttr'] = fill
+            for side in ('Left', 'Right', 'Top', 'Bottom'):
+                items[f'BorderType{side}'] = cell.borders.get(f'type_{side.lower()}', 1)
+                items[f'BorderWidth{side}'] = cell.borders.get(f'width_{side.lower()}', 0)
+        elif action == 'TableCellBlock':
+            return self._cell() is not None
+        elif action == 'PageSetup':
+            items['PageDef'] = FakeParameterSet(self._stats, 'PageDef', {
+                'PaperWidth': 59528, 'PaperHeight': 84188,
+                'LeftMargin': 8504, 'RightMargin': 8504,
+                'TopMargin': 5668, 'BottomMargin': 4252,
+                'HeaderLen': 4252, 'FooterLen': 4252, 'Landscape': 0,
+            })
+        return True
+
+    def _execute(self, action: str, pset: FakeParameterSet) -> bool:
+        if action == 'CharShape':
+            self._apply_char_shape(pset.items())
+        elif action == 'ParagraphShape':
+            lst = self._list()
+            sel = self._selection()
+            first, last = (sel[0][0], sel[1][0]) if sel else (self._pos[1], self._pos[1])
+            for p in range(first, last + 1):
+                para = lst.paragraphs[p]
+                para.para_shape = {**para.para_shape, **pset.items()}
+            lst.touch()
+        elif action == 'InsertText':
+            self._insert_text(str(pset.items().get('Text', '')))
+        elif action == 'CellBorderFill':
+            cell = self._cell()
+            if cell is None:
+                return False
+            fill = pset._items.get('FillAttr')
+            if isinstance(fill, FakeParameterSet) and 'WinBrushFaceColor' in fill._items:
+                color = fill._items['WinBrushFaceColor']
+                cell.bg_color = None if color in (None, 4294967295) else color
+        elif action == 'TableCellBlock':
+            return self._cell() is not None
+        return True
+
+    # ==================================================================
+    # 컨트롤 체인
+    # ==================================================================
+
+    def _ensure_ctrls(self):
+        """HeadCtrl 체인 구성 (구역/단 정의 + 표 + 책갈피, 문서 순서)"""
+        key = (tuple((t.anchor_para, t.index) for t in self.doc.tables),
+               tuple((b.name, b.list_id, b.para, b.pos) for b in self.doc.bookmarks))
+        if self._ctrl_version == key:
+            return
+        entries = [((0, 0, -2), FakeCtrl(self._stats, 'secd', (0, 0, 0), desc='구역 정의')),
+                   ((0, 0, -1), FakeCtrl(self._stats, 'cold', (0, 0, 0), desc='단 정의'))]
+        self._table_ctrls = {}
+        for t in self.doc.tables:
+            ctrl = FakeCtrl(self._stats, 'tbl', (0, t.anchor_para, 0), {
+                'RowCount': t.row_count, 'ColCount': t.col_count,
+                'Width': t.width, 'Height': t.height,
+            }, desc='표', table=t)
+            self._table_ctrls[t.index] = ctrl
+            entries.append(((0, t.anchor_para, 0), ctrl))
+        for b in self.doc.bookmarks:
+            cell = self.doc.cell(b.list_id)
+            key_para = cell.table.anchor_para if cell else b.para
+            ctrl = FakeCtrl(self._stats, 'bokm', (b.list_id, b.para, b.pos),
+                            {'Name': b.name}, desc='책갈피')
+            entries.append(((0, key_para, 1 + b.list_id), ctrl))
+        entries.sort(key=lambda e: e[0])
+        ctrls = [c for _, c in entries]
+        for a, b in zip(ctrls, ctrls[1:]):
+            a._next = b
+            b._prev = a
+        self._ctrl_head = ctrls[0] if ctrls else None
+        self._ctrl_version = key
+
+    # ==================================================================
+    # COM API
+    # ==================================================================
+
+    @_com()
+    def GetPos(self) -> Tuple[int, int, int]:
+        return self._pos
+
+    @_com()
+    def SetPos(self, list_id: int, para: int, pos: int) -> bool:
+        lst = self.doc.lists.get(list_id)
+        if lst is None:
+            return False
+        para = max(0, min(para, len(lst.paragraphs) - 1))
+        pos = max(0, min(pos, lst.paragraphs[para].end_pos))
+        self._anchor = None
+        self._pending_shape = None
+        self._set(list_id, para, pos)
+        return True
+
+    @_com()
+    def SetPosBySet(self, item_set) -> bool:
+        return self.SetPos(item_set.Item("List"), item_set.Item("Para"), item_set.Item("Pos"))
+
+    @_com()
+    def GetPosBySet(self):
+        list_id, para, pos = self._pos
+        return FakeItemSet(self._stats, 'ListParaPos', {'List': list_id, 'Para': para, 'Pos': pos})
+
+    @_com()
+    def MovePos(self, move_id: int = 0, para: int = 0, pos: int = 0) -> bool:
+        list_id, cur_para, cur_pos = self._pos
+        lst = self._list()
+        self._pending_shape = None
+        if move_id >= MOVE_LEFT_OF_CELL:
+            return self._cell_move(move_id)
+        if move_id == MOVE_MAIN:
+            return self.SetPos(0, para, pos)
+        if move_id == MOVE_CUR_LIST:
+            return self.SetPos(list_id, para, pos)
+        if move_id == MOVE_TOP_OF_FILE:
+            self._move(0, 0, 0)
+        elif move_id == MOVE_BOTTOM_OF_FILE:
+            return self._run('MoveDocEnd')
+        elif move_id == MOVE_TOP_OF_LIST:
+            self._move(list_id, 0, 0)
+        elif move_id == MOVE_BOTTOM_OF_LIST:
+            return self._run('MoveBottomOfList')
+        elif move_id == MOVE_START_OF_PARA:
+            self._move(list_id, cur_para, 0)
+        elif move_id == MOVE_END_OF_PARA:
+            self._move(list_id, cur_para, lst.paragraphs[cur_para].end_pos)
+        elif move_id == MOVE_NEXT_PARA:
+            return self._run('MoveNextParaBegin')
+        elif move_id == MOVE_PREV_PARA:
+            return self._run('MovePrevParaBegin')
+        elif move_id == MOVE_NEXT_POS:
+            return self._char_move(1)
+        elif move_id == MOVE_PREV_POS:
+            return self._char_move(-1)
+        elif move_id == MOVE_NEXT_LINE:
+            return self._line_move(1)
+        elif move_id == MOVE_PREV_LINE:
+            return self._line_move(-1)
+        elif move_id == MOVE_START_OF_LINE:
+            return self._run('MoveLineBegin')
+        elif move_id == MOVE_END_OF_LINE:
+            return self._run('MoveLineEnd')
+        elif move_id == MOVE_PARENT_LIST:
+            return self._run('MoveParentList')
+        else:
+            return False
+        return True
+
+    @_com()
+    def SelectText(self, spara: int, spos: int, epara: int, epos: int) -> bool:
+        lst = self._list()
+        if not (0 <= spara < len(lst.paragraphs) and 0 <= epara < len(lst.paragraphs)):
+            return False
+        list_id = self._pos[0]
+        spos = min(spos, lst.paragraphs[spara].end_pos)
+        # 문단 끝을 넘는 끝 위치는 다음 문단 시작 (문단 끝 표시 포함)
+        if epos > lst.paragraphs[epara].end_pos and epara + 1 < len(lst.paragraphs):
+            epara, epos = epara + 1, 0
+        epos = min(epos, lst.paragraphs[epara].end_pos)
+        self._anchor = (list_id, spara, spos)
+        self._pos = (list_id, epara, epos)
+        return True
+
+    @_com()
+    def GetTextFile(self, fmt: str = "TEXT", option: str = "") -> str:
+        if fmt.upper().startswith("HWPML"):
+            if option != "saveblock":
+                return to_hwpml(self.doc)
+            ctrl = self._selected_ctrl
+            return to_hwpml(self.doc, ctrl.table) if ctrl is not None and ctrl.table else ""
+        if option == "saveblock":
+            return self._selected_text()
+        body = self.doc.body
+        out = []
+        for para_id, para in enumerate(body.paragraphs):
+            table = self.doc.table_at_para(para_id)
+            if table is not None:
+                for _, list_id in table.visit_order:
+                    out.append(self.doc.lists[list_id].text())
+            out.append(para.text)
+        return "\r\n".join(out)
+
+    @_com()
+    def KeyIndicator(self) -> Tuple:
+        """(BOOL, seccnt, secno, prnpageno, colno, line, pos, over, ctrlname)"""
+        list_id, para, pos = self._pos
+        page, line = self.doc.page_of(list_id, para, pos)
+        lst = self._list()
+        line_start = lst.lines(para)[lst.line_index(para, pos)].start
+        ctrlname = "표" if self._cell() is not None else ""
+        return (True, 1, 1, page, 1, line, pos - line_start + 1, 0, ctrlname)
+
+    @_com()
+    def CreateAction(self, name: str) -> FakeAction:
+        return FakeAction(self, name)
+
+    @_com_property()
+    def HAction(self) -> FakeHAction:
+        return self._haction
+
+    @_com_property()
+    def HParameterSet(self) -> FakeParameterSets:
+        return self._param_sets
+
+    @_com_property()
+    def CellShape(self) -> Optional[FakeItemSet]:
+        cell = self._cell()
+        if cell is None:
+            return None
+        table = cell.table
+        cell_set = FakeItemSet(self._stats, 'Cell', {
+            'Width': cell.width,
+            'Height': cell.height,
+            'LeftMargin': cell.margin[0],
+            'RightMargin': cell.margin[1],
+            'TopMargin': cell.margin[2],
+            'BottomMargin': cell.margin[3],
+            'Header': int(cell.header),
+            'Protected': int(cell.protected),
+        })
+        return FakeItemSet(self._stats, 'Table', {
+            'Cell': cell_set,
+            'RowCount': table.row_count,
+            'ColCount': table.col_count,
+        })
+
+    @_com_property()
+    def SelectionMode(self) -> int:
+        """선택 영역이 있으면 1, 없으면 0"""
+        return 0 if self._selection() is None else 1
+
+    @_com_property()
+    def CharShape(self) -> FakeItemSet:
+        return FakeItemSet(self._stats, 'CharShape', dict(self._char_shape_at()))
+
+    @_com_property()
+    def ParaShape(self) -> FakeItemSet:
+        return FakeItemSet(self._stats, 'ParaShape', dict(self._para().para_shape))
+
+    @_com_property()
+    def PageCount(self) -> int:
+        return self.doc.page_count
+
+    @_com_property()
+    def Path(self) -> str:
+        return self.doc.path
+
+    @_com_property()
+    def HeadCtrl(self) -> Optional[FakeCtrl]:
+        self._ensure_ctrls()
+        return self._ctrl_head
+
+    @_com_property()
+    def ParentCtrl(self) -> Optional[FakeCtrl]:
+        cell = self._cell()
+        if cell is None:
+            return None
+        self._ensure_ctrls()
+        return self._table_ctrls[cell.table.index]
+
+    @_com_property()
+    def CurSelectedCtrl(self) -> Optional[FakeCtrl]:
+        return self._selected_ctrl
+
+    # ------------------------------------------------------------------
+    # 필드
+    # ------------------------------------------------------------------
+
+    def _fields(self, name: str) -> List[FakeField]:
+        base = name.split('{{')[0]
+        matches = [f for f in self.doc.fields if f.name == base]
+        if '{{' in name:
+            index = int(name.split('{{')[1].rstrip('}'))
+            return matches[index:index + 1]
+        return matches
+
+    def _field_text(self, f: FakeField) -> str:
+        lst = self.doc.lists.get(f.list_id)
+        return lst.text() if lst else ""
+
+    @_com()
+    def GetFieldList(self, number: int = 0, option: int = 0) -> str:
+        kinds = {0: ('cell', 'clickhere'), 1: ('cell',), 2: ('clickhere',)}.get(option, ('cell', 'clickhere'))
+        names = []
+        counts: Dict[str, int] = {}
+        for f in self.doc.fields:
+            if f.kind not in kinds:
+                continue
+            if number:
+                idx = counts.get(f.name, 0)
+                counts[f.name] = idx + 1
+                names.append(f"{f.name}{{{{{idx}}}}}")
+            elif f.name not in names:
+                names.append(f.name)
+        return FIELD_SEPARATOR.join(names)
+
+    @_com()
+    def FieldExist(self, name: str) -> bool:
+        return bool(self._fields(name))
+
+    @_com()
+    def GetFieldText(self, names: str) -> str:
+        out = []
+        for name in names.split(FIELD_SEPARATOR):
+            fields = self._fields(name)
+            out.append(self._field_text(fields[0]) if fields else "")
+        return FIELD_SEPARATOR.join(out)
+
+    @_com()
+    def PutFieldText(self, names: str, texts: str) -> None:
+        for name, text in zip(names.split(FIELD_SEPARATOR), texts.split(FIELD_SEPARATOR)):
+            for f in self._fields(name):
+                lst = self.doc.lists.get(f.list_id)
+                if lst is None:
+                    continue
+                lst.paragraphs = [FakeParagraph(t, [dict(CHAR_SHAPE_DEFAULTS)])
+                                  for t in text.replace('\r\n', '\n').split('\n')]
+                lst.touch()
+
+    @_com()
+    def MoveToField(self, name: str, text: bool = True, start: bool = True,
+                    select: bool = False) -> bool:
+        fields = self._fields(name)
+        if not fields:
+            return False
+        f = fields[0]
+        lst = self.doc.lists[f.list_id]
+        if start:
+            self._move(f.list_id, 0, 0)
+        else:
+            last = len(lst.paragraphs) - 1
+            self._move(f.list_id, last, lst.paragraphs[last].end_pos)
+        if select:
+            self._run('SelectAll')
+        return True
+
+    @_com()
+    def CreateField(self, direction: str = "", memo: str = "", name: str = "") -> bool:
+        list_id, para, pos = self._pos
+        self.doc.fields.append(FakeField(name, list_id, 'clickhere', para, pos))
+        return True
+
+    @_com()
+    def SetCurFieldName(self, name: str, option: int = 0, direction: str = "",
+                        memo: str = "") -> bool:
+        list_id = self._pos[0]
+        kind = 'cell' if option == 1 else 'clickhere'
+        if kind == 'cell' and self._cell() is None:
+            return False
+        for f in self.doc.fields:
+            if f.list_id == list_id and f.kind == kind:
+                f.name = name
+                return True
+        self.doc.fields.append(FakeField(name, list_id, kind))
+        return True
+
+    @_com()
+    def GetCurFieldName(self, option: int = 0) -> str:
+        for f in self.doc.fields:
+            if f.list_id == self._pos[0]:
+                return f.name
+        return ""
+
+    @_com()
+    def RenameField(self, old_name: str, new_name: str) -> bool:
+        fields = self._fields(old_name)
+        for f in fields:
+            f.name = new_name
+        return bool(fields)
+
+    # ------------------------------------------------------------------
+    # 파일 (기록만)
+    # ------------------------------------------------------------------
+
+    @_com()
+    def RegisterModule(self, module_type: str = "", module_name: str = "") -> bool:
+        return True
+
+    @_com()
+    def Open(self, path: str, fmt: str = "", arg: str = "") -> bool:
+        self.doc.path = path
+        return True
+
+    @_com()
+    def SaveAs(self, path: str, fmt: str = "", arg: str = "") -> bool:
+        return True
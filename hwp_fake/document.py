@@ -0,0 +1,584 @@
+# -*- coding: utf-8 -*-
+"""
+가짜 HWP 문서 모델 (FakeDocument)
+
+FakeHwp가 조작하는 문서 구조입니다.
+- FakeList: list_id 단위 문단 목록 (0=본문, 2 이상=셀)
+- FakeParagraph: 문단 텍스트 + 글자별 CharShape + ParaShape
+- FakeTable / FakeCell: 표 격자 (row, col, rowspan, colspan) 및 셀 크기
+- 책갈피, 셀 필드
+
+줄 나눔/쪽 나눔은 글자 크기·자간·장평·줄간격으로 근사 계산합니다.
+(한글 폭 = 글자 크기, 영문/숫자/공백 폭 = 글자 크기의 절반)
+
+JSON 형식:
+    {
+        "page": {"width": 42520, "height": 65764},
+        "body": ["문단 텍스트", {"text": "...", "char_shape": {...}, "para_shape": {...}}],
+        "tables": [{
+            "para": 1,                      # 표가 놓인 본문 문단
+            "col_widths": [...], "row_heights": [...],
+            "cells": [{"row": 0, "col": 0, "rowspan": 1, "colspan": 1,
+                       "text": "...", "bg_color": 15461355, "list_id": 2}]
+        }],
+        "bookmarks": [{"name": "책갈피", "list_id": 2, "para": 0, "pos": 0}],
+        "fields": [{"name": "필드", "list_id": 3}]
+    }
+
+cell_adjacency.json처럼 {"max_row", "max_col", "nodes"} 형식이면
+이웃 정보로 격자를 복원합니다 (document_from_adjacency).
+"""
+
+import json
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# 기본 글자 모양 (HCharShape 항목명)
+CHAR_SHAPE_DEFAULTS = {
+    'FaceNameHangul': '함초롬바탕',
+    'FaceNameLatin': '함초롬바탕',
+    'Height': 1000,          # 10pt
+    'Bold': 0,
+    'Italic': 0,
+    'TextColor': 0,
+    'UnderlineType': 0,
+    'UnderlineColor': 0,
+    'StrikeOutType': 0,
+    'StrikeOutColor': 0,
+    'OutLineType': 0,
+    'ShadowType': 0,
+    'Emboss': 0,
+    'Engrave': 0,
+    'SuperScript': 0,
+    'SubScript': 0,
+    'SpacingHangul': 0,      # 자간 (%)
+    'SpacingLatin': 0,
+    'RatioHangul': 100,      # 장평 (%)
+    'RatioLatin': 100,
+}
+
+# 기본 문단 모양 (HParaShape 항목명)
+PARA_SHAPE_DEFAULTS = {
+    'AlignType': 0,          # 0=양쪽, 1=왼쪽, 2=오른쪽, 3=가운데, 4=배분, 5=나눔
+    'LineSpacingType': 0,
+    'LineSpacing': 160,      # 줄간격 (%)
+    'LeftMargin': 0,         # 1pt = 200
+    'RightMargin': 0,
+    'Indent': 0,
+    'PrevSpacing': 0,
+    'NextSpacing': 0,
+}
+
+# 이름이 다른 같은 항목 (CharShape/ParaShape Item 조회용)
+ITEM_ALIASES = {
+    'CharSpacing': 'SpacingHangul',
+    'Ratio': 'RatioHangul',
+    'Align': 'AlignType',
+}
+
+# A4, 여백 기본값 기준 본문 영역 (HWPUNIT)
+DEFAULT_PAGE_WIDTH = 42520
+DEFAULT_PAGE_HEIGHT = 65764
+
+# 셀 안 여백 기본값 (HWPUNIT)
+DEFAULT_CELL_MARGIN = (510, 510, 141, 141)  # left, right, top, bottom
+
+FIRST_CELL_LIST_ID = 2
+
+
+def char_width(ch: str, shape: Dict[str, Any]) -> float:
+    """글자 1개의 가로 폭 (HWPUNIT, 근사값)"""
+    height = shape.get('Height', 1000)
+    if ord(ch) < 0x1100:
+        # 영문/숫자/공백: 전각의 절반
+        base = height / 2
+        ratio = shape.get('RatioLatin', 100)
+        spacing = shape.get('SpacingLatin', 0)
+    else:
+        base = height
+        ratio = shape.get('RatioHangul', 100)
+        spacing = shape.get('SpacingHangul', 0)
+    width = base * ratio / 100
+    return width + base * spacing / 100
+
+
+@dataclass
+class FakeParagraph:
+    """문단 (글자별 CharShape, 마지막 항목은 문단 끝 표시)"""
+    text: str = ""
+    chars: List[Dict[str, Any]] = field(default_factory=list)
+    para_shape: Dict[str, Any] = field(default_factory=lambda: dict(PARA_SHAPE_DEFAULTS))
+
+    def __post_init__(self):
+        if len(self.chars) != len(self.text) + 1:
+            shape = self.chars[0] if self.chars else dict(CHAR_SHAPE_DEFAULTS)
+            self.chars = [shape] * (len(self.text) + 1)
+
+    @property
+    def end_pos(self) -> int:
+        return len(self.text)
+
+
+@dataclass
+class FakeLine:
+    """줄 배치 결과"""
+    para: int
+    start: int
+    end: int       # 다음 줄 시작 pos (마지막 줄은 문단 끝 pos)
+    height: int
+
+
+class FakeList:
+    """list_id 하나에 해당하는 문단 목록 (본문 또는 셀)"""
+
+    def __init__(self, list_id: int, width: int, paragraphs: List[FakeParagraph] = None,
+                 cell: 'FakeCell' = None):
+        self.list_id = list_id
+        self.width = width
+        self.paragraphs = paragraphs or [FakeParagraph()]
+        self.cell = cell
+        self.version = 0
+        self._layout_version = -1
+        self._lines: List[List[FakeLine]] = []
+
+    def touch(self):
+        """편집 후 호출 (줄 배치 재계산 표시)"""
+        self.version += 1
+
+    def lines(self, para_id: int) -> List[FakeLine]:
+        """문단의 줄 목록"""
+        self._ensure_layout()
+        return self._lines[para_id]
+
+    def line_index(self, para_id: int, pos: int) -> int:
+        """pos가 속한 줄 번호 (0부터)"""
+        lines = self.lines(para_id)
+        starts = [ln.start for ln in lines]
+        return max(0, bisect_right(starts, pos) - 1)
+
+    def text(self) -> str:
+        return "\r\n".join(p.text for p in self.paragraphs)
+
+    def _ensure_layout(self):
+        if self._layout_version == self.version:
+            return
+        self._lines = [self._layout_para(i, p) for i, p in enumerate(self.paragraphs)]
+        self._layout_version = self.version
+
+    def _layout_para(self, para_id: int, para: FakeParagraph) -> List[FakeLine]:
+        """글자 폭 누적으로 줄 나눔 (글자 단위, 줄 끝 공백은 넘침 허용)"""
+        ps = para.para_shape
+        # 문단 여백은 1pt = 200 단위이므로 HWPUNIT으로 환산
+        left = ps.get('LeftMargin', 0) / 2
+        right = ps.get('RightMargin', 0) / 2
+        indent = ps.get('Indent', 0) / 2
+        spacing = ps.get('LineSpacing', 160)
+
+        lines = []
+        start = 0
+        x = 0.0
+        max_h = 0
+
+        def avail(first: bool) -> float:
+            w = self.width - left - right
+            if first and indent > 0:
+                w -= indent
+            elif not first and indent < 0:
+                w += indent
+            return max(w, 1)
+
+        for i, ch in enumerate(para.text):
+            shape = para.chars[i]
+            w = char_width(ch, shape)
+            if i > start and ch != ' ' and x + w > avail(not lines):
+                lines.append(FakeLine(para_id, start, i, int(max_h * spacing / 100)))
+                start = i
+                x = 0.0
+                max_h = 0
+            x += w
+            max_h = max(max_h, shape.get('Height', 1000))
+
+        if max_h == 0:
+            max_h = para.chars[-1].get('Height', 1000)
+        lines.append(FakeLine(para_id, start, para.end_pos, int(max_h * spacing / 100)))
+        return lines
+
+
+@dataclass
+class FakeCell:
+    """표 셀"""
+    list_id: int
+    row: int
+    col: int
+    rowspan: int = 1
+    colspan: int = 1
+    width: int = 0
+    height: int = 0
+    bg_color: Optional[int] = None   # BGR (한글 COLORREF)
+    margin: Tuple[int, int, int, int] = DEFAULT_CELL_MARGIN
+    borders: Dict[str, int] = field(default_factory=dict)
+    header: bool = False
+    protected: bool = False
+    table: Optional['FakeTable'] = None
+
+    @property
+    def end_row(self) -> int:
+        return self.row + self.rowspan - 1
+
+    @property
+    def end_col(self) -> int:
+        return self.col + self.colspan - 1
+
+
+class FakeTable:
+    """표 (격자 + 행 우선 방문 순서)"""
+
+    def __init__(self, index: int, anchor_para: int, cells: List[FakeCell],
+                 col_widths: List[int], row_heights: List[int]):
+        self.index = index
+        self.anchor_list = 0
+        self.anchor_para = anchor_para
+        self.col_widths = col_widths
+        self.row_heights = row_heights
+        self.cells: Dict[int, FakeCell] = {c.list_id: c for c in cells}
+        self.grid: Dict[Tuple[int, int], int] = {}
+        for c in cells:
+            c.table = self
+            if not c.width:
+                c.width = sum(col_widths[c.col:c.col + c.colspan])
+            if not c.height:
+                c.height = sum(row_heights[c.row:c.row + c.rowspan])
+            for r in range(c.row, c.row + c.rowspan):
+                for col in range(c.col, c.col + c.colspan):
+                    self.grid[(r, col)] = c.list_id
+
+        # MOVE_RIGHT_OF_CELL 순서: 행마다 그 행을 덮는 셀을 왼쪽부터 (rowspan 셀은 재방문)
+        self.visit_order: List[Tuple[int, int]] = []  # (row, list_id)
+        for r in range(self.row_count):
+            seen = set()
+            for col in range(self.col_count):
+                list_id = self.grid.get((r, col))
+                if list_id is not None and list_id not in seen:
+                    seen.add(list_id)
+                    self.visit_order.append((r, list_id))
+
+    @property
+    def row_count(self) -> int:
+        return len(self.row_heights)
+
+    @property
+    def col_count(self) -> int:
+        return len(self.col_widths)
+
+    @property
+    def width(self) -> int:
+        return sum(self.col_widths)
+
+    @property
+    def height(self) -> int:
+        return sum(self.row_heights)
+
+    def cell_at(self, row: int, col: int) -> Optional[int]:
+        return self.grid.get((row, col))
+
+    def row_cells(self, row: int) -> List[int]:
+        return [lid for r, lid in self.visit_order if r == row]
+
+
+@dataclass
+class FakeBookmark:
+    """책갈피 컨트롤 위치"""
+    name: str
+    list_id: int
+    para: int = 0
+    pos: int = 0
+
+
+@dataclass
+class FakeField:
+    """필드 (셀 필드 또는 누름틀)"""
+    name: str
+    list_id: int
+    kind: str = 'cell'  # 'cell' 또는 'clickhere'
+    para: int = 0
+    pos: int = 0
+
+
+class FakeDocument:
+    """가짜 HWP 문서"""
+
+    def __init__(self, page_width: int = DEFAULT_PAGE_WIDTH,
+                 page_height: int = DEFAULT_PAGE_HEIGHT):
+        self.page_width = page_width
+        self.page_height = page_height
+        self.lists: Dict[int, FakeList] = {0: FakeList(0, page_width)}
+        self.tables: List[FakeTable] = []
+        self.bookmarks: List[FakeBookmark] = []
+        self.fields: List[FakeField] = []
+        self.path = ""
+        self._page_version = None
+        self._line_pages: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        self._page_count = 1
+
+    @property
+    def body(self) -> FakeList:
+        return self.lists[0]
+
+    def cell(self, list_id: int) -> Optional[FakeCell]:
+        lst = self.lists.get(list_id)
+        return lst.cell if lst else None
+
+    def table_at_para(self, para_id: int) -> Optional[FakeTable]:
+        for t in self.tables:
+            if t.anchor_para == para_id:
+                return t
+        return None
+
+    def add_table(self, anchor_para: int, cells: List[Dict], col_widths: List[int],
+                  row_heights: List[int], texts: Dict[int, str] = None) -> FakeTable:
+        """표 추가 (cells: row/col/rowspan/colspan/text/bg_color/list_id 딕셔너리)"""
+        next_id = max([FIRST_CELL_LIST_ID - 1] + [k for k in self.lists if k > 0]) + 1
+        fake_cells = []
+        for spec in sorted(cells, key=lambda c: (c['row'], c['col'])):
+            list_id = spec.get('list_id', next_id)
+            next_id = max(next_id, list_id) + 1
+            cell = FakeCell(
+                list_id=list_id,
+                row=spec['row'],
+                col=spec['col'],
+                rowspan=spec.get('rowspan', 1),
+                colspan=spec.get('colspan', 1),
+                width=spec.get('width', 0),
+                height=spec.get('height', 0),
+                bg_color=spec.get('bg_color'),
+                borders=dict(spec.get('borders', {})),
+                header=bool(spec.get('header', False)),
+            )
+            fake_cells.append((cell, spec))
+
+        table = FakeTable(len(self.tables), anchor_para, [c for c, _ in fake_cells],
+                          col_widths, row_heights)
+        for cell, spec in fake_cells:
+            inner = cell.width - cell.margin[0] - cell.margin[1]
+            paras = [_make_para(p) for p in _split_paras(spec.get('text', ''))]
+            self.lists[cell.list_id] = FakeList(cell.list_id, inner, paras, cell)
+
+        while len(self.body.paragraphs) <= anchor_para:
+            self.body.paragraphs.append(FakeParagraph())
+        self.tables.append(table)
+        self.tables.sort(key=lambda t: t.anchor_para)
+        for i, t in enumerate(self.tables):
+            t.index = i
+        self.body.touch()
+        return table
+
+    # ------------------------------------------------------------------
+    # 쪽 배치
+    # ------------------------------------------------------------------
+
+    def _layout_key(self) -> Tuple:
+        return tuple((k, v.version) for k, v in self.lists.items())
+
+    def _ensure_pages(self):
+        key = self._layout_key()
+        if self._page_version == key:
+            return
+        self._line_pages.clear()
+        page, y, line_no = 1, 0, 0
+        body = self.body
+        for para_id in range(len(body.paragraphs)):
+            table = self.table_at_para(para_id)
+            for i, line in enumerate(body.lines(para_id)):
+                h = line.height
+                if i == 0 and table:
+                    h += table.height
+                if y > 0 and y + h > self.page_height:
+                    page += 1
+                    y = 0
+                    line_no = 0
+                y += h
+                line_no += 1
+                self._line_pages[(para_id, i)] = (page, line_no)
+        self._page_count = page
+        self._page_version = key
+
+    @property
+    def page_count(self) -> int:
+        self._ensure_pages()
+        return self._page_count
+
+    def page_of(self, list_id: int, para_id: int, pos: int) -> Tuple[int, int]:
+        """(쪽 번호, 쪽 안 줄 번호) - 1부터, 셀은 표가 놓인 줄 기준"""
+        self._ensure_pages()
+        cell = self.cell(list_id)
+        if cell is not None:
+            page, _ = self._line_pages.get((cell.table.anchor_para, 0), (1, 1))
+            return page, self.lists[list_id].line_index(para_id, pos) + 1
+        line = self.body.line_index(para_id, pos)
+        return self._line_pages.get((para_id, line), (1, 1))
+
+    # ------------------------------------------------------------------
+    # 직렬화
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> Dict:
+        """JSON 직렬화용 딕셔너리 (load_document로 다시 읽을 수 있음)"""
+        tables = []
+        for t in self.tables:
+            cells = []
+            for c in t.cells.values():
+                spec = {'list_id': c.list_id, 'row': c.row, 'col': c.col,
+                        'rowspan': c.rowspan, 'colspan': c.colspan,
+                        'text': self.lists[c.list_id].text()}
+                if c.bg_color is not None:
+                    spec['bg_color'] = c.bg_color
+                cells.append(spec)
+            tables.append({'para': t.anchor_para, 'col_widths': t.col_widths,
+                           'row_heights': t.row_heights, 'cells': cells})
+        return {
+            'page': {'width': self.page_width, 'height': self.page_height},
+            'body': [_para_to_dict(p) for p in self.body.paragraphs],
+            'tables': tables,
+            'bookmarks': [vars(b) for b in self.bookmarks],
+            'fields': [vars(f) for f in self.fields],
+        }
+
+    def save(self, path: str):
+        """현재 문서 상태를 JSON으로 저장"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+
+def _split_paras(text: str) -> List[str]:
+    return text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+
+
+def _make_para(spec: Any) -> FakeParagraph:
+    """문자열 또는 {"text", "char_shape", "para_shape"} 딕셔너리로 문단 생성"""
+    if isinstance(spec, str):
+        return FakeParagraph(spec)
+    char_shape = dict(CHAR_SHAPE_DEFAULTS)
+    char_shape.update(spec.get('char_shape', {}))
+    para_shape = dict(PARA_SHAPE_DEFAULTS)
+    para_shape.update(spec.get('para_shape', {}))
+    return FakeParagraph(spec.get('text', ''), [char_shape], para_shape)
+
+
+def _para_to_dict(para: FakeParagraph) -> Dict:
+    return {'text': para.text, 'char_shape': para.chars[0], 'para_shape': para.para_shape}
+
+
+def document_from_dict(data: Dict) -> FakeDocument:
+    """JSON 문서 모델로 FakeDocument 생성"""
+    page = data.get('page', {})
+    doc = FakeDocument(page.get('width', DEFAULT_PAGE_WIDTH),
+                       page.get('height', DEFAULT_PAGE_HEIGHT))
+    body = data.get('body') or [""]
+    doc.body.paragraphs = [_make_para(p) for p in body]
+    for t in data.get('tables', []):
+        doc.add_table(t.get('para', 0), t['cells'], t['col_widths'], t['row_heights'])
+    for b in data.get('bookmarks', []):
+        doc.bookmarks.append(FakeBookmark(**b))
+    for f in data.get('fields', []):
+        doc.fields.append(FakeField(**f))
+    return doc
+
+
+def document_from_adjacency(data: Dict, col_width: int = 3000,
+                            row_height: int = 1000) -> FakeDocument:
+    """
+    셀 이웃 정보({"max_row", "max_col", "nodes"})로 표 1개짜리 문서 생성
+
+    nodes의 row는 셀의 시작 행, up/down/left/right는 MovePos로 수집한 이웃입니다.
+    1. 아래 이웃의 시작 행으로 셀의 끝 행 결정
+    2. 같은 행 범위의 좌우 이웃끼리 경계선(x)을 합치고 (col 0 셀로의 이동은 행 넘김)
+    3. 위아래 이웃은 x 범위가 겹친다는 제약으로 경계선 순서를 정해 열 번호 부여
+    """
+    nodes = {int(k): v for k, v in data['nodes'].items()}
+    row_count = data['max_row'] + 1
+
+    top = {k: v['row'] for k, v in nodes.items()}
+    bottom = {}
+    for k, v in nodes.items():
+        below = [top[d] for d in v['down'] if top[d] > top[k]]
+        bottom[k] = min(below) if below else row_count
+
+    def same_rows(a: int, b: int) -> bool:
+        return top[a] < bottom[b] and top[b] < bottom[a]
+
+    parent: Dict[Any, Any] = {}
+
+    def find(x):
+        parent.setdefault(x, x)
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(a, b):
+        parent[find(a)] = find(b)
+
+    for k, v in nodes.items():
+        has_left = False
+        has_right = False
+        for n in v['right']:
+            if same_rows(k, n) and nodes[n]['col'] != 0:
+                union(('R', k), ('L', n))
+                has_right = True
+        for n in v['left']:
+            if same_rows(k, n) and v['col'] != 0:
+                union(('L', k), ('R', n))
+                has_left = True
+        if not has_left:
+            union(('L', k), 'LEFT')
+        if not has_right:
+            union(('R', k), 'RIGHT')
+
+    # 경계선 사이 최소 간격 제약 (a + 1 <= b)
+    constraints = []
+    for k, v in nodes.items():
+        constraints.append((find(('L', k)), find(('R', k))))
+        for n in v['up'] + v['down']:
+            constraints.append((find(('L', n)), find(('R', k))))
+            constraints.append((find(('L', k)), find(('R', n))))
+        constraints.append((find(('R', k)), find('RIGHT')))
+
+    x = {edge: 0 for pair in constraints for edge in pair}
+    for _ in range(len(x)):
+        changed = False
+        for a, b in constraints:
+            if a != b and x[a] + 1 > x[b]:
+                x[b] = x[a] + 1
+                changed = True
+        if not changed:
+            break
+
+    columns = sorted(set(x.values()))
+    col_index = {v: i for i, v in enumerate(columns)}
+    # 시작하는 셀이 없는 행은 경계가 없으므로 제외
+    rows = sorted(set(top.values()) | {row_count})
+    row_index = {v: i for i, v in enumerate(rows)}
+    cells = []
+    for k in sorted(nodes):
+        c0 = col_index[x[find(('L', k))]]
+        c1 = col_index[x[find(('R', k))]]
+        r0 = row_index[top[k]]
+        r1 = row_index[bottom[k]]
+        cells.append({'list_id': k, 'row': r0, 'col': c0,
+                      'rowspan': r1 - r0, 'colspan': c1 - c0, 'text': ""})
+
+    doc = FakeDocument()
+    doc.body.paragraphs = [FakeParagraph(), FakeParagraph()]
+    doc.add_table(0, cells, [col_width] * (len(columns) - 1), [row_height] * (len(rows) - 1))
+    return doc
+
+
+def load_document(path: str) -> FakeDocument:
+    """JSON 파일로 FakeDocument 생성 (문서 모델 또는 셀 이웃 형식)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    doc = document_from_adjacency(data) if 'nodes' in data else document_from_dict(data)
+    doc.path = path
+    return doc
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+가짜 HWPML 내보내기 (GetTextFile("HWPML2X", ...))
+
+FakeDocument를 한글 HWPML 2.x 형식의 XML 문자열로 변환합니다.
+실제 한글과 같은 요소 이름/속성을 쓰되, 프로젝트에서 읽는 부분만 채웁니다.
+- HEAD/MAPPINGTABLE: BORDERFILLLIST, CHARSHAPELIST, PARASHAPELIST (내용이 같으면 같은 Id)
+- BODY/SECTION/P/TEXT/CHAR, TABLE/ROW/CELL(ColAddr, RowAddr, BorderFill, ...)/PARALIST
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+from xml.sax.saxutils import escape
+
+try:
+    from .document import FakeDocument, FakeList, FakeParagraph, FakeTable, FakeCell
+except ImportError:
+    from document import FakeDocument, FakeList, FakeParagraph, FakeTable, FakeCell
+
+
+class _IdTable:
+    """내용이 같은 모양에 같은 Id 부여"""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.items: List[Dict[str, Any]] = []
+
+    def get(self, shape: Dict[str, Any]) -> int:
+        key = json.dumps(shape, sort_keys=True, ensure_ascii=False)
+        if key not in self.ids:
+            self.ids[key] = len(self.items)
+            self.items.append(shape)
+        return self.ids[key]
+
+
+class HwpmlWriter:
+    """FakeDocument → HWPML 문자열"""
+
+    def __init__(self, doc: FakeDocument):
+        self.doc = doc
+        self.char_shapes = _IdTable()
+        self.para_shapes = _IdTable()
+        self.border_fills = _IdTable()
+
+    # ------------------------------------------------------------------
+    # 본문
+    # ------------------------------------------------------------------
+
+    def _text_runs(self, para: FakeParagraph) -> str:
+        """같은 CharShape가 이어지는 글자를 TEXT 하나로"""
+        text = para.text
+        if not text:
+            return f'<TEXT CharShape="{self.char_shapes.get(para.chars[0])}"/>'
+        runs = []
+        start = 0
+        for i in range(1, len(text) + 1):
+            if i == len(text) or para.chars[i] != para.chars[start]:
+                shape_id = self.char_shapes.get(para.chars[start])
+                runs.append(f'<TEXT CharShape="{shape_id}"><CHAR>{escape(text[start:i])}</CHAR></TEXT>')
+                start = i
+        return "".join(runs)
+
+    def _para(self, para: FakeParagraph, inner: str = "") -> str:
+        shape_id = self.para_shapes.get(para.para_shape)
+        return f'<P ParaShape="{shape_id}" Style="0">{inner}{self._text_runs(para)}</P>'
+
+    def _paralist(self, lst: FakeList) -> str:
+        paras = "".join(self._para(p) for p in lst.paragraphs)
+        return f'<PARALIST LineWrap="Break" LinkListID="0" LinkListIDNext="0" ' \
+               f'TextDirection="0" VertAlign="Center">{paras}</PARALIST>'
+
+    def _cell(self, cell: FakeCell) -> str:
+        fill_id = self.border_fills.get({
+            'bg_color': cell.bg_color,
+            'borders': dict(sorted(cell.borders.items())),
+        })
+        left, right, top, bottom = cell.margin
+        return (f'<CELL BorderFill="{fill_id}" ColAddr="{cell.col}" ColSpan="{cell.colspan}" '
+                f'Dirty="false" Editable="false" HasMargin="false" '
+                f'Header="{str(cell.header).lower()}" Height="{cell.height}" '
+                f'Protect="{str(cell.protected).lower()}" RowAddr="{cell.row}" '
+                f'RowSpan="{cell.rowspan}" Width="{cell.width}">'
+                f'<CELLMARGIN Bottom="{bottom}" Left="{left}" Right="{right}" Top="{top}"/>'
+                f'{self._paralist(self.doc.lists[cell.list_id])}</CELL>')
+
+    def table(self, table: FakeTable) -> str:
+        rows = []
+        for r in range(table.row_count):
+            cells = sorted((c for c in table.cells.values() if c.row == r), key=lambda c: c.col)
+            rows.append("<ROW>" + "".join(self._cell(c) for c in cells) + "</ROW>")
+        return (f'<TABLE BorderFill="0" CellSpacing="0" ColCount="{table.col_count}" '
+                f'PageBreak="Cell" RepeatHeader="true" RowCount="{table.row_count}">'
+                f'<SHAPEOBJECT InstId="{table.index}" TextWrap="TopAndBottom" TreatAsChar="false">'
+                f'<SIZE Height="{table.height}" Width="{table.width}"/></SHAPEOBJECT>'
+                + "".join(rows) + '</TABLE>')
+
+    # ------------------------------------------------------------------
+    # 헤더 / 문서
+    # ------------------------------------------------------------------
+
+    def _head(self) -> str:
+        fills = []
+        for i, f in enumerate(self.border_fills.items):
+            color = f['bg_color'] if f['bg_color'] is not None else 4294967295
+            fills.append(f'<BORDERFILL Id="{i}"><FILLBRUSH><WINDOWBRUSH FaceColor="{color}"/>'
+                         f'</FILLBRUSH></BORDERFILL>')
+        chars = [f'<CHARSHAPE Height="{s.get("Height", 1000)}" Id="{i}" '
+                 f'TextColor="{s.get("TextColor", 0)}"/>'
+                 for i, s in enumerate(self.char_shapes.items)]
+        paras = [f'<PARASHAPE Align="{s.get("AlignType", 0)}" Id="{i}"/>'
+                 for i, s in enumerate(self.para_shapes.items)]
+        return ('<HEAD SecCnt="1"><MAPPINGTABLE>'
+                f'<BORDERFILLLIST Count="{len(fills)}">{"".join(fills)}</BORDERFILLLIST>'
+                f'<CHARSHAPELIST Count="{len(chars)}">{"".join(chars)}</CHARSHAPELIST>'
+                f'<PARASHAPELIST Count="{len(paras)}">{"".join(paras)}</PARASHAPELIST>'
+                '</MAPPINGTABLE></HEAD>')
+
+    def _wrap(self, body: str) -> str:
+        # 본문을 먼저 만들어야 HEAD의 모양 목록이 채워짐
+        return ('<?xml version="1.0" encoding="UTF-16" standalone="no" ?>'
+                '<HWPML Style="embed" SubVersion="8.0.0.0" Version="2.8">'
+                f'{self._head()}<BODY><SECTION Id="0">{body}</SECTION></BODY><TAIL/></HWPML>')
+
+    def document(self, table: Optional[FakeTable] = None) -> str:
+        """문서 전체 (table을 주면 그 표만 담은 블록)"""
+        if table is not None:
+            anchor = self.doc.body.paragraphs[table.anchor_para]
+            body = self._para_with_table(anchor, table)
+            return self._wrap(body)
+
+        out = []
+        for para_id, para in enumerate(self.doc.body.paragraphs):
+            table = self.doc.table_at_para(para_id)
+            out.append(self._para_with_table(para, table) if table else self._para(para))
+        return self._wrap("".join(out))
+
+    def _para_with_table(self, para: FakeParagraph, table: FakeTable) -> str:
+        shape_id = self.char_shapes.get(para.chars[0])
+        return self._para(para, f'<TEXT CharShape="{shape_id}">{self.table(table)}</TEXT>')
+
+
+def to_hwpml(doc: FakeDocument, table: Optional[FakeTable] = None) -> str:
+    """FakeDocument(또는 표 하나)를 HWPML 문자열로 변환"""
+    return HwpmlWriter(doc).document(table)
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+가짜 HWP 호출 통계 (CallStats)
+
+FakeHwp의 모든 COM 대응 호출(메서드/속성)을 이름별로 횟수와 소요 시간을 기록합니다.
+실제 COM 호출은 프로세스 간 통신이라 호출당 비용이 크므로,
+call_cost(초)를 지정하면 호출 수 x 비용으로 예상 실행 시간(virtual_time)도 계산합니다.
+"""
+
+import json
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# 실제 한글 COM 호출 1회 평균 비용 추정치 (초)
+DEFAULT_CALL_COST = 0.0005
+
+
+@dataclass
+class CallRecord:
+    """이름별 호출 집계"""
+    count: int = 0
+    total_time: float = 0.0  # 가짜 백엔드 내부 실행 시간 (초)
+
+
+@dataclass
+class CallStats:
+    """호출 횟수/시간 집계기"""
+    call_cost: float = DEFAULT_CALL_COST
+    records: Dict[str, CallRecord] = field(default_factory=dict)
+    trace: Optional[List[Tuple[str, Any]]] = None  # (이름, 인자) 순서 기록 (trace=True일 때)
+
+    def record(self, name: str, elapsed: float, args: Any = None):
+        """호출 1회 기록"""
+        rec = self.records.get(name)
+        if rec is None:
+            rec = CallRecord()
+            self.records[name] = rec
+        rec.count += 1
+        rec.total_time += elapsed
+        if self.trace is not None:
+            self.trace.append((name, args))
+
+    @contextmanager
+    def timed(self, name: str, args: Any = None):
+        """with 블록의 실행 시간을 name으로 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start, args)
+
+    @property
+    def total_calls(self) -> int:
+        return sum(r.count for r in self.records.values())
+
+    @property
+    def total_time(self) -> float:
+        return sum(r.total_time for r in self.records.values())
+
+    @property
+    def virtual_time(self) -> float:
+        """실제 COM 환경에서의 예상 소요 시간 (호출 수 x call_cost)"""
+        return self.total_calls * self.call_cost
+
+    def count(self, name: str) -> int:
+        """이름별 호출 횟수 (접두어 'HAction.Run'처럼 묶인 이름도 합산)"""
+        return sum(r.count for n, r in self.records.items()
+                   if n == name or n.startswith(name + ":"))
+
+    def reset(self):
+        """기록 초기화"""
+        self.records.clear()
+        if self.trace is not None:
+            self.trace.clear()
+
+    def to_dict(self) -> Dict:
+        """JSON 직렬화용 딕셔너리"""
+        return {
+            'total_calls': self.total_calls,
+            'total_time': self.total_time,
+            'virtual_time': self.virtual_time,
+            'call_cost': self.call_cost,
+            'calls': {
+                name: {'count': r.count, 'total_time': r.total_time}
+                for name, r in sorted(self.records.items(), key=lambda x: -x[1].count)
+            },
+        }
+
+    def save(self, path: str):
+        """통계를 JSON 파일로 저장"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+    def save_trace(self, path: str):
+        """호출 순서 기록을 JSON 파일로 저장 (회귀 비교용)"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump([[name, args] for name, args in (self.trace or [])],
+                      f, ensure_ascii=False, indent=1, default=str)
+
+    def print_summary(self, top: int = 20):
+        """호출 통계 출력"""
+        print(f"=== COM 호출 통계: {self.total_calls}회, "
+              f"내부 {self.total_time * 1000:.1f}ms, 예상 {self.virtual_time:.3f}s ===")
+        items = sorted(self.records.items(), key=lambda x: -x[1].count)
+        for name, r in items[:top]:
+            print(f"  {name:<40} {r.count:>8}회  {r.total_time * 1000:>8.2f}ms")
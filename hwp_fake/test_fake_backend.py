@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""FakeHwp로 표/문단 모듈을 한글 없이 실행하는 테스트 (Linux에서도 실행)
+
+실행: python -m pytest -q hwp_fake
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hwp_fake import FakeHwp, document_from_dict, load_document
+from table import TableInfo, SCAN_MODE_BFS, SCAN_MODE_SINGLE
+from para_page_index import ParagraphPageIndex
+from separated_para import SeparatedPara
+
+
+ADJACENCY_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                              'cell_adjacency.json')
+
+
+@pytest.fixture
+def table_hwp():
+    """병합 셀이 있는 3x3 표, 커서는 첫 셀"""
+    hwp = FakeHwp(document_from_dict({
+        'body': ['표 앞 문단', ''],
+        'tables': [{
+            'para': 1,
+            'col_widths': [4000, 4000, 4000],
+            'row_heights': [1000, 1000, 1000],
+            'cells': [
+                {'row': 0, 'col': 0, 'colspan': 2, 'text': '제목'},
+                {'row': 0, 'col': 2, 'text': '비고'},
+                {'row': 1, 'col': 0, 'rowspan': 2, 'text': '항목'},
+                {'row': 1, 'col': 1, 'text': 'A'},
+                {'row': 1, 'col': 2, 'text': 'B'},
+                {'row': 2, 'col': 1, 'text': 'C'},
+                {'row': 2, 'col': 2, 'text': 'D'},
+            ],
+        }],
+    }))
+    hwp.SetPos(2, 0, 0)
+    return hwp
+
+
+@pytest.fixture
+def long_hwp():
+    """여러 쪽에 걸친 본문"""
+    body = [f'{i}번째 문단 ' + '가나다라마바사아자차카타파하' * 6 for i in range(60)]
+    return FakeHwp(document_from_dict({'body': body}))
+
+
+class TwoColumnHwp(FakeHwp):
+    """쪽마다 앞 COLUMN_LINES줄은 1단, 나머지는 2단으로 보고 (KeyIndicator 줄 번호가 단마다 1부터)"""
+    COLUMN_LINES = 10
+
+    def KeyIndicator(self):
+        key = list(super().KeyIndicator())
+        if key[5] > self.COLUMN_LINES:
+            key[4], key[5] = 2, key[5] - self.COLUMN_LINES
+        return tuple(key)
+
+
+def _coordinate_map(hwp, scan_mode):
+    hwp.SetPos(2, 0, 0)
+    return TableInfo(hwp, scan_mode=scan_mode).build_coordinate_map()
+
+
+def test_table_scan_modes_agree(table_hwp):
+    bfs = _coordinate_map(table_hwp, SCAN_MODE_BFS)
+    single = _coordinate_map(table_hwp, SCAN_MODE_SINGLE)
+
+    assert single == bfs
+    assert len(bfs) == 9
+    assert bfs[(0, 0)] == bfs[(0, 1)]       # colspan
+    assert bfs[(1, 0)] == bfs[(2, 0)]       # rowspan
+
+
+def test_table_scan_falls_back_without_rowspan_revisits(table_hwp):
+    """MOVE_RIGHT_OF_CELL이 세로 병합 셀을 재방문하지 않아도 좌표가 틀리지 않음 (4방향 탐색으로 대체)"""
+    expected = _coordinate_map(table_hwp, SCAN_MODE_BFS)
+
+    table = table_hwp.doc.tables[0]
+    seen = set()
+    table.visit_order = [(r, list_id) for r, list_id in table.visit_order
+                         if not (list_id in seen or seen.add(list_id))]
+
+    table_hwp.SetPos(2, 0, 0)
+    info = TableInfo(table_hwp, scan_mode=SCAN_MODE_SINGLE)
+    assert info.build_coordinate_map() == expected
+    assert info.last_scan_stats.fallback
+    assert [[list_id for _, _, list_id in row] for row in info._scan_rows] == [[2, 3], [4, 5, 6], [4, 7, 8]]
+
+
+def test_table_single_scan_uses_fewer_moves():
+    hwp = FakeHwp(load_document(ADJACENCY_PATH))
+    _coordinate_map(hwp, SCAN_MODE_BFS)
+    bfs_moves = hwp.stats.count('MovePos')
+
+    hwp = FakeHwp(load_document(ADJACENCY_PATH))
+    _coordinate_map(hwp, SCAN_MODE_SINGLE)
+
+    assert hwp.stats.count('MovePos') < bfs_moves
+
+
+def test_separated_para_page_counts(long_hwp, tmp_path):
+    para = SeparatedPara(long_hwp, log_dir=str(tmp_path))
+    page_count = long_hwp.PageCount
+    assert page_count > 1
+
+    seen = []
+    for page in range(1, page_count + 1):
+        result = para.get_page_paragraph_count(page)
+        assert 'error' not in result
+        assert all(p['start_page'] == page for p in result['paragraphs'])
+        seen.extend(p['para_id'] for p in result['paragraphs'])
+
+    assert seen == list(range(60))      # 모든 문단이 시작 쪽에 한 번씩
+
+
+def test_separated_para_rebuilds_index_after_outside_edit(long_hwp, tmp_path):
+    para = SeparatedPara(long_hwp, log_dir=str(tmp_path))
+    para.get_page_paragraph_count(2)
+    builds = len(para.page_index.patches)
+
+    para.get_page_paragraph_count(2)
+    assert len(para.page_index.patches) == builds      # 바뀌지 않았으면 재사용
+
+    # SeparatedPara를 거치지 않은 편집 (앞쪽에 문단 추가)
+    long_hwp.SetPos(0, 0, 0)
+    long_hwp.HAction.GetDefault("InsertText", long_hwp.HParameterSet.HInsertText.HSet)
+    long_hwp.HParameterSet.HInsertText.Text = '추가 문단\r\n' * 8
+    long_hwp.HAction.Execute("InsertText", long_hwp.HParameterSet.HInsertText.HSet)
+
+    result = para.get_page_paragraph_count(2)
+    rebuilt = ParagraphPageIndex(long_hwp).build()
+    assert [p['para_id'] for p in result['paragraphs']] == rebuilt.paragraphs_on_page(2)
+
+
+def _pages_needing_fix(index):
+    """마지막으로 시작하는 문단이 다음 쪽으로 걸친 쪽"""
+    pages = []
+    for page in range(1, index.page_count + 1):
+        last = index.last_para_on_page(page)
+        if last is not None and index.get(last).is_spanning:
+            pages.append(page)
+    return pages
+
+
+def test_separated_para_fix_document_matches_rebuild(tmp_path):
+    """쪽을 밀어내는 편집 여러 번 뒤에도 새로 걸친 쪽을 빠짐없이 처리하고 인덱스가 전체 재생성과 같음"""
+    body = []
+    for i in range(60):
+        body.append('')
+        body.append(f'{i}번째 문단 ' + '가나다라마바사아자차카타파하 ' * (3 + i % 4))
+    hwp = FakeHwp(document_from_dict({'body': body}))
+    initial = _pages_needing_fix(ParagraphPageIndex(hwp).build())
+
+    para = SeparatedPara(hwp, log_dir=str(tmp_path))
+    result = para.fix_document()
+
+    checked = [r['page'] for r in result['results']]
+    assert len(checked) >= 2
+    assert set(checked) - set(initial)              # 앞 편집으로 배치가 바뀌어 새로 걸친 쪽도 처리
+
+    rebuilt = ParagraphPageIndex(hwp).build()
+    assert [(e.start_page, e.end_page, e.line_count) for e in para.page_index] == \
+           [(e.start_page, e.end_page, e.line_count) for e in rebuilt]
+    failed = {r['page'] for r in result['results'] if not r['success']}
+    assert set(_pages_needing_fix(rebuilt)) <= failed
+
+
+def _layout(index):
+    return [(e.start_page, e.end_page, e.line_count, e.lines_per_page) for e in index]
+
+
+def test_page_index_counts_lines_across_columns(long_hwp):
+    body = [p.text for p in long_hwp.doc.body.paragraphs]
+    columns = ParagraphPageIndex(TwoColumnHwp(document_from_dict({'body': body}))).build()
+
+    assert _layout(columns) == _layout(ParagraphPageIndex(long_hwp).build())
+    assert {e.start_col for e in columns} == {1, 2}
+
+
+def test_spanning_lines_use_cached_line_starts(long_hwp, tmp_path):
+    para = SeparatedPara(long_hwp, log_dir=str(tmp_path))
+    para_id = next(e.para_id for e in para._get_index() if e.is_spanning)
+
+    before = long_hwp.stats.count('KeyIndicator')
+    expected = para.get_spanning_lines(para_id)
+    by_chars = long_hwp.stats.count('KeyIndicator') - before
+
+    para.block._get_line_starts(para_id)        # 분리단어 처리가 측정한 줄 시작
+    before = long_hwp.stats.count('KeyIndicator')
+    assert para.get_spanning_lines(para_id) == expected
+    assert long_hwp.stats.count('KeyIndicator') - before < by_chars
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""md_hwpml 문서 구조 테스트 (한글 없이 XML을 파싱해서 확인)
+
+실행: python -m pytest -q hwp_fake
+"""
+
+import base64
+import os
+import struct
+import sys
+import xml.etree.ElementTree as ET
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from md_hwpml import HWPUNIT_PER_INCH, PIXEL_DPI, markdown_to_hwpml
+from md_to_hwp import para_margins
+
+
+# 삽입 위치 문단 모양 (줄간격/문단 간격이 기본값과 다름)
+SPACING = {'LineSpacingType': 0, 'LineSpacing': 180, 'PrevSpacing': 400, 'NextSpacing': 200}
+
+
+def _png(width: int, height: int) -> bytes:
+    """크기만 읽을 수 있는 PNG 헤더"""
+    return b'\x89PNG\r\n\x1a\n' + struct.pack('>I', 13) + b'IHDR' + struct.pack('>II', width, height)
+
+
+@pytest.fixture
+def sample(tmp_path):
+    """제목, 목록, 그림 두 개(하나는 없는 파일), 일반 텍스트가 있는 마크다운"""
+    first = tmp_path / 'first.png'
+    second = tmp_path / 'second.png'
+    first.write_bytes(_png(96, 48))
+    second.write_bytes(_png(192, 96))
+    markdown = '\n'.join([
+        '# 제목',
+        '## 목록 하나',
+        '## 목록 둘',
+        f'[picture] {first}',
+        '본문 <문장> & 기호',
+        f'[picture] {tmp_path / "missing.png"}',
+        f'[picture] {second}',
+    ])
+    xml = markdown_to_hwpml(markdown, base_para_shape=SPACING)
+    return ET.fromstring(xml.split('?>', 1)[1]), first, second
+
+
+def _para_shapes(root):
+    return {int(e.get('Id')): e for e in root.iter('PARASHAPE')}
+
+
+def _body_paras(root):
+    return list(root.find('BODY/SECTION').findall('P'))
+
+
+def test_para_shape_references(sample):
+    root, _, _ = sample
+    shapes = _para_shapes(root)
+    paras = _body_paras(root)
+
+    assert int(root.find('.//PARASHAPELIST').get('Count')) == len(shapes)
+    assert all(int(p.get('ParaShape')) in shapes for p in root.iter('P'))
+    assert {int(t.get('CharShape')) for t in root.iter('TEXT')} == {0}
+    assert [int(c.get('Id')) for c in root.iter('CHARSHAPE')] == [0]
+
+    # 삽입 위치의 줄간격/문단 간격은 모든 문단 모양에 그대로
+    for shape in shapes.values():
+        margin = shape.find('PARAMARGIN')
+        assert margin.get('LineSpacingType') == 'Percent'
+        assert (margin.get('LineSpacing'), margin.get('Prev'), margin.get('Next')) == ('180', '400', '200')
+
+    # 제목/목록은 레벨별 내어쓰기, 같은 레벨 줄은 같은 모양
+    heading, item1, item2, picture, text = paras[:5]
+    assert shapes[int(heading.get('ParaShape'))].find('PARAMARGIN').get('Indent') == str(para_margins(1)[1])
+    assert item1.get('ParaShape') == item2.get('ParaShape')
+    assert shapes[int(item1.get('ParaShape'))].find('PARAMARGIN').get('Indent') == str(para_margins(2)[1])
+
+    # 그림 문단부터 가운데 정렬 (뒤 문단도 물려받음)
+    assert shapes[int(heading.get('ParaShape'))].get('Align') == 'Justify'
+    assert shapes[int(picture.get('ParaShape'))].get('Align') == 'Center'
+    assert text.get('ParaShape') == picture.get('ParaShape')
+    assert text.find('TEXT/CHAR').text == '본문 <문장> & 기호'
+
+
+def test_picture_caption_and_size(sample):
+    root, first, _ = sample
+    pictures = list(root.iter('PICTURE'))
+    assert len(pictures) == 2
+
+    unit = HWPUNIT_PER_INCH // PIXEL_DPI
+    size = pictures[0].find('SHAPEOBJECT/SIZE')
+    assert (int(size.get('Width')), int(size.get('Height'))) == (96 * unit, 48 * unit)
+
+    caption = pictures[0].find('SHAPEOBJECT/CAPTION')
+    assert caption.get('Side') == 'Bottom'
+    caption_para = caption.find('PARALIST/P')
+    assert caption_para.find('TEXT/CHAR').text == os.path.basename(str(first))
+    assert int(caption_para.get('ParaShape')) in _para_shapes(root)
+
+    # 없는 그림은 빈 문단
+    missing = _body_paras(root)[5]
+    assert missing.find('.//PICTURE') is None and missing.find('TEXT/CHAR') is None
+
+
+def test_bin_items_match_bin_data(sample):
+    root, first, second = sample
+    items = root.findall('HEAD/MAPPINGTABLE/BINDATALIST/BINITEM')
+    data = {int(e.get('Id')): e for e in root.findall('TAIL/BINDATASTORAGE/BINDATA')}
+    refs = [int(e.get('BinItem')) for e in root.iter('IMAGE')]
+
+    assert int(root.find('.//BINDATALIST').get('Count')) == len(items) == 2
+    assert [int(e.get('BinData')) for e in items] == refs == sorted(data) == [1, 2]
+    assert all(e.get('Type') == 'Embedding' and e.get('Format') == 'png' for e in items)
+    for bin_id, path in zip(refs, (first, second)):
+        content = path.read_bytes()
+        assert base64.b64decode(data[bin_id].text) == content
+        assert int(data[bin_id].get('Size')) == len(content)
+
+
+def test_linked_pictures_have_no_bin_data(tmp_path):
+    path = tmp_path / 'linked.png'
+    path.write_bytes(_png(10, 10))
+    root = ET.fromstring(markdown_to_hwpml(f'[picture] {path}', embed=False).split('?>', 1)[1])
+
+    item = root.find('HEAD/MAPPINGTABLE/BINDATALIST/BINITEM')
+    assert item.get('Type') == 'Link' and item.get('APath') == str(path)
+    assert root.find('TAIL/BINDATASTORAGE') is None
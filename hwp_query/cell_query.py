@@ -11,7 +11,7 @@ from typing import Dict, List, Optional, Tuple
 from table.cell_position import CellRange, CellPositionResult
 
 
-def calculate_cell_positions(hwp, max_cells: int = 1000) -> CellPositionResult:
+def calculate_cell_positions(hwp, max_cells: int = None) -> CellPositionResult:
     """
     테이블의 모든 셀 위치 및 범위 계산
 
@@ -19,7 +19,7 @@ def calculate_cell_positions(hwp, max_cells: int = 1000) -> CellPositionResult:
 
     Args:
         hwp: HWP COM 객체
-        max_cells: 최대 처리할 셀 수 (기본 1000)
+        max_cells: 최대 처리할 셀 수 (None이면 제한 없음)
 
     Returns:
         CellPositionResult: 셀 위치 계산 결과
@@ -32,10 +32,12 @@ class ListIdMapper:
     list_id와 (row, col) 좌표 간 변환을 위한 매퍼 클래스
 
     TableInfo와 연동하여 좌표 맵을 생성합니다.
+    cache(TableStructureCache)를 주면 구조가 같은 테이블은 셀 순회 없이 복원합니다.
     """
 
-    def __init__(self, hwp):
+    def __init__(self, hwp, cache=None):
         self.hwp = hwp
+        self.cache = cache
         self._coord_map: Dict[Tuple[int, int], int] = {}  # (row, col) -> list_id
         self._list_id_to_coord: Dict[int, Tuple[int, int]] = {}  # list_id -> (row, col)
         self._initialized = False
@@ -50,8 +52,14 @@ class ListIdMapper:
             table_info = TableInfo(self.hwp, debug=False)
 
             if table_info.is_in_table():
-                table_info.collect_cells_bfs()
-                self._coord_map = table_info.build_coordinate_map()
+                key = self.cache.bind(self.hwp) if self.cache else None
+                if key and self.cache.load_table_info(key, table_info, with_coords=True):
+                    self._coord_map = dict(table_info._coord_map)
+                else:
+                    table_info.collect_cells_bfs()
+                    self._coord_map = table_info.build_coordinate_map()
+                    if key:
+                        self.cache.store_table_info(key, table_info)
                 self._list_id_to_coord = dict(table_info._representative_coords)
                 self._initialized = True
         except Exception:
@@ -7,6 +7,9 @@
 
 from typing import Dict, Tuple, Any, List, Optional
 
+from sentence_segmenter import split_sentences
+from document_snapshot import DocumentSnapshot
+
 
 def get_current_pos(hwp) -> Dict[str, Any]:
     """
@@ -40,12 +43,13 @@ def get_current_pos(hwp) -> Dict[str, Any]:
     }
 
 
-def get_para_range(hwp) -> Dict[str, Any]:
+def get_para_range(hwp, snapshot: Optional[DocumentSnapshot] = None) -> Dict[str, Any]:
     """
     문단 시작/끝 pos 반환
 
     Args:
         hwp: HWP COM 객체
+        snapshot: 문서 스냅샷 (있으면 커서를 옮기지 않고 스냅샷에서 조회)
 
     Returns:
         dict: {
@@ -55,6 +59,11 @@ def get_para_range(hwp) -> Dict[str, Any]:
         }
     """
     current = hwp.GetPos()
+    if snapshot is not None:
+        end = snapshot.para_end(current[0], current[1])
+        if end is not None:
+            return {'current': current, 'start': 0, 'end': end}
+
     hwp.HAction.Run("MoveParaBegin")
     start = hwp.GetPos()[2]
     hwp.HAction.Run("MoveParaEnd")
@@ -68,12 +77,13 @@ def get_para_range(hwp) -> Dict[str, Any]:
     }
 
 
-def get_line_range(hwp) -> Dict[str, Any]:
+def get_line_range(hwp, snapshot: Optional[DocumentSnapshot] = None) -> Dict[str, Any]:
     """
     현재 줄의 시작/끝 pos 반환
 
     Args:
         hwp: HWP COM 객체
+        snapshot: 문서 스냅샷 (있으면 줄 시작 목록을 문단별로 한 번만 측정)
 
     Returns:
         dict: {
@@ -86,6 +96,18 @@ def get_line_range(hwp) -> Dict[str, Any]:
     current = hwp.GetPos()
     init_para, init_pos = current[1], current[2]
 
+    if snapshot is not None:
+        all_starts = snapshot.line_starts(current[0], init_para)
+        if all_starts is not None:
+            line_starts = [s for s in all_starts if s <= init_pos]
+            next_starts = [s for s in all_starts if s > init_pos]
+            return {
+                'current': current,
+                'start': line_starts[-1],
+                'end': next_starts[0] - 1 if next_starts else snapshot.para_end(current[0], init_para),
+                'line_starts': line_starts
+            }
+
     hwp.HAction.Run("MoveParaEnd")
     para_end = hwp.GetPos()[2]
     hwp.HAction.Run("MoveParaBegin")
@@ -118,7 +140,7 @@ def get_line_range(hwp) -> Dict[str, Any]:
 
 def get_sentences(hwp, include_text: bool = False):
     """
-    문단 내 문장 경계 반환 ('.' 기준)
+    문단 내 문장 경계 반환 (sentence_segmenter.split_sentences 규칙)
 
     Args:
         hwp: HWP COM 객체
@@ -146,47 +168,20 @@ def get_sentences(hwp, include_text: bool = False):
         return ([], "") if include_text else []
 
     para_text = para_text.replace('\r\n', '').replace('\r', '').replace('\n', '')
-
-    sentences = []
-    sentence_index = 1
-    sentence_start = 0
-    i = 0
-
-    while i < len(para_text):
-        if para_text[i] == '.':
-            sentences.append({'index': sentence_index, 'start': sentence_start, 'end': i})
-
-            next_start = i + 1
-            skip_count = 0
-            while next_start < len(para_text) and skip_count < 3:
-                if para_text[next_start] == ' ':
-                    next_start += 1
-                    skip_count += 1
-                else:
-                    break
-
-            if next_start >= len(para_text) or (skip_count >= 3 and para_text[next_start] == ' '):
-                break
-
-            sentence_index += 1
-            sentence_start = next_start
-            i = next_start
-        else:
-            i += 1
-
-    if sentence_start < len(para_text) and (not sentences or sentences[-1]['end'] < len(para_text) - 1):
-        sentences.append({'index': sentence_index, 'start': sentence_start, 'end': len(para_text) - 1})
+    sentences = split_sentences(para_text)
 
     return (sentences, para_text) if include_text else sentences
 
 
-def get_cursor_index(hwp, pos: Optional[int] = None) -> Optional[Dict[str, Any]]:
+def get_cursor_index(hwp, pos: Optional[int] = None,
+                     snapshot: Optional[DocumentSnapshot] = None) -> Optional[Dict[str, Any]]:
     """
     현재 커서가 몇 번째 문장의 몇 번째 단어인지 반환
 
     Args:
         hwp: HWP COM 객체
         pos: 문단 내 위치 (None이면 현재 커서 위치)
+        snapshot: 문서 스냅샷 (있으면 커서를 옮기지 않고 스냅샷 텍스트로 계산)
 
     Returns:
         dict: {
@@ -197,10 +192,18 @@ def get_cursor_index(hwp, pos: Optional[int] = None) -> Optional[Dict[str, Any]]
         }
         또는 None (위치를 찾을 수 없는 경우)
     """
-    if pos is None:
-        pos = hwp.GetPos()[2]
-
-    sentences, para_text = get_sentences(hwp, include_text=True)
+    para_text = None
+    if snapshot is not None:
+        current = hwp.GetPos()
+        if pos is None:
+            pos = current[2]
+        para_text = snapshot.text(current[0], current[1])
+        sentences = snapshot.sentences(current[0], current[1])
+
+    if para_text is None:
+        if pos is None:
+            pos = hwp.GetPos()[2]
+        sentences, para_text = get_sentences(hwp, include_text=True)
     if not sentences or not para_text:
         return None
 
@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+"""
+그림 미리 준비 - [picture] 줄의 그림을 스레드 풀에서 확인/크기 측정/축소해 두고 COM 스레드는 삽입만
+
+md_to_hwp의 렌더링이 블록을 읽어 나가는 동안 앞쪽 블록의 그림 경로를 미리 작업에 넘기고,
+그림 차례가 되면 준비된 결과(경로, 크기)를 받아 InsertPicture만 호출합니다.
+
+작업 (작업 스레드):
+- 파일 확인 (WSL 경로 → Windows 경로 변환 포함), 내용 해시
+- 헤더로 픽셀 크기 확인 (PNG / GIF / JPEG / BMP)
+- max_width_mm / max_height_mm를 넘으면 비율을 유지해 축소
+  (Pillow가 있으면 캐시 폴더에 다시 저장, 없으면 InsertPicture 지정 크기로만 줄임)
+- 같은 내용 + 같은 설정은 해시 캐시로 한 번만 처리 (동시에 들어온 같은 내용은 먼저 시작한 작업을 기다림)
+- 축소본은 임시 파일에 저장한 뒤 os.replace로 옮겨 한글이 쓰는 중인 파일을 열지 않게 함
+- cache_dir는 한글이 열 수 있는 경로여야 함 (Windows 또는 WSL의 /mnt/<드라이브>/ 아래)
+
+사용법:
+    from image_prep import ImagePrefetcher
+
+    with ImagePrefetcher(max_width_mm=150) as images:
+        for block in images.prefetch(blocks):          # 앞쪽 그림을 미리 작업에 넘김
+            if block.kind == 'picture' and block.path:
+                prepared = images.get(block.path)       # 준비될 때까지 대기
+                insert_picture(hwp, block.path, prepared=prepared)
+"""
+
+import hashlib
+import os
+import struct
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+
+# 픽셀 → mm (96 DPI)
+PIXEL_DPI = 96
+MM_PER_INCH = 25.4
+
+# Pillow로 다시 저장할 수 있는 형식 (확장자 → Pillow 형식 이름)
+_SAVE_FORMATS = {'png': 'PNG', 'jpg': 'JPEG', 'jpeg': 'JPEG', 'gif': 'GIF', 'bmp': 'BMP'}
+
+
+def to_windows_path(path):
+    """WSL 경로를 Windows 경로로 (/mnt/c/... → C:/...), 그 외는 그대로"""
+    if path.startswith("/mnt/"):
+        parts = path.split("/")
+        if len(parts) >= 3:
+            drive = parts[2].upper()
+            rest = "/".join(parts[3:])
+            return f"{drive}:/{rest}"
+    return path
+
+
+def is_windows_reachable(path):
+    """한글(Windows)이 열 수 있는 경로인지 (Windows에서 실행 중이거나 WSL의 /mnt/<드라이브>/ 아래)"""
+    if os.name == 'nt':
+        return True
+    parts = os.path.abspath(path).split("/")
+    return len(parts) >= 3 and parts[1] == "mnt" and len(parts[2]) == 1
+
+
+def local_image_path(path):
+    """이 프로세스에서 열 수 있는 그림 경로 (원래 경로가 없으면 Windows 경로 시도)"""
+    if os.path.exists(path):
+        return path
+    win_path = to_windows_path(path).replace("/", "\\")
+    if os.path.exists(win_path):
+        return win_path
+    return path
+
+
+def image_pixel_size(data: bytes) -> Optional[Tuple[int, int]]:
+    """PNG / GIF / JPEG / BMP 헤더에서 (가로, 세로) 픽셀 크기 읽기 (모르면 None)"""
+    if data[:8] == b'\x89PNG\r\n\x1a\n' and len(data) >= 24:
+        return struct.unpack('>II', data[16:24])
+    if data[:6] in (b'GIF87a', b'GIF89a') and len(data) >= 10:
+        return struct.unpack('<HH', data[6:10])
+    if data[:2] == b'BM' and len(data) >= 26:
+        width, height = struct.unpack('<ii', data[18:26])
+        return width, abs(height)
+    if data[:2] == b'\xff\xd8':
+        i = 2
+        while i + 9 < len(data):
+            if data[i] != 0xFF:
+                i += 1
+                continue
+            marker = data[i + 1]
+            if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+                i += 2
+                continue
+            length = struct.unpack('>H', data[i + 2:i + 4])[0]
+            # SOF0~SOF15 (DHT, JPG, DAC 제외)
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                height, width = struct.unpack('>HH', data[i + 5:i + 9])
+                return width, height
+            i += 2 + length
+    return None
+
+
+def read_pixel_size(data: bytes, path: str = None,
+                    on_error: Callable[[Exception], None] = None) -> Optional[Tuple[int, int]]:
+    """
+    헤더로 픽셀 크기를 읽고, 모르는 형식(webp, tiff 등)은 Pillow로 열어서 확인 (모르면 None)
+
+    Args:
+        on_error: Pillow가 파일을 열지 못했을 때 예외를 받을 함수 (None이면 무시)
+    """
+    size = image_pixel_size(data)
+    if size is None and HAS_PIL and path:
+        try:
+            with Image.open(path) as image:
+                size = image.size
+        except Exception as e:
+            if on_error is not None:
+                on_error(e)
+    return size
+
+
+def pixels_to_mm(pixels: int) -> float:
+    return pixels * MM_PER_INCH / PIXEL_DPI
+
+
+@dataclass
+class PreparedImage:
+    """준비된 그림 (insert_picture(prepared=...)에 전달)"""
+    path: str                                    # 마크다운에 적힌 경로
+    win_path: str                                # InsertPicture에 넘길 경로 (축소본이면 캐시 파일)
+    exists: bool = False
+    digest: str = ""                             # 원본 내용 해시 (sha1)
+    pixel_size: Optional[Tuple[int, int]] = None  # 원본 픽셀 크기
+    width_mm: Optional[float] = None             # 지정 크기 (None이면 원본 크기로 삽입)
+    height_mm: Optional[float] = None
+    resized: bool = False                        # 캐시 폴더에 축소본을 저장했는지
+    error: str = ""
+
+
+class ImagePrefetcher:
+    """그림 준비 작업 스레드 풀 + 내용 해시 캐시"""
+
+    def __init__(self, max_width_mm: float = None, max_height_mm: float = None,
+                 resample: bool = True, cache_dir: str = None, workers: int = 4):
+        """
+        Args:
+            max_width_mm: 최대 가로 (mm, None이면 제한 없음)
+            max_height_mm: 최대 세로 (mm, None이면 제한 없음)
+            resample: 최대 크기를 넘으면 Pillow로 축소본 저장 (Pillow가 없으면 지정 크기로만 줄임)
+            cache_dir: 축소본 저장 폴더 (None이거나 한글이 열 수 없는 경로면 resample하지 않음)
+            workers: 작업 스레드 수
+        """
+        self.max_width_mm = max_width_mm
+        self.max_height_mm = max_height_mm
+        if resample and cache_dir is not None and not is_windows_reachable(cache_dir):
+            print(f"[경고] 한글이 열 수 없는 캐시 폴더입니다: {cache_dir} (/mnt/<드라이브>/ 아래 사용). "
+                  f"축소본을 저장하지 않고 삽입 크기만 줄입니다.")
+            cache_dir = None
+        self.resample = resample and HAS_PIL and cache_dir is not None
+        self.cache_dir = cache_dir
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='ImagePrefetch')
+        self._futures: Dict[str, Future] = {}
+        self._cache: Dict[Tuple, Future] = {}      # 설정 키 -> 먼저 시작한 작업의 결과
+        self._lock = threading.Lock()
+        self.cache_hits = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """남은 작업을 기다리고 스레드 풀 종료"""
+        self._pool.shutdown(wait=True)
+
+    # ------------------------------------------------------------------
+    # 작업 등록 / 결과
+    # ------------------------------------------------------------------
+
+    def submit(self, path: str) -> Future:
+        """그림 준비 작업 등록 (같은 경로는 한 번만)"""
+        future = self._futures.get(path)
+        if future is None:
+            future = self._pool.submit(self._prepare, path)
+            self._futures[path] = future
+        return future
+
+    def get(self, path: str) -> PreparedImage:
+        """준비된 그림 (등록 전이면 등록 후 대기)"""
+        return self.submit(path).result()
+
+    def prefetch(self, blocks: Iterable, lookahead: int = 32) -> Iterator:
+        """
+        블록을 그대로 내보내면서 앞쪽 lookahead개 블록의 그림을 미리 등록
+
+        Args:
+            blocks: MarkdownBlock iterable (스트리밍 가능)
+            lookahead: 미리 읽을 블록 수
+        """
+        window = deque()
+        for block in blocks:
+            if block.kind == 'picture' and block.path:
+                self.submit(block.path)
+            window.append(block)
+            if len(window) > lookahead:
+                yield window.popleft()
+        while window:
+            yield window.popleft()
+
+    # ------------------------------------------------------------------
+    # 작업 (작업 스레드)
+    # ------------------------------------------------------------------
+
+    def _prepare(self, path: str) -> PreparedImage:
+        result = PreparedImage(path=path, win_path=to_windows_path(path))
+        local = local_image_path(path)
+        try:
+            with open(local, 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            result.error = str(e)
+            return result
+        result.exists = True
+        result.digest = hashlib.sha1(data).hexdigest()
+
+        key = (result.digest, self.max_width_mm, self.max_height_mm, self.resample)
+        with self._lock:
+            shared = self._cache.get(key)
+            if shared is None:
+                shared = self._cache[key] = Future()
+                owner = True
+            else:
+                self.cache_hits += 1
+                owner = False
+        if not owner:
+            cached = shared.result()
+            result.pixel_size = cached.pixel_size
+            result.width_mm, result.height_mm = cached.width_mm, cached.height_mm
+            if cached.resized:
+                result.win_path, result.resized = cached.win_path, True
+            return result
+
+        try:
+            self._measure(result, local, data)
+        except BaseException as e:
+            shared.set_exception(e)
+            raise
+        shared.set_result(result)
+        return result
+
+    def _measure(self, result: PreparedImage, local: str, data: bytes):
+        """픽셀 크기 확인 후 최대 크기에 맞춤"""
+        def report(e: Exception):
+            result.error = str(e)
+
+        result.pixel_size = read_pixel_size(data, local, on_error=report)
+        if result.pixel_size:
+            self._fit(result, local)
+
+    def _fit(self, result: PreparedImage, local: str):
+        """최대 크기를 넘으면 비율 유지 축소 (Pillow로 다시 저장하거나 지정 크기만 설정)"""
+        px_w, px_h = result.pixel_size
+        width_mm, height_mm = pixels_to_mm(px_w), pixels_to_mm(px_h)
+        scale = 1.0
+        if self.max_width_mm and width_mm > self.max_width_mm:
+            scale = min(scale, self.max_width_mm / width_mm)
+        if self.max_height_mm and height_mm > self.max_height_mm:
+            scale = min(scale, self.max_height_mm / height_mm)
+        if scale >= 1.0:
+            return
+
+        ext = os.path.splitext(local)[1].lstrip('.').lower()
+        if self.resample and ext in _SAVE_FORMATS:
+            target = (max(1, int(px_w * scale)), max(1, int(px_h * scale)))
+            out_path = os.path.join(self.cache_dir, f"{result.digest}_{target[0]}x{target[1]}.{ext}")
+            try:
+                if not os.path.exists(out_path):
+                    os.makedirs(self.cache_dir, exist_ok=True)
+                    # 다른 작업/프로세스가 같은 파일을 쓰거나 한글이 읽는 중이어도 완성된 파일만 보이게
+                    tmp_path = f"{out_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                    try:
+                        with Image.open(local) as image:
+                            image.resize(target, Image.LANCZOS).save(tmp_path, _SAVE_FORMATS[ext])
+                        os.replace(tmp_path, out_path)
+                    finally:
+                        if os.path.exists(tmp_path):
+                            os.remove(tmp_path)
+                result.win_path = to_windows_path(os.path.abspath(out_path))
+                result.resized = True
+                return
+            except Exception as e:
+                result.error = str(e)
+
+        # 다시 저장하지 않고 삽입 크기만 지정
+        result.width_mm = round(width_mm * scale, 2)
+        result.height_mm = round(height_mm * scale, 2)
@@ -0,0 +1,118 @@
+"""
+레이아웃 안정 대기 - 고정 sleep 대신 레이아웃 시그니처를 짧은 간격으로 확인
+
+자간/글자 크기 등을 바꾼 뒤 한글이 줄 나눔을 다시 계산했는지 확인하기 위해
+가벼운 레이아웃 시그니처(문단 끝의 페이지/줄, 문단의 줄 시작 pos 목록 등)를 읽고,
+연속으로 같은 값이 나오면 바로 반환합니다. 값이 바뀌는 동안에는 대기 간격을
+두 배씩 늘리며(최대 max_delay) 다시 읽고, timeout이 지나면 마지막 값으로 반환합니다.
+
+사용법:
+    from layout_settle import wait_for_layout, para_end_signature
+
+    hwp.HAction.Execute("CharShape", pset.HSet)
+    result = wait_for_layout(lambda: para_end_signature(hwp, para_id))
+    print(result.settled, result.polls, result.elapsed)
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Tuple
+
+
+# 기본 대기 설정 (초)
+DEFAULT_TIMEOUT = 0.25
+DEFAULT_INITIAL_DELAY = 0.001
+DEFAULT_MAX_DELAY = 0.032
+
+
+@dataclass
+class SettleResult:
+    """레이아웃 대기 결과"""
+    settled: bool = False      # 시그니처가 안정되었는지 (False면 timeout)
+    signature: Any = None      # 마지막으로 읽은 시그니처
+    polls: int = 0             # 시그니처를 읽은 횟수
+    elapsed: float = 0.0       # 걸린 시간 (초)
+
+
+def wait_for_layout(read_signature: Callable[[], Any],
+                    timeout: float = DEFAULT_TIMEOUT,
+                    initial_delay: float = DEFAULT_INITIAL_DELAY,
+                    max_delay: float = DEFAULT_MAX_DELAY,
+                    stable_reads: int = 2,
+                    sleep: Callable[[float], None] = time.sleep) -> SettleResult:
+    """
+    레이아웃 시그니처가 안정될 때까지 대기
+
+    Args:
+        read_signature: 시그니처 조회 함수 (비교 가능한 값 반환, 예외 시 안정되지 않은 것으로 처리)
+        timeout: 최대 대기 시간 (초)
+        initial_delay: 첫 대기 간격 (초)
+        max_delay: 최대 대기 간격 (초)
+        stable_reads: 연속으로 같아야 하는 조회 횟수 (2 이상)
+        sleep: 대기 함수 (테스트용 교체)
+
+    Returns:
+        SettleResult
+    """
+    start = time.perf_counter()
+    deadline = start + timeout
+    result = SettleResult()
+
+    def read():
+        result.polls += 1
+        try:
+            return read_signature()
+        except Exception:
+            return None
+
+    previous = read()
+    same = 1
+    delay = initial_delay
+    while True:
+        if previous is not None and same >= stable_reads:
+            result.settled = True
+            break
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            break
+        sleep(min(delay, remaining))
+        current = read()
+        if current is not None and current == previous:
+            same += 1
+        else:
+            same = 1
+            delay = min(delay * 2, max_delay)
+        previous = current
+
+    result.signature = previous
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+# =============================================================================
+# 시그니처
+# =============================================================================
+
+def para_end_signature(hwp, para_id: int, list_id: Optional[int] = None) -> Tuple[int, int, int]:
+    """
+    문단 끝의 (페이지, 페이지 안 줄 번호, 문단 끝 pos) - 커서 위치는 복원
+
+    줄 나눔이 바뀌면 문단 끝 줄 번호나 페이지가 바뀌므로 자간 변경 확인에 충분합니다.
+    """
+    saved = hwp.GetPos()
+    try:
+        hwp.SetPos(saved[0] if list_id is None else list_id, para_id, 0)
+        hwp.HAction.Run("MoveParaEnd")
+        key_info = hwp.KeyIndicator()
+        # KeyIndicator 반환: (BOOL, seccnt, secno, prnpageno, colno, line, pos, over, ctrlname)
+        return key_info[3], key_info[5], hwp.GetPos()[2]
+    finally:
+        hwp.SetPos(saved[0], saved[1], saved[2])
+
+
+def line_starts_signature(block, para_id: int) -> Tuple[int, ...]:
+    """
+    문단의 줄 시작 pos 목록 (BlockSelector._measure_line_starts, 캐시 미사용) - 줄 수만큼 이동하므로 더 정확하지만 비쌈
+    """
+    line_starts, para_end = block._measure_line_starts(para_id)
+    return tuple(line_starts) + (para_end,)
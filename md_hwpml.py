@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+"""
+마크다운 → HWPML 문서 생성 (커서로 입력하지 않고 문서 전체를 XML로 만든 뒤 한 번에 삽입)
+
+md_to_hwp의 줄 파싱/컴파일(compile_markdown) 결과를 HWPML 2.x 문자열로 변환합니다.
+생성은 순수 파이썬이라 한글 없이(Linux 포함) 만들어서 XML을 비교/측정할 수 있고,
+한글에서는 SetTextFile(xml, "HWPML2X", "insertfile") 한 번으로 현재 위치에 삽입합니다.
+
+커서 입력(render_blocks)과 같은 결과가 되도록 문단 모양을 정합니다:
+- 레벨 1~5 줄: HEADING_STYLES의 prefix + 왼쪽 여백/내어쓰기 (para_margins)
+- 일반 텍스트(레벨 0) 줄: 앞 문단 모양을 그대로 (한글이 줄바꿈으로 생긴 문단에 물려주는 것과 같음)
+- [picture] 줄: 문단 가운데 정렬 + 글자처럼 취급하는 그림 + 파일명 캡션 (이후 문단도 정렬을 물려받음)
+- 경로가 없거나 읽을 수 없는 그림은 빈 문단으로 두고 missing_pictures에 기록
+  (읽을 수 있지만 크기를 모르는 형식은 DEFAULT_IMAGE_PIXELS 크기로 삽입)
+
+사용법:
+    from md_hwpml import markdown_to_hwpml
+
+    xml = markdown_to_hwpml(markdown_text)
+    hwp.SetTextFile(xml, "HWPML2X", "insertfile")
+"""
+
+import base64
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from image_prep import local_image_path, read_pixel_size, to_windows_path
+from md_to_hwp import MarkdownBlock, compile_markdown, para_margins
+
+
+# AlignType(ParameterSet) → HWPML Align
+ALIGN_NAMES = ['Justify', 'Left', 'Right', 'Center', 'Distribute', 'DistributeSpace']
+
+# LineSpacingType(ParameterSet) → HWPML LineSpacingType
+LINE_SPACING_NAMES = ['Percent', 'Fixed', 'BetweenLines', 'AtLeast']
+
+# 그림 크기 계산 (96 DPI 기준: 1인치 = 7200 HWPUNIT)
+PIXEL_DPI = 96
+HWPUNIT_PER_INCH = 7200
+
+# 헤더로도 Pillow로도 크기를 읽지 못한 그림의 픽셀 크기 (한글이 삽입하면서 원래 크기로 다시 계산하지 않음)
+DEFAULT_IMAGE_PIXELS = (400, 300)
+
+# 커서 입력 전 문단 모양 (ParagraphShape 파라미터셋 항목, 이 순서로 PARASHAPE를 구분)
+BASE_PARA_SHAPE = {
+    'AlignType': 0, 'LeftMargin': 0, 'Indentation': 0, 'RightMargin': 0,
+    'LineSpacingType': 0, 'LineSpacing': 160, 'PrevSpacing': 0, 'NextSpacing': 0,
+}
+
+# 글꼴 언어 (FONTFACE Lang / HCharShape FaceNameXxx)
+FONT_LANGS = ('Hangul', 'Latin', 'Hanja', 'Japanese', 'Other', 'Symbol', 'User')
+
+# 커서 입력 전 글자 모양 (CharShape 파라미터셋 항목)
+BASE_CHAR_SHAPE = dict(
+    {f'FaceName{lang}': '함초롬바탕' for lang in FONT_LANGS},
+    Height=1000, TextColor=0, ShadeColor=0xFFFFFFFF, Bold=0, Italic=0,
+)
+
+# XML에 쓸 수 없는 제어 문자 (탭 제외)
+_XML_INVALID = {c: None for c in range(0x20) if c != 0x09}
+
+
+def _attr(value) -> str:
+    return escape(str(value), {'"': '&quot;'})
+
+
+# =============================================================================
+# 그림
+# =============================================================================
+
+@dataclass
+class ImageInfo:
+    """그림 파일 정보 (HWPML BINITEM/PICTURE 생성용)"""
+    path: str                     # 원래 경로 (마크다운에 적힌 값)
+    win_path: str                 # 한글에 넘길 Windows 경로
+    format: str = ""              # 확장자 (png, jpg, ...)
+    width: int = 0                # HWPUNIT
+    height: int = 0               # HWPUNIT
+    data: Optional[bytes] = None  # 포함할 파일 내용 (embed=False면 None)
+
+
+def load_image(path: str, embed: bool = True) -> Optional[ImageInfo]:
+    """
+    그림 파일을 읽어 크기(HWPUNIT)와 포함할 내용 준비
+
+    Returns:
+        ImageInfo, 파일을 읽을 수 없으면 None (크기를 모르는 형식은 DEFAULT_IMAGE_PIXELS)
+    """
+    win_path = to_windows_path(path)
+    local = local_image_path(path)
+    try:
+        with open(local, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    size = read_pixel_size(data, local) or DEFAULT_IMAGE_PIXELS
+    unit = HWPUNIT_PER_INCH // PIXEL_DPI
+    ext = os.path.splitext(path)[1].lstrip('.').lower() or 'png'
+    return ImageInfo(path, win_path, ext, size[0] * unit, size[1] * unit, data if embed else None)
+
+
+# =============================================================================
+# HWPML 작성
+# =============================================================================
+
+class MarkdownHwpmlWriter:
+    """컴파일한 마크다운 블록 → HWPML 문자열"""
+
+    def __init__(self, embed: bool = True, caption: bool = True,
+                 base_para_shape: Dict[str, int] = None, base_char_shape: Dict = None):
+        """
+        Args:
+            embed: 그림을 문서에 포함 (False면 파일 경로로 연결)
+            caption: 그림 아래에 파일명 캡션
+            base_para_shape: 삽입 위치 문단의 모양 (BASE_PARA_SHAPE 항목: 정렬, 여백, 줄간격, 문단 간격)
+            base_char_shape: 삽입 위치 글자 모양 (BASE_CHAR_SHAPE 항목: 글꼴, Height, 색, 굵게/기울임)
+        """
+        self.embed = embed
+        self.caption = caption
+        self.base_para_shape = dict(BASE_PARA_SHAPE, **(base_para_shape or {}))
+        self.base_char_shape = dict(BASE_CHAR_SHAPE, **(base_char_shape or {}))
+        self._para_shapes: Dict[Tuple[int, ...], int] = {}
+        self._images: List[ImageInfo] = []
+        self.missing_pictures: List[str] = []
+        self.paragraph_count = 0
+
+    # ------------------------------------------------------------------
+    # 본문
+    # ------------------------------------------------------------------
+
+    def _para_shape_id(self, shape: Dict[str, int]) -> int:
+        key = tuple(int(shape[name]) for name in BASE_PARA_SHAPE)
+        if key not in self._para_shapes:
+            self._para_shapes[key] = len(self._para_shapes)
+        return self._para_shapes[key]
+
+    @staticmethod
+    def _chars(text: str) -> str:
+        """CHAR 요소 (탭은 <TAB/>)"""
+        text = text.translate(_XML_INVALID)
+        if not text:
+            return ''
+        return '<CHAR>' + '<TAB/>'.join(escape(part) for part in text.split('\t')) + '</CHAR>'
+
+    def _para(self, shape: Dict[str, int], inner: str = '') -> str:
+        self.paragraph_count += 1
+        shape_id = self._para_shape_id(shape)
+        if not inner:
+            return f'<P ParaShape="{shape_id}" Style="0"><TEXT CharShape="0"/></P>'
+        return f'<P ParaShape="{shape_id}" Style="0"><TEXT CharShape="0">{inner}</TEXT></P>'
+
+    def _picture(self, image: ImageInfo, caption_shape: Dict[str, int]) -> str:
+        self._images.append(image)
+        bin_id = len(self._images)
+        w, h = image.width, image.height
+        caption = ''
+        if self.caption:
+            name = self._chars(os.path.basename(image.win_path))
+            shape_id = self._para_shape_id(caption_shape)
+            caption = (f'<CAPTION FullSize="false" Gap="850" LastWidth="{w}" Side="Bottom" Width="{w}">'
+                       f'<PARALIST LineWrap="Break" LinkListID="0" LinkListIDNext="0" '
+                       f'TextDirection="0" VertAlign="Top">'
+                       f'<P ParaShape="{shape_id}" Style="0"><TEXT CharShape="0">{name}</TEXT></P>'
+                       f'</PARALIST></CAPTION>')
+        return (f'<PICTURE Reverse="false">'
+                f'<SHAPEOBJECT InstId="{bin_id}" Lock="false" NumberingType="Figure" '
+                f'TextFlow="BothSides" TextWrap="TopAndBottom" ZOrder="{bin_id}">'
+                f'<SIZE Height="{h}" HeightRelTo="Absolute" Protect="false" Width="{w}" WidthRelTo="Absolute"/>'
+                f'<POSITION AffectLSpacing="false" AllowOverlap="false" FlowWithText="true" '
+                f'HoldAnchorAndSO="false" HorzAlign="Left" HorzOffset="0" HorzRelTo="Column" '
+                f'TreatAsChar="true" VertAlign="Top" VertOffset="0" VertRelTo="Para"/>'
+                f'<OUTSIDEMARGIN Bottom="0" Left="0" Right="0" Top="0"/>{caption}</SHAPEOBJECT>'
+                f'<SHAPECOMPONENT CurHeight="{h}" CurWidth="{w}" GroupLevel="0" HorzFlip="false" '
+                f'InstID="{bin_id}" OriHeight="{h}" OriWidth="{w}" VertFlip="false" XPos="0" YPos="0">'
+                f'<ROTATIONINFO Angle="0" CenterX="{w // 2}" CenterY="{h // 2}"/></SHAPECOMPONENT>'
+                f'<IMAGERECT X0="0" X1="{w}" X2="{w}" X3="0" Y0="0" Y1="0" Y2="{h}" Y3="{h}"/>'
+                f'<IMAGECLIP Bottom="{h}" Left="0" Right="{w}" Top="0"/>'
+                f'<INSIDEMARGIN Bottom="0" Left="0" Right="0" Top="0"/>'
+                f'<IMAGE Alpha="0" BinItem="{bin_id}" Bright="0" Contrast="0" Effect="RealPic"/>'
+                f'</PICTURE>')
+
+    def body(self, blocks: List[MarkdownBlock], images: Dict[str, Optional[ImageInfo]] = None) -> str:
+        """
+        SECTION 안의 문단들
+
+        Args:
+            blocks: compile_markdown 결과
+            images: {경로: ImageInfo} 미리 읽은 그림 (없는 경로는 여기서 읽음)
+        """
+        images = images or {}
+        shape = dict(self.base_para_shape)
+        out = []
+        for block in blocks:
+            if block.kind == 'picture':
+                image = None
+                if block.path:
+                    # 커서 입력과 같이 그림 문단은 가운데 정렬 (이후 문단도 물려받음)
+                    shape = dict(shape, AlignType=3)
+                    image = images[block.path] if block.path in images else load_image(block.path, self.embed)
+                    if image is None:
+                        self.missing_pictures.append(block.path)
+                out.append(self._para(shape, self._picture(image, shape) if image else ''))
+                continue
+
+            if block.level > 0:
+                left, indent = para_margins(block.level)
+                shape = dict(shape, LeftMargin=left, Indentation=indent)
+            for line in block.text.split('\r\n'):
+                out.append(self._para(shape, self._chars(line)))
+        return ''.join(out)
+
+    # ------------------------------------------------------------------
+    # 헤더 / 문서
+    # ------------------------------------------------------------------
+
+    def _head(self) -> str:
+        # 글자 모양은 삽입 위치 모양 하나 (커서 입력처럼 이어서 입력한 글자와 같게)
+        base = self.base_char_shape
+        fonts = ''.join(f'<FONTFACE Count="1" Lang="{lang}">'
+                        f'<FONT Id="0" Name="{_attr(base[f"FaceName{lang}"])}" Type="ttf"/></FONTFACE>'
+                        for lang in FONT_LANGS)
+        font_ids = ' '.join(f'{lang}="0"' for lang in FONT_LANGS)
+        ratio = ' '.join(f'{lang}="100"' for lang in FONT_LANGS)
+        zero = ' '.join(f'{lang}="0"' for lang in FONT_LANGS)
+        emphasis = ('<BOLD/>' if base['Bold'] else '') + ('<ITALIC/>' if base['Italic'] else '')
+        char_shape = (f'<CHARSHAPE BorderFillId="1" Height="{int(base["Height"])}" Id="0" '
+                      f'ShadeColor="{int(base["ShadeColor"]) & 0xFFFFFFFF}" '
+                      f'SymMark="0" TextColor="{int(base["TextColor"]) & 0xFFFFFFFF}" '
+                      f'UseFontSpace="false" UseKerning="false">'
+                      f'<FONTID {font_ids}/><RATIO {ratio}/><CHARSPACING {zero}/>'
+                      f'<RELSIZE {ratio}/><CHAROFFSET {zero}/>{emphasis}</CHARSHAPE>')
+
+        para_shapes = []
+        for key, shape_id in self._para_shapes.items():
+            shape = dict(zip(BASE_PARA_SHAPE, key))
+            para_shapes.append(
+                f'<PARASHAPE Align="{ALIGN_NAMES[shape["AlignType"]]}" HeadingType="None" Id="{shape_id}" '
+                f'Level="0" TabDef="0"><PARAMARGIN Indent="{shape["Indentation"]}" '
+                f'Left="{shape["LeftMargin"]}" LineSpacing="{shape["LineSpacing"]}" '
+                f'LineSpacingType="{LINE_SPACING_NAMES[shape["LineSpacingType"]]}" '
+                f'Next="{shape["NextSpacing"]}" Prev="{shape["PrevSpacing"]}" '
+                f'Right="{shape["RightMargin"]}"/></PARASHAPE>')
+
+        bin_items = ''
+        if self._images:
+            items = []
+            for i, image in enumerate(self._images, 1):
+                if image.data is not None:
+                    items.append(f'<BINITEM BinData="{i}" Format="{_attr(image.format)}" Type="Embedding"/>')
+                else:
+                    items.append(f'<BINITEM APath="{_attr(image.win_path)}" BinData="{i}" '
+                                 f'Format="{_attr(image.format)}" Type="Link"/>')
+            bin_items = f'<BINDATALIST Count="{len(items)}">{"".join(items)}</BINDATALIST>'
+
+        return ('<HEAD SecCnt="1"><MAPPINGTABLE>'
+                f'{bin_items}'
+                f'<FACENAMELIST>{fonts}</FACENAMELIST>'
+                '<BORDERFILLLIST Count="1"><BORDERFILL BackSlash="0" BreakCellSeparateLine="0" '
+                'CenterLine="0" CounterBackSlash="0" CounterSlash="0" CrookedSlash="0" Id="1" '
+                'Shadow="false" Slash="0" ThreeD="false"/></BORDERFILLLIST>'
+                f'<CHARSHAPELIST Count="1">{char_shape}</CHARSHAPELIST>'
+                '<TABDEFLIST Count="1"><TABDEF AutoTabLeft="false" AutoTabRight="false" Id="0"/></TABDEFLIST>'
+                f'<PARASHAPELIST Count="{len(para_shapes)}">{"".join(para_shapes)}</PARASHAPELIST>'
+                '<STYLELIST Count="1"><STYLE CharShape="0" EngName="Normal" Id="0" LangId="1042" '
+                'LockForm="0" Name="바탕글" NextStyle="0" ParaShape="0" Type="Para"/></STYLELIST>'
+                '</MAPPINGTABLE></HEAD>')
+
+    def _tail(self) -> str:
+        embedded = [(i, image) for i, image in enumerate(self._images, 1) if image.data is not None]
+        if not embedded:
+            return '<TAIL/>'
+        items = ''.join(f'<BINDATA Encoding="Base64" Id="{i}" Size="{len(image.data)}">'
+                        f'{base64.b64encode(image.data).decode("ascii")}</BINDATA>'
+                        for i, image in embedded)
+        return f'<TAIL><BINDATASTORAGE>{items}</BINDATASTORAGE></TAIL>'
+
+    def document(self, blocks: List[MarkdownBlock], images: Dict[str, Optional[ImageInfo]] = None) -> str:
+        """HWPML 문서 전체"""
+        self._para_shapes.clear()
+        self._images.clear()
+        self.missing_pictures.clear()
+        self.paragraph_count = 0
+        self._para_shape_id(self.base_para_shape)       # Id 0 = 스타일 기본 문단 모양
+        # 본문을 먼저 만들어야 HEAD의 모양/그림 목록이 채워짐
+        body = self.body(blocks, images)
+        return ('<?xml version="1.0" encoding="UTF-16" standalone="no" ?>'
+                '<HWPML Style="embed" SubVersion="8.0.0.0" Version="2.8">'
+                f'{self._head()}<BODY><SECTION Id="0">{body}</SECTION></BODY>{self._tail()}</HWPML>')
+
+
+def markdown_to_hwpml(markdown_text: str, embed: bool = True, caption: bool = True,
+                      base_para_shape: Dict[str, int] = None, base_char_shape: Dict = None) -> str:
+    """
+    마크다운 텍스트를 HWPML 문자열로 변환 (md_to_hwp.markdown_to_hwp와 같은 줄 규칙)
+
+    Args:
+        markdown_text: 마크다운 텍스트
+        embed: 그림을 문서에 포함 (False면 파일 경로로 연결)
+        caption: 그림 아래에 파일명 캡션
+        base_para_shape: 삽입 위치 문단의 모양 (BASE_PARA_SHAPE 항목)
+        base_char_shape: 삽입 위치 글자 모양 (BASE_CHAR_SHAPE 항목)
+
+    Returns:
+        HWPML 문자열 (SetTextFile(xml, "HWPML2X", "insertfile")로 삽입)
+    """
+    lines = markdown_text.strip().split('\n')
+    writer = MarkdownHwpmlWriter(embed=embed, caption=caption, base_para_shape=base_para_shape,
+                                 base_char_shape=base_char_shape)
+    return writer.document(compile_markdown(lines))
@@ -7,8 +7,15 @@
 import sys
 import os
 import re
+import io
+from contextlib import nullcontext
+from dataclasses import dataclass
+from itertools import chain, groupby
+from typing import Optional
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from cursor import get_hwp_instance
+
+from image_prep import ImagePrefetcher, to_windows_path
+from shape_state import ShapeState
 
 # 전역 hwp 인스턴스
 _hwp_instance = None
@@ -17,6 +24,8 @@ def get_hwp():
     """전역 hwp 인스턴스 반환"""
     global _hwp_instance
     if _hwp_instance is None:
+        # 연결할 때만 pywin32 필요 (파싱/HWPML 생성은 한글 없이도 사용)
+        from cursor import get_hwp_instance
         _hwp_instance = get_hwp_instance()
     return _hwp_instance
 
@@ -61,6 +70,74 @@ def parse_markdown_line(line):
     return level, text
 
 
+# =============================================================================
+# 스트리밍 입력: 줄 읽기 → 앞뒤 공백 정리 → 섹션 경계
+# =============================================================================
+
+def read_markdown_lines(source):
+    """
+    마크다운 원본을 한 줄씩 읽기 (끝의 '\n' 제거)
+
+    Args:
+        source: 문자열, 파일 객체(텍스트 모드) 또는 줄 iterable
+    """
+    if isinstance(source, str):
+        source = io.StringIO(source, newline='\n')
+    for line in source:
+        yield line[:-1] if line.endswith('\n') else line
+
+
+def strip_markdown_lines(lines):
+    """
+    markdown_text.strip().split('\n')과 같은 줄을 스트리밍으로 생성
+
+    앞쪽 빈 줄과 첫 줄 앞 공백, 뒤쪽 빈 줄과 마지막 줄 뒤 공백을 제거합니다.
+    중간의 빈 줄은 다음 내용 줄이 나올 때까지만 보관합니다.
+    """
+    lines = iter(lines)
+    prev = None
+    for line in lines:
+        if line.strip():
+            prev = line.lstrip()
+            break
+    if prev is None:
+        yield ''
+        return
+
+    blanks = []
+    for line in lines:
+        if not line.strip():
+            blanks.append(line)
+            continue
+        yield prev
+        yield from blanks
+        blanks = []
+        prev = line
+    yield prev.rstrip()
+
+
+def iter_sections(lines):
+    """
+    줄을 # (레벨 1) 단위 섹션으로 나누기 (섹션 내용을 모아두지 않음)
+
+    Yields:
+        (index, title, section_lines) - section_lines는 헤딩 줄부터 시작하는 줄 iterator,
+        다음 섹션으로 넘어가면 읽지 않은 줄은 건너뜀 (itertools.groupby와 같음)
+    """
+    heading_count = 0
+
+    def section_key(line):
+        nonlocal heading_count
+        if parse_markdown_line(line)[0] == 1:
+            heading_count += 1
+        return heading_count
+
+    for index, (_, group) in enumerate(groupby(lines, section_key)):
+        first = next(group)
+        level, text = parse_markdown_line(first)
+        yield index, (text if level == 1 else None), chain([first], group)
+
+
 def split_by_section(markdown_text):
     """
     마크다운 텍스트를 # (레벨 1) 단위로 섹션 분리
@@ -75,36 +152,9 @@ def split_by_section(markdown_text):
             ...
         ]
     """
-    lines = markdown_text.strip().split('\n')
-    sections = []
-    current_section = []
-    current_title = None
-
-    for line in lines:
-        level, text = parse_markdown_line(line)
-
-        if level == 1:
-            # 새 섹션 시작
-            if current_section:
-                # 이전 섹션 저장
-                sections.append({
-                    'title': current_title,
-                    'content': '\n'.join(current_section)
-                })
-            current_section = [line]
-            current_title = text
-        else:
-            # 현재 섹션에 추가
-            current_section.append(line)
-
-    # 마지막 섹션 저장
-    if current_section:
-        sections.append({
-            'title': current_title,
-            'content': '\n'.join(current_section)
-        })
-
-    return sections
+    lines = strip_markdown_lines(read_markdown_lines(markdown_text))
+    return [{'title': title, 'content': '\n'.join(section_lines)}
+            for _, title, section_lines in iter_sections(lines)]
 
 
 def get_sections(markdown_text):
@@ -114,8 +164,8 @@ def get_sections(markdown_text):
     Returns:
         [(index, title), ...]
     """
-    sections = split_by_section(markdown_text)
-    return [(i, s['title']) for i, s in enumerate(sections)]
+    lines = strip_markdown_lines(read_markdown_lines(markdown_text))
+    return [(i, title) for i, title, _ in iter_sections(lines)]
 
 
 def convert_line(level, text):
@@ -129,24 +179,30 @@ def convert_line(level, text):
     return f"{prefix}{text}"
 
 
-def set_para_shape(hwp, level):
-    """문단 모양 설정 (왼쪽 여백 + 내어쓰기)"""
-    if level == 0:
-        return
-
+def para_margins(level):
+    """레벨의 (왼쪽 여백, 들여쓰기) HWPUNIT - 들여쓰기는 음수(내어쓰기)"""
     style = HEADING_STYLES.get(level, HEADING_STYLES[5])
-    left_margin = style["left_margin"]
-    hanging = style["hanging"]
 
     # pt → HWPUNIT 변환 (1pt = 200 HWPUNIT)
-    left_margin_hwp = int(left_margin * 200)
-    hanging_hwp = int(hanging * 200)
+    left_margin_hwp = int(style["left_margin"] * 200)
+    hanging_hwp = int(style["hanging"] * 200)
+    return left_margin_hwp, -hanging_hwp
+
 
-    # 문단 모양 설정
-    hwp.HAction.GetDefault("ParagraphShape", hwp.HParameterSet.HParaShape.HSet)
-    hwp.HParameterSet.HParaShape.LeftMargin = left_margin_hwp
-    hwp.HParameterSet.HParaShape.Indentation = -hanging_hwp  # 음수 = 내어쓰기
-    hwp.HAction.Execute("ParagraphShape", hwp.HParameterSet.HParaShape.HSet)
+def set_para_shape(hwp, level, shapes=None):
+    """문단 모양 설정 (왼쪽 여백 + 내어쓰기)
+
+    shapes(ShapeState)를 주면 마지막으로 적용한 값과 같을 때 실행하지 않음
+    """
+    if level == 0:
+        return
+
+    left_margin_hwp, indent_hwp = para_margins(level)
+
+    # 문단 모양 설정 (음수 Indentation = 내어쓰기)
+    if shapes is None:
+        shapes = ShapeState(hwp)
+    shapes.set_para(LeftMargin=left_margin_hwp, Indentation=indent_hwp)
 
 
 # 이미지 삽입 관련 상수
@@ -191,7 +247,8 @@ def parse_picture_line(line):
     return path
 
 
-def insert_picture(hwp, path, width=None, height=None, embed=True, in_cell=False, caption=True):
+def insert_picture(hwp, path, width=None, height=None, embed=True, in_cell=False, caption=True,
+                   prepared=None):
     """한글 문서에 이미지 삽입
 
     Args:
@@ -202,24 +259,19 @@ def insert_picture(hwp, path, width=None, height=None, embed=True, in_cell=False
         embed: 문서에 포함 여부 (기본 True)
         in_cell: 테이블 셀 안에 삽입 여부
         caption: 캡션에 파일명 삽입 여부 (기본 True)
+        prepared: image_prep.PreparedImage (미리 확인/축소한 경로와 크기, 없으면 그대로 삽입)
 
     Returns:
         성공 시 Ctrl 객체, 실패 시 None
     """
     # 경로 변환 (WSL 경로 → Windows 경로)
-    win_path = path
-    if path.startswith("/mnt/"):
-        # /mnt/c/... → C:/...
-        parts = path.split("/")
-        if len(parts) >= 3:
-            drive = parts[2].upper()
-            rest = "/".join(parts[3:])
-            win_path = f"{drive}:/{rest}"
-
-    # 파일 존재 확인 (원본 경로로)
-    check_path = path
-    if not os.path.exists(check_path) and os.path.exists(win_path.replace("/", "\\")):
-        check_path = win_path.replace("/", "\\")
+    win_path = to_windows_path(path)
+
+    if prepared is not None:
+        # 미리 확인한 결과 사용
+        win_path = prepared.win_path
+        if width is None and height is None and prepared.width_mm is not None:
+            width, height = prepared.width_mm, prepared.height_mm
 
     # 크기 옵션 결정
     if in_cell:
@@ -241,6 +293,11 @@ def insert_picture(hwp, path, width=None, height=None, embed=True, in_cell=False
         hwp.HParameterSet.HParaShape.AlignType = 3  # 3 = 가운데 정렬
         hwp.HAction.Execute("ParagraphShape", hwp.HParameterSet.HParaShape.HSet)
 
+        # 미리 확인한 파일이 없으면 삽입 호출 생략 (가운데 정렬은 md_hwpml과 같이 유지)
+        if prepared is not None and not prepared.exists:
+            print(f"[오류] 이미지 파일 없음: {win_path}")
+            return None
+
         ctrl = hwp.InsertPicture(
             win_path,       # path
             embed,          # embedded
@@ -256,8 +313,8 @@ def insert_picture(hwp, path, width=None, height=None, embed=True, in_cell=False
             # 캡션 추가 (파일명)
             if caption:
                 try:
-                    # 파일명 추출
-                    filename = os.path.basename(win_path)
+                    # 파일명 추출 (축소본이어도 원래 파일명)
+                    filename = os.path.basename(to_windows_path(path))
 
                     # 이미지 선택 (방금 삽입한 개체)
                     hwp.HAction.Run("SelectCtrlFront")
@@ -290,6 +347,142 @@ def insert_picture(hwp, path, width=None, height=None, embed=True, in_cell=False
         return None
 
 
+# =============================================================================
+# 컴파일: 마크다운 줄 → 렌더링 블록
+# =============================================================================
+
+@dataclass
+class MarkdownBlock:
+    """렌더링 단위 - 같은 레벨이 이어지는 줄 묶음(text) 또는 그림 한 줄(picture)"""
+    kind: str                     # 'text' 또는 'picture'
+    level: int = 0                # 'text': HEADING_STYLES 레벨 (0=일반 텍스트)
+    text: str = ""                # 'text': 변환한 줄들을 "\r\n"으로 이은 텍스트
+    path: Optional[str] = None    # 'picture': 그림 경로 (경로가 없는 태그면 None)
+    line_count: int = 0           # 블록이 차지하는 마크다운 줄 수
+    break_after: bool = False     # 블록 뒤 줄바꿈 (마지막 줄이 아니면 True)
+
+
+# 스트리밍 렌더링에서 text 블록 하나에 묶는 최대 줄 수 (같은 레벨이 아주 길게 이어져도 메모리 제한)
+MAX_BLOCK_LINES = 1000
+
+
+def _text_block(level, converted_lines):
+    return MarkdownBlock('text', level=level, text="\r\n".join(converted_lines),
+                         line_count=len(converted_lines))
+
+
+def iter_blocks(lines, group_levels=True, max_lines=None):
+    """
+    마크다운 줄을 렌더링 블록으로 하나씩 컴파일 (블록 하나만 미리 읽어 break_after 결정)
+
+    같은 레벨이 이어지는 줄은 한 블록으로 묶어 문단 모양 설정 1회 + InsertText 1회로 렌더링합니다.
+    한글은 줄바꿈으로 생긴 문단에 앞 문단의 모양을 물려주므로 줄마다 설정한 결과와 같습니다.
+
+    Args:
+        lines: 마크다운 줄 iterable
+        group_levels: False면 레벨과 관계없이 연속된 텍스트 줄을 한 블록으로 (문단 모양을 설정하지 않는 셀 삽입용)
+        max_lines: text 블록 하나의 최대 줄 수 (None이면 제한 없음, 넘으면 같은 레벨 블록을 이어서 생성)
+
+    Yields:
+        MarkdownBlock
+    """
+    def raw_blocks():
+        level = None            # 묶는 중인 text 블록 레벨
+        converted = []
+        for line in lines:
+            if is_picture_line(line):
+                if converted:
+                    yield _text_block(level, converted)
+                    converted = []
+                yield MarkdownBlock('picture', path=parse_picture_line(line), line_count=1)
+                continue
+
+            line_level, text = parse_markdown_line(line)
+            if converted and ((group_levels and line_level != level)
+                              or (max_lines and len(converted) >= max_lines)):
+                yield _text_block(level, converted)
+                converted = []
+            if not converted:
+                level = line_level
+            converted.append(convert_line(line_level, text))
+        if converted:
+            yield _text_block(level, converted)
+
+    pending = None
+    for block in raw_blocks():
+        if pending is not None:
+            pending.break_after = True
+            yield pending
+        pending = block
+    if pending is not None:
+        yield pending
+
+
+def compile_markdown(lines, group_levels=True):
+    """
+    마크다운 줄 목록을 렌더링 블록 목록으로 컴파일 (iter_blocks 참고)
+
+    Returns:
+        [MarkdownBlock, ...]
+    """
+    return list(iter_blocks(lines, group_levels))
+
+
+def _insert_text(hwp, text):
+    """현재 위치에 텍스트 삽입 (\r\n은 문단 나누기)"""
+    hwp.HAction.GetDefault("InsertText", hwp.HParameterSet.HInsertText.HSet)
+    hwp.HParameterSet.HInsertText.Text = text
+    hwp.HAction.Execute("InsertText", hwp.HParameterSet.HInsertText.HSet)
+
+
+def _image_prefetcher(images):
+    """전달받은 ImagePrefetcher는 그대로 사용(닫지 않음), 없으면 새로 만들고 렌더링이 끝나면 닫음"""
+    return nullcontext(images) if images is not None else ImagePrefetcher()
+
+
+def render_blocks(hwp, blocks, para_shape=True, in_cell=False, images=None, shapes=None):
+    """
+    컴파일한 블록을 현재 위치에 렌더링
+
+    Args:
+        hwp: HWP 객체
+        blocks: compile_markdown / iter_blocks 결과
+        para_shape: True면 text 블록마다 문단 모양(내어쓰기) 설정
+        in_cell: 그림을 셀 크기에 맞춰 삽입
+        images: image_prep.ImagePrefetcher (앞쪽 그림을 작업 스레드에서 미리 준비, None이면 바로 삽입)
+        shapes: shape_state.ShapeState (이어서 렌더링할 때 공유, None이면 새로 만듦)
+                새 문단은 앞 문단 모양을 물려받으므로 같은 레벨이 다시 나오면 문단 모양을 다시 설정하지 않음
+
+    Returns:
+        {'lines': 렌더링한 마크다운 줄 수, 'pictures': 삽입한 그림 수}
+    """
+    line_count = 0
+    picture_count = 0
+    if images is not None:
+        blocks = images.prefetch(blocks)
+    if shapes is None:
+        shapes = ShapeState(hwp)
+    for block in blocks:
+        line_count += block.line_count
+        if block.kind == 'picture':
+            if block.path:
+                prepared = images.get(block.path) if images is not None else None
+                insert_picture(hwp, block.path, in_cell=in_cell, prepared=prepared)
+                picture_count += 1
+                # 가운데 정렬/캡션 입력으로 커서 위치의 모양을 알 수 없음
+                shapes.invalidate()
+            # 그림 문단은 가운데 정렬이므로 줄바꿈은 따로 삽입 (다음 블록 문단 모양과 섞이지 않게)
+            if block.break_after:
+                _insert_text(hwp, "\r\n")
+            continue
+
+        # 문단 모양 먼저 설정 (내어쓰기) - 묶음 안의 문단은 이 모양을 물려받음
+        if para_shape:
+            set_para_shape(hwp, block.level, shapes)
+        _insert_text(hwp, block.text + "\r\n" if block.break_after else block.text)
+    return {'lines': line_count, 'pictures': picture_count}
+
+
 def markdown_to_hwp_text(markdown_text):
     """마크다운 텍스트를 한글 문서 형식으로 변환"""
     lines = markdown_text.strip().split('\n')
@@ -318,60 +511,92 @@ def insert_text_to_hwp(text):
     return True
 
 
-def markdown_to_hwp(markdown_text):
-    """마크다운 텍스트를 한글 문서에 삽입 (내어쓰기 적용, 이미지 지원)"""
+def markdown_to_hwp(markdown_text, images=None):
+    """
+    마크다운 텍스트를 한글 문서에 삽입 (내어쓰기 적용, 이미지 지원)
+
+    Args:
+        markdown_text: 문자열, 파일 객체 또는 줄 iterable (읽으면서 렌더링)
+        images: image_prep.ImagePrefetcher (최대 크기/캐시 설정, None이면 기본 설정으로 생성)
+    """
     hwp = get_hwp()
     if not hwp:
         print("[오류] 한글이 실행 중이지 않습니다.")
         return False
 
-    lines = markdown_text.strip().split('\n')
-    picture_count = 0
+    lines = strip_markdown_lines(read_markdown_lines(markdown_text))
+    with _image_prefetcher(images) as prefetcher:
+        result = render_blocks(hwp, iter_blocks(lines, max_lines=MAX_BLOCK_LINES), images=prefetcher)
 
-    for i, line in enumerate(lines):
-        # [picture] 태그 처리
-        if is_picture_line(line):
-            pic_path = parse_picture_line(line)
-            if pic_path:
-                insert_picture(hwp, pic_path)
-                picture_count += 1
-            # 마지막 줄이 아니면 줄바꿈
-            if i < len(lines) - 1:
-                hwp.HAction.GetDefault("InsertText", hwp.HParameterSet.HInsertText.HSet)
-                hwp.HParameterSet.HInsertText.Text = "\r\n"
-                hwp.HAction.Execute("InsertText", hwp.HParameterSet.HInsertText.HSet)
-            continue
+    print(f"총 {result['lines']}줄 삽입 완료 (이미지 {result['pictures']}개)")
+    return True
 
-        level, text = parse_markdown_line(line)
-        converted = convert_line(level, text)
 
-        # 문단 모양 먼저 설정 (내어쓰기)
-        set_para_shape(hwp, level)
+def markdown_to_hwp_hwpml(markdown_text, embed=True, caption=True):
+    """
+    마크다운 텍스트를 HWPML로 만든 뒤 현재 위치에 한 번에 삽입 (커서 입력 없음)
+
+    줄마다 문단 모양/텍스트를 입력하는 markdown_to_hwp와 같은 결과를 SetTextFile 1회로 만듭니다.
+    큰 문서에서 사용하세요. HWPML 생성은 md_hwpml.markdown_to_hwpml (한글 없이도 실행 가능).
+
+    Args:
+        markdown_text: 마크다운 텍스트
+        embed: 그림을 문서에 포함 (False면 파일 경로로 연결)
+        caption: 그림 아래에 파일명 캡션
+    """
+    from md_hwpml import BASE_CHAR_SHAPE, BASE_PARA_SHAPE, MarkdownHwpmlWriter
+
+    hwp = get_hwp()
+    if not hwp:
+        print("[오류] 한글이 실행 중이지 않습니다.")
+        return False
 
-        # 텍스트 삽입
-        hwp.HAction.GetDefault("InsertText", hwp.HParameterSet.HInsertText.HSet)
-        hwp.HParameterSet.HInsertText.Text = converted
-        hwp.HAction.Execute("InsertText", hwp.HParameterSet.HInsertText.HSet)
+    # 삽입 위치 문단 모양에서 이어서 (레벨 0 줄은 앞 문단 모양을, 모든 줄은 줄간격/문단 간격을 물려받음)
+    para_shape = hwp.ParaShape
+    base = {}
+    for name in BASE_PARA_SHAPE:
+        value = para_shape.Item(name)
+        if value is not None:
+            base[name] = value
+    # 글자 모양도 삽입 위치에서 이어서 (커서 입력은 삽입 위치 글자 모양으로 입력됨)
+    char_shape = hwp.CharShape
+    base_char = {}
+    for name in BASE_CHAR_SHAPE:
+        value = char_shape.Item(name)
+        if value is not None:
+            base_char[name] = value
 
-        # 마지막 줄이 아니면 줄바꿈
-        if i < len(lines) - 1:
-            hwp.HAction.GetDefault("InsertText", hwp.HParameterSet.HInsertText.HSet)
-            hwp.HParameterSet.HInsertText.Text = "\r\n"
-            hwp.HAction.Execute("InsertText", hwp.HParameterSet.HInsertText.HSet)
+    lines = markdown_text.strip().split('\n')
+    blocks = compile_markdown(lines)
+    writer = MarkdownHwpmlWriter(embed=embed, caption=caption, base_para_shape=base,
+                                 base_char_shape=base_char)
+    xml = writer.document(blocks)
 
-    print(f"총 {len(lines)}줄 삽입 완료 (이미지 {picture_count}개)")
+    for path in writer.missing_pictures:
+        print(f"[오류] 이미지 삽입 실패: {to_windows_path(path)}")
+
+    if not hwp.SetTextFile(xml, "HWPML2X", "insertfile"):
+        print("[오류] HWPML 삽입 실패")
+        return False
+
+    picture_count = sum(1 for block in blocks if block.kind == 'picture' and block.path)
+    print(f"총 {len(lines)}줄 삽입 완료 (HWPML, 이미지 {picture_count - len(writer.missing_pictures)}개)")
     return True
 
 
-def markdown_to_hwp_by_section(markdown_text, section_index=None, callback=None):
+def markdown_to_hwp_by_section(markdown_text, section_index=None, callback=None, images=None):
     """
     마크다운 텍스트를 # 단위(섹션)로 나눠서 렌더링
 
+    원본을 한 줄씩 읽으며 섹션 경계를 찾아 바로 렌더링하므로 첫 섹션은 원본을 끝까지 읽기 전에
+    삽입되고, 섹션 내용을 메모리에 모아두지 않습니다. section_index를 주면 다른 섹션은 읽기만 하고 건너뜁니다.
+
     Args:
-        markdown_text: 전체 마크다운 텍스트
+        markdown_text: 전체 마크다운 텍스트, 파일 객체 또는 줄 iterable
         section_index: 특정 섹션만 렌더링 (None이면 전체, 0부터 시작)
         callback: 각 섹션 렌더링 후 호출할 콜백 함수
                   callback(section_idx, section_title, result)
+        images: image_prep.ImagePrefetcher (None이면 기본 설정으로 생성)
 
     Returns:
         {
@@ -386,91 +611,59 @@ def markdown_to_hwp_by_section(markdown_text, section_index=None, callback=None)
         print("[오류] 한글이 실행 중이지 않습니다.")
         return {'success': False, 'error': '한글이 실행 중이지 않습니다.'}
 
-    # 섹션 분리
-    sections = split_by_section(markdown_text)
-    total_sections = len(sections)
-
-    if total_sections == 0:
-        print("[오류] 섹션이 없습니다.")
-        return {'success': False, 'error': '섹션이 없습니다.'}
-
-    print(f"[섹션 분리] 총 {total_sections}개 섹션")
-    for i, s in enumerate(sections):
-        line_count = len(s['content'].split('\n'))
-        print(f"  [{i}] {s['title']} ({line_count}줄)")
-
-    # 렌더링할 섹션 결정
-    if section_index is not None:
-        if section_index < 0 or section_index >= total_sections:
-            print(f"[오류] 섹션 인덱스 {section_index}가 범위를 벗어났습니다. (0~{total_sections-1})")
-            return {'success': False, 'error': f'섹션 인덱스 범위 오류'}
-        sections_to_render = [(section_index, sections[section_index])]
-    else:
-        sections_to_render = list(enumerate(sections))
+    if section_index is not None and section_index < 0:
+        print(f"[오류] 섹션 인덱스 {section_index}가 범위를 벗어났습니다.")
+        return {'success': False, 'error': f'섹션 인덱스 범위 오류'}
 
     rendered_sections = []
+    total_sections = 0
     total_lines = 0
     total_pictures = 0
 
-    for idx, section in sections_to_render:
-        print(f"\n[섹션 {idx}] '{section['title']}' 렌더링 중...")
+    lines = strip_markdown_lines(read_markdown_lines(markdown_text))
+    shapes = ShapeState(hwp)    # 섹션 구분 줄바꿈도 문단 모양을 물려받으므로 섹션 사이에 공유
+    with _image_prefetcher(images) as prefetcher:
+        for idx, title, section_lines in iter_sections(lines):
+            total_sections += 1
+            if section_index is not None and idx != section_index:
+                continue    # 읽기만 하고 건너뜀 (다음 섹션으로 넘어갈 때 남은 줄 소비)
 
-        lines = section['content'].strip().split('\n')
-        picture_count = 0
+            # 섹션 간 구분 (앞 섹션이 있으면 줄바꿈 추가)
+            if rendered_sections:
+                _insert_text(hwp, "\r\n")
 
-        for i, line in enumerate(lines):
-            # [picture] 태그 처리
-            if is_picture_line(line):
-                pic_path = parse_picture_line(line)
-                if pic_path:
-                    insert_picture(hwp, pic_path)
-                    picture_count += 1
-                if i < len(lines) - 1:
-                    hwp.HAction.GetDefault("InsertText", hwp.HParameterSet.HInsertText.HSet)
-                    hwp.HParameterSet.HInsertText.Text = "\r\n"
-                    hwp.HAction.Execute("InsertText", hwp.HParameterSet.HInsertText.HSet)
-                continue
-
-            level, text = parse_markdown_line(line)
-            converted = convert_line(level, text)
+            print(f"\n[섹션 {idx}] '{title}' 렌더링 중...")
 
-            # 문단 모양 설정
-            set_para_shape(hwp, level)
+            blocks = iter_blocks(strip_markdown_lines(section_lines), max_lines=MAX_BLOCK_LINES)
+            rendered = render_blocks(hwp, blocks, images=prefetcher, shapes=shapes)
 
-            # 텍스트 삽입
-            hwp.HAction.GetDefault("InsertText", hwp.HParameterSet.HInsertText.HSet)
-            hwp.HParameterSet.HInsertText.Text = converted
-            hwp.HAction.Execute("InsertText", hwp.HParameterSet.HInsertText.HSet)
+            section_result = {
+                'index': idx,
+                'title': title,
+                'lines': rendered['lines'],
+                'pictures': rendered['pictures']
+            }
+            rendered_sections.append(section_result)
+            total_lines += rendered['lines']
+            total_pictures += rendered['pictures']
 
-            # 줄바꿈
-            if i < len(lines) - 1:
-                hwp.HAction.GetDefault("InsertText", hwp.HParameterSet.HInsertText.HSet)
-                hwp.HParameterSet.HInsertText.Text = "\r\n"
-                hwp.HAction.Execute("InsertText", hwp.HParameterSet.HInsertText.HSet)
-
-        section_result = {
-            'index': idx,
-            'title': section['title'],
-            'lines': len(lines),
-            'pictures': picture_count
-        }
-        rendered_sections.append(section_result)
-        total_lines += len(lines)
-        total_pictures += picture_count
+            print(f"  -> {rendered['lines']}줄, 이미지 {rendered['pictures']}개 완료")
 
-        print(f"  -> {len(lines)}줄, 이미지 {picture_count}개 완료")
+            # 콜백 호출 (콜백이 커서나 모양을 바꿀 수 있으므로 기억한 모양 버림)
+            if callback:
+                callback(idx, title, section_result)
+                shapes.invalidate()
 
-        # 콜백 호출
-        if callback:
-            callback(idx, section['title'], section_result)
+    if total_sections == 0:
+        print("[오류] 섹션이 없습니다.")
+        return {'success': False, 'error': '섹션이 없습니다.'}
 
-        # 섹션 간 구분 (마지막 섹션이 아니면 줄바꿈 추가)
-        if idx < total_sections - 1 and section_index is None:
-            hwp.HAction.GetDefault("InsertText", hwp.HParameterSet.HInsertText.HSet)
-            hwp.HParameterSet.HInsertText.Text = "\r\n"
-            hwp.HAction.Execute("InsertText", hwp.HParameterSet.HInsertText.HSet)
+    if section_index is not None and not rendered_sections:
+        print(f"[오류] 섹션 인덱스 {section_index}가 범위를 벗어났습니다. (0~{total_sections-1})")
+        return {'success': False, 'error': f'섹션 인덱스 범위 오류'}
 
-    print(f"\n[완료] {len(rendered_sections)}개 섹션, 총 {total_lines}줄, 이미지 {total_pictures}개")
+    print(f"\n[완료] {len(rendered_sections)}개 섹션 (전체 {total_sections}개), "
+          f"총 {total_lines}줄, 이미지 {total_pictures}개")
 
     return {
         'success': True,
@@ -496,8 +689,8 @@ def render_section(markdown_text, section_index):
     return markdown_to_hwp_by_section(markdown_text, section_index=section_index)
 
 
-def markdown_to_hwp_in_table(markdown_text, table_index=0, row=0, col=0):
-    """마크다운 텍스트를 테이블 셀에 삽입"""
+def markdown_to_hwp_in_table(markdown_text, table_index=0, row=0, col=0, images=None):
+    """마크다운 텍스트를 테이블 셀에 삽입 (images: image_prep.ImagePrefetcher, None이면 기본 설정)"""
     from table.table_info import TableInfo
 
     hwp = get_hwp()
@@ -533,35 +726,9 @@ def markdown_to_hwp_in_table(markdown_text, table_index=0, row=0, col=0):
 
     # 마크다운 텍스트 변환 및 삽입
     lines = markdown_text.strip().split('\n')
-    picture_count = 0
-
-    for i, line in enumerate(lines):
-        # [picture] 태그 처리
-        if is_picture_line(line):
-            pic_path = parse_picture_line(line)
-            if pic_path:
-                insert_picture(hwp, pic_path, in_cell=True)
-                picture_count += 1
-            # 마지막 줄이 아니면 줄바꿈
-            if i < len(lines) - 1:
-                hwp.HAction.GetDefault("InsertText", hwp.HParameterSet.HInsertText.HSet)
-                hwp.HParameterSet.HInsertText.Text = "\r\n"
-                hwp.HAction.Execute("InsertText", hwp.HParameterSet.HInsertText.HSet)
-            continue
-
-        level, text = parse_markdown_line(line)
-        converted = convert_line(level, text)
-
-        # 텍스트 삽입
-        hwp.HAction.GetDefault("InsertText", hwp.HParameterSet.HInsertText.HSet)
-        hwp.HParameterSet.HInsertText.Text = converted
-        hwp.HAction.Execute("InsertText", hwp.HParameterSet.HInsertText.HSet)
-
-        # 마지막 줄이 아니면 줄바꿈
-        if i < len(lines) - 1:
-            hwp.HAction.GetDefault("InsertText", hwp.HParameterSet.HInsertText.HSet)
-            hwp.HParameterSet.HInsertText.Text = "\r\n"
-            hwp.HAction.Execute("InsertText", hwp.HParameterSet.HInsertText.HSet)
+    with _image_prefetcher(images) as prefetcher:
+        picture_count = render_blocks(hwp, compile_markdown(lines, group_levels=False),
+                                      para_shape=False, in_cell=True, images=prefetcher)['pictures']
 
     # 테이블 밖으로 나가기
     hwp.HAction.Run("MoveParentList")
@@ -0,0 +1,403 @@
+"""
+문단-페이지 인덱스 - 본문 모든 문단의 시작/끝 페이지, 줄 수, 빈 문단 여부를 한 번의 순회로 수집
+
+문단마다 문서 처음부터 다시 순회하지 않고, 한 번 만든 인덱스에서 bisect로 페이지별 문단을 찾습니다.
+편집 후에는 patch(para_id)로 편집한 문단부터 배치가 이전과 같아지는 페이지까지만 다시 계산합니다.
+
+사용법:
+    from para_page_index import ParagraphPageIndex
+
+    index = ParagraphPageIndex(hwp).build()
+    index.paragraphs_on_page(80)      # 80쪽에서 시작하는 문단 ID 목록
+    index.last_para_on_page(80)       # 80쪽에서 시작하는 마지막 문단
+
+    # 문단 12를 편집한 후
+    index.patch(12)
+    index.patches[-1]                 # 배치가 바뀐 페이지 범위 (IndexPatch)
+"""
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field, replace
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+def lines_per_page_by_bisection(hwp, list_id: int, para_id: int, para_end: int,
+                                start: Tuple[int, ...], end: Tuple[int, ...],
+                                line_starts: Sequence[int] = None) -> Dict[int, int]:
+    """
+    걸친 문단의 페이지별 줄 수 (페이지/단 경계를 이분 탐색)
+
+    줄마다 MoveDown + KeyIndicator를 하지 않고, 페이지나 단이 바뀌는 첫 위치를
+    SetPos + KeyIndicator로 이분 탐색합니다. 경계 하나에 O(log 줄 수)번 (줄 시작 목록이 없으면
+    O(log 글자 수)번) 조회하며, 구간의 마지막 위치의 줄 번호로 그 구간의 줄 수를 계산합니다.
+    다단 편집에서는 KeyIndicator의 줄 번호가 단마다 다시 시작하므로 (페이지, 단) 구간마다 세어
+    페이지별로 더합니다.
+
+    Args:
+        hwp: 한글 인스턴스 (커서 위치는 호출자가 복원)
+        list_id, para_id: 문단 위치
+        para_end: 문단 끝 pos
+        start: 문단 시작의 (페이지, 줄 번호, 단 번호) - 단 번호를 빼면 1단
+        end: 문단 끝의 (페이지, 줄 번호, 단 번호)
+        line_starts: 줄 시작 pos 목록 (있으면 줄 단위로 탐색, 예: BlockSelector 캐시)
+
+    Returns:
+        {페이지: 줄 수} (SeparatedPara.get_spanning_lines의 lines_per_page와 같은 형식)
+    """
+    def segment(info):
+        return info[0], (info[2] if len(info) > 2 else 1)
+
+    if segment(start) == segment(end):
+        return {start[0]: end[1] - start[1] + 1}
+
+    points = list(line_starts) if line_starts else range(para_end + 1)
+    last = len(points) - 1
+
+    def probe(index):
+        hwp.SetPos(list_id, para_id, points[index])
+        key_info = hwp.KeyIndicator()
+        # KeyIndicator 반환: (BOOL, seccnt, secno, prnpageno, colno, line, pos, over, ctrlname)
+        return key_info[3], key_info[5], key_info[4]
+
+    lines_per_page: Dict[int, int] = {}
+    lo, lo_info = 0, start              # 현재 구간의 위치 (탐색 후 마지막 위치)
+    first, first_line = 0, start[1]     # 현재 구간에서 문단이 시작하는 위치/줄 번호
+    while segment(lo_info) != segment(end) and lo < last:
+        current = segment(lo_info)
+        hi, hi_info = last, end         # 다음 구간 이후의 위치
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            info = probe(mid)
+            if segment(info) != current:
+                hi, hi_info = mid, info
+            else:
+                lo, lo_info = mid, info
+
+        count = lo - first + 1 if line_starts else lo_info[1] - first_line + 1
+        lines_per_page[current[0]] = lines_per_page.get(current[0], 0) + count
+        lo, lo_info = hi, hi_info
+        first, first_line = hi, hi_info[1]
+
+    page = lo_info[0]
+    count = last - first + 1 if line_starts else end[1] - first_line + 1
+    lines_per_page[page] = lines_per_page.get(page, 0) + count
+    return lines_per_page
+
+
+@dataclass
+class ParaPageInfo:
+    """문단 하나의 페이지 배치 정보"""
+    para_id: int
+    start_page: int
+    end_page: int
+    start_line: int = 1        # 시작 페이지 안에서의 줄 번호 (1부터, KeyIndicator 기준, 다단이면 단 안에서)
+    end_line: int = 1          # 끝 페이지 안에서의 줄 번호
+    start_col: int = 1         # 시작 단 번호 (1단이면 1)
+    line_count: int = 1
+    is_empty: bool = False
+    lines_per_page: Dict[int, int] = field(default_factory=dict)  # {page: 줄 수}
+
+    @property
+    def is_spanning(self) -> bool:
+        """두 페이지 이상에 걸친 문단인지"""
+        return self.start_page != self.end_page
+
+    def to_dict(self) -> Dict:
+        """SeparatedPara.para_page_map 항목 형식"""
+        return {
+            'start_page': self.start_page,
+            'end_page': self.end_page,
+            'is_empty': self.is_empty,
+        }
+
+    def lines_info(self) -> Dict:
+        """SeparatedPara.get_spanning_lines() 결과 형식"""
+        return {
+            'para_id': self.para_id,
+            'start_page': self.start_page,
+            'end_page': self.end_page,
+            'is_spanning': self.is_spanning,
+            'lines_per_page': dict(self.lines_per_page),
+            'total_lines': self.line_count,
+        }
+
+
+@dataclass
+class IndexPatch:
+    """build/patch 한 번으로 배치가 바뀐 페이지 범위
+
+    first_page 이후 페이지가 바뀌었고, 이전 인덱스의 old_stop_page 이후 페이지는
+    배치가 같은 채로 new_stop_page 이후로 옮겨졌습니다 (stop이 None이면 문서 끝까지 바뀜).
+    """
+    para_id: int                         # 다시 계산을 시작한 문단
+    recomputed: int                      # 다시 계산한 문단 수
+    first_page: int
+    old_stop_page: Optional[int] = None
+    new_stop_page: Optional[int] = None
+
+    @property
+    def page_shift(self) -> int:
+        """재사용한 페이지의 번호 변화"""
+        if self.old_stop_page is None:
+            return 0
+        return self.new_stop_page - self.old_stop_page
+
+    def map_page(self, page: int) -> Optional[int]:
+        """이전 페이지 번호 -> 현재 페이지 번호 (배치가 바뀐 페이지면 None)"""
+        if page < self.first_page:
+            return page
+        if self.old_stop_page is not None and page >= self.old_stop_page:
+            return page + self.page_shift
+        return None
+
+    def changed_pages(self, page_count: int) -> range:
+        """배치가 바뀐 페이지 (현재 번호)"""
+        stop = self.new_stop_page if self.new_stop_page is not None else page_count + 1
+        return range(self.first_page, stop)
+
+
+class ParagraphPageIndex:
+    """본문 문단 → 페이지 인덱스"""
+
+    def __init__(self, hwp, debug: bool = False):
+        """
+        Args:
+            hwp: HWP 객체
+            debug: 디버그 출력 여부
+        """
+        self.hwp = hwp
+        self.debug = debug
+        self.list_id = 0
+        self._entries: List[ParaPageInfo] = []
+        self._starts: List[int] = []   # 문단별 시작 페이지 (문단 순서 = 페이지 순서)
+        self.built = False
+        self.last_recomputed = 0       # 마지막 build/patch에서 다시 계산한 문단 수
+        self.patches: List[IndexPatch] = []   # build/patch 기록 (배치가 바뀐 페이지 추적용)
+
+    def _log(self, msg: str):
+        """디버그 메시지 출력"""
+        if self.debug:
+            print(f"[ParagraphPageIndex] {msg}")
+
+    # ------------------------------------------------------------------
+    # 수집
+    # ------------------------------------------------------------------
+
+    def _page_line(self):
+        """현재 위치의 (페이지, 줄 번호, 단 번호) - 줄 번호는 단마다 1부터"""
+        key_info = self.hwp.KeyIndicator()
+        # KeyIndicator 반환: (BOOL, seccnt, secno, prnpageno, colno, line, pos, over, ctrlname)
+        return key_info[3], key_info[5], key_info[4]
+
+    def _sweep(self, start_para: int) -> Iterator[ParaPageInfo]:
+        """start_para부터 문서 끝까지 문단 정보를 차례로 생성 (커서 복원은 호출자가 담당)"""
+        self.hwp.SetPos(self.list_id, start_para, 0)
+        pos = self.hwp.GetPos()
+
+        while True:
+            para_id = pos[1]
+            start = self._page_line()
+
+            self.hwp.HAction.Run("MoveParaEnd")
+            para_end = self.hwp.GetPos()[2]
+            end = self._page_line()
+            start_page, start_line = start[:2]
+            end_page, end_line = end[:2]
+
+            info = ParaPageInfo(
+                para_id=para_id,
+                start_page=start_page,
+                end_page=end_page,
+                start_line=start_line,
+                end_line=end_line,
+                start_col=start[2],
+                is_empty=para_end <= 1,   # 줄바꿈만 있는 문단
+            )
+            if start[0::2] == end[0::2]:       # 같은 페이지, 같은 단
+                info.line_count = end_line - start_line + 1
+                info.lines_per_page = {start_page: info.line_count}
+            else:
+                info.lines_per_page = lines_per_page_by_bisection(
+                    self.hwp, self.list_id, para_id, para_end, start, end)
+                info.line_count = sum(info.lines_per_page.values())
+                self.hwp.SetPos(self.list_id, para_id, para_end)
+            yield info
+
+            self.hwp.HAction.Run("MoveNextParaBegin")
+            pos = self.hwp.GetPos()
+            if pos[1] == para_id:
+                break
+
+    def _para_count(self) -> int:
+        """본문 문단 수"""
+        self.hwp.MovePos(3)  # moveDocEnd
+        return self.hwp.GetPos()[1] + 1
+
+    def _set_entries(self, entries: List[ParaPageInfo]):
+        self._entries = entries
+        self._starts = [e.start_page for e in entries]
+        self.built = True
+
+    def build(self) -> 'ParagraphPageIndex':
+        """문서 처음부터 한 번 순회해 인덱스 생성"""
+        saved_pos = self.hwp.GetPos()
+        try:
+            self.hwp.MovePos(2)  # moveDocBegin
+            self.list_id = self.hwp.GetPos()[0]
+            self._set_entries(list(self._sweep(0)))
+        finally:
+            self.hwp.SetPos(saved_pos[0], saved_pos[1], saved_pos[2])
+
+        self.last_recomputed = len(self._entries)
+        self.patches.append(IndexPatch(0, self.last_recomputed, 1))
+        self._log(f"인덱스 생성: {len(self._entries)}개 문단, {self.page_count}쪽")
+        return self
+
+    def patch(self, para_id: int) -> int:
+        """
+        문단 para_id 편집 후 인덱스 갱신
+
+        para_id부터 다시 순회하다가, 편집 범위 뒤의 문단이 페이지(단) 첫 줄에서 시작하고
+        이전 인덱스에서도 대응 문단이 같은 단의 첫 줄에서 시작했다면 그 뒤 배치는 같으므로
+        이전 항목을 문단/페이지 번호만 옮겨 재사용합니다.
+        (문단 삭제/추가는 문단 수 차이로 대응 문단을 찾음)
+
+        Returns:
+            다시 계산한 문단 수
+        """
+        if not self.built:
+            self.build()
+            return self.last_recomputed
+
+        old = self._entries
+        para_id = max(0, min(para_id, len(old)))
+        saved_pos = self.hwp.GetPos()
+        recomputed: List[ParaPageInfo] = []
+        reused: List[ParaPageInfo] = []
+        try:
+            delta = self._para_count() - len(old)
+            para_id = min(para_id, len(old) + delta - 1)
+            edited_end = para_id + max(delta, 0)   # 이 문단까지는 내용이 바뀌었을 수 있음
+
+            sweep = self._sweep(para_id)
+            for info in sweep:
+                j = info.para_id - delta
+                if (info.para_id > edited_end and 0 <= j < len(old)
+                        and info.start_line == 1 and old[j].start_line == 1
+                        and info.start_col == old[j].start_col):
+                    page_shift = info.start_page - old[j].start_page
+                    reused = [self._shifted(e, delta, page_shift) for e in old[j:]]
+                    break
+                recomputed.append(info)
+            sweep.close()
+        finally:
+            self.hwp.SetPos(saved_pos[0], saved_pos[1], saved_pos[2])
+
+        self._set_entries(old[:para_id] + recomputed + reused)
+        self.last_recomputed = len(recomputed)
+
+        first_page = min([e.start_page for e in (old[para_id:para_id + 1] + recomputed[:1])]
+                         or [self.page_count])
+        patch = IndexPatch(para_id, len(recomputed), first_page)
+        if reused:
+            patch.new_stop_page = reused[0].start_page
+            patch.old_stop_page = old[reused[0].para_id - delta].start_page
+        self.patches.append(patch)
+        self._log(f"문단 {para_id}부터 갱신: {len(recomputed)}개 다시 계산, {len(reused)}개 재사용")
+        return self.last_recomputed
+
+    @staticmethod
+    def _shifted(info: ParaPageInfo, para_shift: int, page_shift: int) -> ParaPageInfo:
+        if not para_shift and not page_shift:
+            return info
+        return replace(
+            info,
+            para_id=info.para_id + para_shift,
+            start_page=info.start_page + page_shift,
+            end_page=info.end_page + page_shift,
+            lines_per_page={p + page_shift: n for p, n in info.lines_per_page.items()},
+        )
+
+    def is_stale(self) -> bool:
+        """
+        인덱스를 만든 뒤 바깥에서 문서가 바뀌었는지 간단히 확인 (COM 호출 몇 번)
+
+        쪽 수, 문단 수, 문서 끝의 (페이지, 줄 번호)를 인덱스와 비교합니다.
+        문서 끝 배치를 바꾸지 않는 편집은 알아채지 못하므로 그런 경우는 build()로 다시 만듭니다.
+        """
+        if not self.built:
+            return True
+        if self.hwp.PageCount != self.page_count:
+            return True
+        saved_pos = self.hwp.GetPos()
+        try:
+            self.hwp.MovePos(3)  # moveDocEnd
+            para_count = self.hwp.GetPos()[1] + 1
+            end_page, end_line, _ = self._page_line()
+        finally:
+            self.hwp.SetPos(saved_pos[0], saved_pos[1], saved_pos[2])
+        last = self._entries[-1] if self._entries else None
+        return (last is None or para_count != len(self._entries)
+                or (end_page, end_line) != (last.end_page, last.end_line))
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[ParaPageInfo]:
+        return iter(self._entries)
+
+    def get(self, para_id: int) -> Optional[ParaPageInfo]:
+        """문단 정보 (없으면 None)"""
+        if 0 <= para_id < len(self._entries):
+            return self._entries[para_id]
+        return None
+
+    @property
+    def page_count(self) -> int:
+        """마지막 문단의 끝 페이지"""
+        return self._entries[-1].end_page if self._entries else 0
+
+    def paragraphs_on_page(self, page: int) -> List[int]:
+        """page에서 시작하는 문단 ID 목록"""
+        lo = bisect_left(self._starts, page)
+        hi = bisect_right(self._starts, page)
+        return list(range(lo, hi))
+
+    def paragraphs_touching_page(self, page: int) -> List[int]:
+        """page에 한 줄이라도 있는 문단 ID 목록 (앞 페이지에서 넘어온 문단 포함)"""
+        lo = bisect_left(self._starts, page)
+        hi = bisect_right(self._starts, page)
+        if lo > 0 and self._entries[lo - 1].end_page >= page:
+            lo -= 1
+        return list(range(lo, hi))
+
+    def first_para_on_page(self, page: int) -> Optional[int]:
+        """page에서 시작하는 첫 문단 (없으면 None)"""
+        ids = self.paragraphs_on_page(page)
+        return ids[0] if ids else None
+
+    def last_para_on_page(self, page: int) -> Optional[int]:
+        """page에서 시작하는 마지막 문단 (없으면 None)"""
+        hi = bisect_right(self._starts, page)
+        if hi > 0 and self._starts[hi - 1] == page:
+            return hi - 1
+        return None
+
+    def spanning_paras(self, page: int = None) -> List[int]:
+        """페이지에 걸친 (빈 문단 제외) 문단 ID 목록 (page를 주면 그 페이지에서 시작하는 문단만)"""
+        ids = self.paragraphs_on_page(page) if page is not None else range(len(self._entries))
+        return [i for i in ids
+                if self._entries[i].is_spanning and not self._entries[i].is_empty]
+
+    def empty_paras_before(self, para_id: int, page: int) -> List[int]:
+        """page에서 시작하는 빈 문단 중 para_id보다 앞에 있는 문단 ID 목록"""
+        return [i for i in self.paragraphs_on_page(page)
+                if i < para_id and self._entries[i].is_empty]
+
+    def to_page_map(self) -> Dict[int, Dict]:
+        """{para_id: {'start_page', 'end_page', 'is_empty'}} (SeparatedPara.para_page_map 형식)"""
+        return {e.para_id: e.to_dict() for e in self._entries}
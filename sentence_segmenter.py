@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+문장 분리 - 한국어 문장 끝(다. 요. ? ! 따옴표, 소수점)을 구분하는 정규식 분리기 + 여러 문단 일괄 처리
+
+cursor.get_sentences, hwp_query.position.get_sentences, BlockSelector._get_sentences가
+같은 분리 규칙(split_sentences)을 사용합니다.
+
+분리 규칙:
+- 문장 끝: . ? ! … 。 ？ ！ (연속 부호는 하나로: '...', '?!')
+- 뒤따르는 닫는 따옴표/괄호까지 문장에 포함: 했다." / 했어요!』 / (참고.)
+- 문장 끝 부호 뒤에 공백 또는 텍스트 끝이 와야 함: 3.14, v1.2, "…했다."라고 는 나누지 않음
+- 번호만 있는 조각(1. / 가. / a. / iv.)은 문장으로 보지 않음
+- 마침표로 끝나는 영문 약어(Dr. / e.g. / vs. / Fig.)에서는 나누지 않음
+
+사용법:
+    from sentence_segmenter import split_sentences, segment_paragraphs
+
+    split_sentences("첫 문장입니다. 둘째 문장이에요! 값은 3.14다.")
+    # [{'index': 1, 'start': 0, 'end': 7}, {'index': 2, 'start': 9, 'end': 17}, ...]
+
+    index = segment_paragraphs(hwp)            # 문서 전체 (GetTextFile 1회)
+    index[12].sentences                        # 12번 문단의 문장 목록
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+# 문장 끝 부호(연속 포함) + 닫는 따옴표/괄호, 뒤에 공백 또는 텍스트 끝
+_SENTENCE_END = re.compile(
+    r'(?:\.{2,}|…+|[.?!。？！]+)'
+    r'["\'”’」』》〉)\]]*'
+    r'(?=\s|$)'
+)
+
+# 번호만 있는 조각 (목록 번호: 1. / 가. / a. / iv.)
+_LIST_MARKER = re.compile(r'\s*(?:\d{1,3}|[가나다라마바사아자차카타파하]|[A-Za-z]|[ivxIVX]{1,4})\s*')
+
+# 마침표 앞 단어가 이 약어면 문장 끝이 아님 (소문자, 끝의 마침표 제외)
+_ABBREVIATIONS = frozenset({
+    'mr', 'mrs', 'ms', 'dr', 'prof', 'st', 'jr', 'sr', 'no', 'vol', 'pp', 'fig', 'eq',
+    'vs', 'cf', 'approx', 'e.g', 'i.e',
+})
+
+# 마침표 바로 앞의 영문 단어 (e.g 처럼 중간 마침표 포함)
+_WORD_BEFORE_PERIOD = re.compile(r'([A-Za-z][A-Za-z.]*)$')
+
+
+@dataclass
+class ParagraphSentences:
+    """문단 하나의 문장 분리 결과 (start/end는 문단 텍스트의 문자 인덱스, end 포함)"""
+    para_id: int
+    text: str
+    sentences: List[Dict] = field(default_factory=list)
+
+
+def iter_sentence_spans(text: str) -> Iterator[Tuple[int, int, bool]]:
+    """
+    문장 범위 생성
+
+    Yields:
+        (시작 인덱스, 끝 인덱스(포함), 문장 끝 부호로 끝났는지)
+    """
+    n = len(text)
+    start = 0
+    for m in _SENTENCE_END.finditer(text):
+        if m.start() < start:
+            continue
+        if _LIST_MARKER.fullmatch(text, start, m.start()):
+            continue
+        if m.group() == '.':
+            word = _WORD_BEFORE_PERIOD.search(text, start, m.start())
+            if word and word.group(1).lower() in _ABBREVIATIONS:
+                continue
+        yield start, m.end() - 1, True
+        start = m.end()
+        while start < n and text[start].isspace():
+            start += 1
+    if start < n and not text[start:].isspace():
+        yield start, n - 1, False
+
+
+def split_sentences(text: str) -> List[Dict]:
+    """
+    텍스트를 문장 목록으로 분리
+
+    Returns:
+        [{'index': 1, 'start': 0, 'end': 15}, ...] (index는 1부터, end 포함)
+    """
+    if not text or text.isspace():
+        return []
+    return [{'index': i, 'start': s, 'end': e}
+            for i, (s, e, _) in enumerate(iter_sentence_spans(text), 1)]
+
+
+# =============================================================================
+# 여러 문단 일괄 처리
+# =============================================================================
+
+def _split_lines(text: str) -> List[str]:
+    return text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+
+
+def export_paragraph_texts(hwp, start_para: int, end_para: int,
+                           list_id: int = None) -> Optional[List[str]]:
+    """
+    start_para ~ end_para 문단 텍스트를 GetTextFile 한 번으로 가져오기 (커서 위치 복원)
+
+    Returns:
+        문단별 텍스트 목록, 문단 수와 줄 수가 맞지 않으면(표 등 컨트롤 포함) None
+    """
+    saved = hwp.GetPos()
+    if list_id is None:
+        list_id = saved[0]
+    try:
+        hwp.SetPos(list_id, end_para, 0)
+        hwp.HAction.Run("MoveParaEnd")
+        end_pos = hwp.GetPos()[2]
+        hwp.SelectText(start_para, 0, end_para, end_pos)
+        text = hwp.GetTextFile("TEXT", "saveblock")
+        hwp.HAction.Run("Cancel")
+    finally:
+        hwp.SetPos(saved[0], saved[1], saved[2])
+
+    count = end_para - start_para + 1
+    parts = _split_lines(text or "")
+    if len(parts) == count + 1 and parts[-1] == "":
+        parts.pop()
+    return parts if len(parts) == count else None
+
+
+def _export_paragraph_text(hwp, list_id: int, para_id: int) -> str:
+    """문단 하나의 텍스트 (일괄 내보내기가 맞지 않을 때)"""
+    saved = hwp.GetPos()
+    try:
+        hwp.SetPos(list_id, para_id, 0)
+        hwp.HAction.Run("MoveParaEnd")
+        end_pos = hwp.GetPos()[2]
+        hwp.SelectText(para_id, 0, para_id, end_pos)
+        text = hwp.GetTextFile("TEXT", "saveblock") or ""
+        hwp.HAction.Run("Cancel")
+    finally:
+        hwp.SetPos(saved[0], saved[1], saved[2])
+    return text.replace('\r\n', '').replace('\r', '').replace('\n', '')
+
+
+def segment_paragraphs(hwp, start_para: int = 0, end_para: int = None,
+                       list_id: int = None, chunk_size: int = None) -> Dict[int, ParagraphSentences]:
+    """
+    여러 문단의 문장 분리 (문단 범위를 한 번에 내보낸 뒤 로컬에서 분리)
+
+    Args:
+        hwp: 한글 인스턴스
+        start_para: 시작 문단
+        end_para: 끝 문단 (None이면 리스트의 마지막 문단)
+        list_id: 리스트 ID (None이면 현재 리스트)
+        chunk_size: 한 번에 내보낼 문단 수 (None이면 범위 전체를 한 번에)
+
+    Returns:
+        {para_id: ParagraphSentences}
+    """
+    saved = hwp.GetPos()
+    if list_id is None:
+        list_id = saved[0]
+    if end_para is None:
+        hwp.SetPos(list_id, 0, 0)
+        hwp.HAction.Run("MoveListEnd")
+        end_para = hwp.GetPos()[1]
+        hwp.SetPos(saved[0], saved[1], saved[2])
+
+    index: Dict[int, ParagraphSentences] = {}
+    step = chunk_size or (end_para - start_para + 1)
+    for chunk_start in range(start_para, end_para + 1, step):
+        chunk_end = min(chunk_start + step - 1, end_para)
+        texts = export_paragraph_texts(hwp, chunk_start, chunk_end, list_id)
+        if texts is None:
+            texts = [_export_paragraph_text(hwp, list_id, p) for p in range(chunk_start, chunk_end + 1)]
+        for para_id, text in enumerate(texts, chunk_start):
+            index[para_id] = ParagraphSentences(para_id, text, split_sentences(text))
+    return index
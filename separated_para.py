@@ -10,15 +10,28 @@
     # 현재 페이지 문단 정보
     result = helper.get_page_paragraph_count()
     print(f"문단 수: {result['paragraph_count']}")
+
+    # 문서 전체 걸친 문단 처리
+    result = helper.fix_document()
+    print(f"처리 페이지: {result['checked']}, 해소: {result['fixed']}")
+
+문단-페이지 정보는 ParagraphPageIndex로 한 번 수집한 뒤, 이 클래스의 편집 메서드가
+편집한 문단부터 갱신합니다. 클래스 밖에서 문서를 편집했다면 ParaAlignWords()로 다시 수집하세요.
 """
 
 import json
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, List, Set, Tuple
 
 from cursor import get_hwp_instance
 from separated_word import SeparatedWord
+from block_selector import BlockSelector
+from para_page_index import ParagraphPageIndex, IndexPatch, lines_per_page_by_bisection
+from spacing_search import search_spacing
+from layout_settle import wait_for_layout, para_end_signature
+from document_snapshot import DocumentSnapshot
 
 
 class SeparatedPara:
@@ -27,19 +40,24 @@ class SeparatedPara:
     # 클래스 변수: 문단-페이지 매핑 저장소
     para_page_map = {}  # {para_id: {'start_page': int, 'end_page': int, 'is_empty': bool}}
 
-    def __init__(self, hwp, log_dir: str = "debugs/logs"):
+    def __init__(self, hwp, log_dir: str = "debugs/logs", snapshot: DocumentSnapshot = None):
         """
         Args:
             hwp: HWP 객체
             log_dir: 로그 파일 저장 디렉토리
+            snapshot: 문서 스냅샷 (있으면 빈 문단 확인을 스냅샷에서 하고, 이 클래스의 편집을 스냅샷에 반영)
         """
         self.hwp = hwp
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.page_index = ParagraphPageIndex(hwp)
+        self.snapshot = snapshot
+        # 분리단어 처리(SeparatedWord)와 줄 시작 캐시 공유 - get_spanning_lines가 측정한 줄 단위로 탐색
+        self.block = BlockSelector(hwp)
 
     def ParaAlignWords(self) -> Dict:
         """
-        모든 문단의 페이지 정보를 수집하여 클래스 변수에 저장
+        모든 문단의 페이지 정보를 수집하여 클래스 변수에 저장 (문단-페이지 인덱스 재생성)
 
         Returns:
             {
@@ -47,47 +65,46 @@ class SeparatedPara:
                 ...
             }
         """
-        saved_pos = self.hwp.GetPos()
-        SeparatedPara.para_page_map = {}
-
         try:
-            # 문서 처음으로 이동
-            self.hwp.MovePos(2)  # moveDocBegin
-
-            # 모든 문단 순회
-            while True:
-                para_id = self._get_current_para_id()
-                start_page, end_page = self._get_para_page_range(para_id)
-                is_empty = self._is_empty_paragraph()
-
-                # 클래스 변수에 저장
-                SeparatedPara.para_page_map[para_id] = {
-                    'start_page': start_page,
-                    'end_page': end_page,
-                    'is_empty': is_empty
-                }
+            self.page_index.build()
+        except Exception:
+            pass
+        SeparatedPara.para_page_map = self.page_index.to_page_map()
+        return SeparatedPara.para_page_map
 
-                # 다음 문단으로 이동
-                before_para = para_id
-                self.hwp.HAction.Run("MoveNextParaBegin")
-                after_para = self._get_current_para_id()
-
-                if before_para == after_para:
-                    break
-
-            # 원래 위치 복원
-            self.hwp.SetPos(saved_pos[0], saved_pos[1], saved_pos[2])
-
-            return SeparatedPara.para_page_map
+    def _get_index(self, check: bool = False) -> ParagraphPageIndex:
+        """
+        문단-페이지 인덱스 (아직 수집 전이면 수집)
 
-        except Exception as e:
-            self.hwp.SetPos(saved_pos[0], saved_pos[1], saved_pos[2])
-            return SeparatedPara.para_page_map
+        Args:
+            check: 재사용 전에 바깥 편집 여부를 확인 (ParagraphPageIndex.is_stale)하고 바뀌었으면 다시 수집
+                   - 공개 조회/처리 메서드의 시작에서 사용, 이 클래스의 편집 뒤에는 _patch_index가 갱신함
+        """
+        if not self.page_index.built or (check and self.page_index.is_stale()):
+            self.ParaAlignWords()
+        return self.page_index
+
+    def _patch_index(self, para_id: int):
+        """문단 para_id 편집 후 인덱스와 para_page_map 갱신"""
+        if self.snapshot is not None:
+            self.snapshot.invalidate_layout(para_id, self.page_index.list_id)
+        self.block.invalidate(para_id, self.page_index.list_id)
+        if not self.page_index.built:
+            return
+        # 편집한 문단의 줄 나눔이 안정된 뒤 다시 수집
+        wait_for_layout(lambda: para_end_signature(self.hwp, para_id, self.page_index.list_id))
+        self.page_index.patch(para_id)
+        SeparatedPara.para_page_map = self.page_index.to_page_map()
 
     def _is_empty_paragraph(self) -> bool:
         """현재 문단이 빈 문단인지 확인"""
         saved_pos = self.hwp.GetPos()
 
+        if self.snapshot is not None and not self.snapshot.dirty:
+            is_empty = self.snapshot.is_empty(saved_pos[0], saved_pos[1])
+            if is_empty is not None:
+                return is_empty
+
         self.hwp.HAction.Run("MoveParaBegin")
         self.hwp.HAction.Run("MoveParaEnd")
         para_end = self.hwp.GetPos()[2]
@@ -103,6 +120,11 @@ class SeparatedPara:
         # KeyIndicator 반환: (BOOL, seccnt, secno, prnpageno, colno, line, pos, over, ctrlname)
         return key_info[3]
 
+    def _get_page_line(self) -> Tuple[int, int, int]:
+        """현재 커서 위치의 (페이지 번호, 줄 번호, 단 번호) 반환 (줄 번호는 단마다 1부터)"""
+        key_info = self.hwp.KeyIndicator()
+        return key_info[3], key_info[5], key_info[4]
+
     def _get_current_para_id(self) -> int:
         """현재 커서 위치의 문단 ID 반환"""
         pos = self.hwp.GetPos()
@@ -147,44 +169,21 @@ class SeparatedPara:
                 'paragraphs': [{'para_id': int, 'start_page': int, 'end_page': int}, ...]
             }
         """
-        saved_pos = self.hwp.GetPos()
-
         if target_page is None:
             target_page = self._get_current_page()
 
-        paragraphs = []
-
         try:
-            # 문서 처음으로 이동
-            self.hwp.MovePos(2)  # moveDocBegin
-
-            # 문단 순회
-            while True:
-                para_id = self._get_current_para_id()
-                start_page, end_page = self._get_para_page_range(para_id)
-
-                # 문단 시작이 target_page 이후면 종료
-                if start_page > target_page:
-                    break
-
-                # 시작 페이지 기준: start_page == target_page 인 문단만 포함
-                if start_page == target_page:
-                    paragraphs.append({
-                        'para_id': para_id,
-                        'start_page': start_page,
-                        'end_page': end_page
-                    })
-
-                # 다음 문단으로 이동
-                before_para = para_id
-                self.hwp.HAction.Run("MoveNextParaBegin")
-                after_para = self._get_current_para_id()
+            index = self._get_index(check=True)
 
-                if before_para == after_para:
-                    break
-
-            # 원래 위치 복원
-            self.hwp.SetPos(saved_pos[0], saved_pos[1], saved_pos[2])
+            # 시작 페이지 기준: start_page == target_page 인 문단만 포함
+            paragraphs = []
+            for para_id in index.paragraphs_on_page(target_page):
+                info = index.get(para_id)
+                paragraphs.append({
+                    'para_id': para_id,
+                    'start_page': info.start_page,
+                    'end_page': info.end_page
+                })
 
             return {
                 'page': target_page,
@@ -193,7 +192,6 @@ class SeparatedPara:
             }
 
         except Exception as e:
-            self.hwp.SetPos(saved_pos[0], saved_pos[1], saved_pos[2])
             return {
                 'page': target_page,
                 'paragraph_count': 0,
@@ -223,18 +221,19 @@ class SeparatedPara:
         self.hwp.HAction.Run("MoveParaBegin")
 
         # 분리단어 처리 실행
-        align = SeparatedWord(self.hwp, debug=False)
+        align = SeparatedWord(self.hwp, debug=False, block=self.block)
         result = align.align_paragraph(
             spacing_step=spacing_step,
             min_spacing=min_spacing,
             max_iterations=max_iterations
         )
 
+        self._patch_index(para_id)
         return result
 
     def get_page_paragraphs(self, page: int) -> list:
         """
-        페이지에 해당하는 문단 목록 반환 (para_page_map 최신 업데이트)
+        페이지에 해당하는 문단 목록 반환 (문단-페이지 인덱스에서 조회)
 
         Args:
             page: 페이지 번호
@@ -242,16 +241,7 @@ class SeparatedPara:
         Returns:
             [para_id, para_id, ...] 해당 페이지에서 시작하는 문단 ID 목록
         """
-        # para_page_map 최신 업데이트
-        self.ParaAlignWords()
-
-        # 해당 페이지의 문단 필터링
-        result = []
-        for para_id, info in SeparatedPara.para_page_map.items():
-            if info['start_page'] == page:
-                result.append(para_id)
-
-        return result
+        return self._get_index(check=True).paragraphs_on_page(page)
 
     def fix_paragraph(self, para_id: int, min_font_size: int = 4) -> Dict:
         """
@@ -295,14 +285,8 @@ class SeparatedPara:
                 'total_reduction': 0
             }
 
-        # 같은 페이지(start_page)에 있는 빈 문단 찾기
-        empty_paras = []
-        for pid, info in SeparatedPara.para_page_map.items():
-            if info.get('is_empty', False) and info['start_page'] == start_page:
-                if pid < para_id:  # 걸친 문단보다 앞에 있는 빈 문단만
-                    empty_paras.append(pid)
-
-        empty_paras.sort()  # 문단 순서대로
+        # 같은 페이지(start_page)에 있는 빈 문단 찾기 (걸친 문단보다 앞, 문단 순서대로)
+        empty_paras = self._get_index().empty_paras_before(para_id, start_page)
 
         if not empty_paras:
             self.hwp.SetPos(saved_pos[0], saved_pos[1], saved_pos[2])
@@ -368,6 +352,9 @@ class SeparatedPara:
         # 원래 위치 복원
         self.hwp.SetPos(saved_pos[0], saved_pos[1], saved_pos[2])
 
+        if empty_paras_reduced:
+            self._patch_index(empty_paras_reduced[0])
+
         return {
             'success': start_page == end_page,
             'para_id': para_id,
@@ -404,20 +391,14 @@ class SeparatedPara:
         results = []
         rounds = 0
         failed_paras = set()  # 실패한 문단 기록 (무한 루프 방지)
+        self._get_index(check=True)
 
         while rounds < max_rounds:
             rounds += 1
 
-            # para_page_map 최신 업데이트
-            self.ParaAlignWords()
-
-            # 페이지 걸친 문단 찾기 (실패한 것 제외)
-            spanning_paras = []
-            for para_id, info in SeparatedPara.para_page_map.items():
-                if info['start_page'] != info['end_page'] and not info.get('is_empty', False):
-                    if page is None or info['start_page'] == page:
-                        if para_id not in failed_paras:
-                            spanning_paras.append(para_id)
+            # 페이지 걸친 문단 찾기 (실패한 것 제외, 인덱스는 fix_paragraph가 갱신)
+            spanning_paras = [para_id for para_id in self._get_index().spanning_paras(page)
+                              if para_id not in failed_paras]
 
             # 걸친 문단이 없으면 종료
             if not spanning_paras:
@@ -436,12 +417,7 @@ class SeparatedPara:
                 failed_paras.add(para_id)  # 실패한 문단 기록
 
         # 최종 상태 확인
-        self.ParaAlignWords()
-        remaining = 0
-        for para_id, info in SeparatedPara.para_page_map.items():
-            if info['start_page'] != info['end_page'] and not info.get('is_empty', False):
-                if page is None or info['start_page'] == page:
-                    remaining += 1
+        remaining = len(self._get_index().spanning_paras(page))
 
         return {
             'rounds': rounds,
@@ -543,36 +519,22 @@ class SeparatedPara:
         saved_pos = self.hwp.GetPos()
         list_id = saved_pos[0]
 
-        # 해당 문단으로 이동
+        # 문단 시작/끝의 (페이지, 줄 번호)
         self.hwp.SetPos(list_id, para_id, 0)
-
-        # 문단의 시작/끝 페이지 확인
-        start_page, end_page = self._get_para_page_range(para_id)
-        is_spanning = (start_page != end_page)
-
-        lines_per_page = {}
-        total_lines = 0
-
-        # 문단의 각 줄을 순회하며 페이지 확인
         self.hwp.HAction.Run("MoveParaBegin")
+        start = self._get_page_line()
+        self.hwp.HAction.Run("MoveParaEnd")
+        para_end = self.hwp.GetPos()[2]
+        end = self._get_page_line()
+        start_page, end_page = start[0], end[0]
+        is_spanning = (start_page != end_page)
 
-        while True:
-            current_page = self._get_current_page()
-            lines_per_page[current_page] = lines_per_page.get(current_page, 0) + 1
-            total_lines += 1
-
-            # 다음 줄로 이동
-            before_pos = self.hwp.GetPos()
-            self.hwp.HAction.Run("MoveDown")
-            after_pos = self.hwp.GetPos()
-
-            # 문단을 벗어났는지 확인
-            if after_pos[1] != para_id:
-                break
-
-            # 더 이상 이동하지 않으면 종료
-            if before_pos == after_pos:
-                break
+        # 페이지 경계를 이분 탐색해 페이지별 줄 수 계산 (분리단어 처리가 측정한 줄 시작이 있으면 줄 단위로)
+        cached = self.block.cached_line_starts(para_id)
+        line_starts = cached[0] if cached and cached[1] == para_end else None
+        lines_per_page = lines_per_page_by_bisection(self.hwp, list_id, para_id, para_end, start, end,
+                                                     line_starts=line_starts)
+        total_lines = sum(lines_per_page.values())
 
         # 원래 위치 복원
         self.hwp.SetPos(saved_pos[0], saved_pos[1], saved_pos[2])
@@ -600,15 +562,10 @@ class SeparatedPara:
                 'lines_info': get_spanning_lines 결과 or None
             }
         """
-        # para_page_map 최신화
-        self.ParaAlignWords()
+        index = self._get_index(check=True)
 
         # 해당 페이지에서 시작하는 문단 중 마지막 문단 찾기
-        last_para_id = None
-        for para_id, info in SeparatedPara.para_page_map.items():
-            if info['start_page'] == page:
-                if last_para_id is None or para_id > last_para_id:
-                    last_para_id = para_id
+        last_para_id = index.last_para_on_page(page)
 
         if last_para_id is None:
             return {
@@ -618,22 +575,20 @@ class SeparatedPara:
             }
 
         # 마지막 문단의 정보 확인
-        para_info = SeparatedPara.para_page_map[last_para_id]
+        para_info = index.get(last_para_id)
 
-        if para_info['start_page'] == para_info['end_page']:
+        if not para_info.is_spanning:
             return {
                 'has_spanning': False,
                 'para_id': last_para_id,
                 'lines_info': None
             }
 
-        # 걸친 문단의 줄 분포 분석
-        lines_info = self.get_spanning_lines(last_para_id)
-
+        # 걸친 문단의 줄 분포 (인덱스 수집 시 분석됨)
         return {
             'has_spanning': True,
             'para_id': last_para_id,
-            'lines_info': lines_info
+            'lines_info': para_info.lines_info()
         }
 
     def reduce_empty_para_font_size(self, page: int, para_id: int, min_font_size: int = 4) -> Dict:
@@ -655,13 +610,7 @@ class SeparatedPara:
         list_id = saved_pos[0]
 
         # 같은 페이지의 빈 문단 찾기 (걸친 문단보다 앞)
-        empty_paras = []
-        for pid, info in SeparatedPara.para_page_map.items():
-            if info.get('is_empty', False) and info['start_page'] == page:
-                if pid < para_id:
-                    empty_paras.append(pid)
-
-        empty_paras.sort()
+        empty_paras = self._get_index().empty_paras_before(para_id, page)
 
         if not empty_paras:
             self.hwp.SetPos(saved_pos[0], saved_pos[1], saved_pos[2])
@@ -697,6 +646,9 @@ class SeparatedPara:
 
         self.hwp.SetPos(saved_pos[0], saved_pos[1], saved_pos[2])
 
+        if reduced_paras:
+            self._patch_index(reduced_paras[0])
+
         return {
             'reduced_paras': reduced_paras,
             'total_reduction': total_reduction
@@ -787,16 +739,18 @@ class SeparatedPara:
         글자 간격을 줄이고 분리단어 처리 적용 (우선 전략)
 
         마지막 줄의 남은 글자 수가 (줄 수 * 2 + 1)보다 작으면
-        글자 간격을 1 줄이고 분리단어 처리를 적용. 최대 2회 반복.
+        문단 자간 감소량 1 ~ max_attempts를 이분 탐색해 걸침이 풀리는 가장 작은 값을 적용하고
+        분리단어 처리를 한 번 적용.
 
         Args:
             para_id: 문단 ID
-            max_attempts: 최대 시도 횟수 (기본 2)
+            max_attempts: 최대 자간 감소량 (기본 2)
 
         Returns:
             {
                 'applied': bool,
-                'attempts': int,
+                'attempts': int,  # 자간 적용 횟수
+                'spacing_reduced': int,  # 최종 자간 감소량
                 'success': bool  # 걸침 해소 여부
             }
         """
@@ -815,43 +769,51 @@ class SeparatedPara:
                 'reason': f"조건 미충족: remaining={check_result['remaining_chars']}, threshold={check_result.get('threshold', 0)}"
             }
 
-        attempts = 0
-        success = False
-
-        for i in range(max_attempts):
-            attempts += 1
-
-            # 문단으로 이동하여 전체 선택
+        def select_para():
             self.hwp.SetPos(list_id, para_id, 0)
             self.hwp.HAction.Run("MoveParaBegin")
             self.hwp.HAction.Run("MoveSelParaEnd")
 
-            # 현재 자간 가져오기
-            pset = self.hwp.HParameterSet.HCharShape
+        # 현재 자간 (감소량의 기준)
+        select_para()
+        pset = self.hwp.HParameterSet.HCharShape
+        self.hwp.HAction.GetDefault("CharShape", pset.HSet)
+        base_hangul = pset.SpacingHangul
+        base_latin = pset.SpacingLatin
+        self.hwp.HAction.Run("Cancel")
+
+        def apply_reduction(amount):
+            # 문단 전체 선택 후 자간 적용
+            select_para()
             self.hwp.HAction.GetDefault("CharShape", pset.HSet)
-
-            # 자간 1 줄이기
-            pset.SpacingHangul = pset.SpacingHangul - 1
-            pset.SpacingLatin = pset.SpacingLatin - 1
+            pset.SpacingHangul = base_hangul - amount
+            pset.SpacingLatin = base_latin - amount
             self.hwp.HAction.Execute("CharShape", pset.HSet)
             self.hwp.HAction.Run("Cancel")
+            return True
 
-            # 분리단어 처리 적용
-            self.fix_word_in_paragraph(para_id)
-
-            # 걸침 해소 확인
+        def check_resolved(amount):
+            self.hwp.SetPos(list_id, para_id, 0)
             start_page, end_page = self._get_para_page_range(para_id)
+            return start_page == end_page
 
-            if start_page == end_page:
-                success = True
-                break
+        search = search_spacing(list(range(1, max_attempts + 1)), apply_reduction, check_resolved)
+        self._patch_index(para_id)
+
+        # 분리단어 처리 적용
+        self.fix_word_in_paragraph(para_id)
+
+        # 걸침 해소 확인
+        self.hwp.SetPos(list_id, para_id, 0)
+        start_page, end_page = self._get_para_page_range(para_id)
 
         self.hwp.SetPos(saved_pos[0], saved_pos[1], saved_pos[2])
 
         return {
             'applied': True,
-            'attempts': attempts,
-            'success': success
+            'attempts': search.probes,
+            'spacing_reduced': search.value,
+            'success': start_page == end_page
         }
 
     def remove_empty_line_at_page_start(self, page: int) -> Dict:
@@ -870,16 +832,9 @@ class SeparatedPara:
         """
         saved_pos = self.hwp.GetPos()
 
-        # 해당 페이지로 이동
-        # MovePos로 특정 페이지로 이동하기 어려우므로 문단 순회로 찾기
-        self.ParaAlignWords()
-
-        # 해당 페이지에서 시작하는 첫 번째 문단 찾기
-        first_para_id = None
-        for para_id, info in sorted(SeparatedPara.para_page_map.items()):
-            if info['start_page'] == page:
-                first_para_id = para_id
-                break
+        # 해당 페이지에서 시작하는 첫 번째 문단 찾기 (문단-페이지 인덱스)
+        index = self._get_index()
+        first_para_id = index.first_para_on_page(page)
 
         if first_para_id is None:
             self.hwp.SetPos(saved_pos[0], saved_pos[1], saved_pos[2])
@@ -890,9 +845,7 @@ class SeparatedPara:
             }
 
         # 첫 번째 문단이 빈 문단인지 확인
-        para_info = SeparatedPara.para_page_map.get(first_para_id, {})
-
-        if not para_info.get('is_empty', False):
+        if not index.get(first_para_id).is_empty:
             self.hwp.SetPos(saved_pos[0], saved_pos[1], saved_pos[2])
             return {
                 'removed': False,
@@ -907,8 +860,12 @@ class SeparatedPara:
 
         # DeleteLine 액션으로 한 줄 삭제 (빈 문단 전체 삭제)
         self.hwp.HAction.Run("DeleteLine")
+        if self.snapshot is not None:
+            self.snapshot.invalidate()
+        self.block.invalidate(list_id=list_id)     # 뒤 문단 번호가 하나씩 당겨짐
 
         self.hwp.SetPos(saved_pos[0], saved_pos[1], saved_pos[2])
+        self._patch_index(first_para_id)
 
         return {
             'removed': True,
@@ -922,7 +879,7 @@ class SeparatedPara:
         페이지 걸친 문단 처리 (메인 함수)
 
         전략 우선순위:
-        1. char_spacing_align: 남은 글자가 적으면 자간 줄이고 분리단어 처리 (2회)
+        1. char_spacing_align: 남은 글자가 적으면 자간 줄이고 분리단어 처리 (감소량 1~2 이분 탐색)
         2. empty_font: 빈 문단 글자 크기 줄이기
         3. line_spacing: 줄 간격 줄이기 (미구현)
         4. font_size: 문단 글자 크기 줄이기 (미구현)
@@ -946,8 +903,8 @@ class SeparatedPara:
             if log_callback:
                 log_callback(msg)
 
-        # 1. para_page_map 조회
-        self.ParaAlignWords()
+        # 1. para_page_map 조회 (인덱스가 없거나 바깥 편집으로 바뀌었을 때만 수집, 이후에는 편집한 문단부터 갱신됨)
+        self._get_index(check=True)
         log(f"[1] para_page_map 조회 완료: {len(SeparatedPara.para_page_map)}개 문단")
 
         # 2. 페이지 마지막 걸친 문단 확인
@@ -1047,13 +1004,150 @@ class SeparatedPara:
             'empty_line_removed': empty_line_removed
         }
 
+    def _page_needs_fix(self, page: int) -> bool:
+        """페이지 마지막 문단이 다음 페이지로 걸쳐 있는지 (인덱스 조회, fix_page 대상 여부)"""
+        index = self._get_index()
+        last_para_id = index.last_para_on_page(page)
+        return last_para_id is not None and index.get(last_para_id).is_spanning
+
+    def _propagate_dirty(self, dirty: Set[int], patches: List[IndexPatch]) -> Set[int]:
+        """
+        인덱스 갱신으로 배치가 바뀐 페이지를 다시 판정하고, 뒤로 밀린 페이지 번호를 옮김
+
+        패치마다 페이지 번호 기준이 다르므로 기존 페이지는 모든 패치를 차례로 거쳐 옮기고,
+        바뀐 범위는 마지막 번호 기준으로 합쳐서 최종 인덱스로 한 번만 판정합니다.
+
+        Args:
+            dirty: 처리가 필요한 페이지 집합 (갱신 전 번호)
+            patches: 이번 편집으로 생긴 ParagraphPageIndex.patches 항목 (순서대로)
+
+        Returns:
+            갱신 후 번호 기준 페이지 집합
+        """
+        if not patches:
+            return set(dirty)
+
+        result = set()
+        for page in dirty:
+            for patch in patches:
+                page = patch.map_page(page)
+                if page is None:
+                    break
+            if page is not None:
+                result.add(page)
+
+        # 바뀐 범위의 끝을 이후 패치로 옮김 (이후 패치가 바꾼 범위 안이면 그 패치의 끝이 덮음)
+        page_count = self.page_index.page_count
+        stop = 0
+        for i, patch in enumerate(patches):
+            end = patch.new_stop_page
+            if end is None:
+                stop = page_count + 1
+                break
+            for later in patches[i + 1:]:
+                end = later.map_page(end)
+                if end is None:
+                    break
+            if end is not None:
+                stop = max(stop, end)
+
+        for page in range(min(p.first_page for p in patches), min(stop, page_count + 1)):
+            if self._page_needs_fix(page):
+                result.add(page)
+        return result
+
+    def fix_document(self, max_iterations: int = 50, strategy: str = 'empty_font',
+                     log_callback=None) -> Dict:
+        """
+        문서 전체 페이지 걸친 문단 처리 (앞 페이지부터)
+
+        문단-페이지 인덱스로 걸친 문단이 있는 페이지(dirty)만 fix_page로 처리합니다.
+        편집으로 배치가 바뀐 페이지는 인덱스 갱신 범위(IndexPatch)로 다시 판정하고,
+        그 뒤 페이지는 번호만 옮기므로 문서 전체를 다시 조회하지 않습니다.
+
+        Args:
+            max_iterations: 페이지별 최대 반복 횟수
+            strategy: fix_page 전략
+            log_callback: 로그 출력 함수 (선택)
+
+        Returns:
+            {
+                'pages': int,              # 처리 후 전체 페이지 수
+                'checked': int,            # fix_page를 실행한 페이지 수
+                'skipped': int,            # 걸친 문단이 없어 건너뛴 페이지 수
+                'fixed': int,              # 걸침 해소 페이지 수
+                'failed': int,
+                'recomputed_paras': int,   # 인덱스에서 다시 계산한 문단 수 (이번 실행에서 수집한 경우 포함)
+                'elapsed': float,          # 전체 소요 시간 (초)
+                'results': [{'page', 'para_id', 'success', 'strategy', 'iterations', 'elapsed'}, ...]
+            }
+        """
+        def log(msg):
+            if log_callback:
+                log_callback(msg)
+
+        started = time.perf_counter()
+        patch_count = len(self.page_index.patches)
+        index = self._get_index(check=True)
+        recomputed_paras = sum(p.recomputed for p in index.patches[patch_count:])
+        patch_count = len(index.patches)
+
+        dirty = {page for page in range(1, index.page_count + 1) if self._page_needs_fix(page)}
+        log(f"[문서] {index.page_count}쪽 중 걸친 문단이 있는 페이지 {len(dirty)}개")
+
+        results = []
+
+        while dirty:
+            page = min(dirty)
+
+            page_started = time.perf_counter()
+            try:
+                result = self.fix_page(page, max_iterations=max_iterations, strategy=strategy,
+                                       log_callback=log_callback)
+            except Exception as e:
+                result = {'success': False, 'iterations': 0,
+                          'para_id': None, 'error': str(e)}
+            page_elapsed = time.perf_counter() - page_started
+
+            results.append({
+                'page': page,
+                'para_id': result.get('para_id'),
+                'success': result.get('success', False),
+                'strategy': result.get('strategy_used'),
+                'iterations': result.get('iterations', 0),
+                'elapsed': page_elapsed,
+            })
+            if 'error' in result:
+                results[-1]['error'] = result['error']
+            log(f"[페이지 {page}] 성공={results[-1]['success']}, 전략={results[-1]['strategy']}, "
+                f"반복={results[-1]['iterations']}회, {page_elapsed:.2f}초")
+
+            # 이번 페이지 편집으로 바뀐 페이지 다시 판정 (지난 페이지는 다시 처리하지 않음)
+            new_patches = index.patches[patch_count:]
+            dirty = self._propagate_dirty(dirty, new_patches)
+            recomputed_paras += sum(p.recomputed for p in new_patches)
+            patch_count = len(index.patches)
+            dirty = {p for p in dirty if p > page}
+
+        fixed = sum(1 for r in results if r['success'])
+        return {
+            'pages': index.page_count,
+            'checked': len(results),
+            'skipped': index.page_count - len(results),
+            'fixed': fixed,
+            'failed': len(results) - fixed,
+            'recomputed_paras': recomputed_paras,
+            'elapsed': time.perf_counter() - started,
+            'results': results
+        }
+
 
 # ============================================================
 # 페이지 걸침 문단 처리 전략 (fix_page 함수)
 # ============================================================
 #
 # 처리 순서:
-# 1. para_page_map 조회 (ParaAlignWords)
+# 1. para_page_map 조회 (ParagraphPageIndex, 편집 후에는 patch로 편집 문단부터 갱신)
 # 2. 페이지 마지막 문단의 걸침 여부 확인 (get_page_last_spanning_para)
 # 3. 걸친 문단이 없으면 종료
 #
@@ -1061,8 +1155,7 @@ class SeparatedPara:
 # ----------------------------------------------------------
 # [우선 전략] char_spacing_align (try_char_spacing_align)
 #   - 조건: 다음 페이지에 있는 글자 수 < (전체 줄 수 * 2 + 1)
-#   - 동작: 문단 전체 자간을 1 줄이고 분리단어 처리 적용
-#   - 반복: 최대 2회
+#   - 동작: 문단 전체 자간 감소량(1~2)을 이분 탐색(search_spacing)해 적용하고 분리단어 처리 적용
 #   - 함수: get_last_line_remaining_chars(), try_char_spacing_align()
 #
 # [전략 1] empty_font (reduce_empty_para_font_size)
@@ -1085,4 +1178,5 @@ class SeparatedPara:
 # - get_page_last_spanning_para(page): 페이지 마지막 걸친 문단 확인
 # - remove_empty_line_at_page_start(page): 페이지 첫 빈줄 제거
 # - fix_page(page, strategy): 메인 처리 함수
+# - fix_document(strategy): 문서 전체 처리 (걸친 문단이 있는 페이지만, 편집으로 바뀐 페이지 재판정)
 # ============================================================
@@ -10,9 +10,13 @@
     # 현재 문단 처리
     result = sw.fix_paragraph()
     print(f"조정된 줄 수: {result['adjusted_lines']}")
+
+로그:
+    debug=False(기본)면 WARNING 이상만 기록하고, 상세 로그 문자열 생성과 추적용 GetPos를 건너뜁니다.
+    debug=True 또는 log_level="INFO"/"DEBUG"면 상세 로그를 링 버퍼(log_capacity개)에 기록하고,
+    log_file을 주면 별도 스레드가 파일에 이어 씁니다.
 """
 
-import time
 import re
 import json
 import traceback
@@ -23,24 +27,42 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from block_selector import BlockSelector
 from cursor import get_hwp_instance
+from spacing_search import search_spacing, spacing_candidates
+from layout_settle import wait_for_layout, para_end_signature
+from trace_log import TraceLog
+
+
+# 모듈 정보 (디버그 로그에 기록)
+_MODULE_INFO = {
+    'file': os.path.abspath(__file__),
+    'loaded_at': datetime.now().isoformat(),
+}
 
 
 class SeparatedWord:
     """분리된 단어 처리 클래스"""
 
-    def __init__(self, hwp, debug: bool = False, log_dir: str = "debugs/logs"):
+    def __init__(self, hwp, debug: bool = False, log_dir: str = "debugs/logs",
+                 log_level: str = None, log_capacity: int = 5000, log_file: str = None,
+                 block: BlockSelector = None):
         """
         Args:
             hwp: HWP 객체
             debug: 디버그 모드 (True시 상세 로그 출력)
-            log_dir: 로그 파일 저장 디렉토리
+            log_dir: 로그 파일 저장 디렉토리 (save_debug_log/save_text_log)
+            log_level: 기록할 최소 레벨 (None이면 debug=True: DEBUG, False: WARNING)
+            log_capacity: 메모리에 보관할 최대 로그 수
+            log_file: 지정 시 로그를 비동기로 이어 쓸 파일
+            block: 줄 정보 캐시를 공유할 BlockSelector (None이면 새로 만듦)
         """
         self.hwp = hwp
         self.debug = debug
-        self.block = BlockSelector(hwp)
-        self.log_messages = []
+        self.block = block if block is not None else BlockSelector(hwp)
+        self.trace = TraceLog(level=log_level or ("DEBUG" if debug else "WARNING"),
+                              echo=debug, capacity=log_capacity, file_path=log_file)
+        # 상세 로그(INFO) 기록 여부 - False면 로그 문자열 생성과 추적용 GetPos를 건너뜀
+        self.tracing = self.trace.enabled("INFO")
         self.log_dir = Path(log_dir)
-        self.log_dir.mkdir(parents=True, exist_ok=True)
 
         # 세션 정보
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -53,28 +75,30 @@ class SeparatedWord:
         self.cursor_history = []
 
         # 초기화 로그
-        self._log(f"{'=' * 70}")
-        self._log(f"[INIT] SeparatedWord 인스턴스 생성")
-        self._log(f"[INIT] 실행 파일: {_MODULE_INFO['file']}")
-        self._log(f"[INIT] Python 버전: {sys.version}")
-        self._log(f"[INIT] 세션 ID: {self.session_id}")
-        self._log(f"[INIT] 디버그 모드: {self.debug}")
-        self._log(f"[INIT] 로그 디렉토리: {self.log_dir}")
-        self._log(f"{'=' * 70}")
+        if self.tracing:
+            self._log(f"{'=' * 70}")
+            self._log(f"[INIT] SeparatedWord 인스턴스 생성")
+            self._log(f"[INIT] 실행 파일: {_MODULE_INFO['file']}")
+            self._log(f"[INIT] Python 버전: {sys.version}")
+            self._log(f"[INIT] 세션 ID: {self.session_id}")
+            self._log(f"[INIT] 디버그 모드: {self.debug}")
+            self._log(f"[INIT] 로그 디렉토리: {self.log_dir}")
+            self._log(f"{'=' * 70}")
 
     def _log(self, message: str, level: str = "INFO"):
-        """로그 메시지 출력 및 저장"""
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        msg = f"[{timestamp}] [{level}] {message}"
-        if self.debug:
-            print(msg)
-        self.log_messages.append({
-            'timestamp': timestamp,
-            'level': level,
-            'message': message
-        })
-
-    def _track_cursor(self, action: str, context: str = "") -> Tuple[int, int, int]:
+        """로그 메시지 출력 및 저장 (꺼진 레벨은 무시)"""
+        self.trace.log(message, level)
+
+    @property
+    def log_messages(self) -> List[Dict]:
+        """기록된 로그 (오래된 것부터, 최대 log_capacity개)"""
+        return self.trace.messages()
+
+    def close_log(self):
+        """log_file 기록 종료 (남은 로그를 모두 쓰고 스레드 종료)"""
+        self.trace.close()
+
+    def _track_cursor(self, action: str, context: str = "") -> Optional[Tuple[int, int, int]]:
         """
         커서 위치를 추적하고 이력에 기록
 
@@ -83,8 +107,10 @@ class SeparatedWord:
             context: 추가 컨텍스트 정보
 
         Returns:
-            현재 커서 위치 (list_id, para_id, pos)
+            현재 커서 위치 (list_id, para_id, pos), 추적이 꺼져 있으면 None (GetPos 호출 안 함)
         """
+        if not self.tracing:
+            return None
         try:
             pos = self.hwp.GetPos()
             entry = {
@@ -113,6 +139,8 @@ class SeparatedWord:
             end_para, end_pos: 선택 끝 위치
             result_text: 선택된 텍스트 (있는 경우)
         """
+        if not self.trace.enabled("SELECT"):
+            return
         self._log(f"[SELECT] {action}", "SELECT")
         self._log(f"   범위: para {start_para}:{start_pos} ~ para {end_para}:{end_pos}", "SELECT")
         self._log(f"   문자 수: {end_pos - start_pos if start_para == end_para else '(다중 문단)'}", "SELECT")
@@ -130,6 +158,8 @@ class SeparatedWord:
             after: 이후 위치 (list_id, para_id, pos)
             operation: 수행한 작업명
         """
+        if not self.trace.enabled("CURSOR"):
+            return
         if before == after:
             self._log(f"[CURSOR_CHG] {operation}: 위치 변경 없음 (para={before[1]}, pos={before[2]})", "CURSOR")
         else:
@@ -160,38 +190,27 @@ class SeparatedWord:
                 'line_count': 5                    # 총 줄 수
             }
         """
-        self._log(f"")
-        self._log(f"[_get_line_info] 문단 줄 정보 수집 시작: para_id={para_id}")
-
-        # 현재 커서 위치 저장
-        saved_pos = self.hwp.GetPos()
-        self._log(f"   [1] 현재 커서 위치 저장: list={saved_pos[0]}, para={saved_pos[1]}, pos={saved_pos[2]}")
+        if self.tracing:
+            self._log(f"")
+            self._log(f"[_get_line_info] 문단 줄 정보 수집 시작: para_id={para_id}")
+            saved_pos = self._track_cursor("SAVE", f"_get_line_info 시작 (para_id={para_id})")
 
-        # BlockSelector의 _get_line_starts 활용
-        self._log(f"   [2] BlockSelector._get_line_starts({para_id}) 호출")
+        # BlockSelector의 _get_line_starts 활용 (커서 위치는 BlockSelector가 복원)
         line_starts, para_end = self.block._get_line_starts(para_id)
-        self._log(f"   [3] 결과: line_starts={line_starts}, para_end={para_end}")
-
-        # 커서 위치 확인 (BlockSelector 내부에서 변경되었을 수 있음)
-        current_pos = self.hwp.GetPos()
-        self._log(f"   [4] _get_line_starts 후 커서 위치: list={current_pos[0]}, para={current_pos[1]}, pos={current_pos[2]}")
-
-        # 커서 위치가 변경되었으면 복원
-        if current_pos != saved_pos:
-            self._log(f"   [5] 커서 위치 변경 감지! 원래 위치로 복원: SetPos({saved_pos[0]}, {saved_pos[1]}, {saved_pos[2]})")
-            self.hwp.SetPos(saved_pos[0], saved_pos[1], saved_pos[2])
-            restored_pos = self.hwp.GetPos()
-            self._log(f"   [6] 복원 후 커서 위치: list={restored_pos[0]}, para={restored_pos[1]}, pos={restored_pos[2]}")
-        else:
-            self._log(f"   [5] 커서 위치 변경 없음")
 
-        result = {
+        if self.tracing:
+            self._log(f"   BlockSelector._get_line_starts({para_id}) 결과: line_starts={line_starts}, para_end={para_end}")
+            current_pos = self._track_cursor("CHECK", "_get_line_starts 후")
+            self._log_cursor_change(saved_pos, current_pos, "_get_line_starts")
+            if current_pos != saved_pos:
+                self._log(f"   [WARNING] 커서 위치 복원 불일치! 예상: {saved_pos}, 실제: {current_pos}", "WARNING")
+            self._log(f"[_get_line_info] 완료: line_count={len(line_starts)}")
+
+        return {
             'line_starts': line_starts,
             'para_end': para_end,
             'line_count': len(line_starts)
         }
-        self._log(f"[_get_line_info] 완료: line_count={len(line_starts)}")
-        return result
 
     def _get_line_text(self, para_id: int, line_index: int, line_info: Dict) -> str:
         """
@@ -220,74 +239,73 @@ class SeparatedWord:
         else:
             end_pos = line_starts[line_index + 1]
 
-        self._log(f"_get_line_text: para_id={para_id}, line_index={line_index}, start_pos={start_pos}, end_pos={end_pos}")
+        # 같은 범위를 이미 읽었으면 (자간 변경 전까지) 캐시 사용
+        cached = self.block.get_cached_text(para_id, start_pos, end_pos)
+        if cached is not None:
+            text = self._normalize_line_text(cached)
+            if self.tracing:
+                self._log(f"_get_line_text: 캐시 사용 para_id={para_id}, line_index={line_index} = '{text}'")
+            return text
+
+        if self.tracing:
+            self._log(f"_get_line_text: para_id={para_id}, line_index={line_index}, start_pos={start_pos}, end_pos={end_pos}")
+
+        # 현재 위치 저장
+        saved_pos = self.hwp.GetPos()
+        list_id = saved_pos[0]
+        if self.tracing:
+            self._track_cursor("SAVE", f"_get_line_text 시작 (line_index={line_index})")
 
         # 범위 선택 및 텍스트 추출
         try:
-            # 현재 위치 저장
-            saved_pos = self._track_cursor("SAVE", f"_get_line_text 시작 (line_index={line_index})")
-            list_id = saved_pos[0]
-
             # 줄의 시작 위치로 이동
-            self._log(f"   [2] 줄 시작 위치로 이동: SetPos({list_id}, {para_id}, {start_pos})")
             self.hwp.SetPos(list_id, para_id, start_pos)
-            actual_pos = self._track_cursor("MOVE", f"SetPos({list_id}, {para_id}, {start_pos}) 후")
-            self._log_cursor_change(saved_pos, actual_pos, "SetPos (줄 시작)")
+            if self.tracing:
+                actual_pos = self._track_cursor("MOVE", f"SetPos({list_id}, {para_id}, {start_pos}) 후")
+                self._log_cursor_change(saved_pos, actual_pos, "SetPos (줄 시작)")
 
             # 문단 내 범위 선택
-            self._log(f"   [4] 범위 선택: SelectText({para_id}, {start_pos}, {para_id}, {end_pos})")
-            before_select = self.hwp.GetPos()
             self.hwp.SelectText(para_id, start_pos, para_id, end_pos)
-            after_select = self._track_cursor("SELECT", f"SelectText({para_id}, {start_pos}, {para_id}, {end_pos}) 후")
-            self._log_cursor_change(before_select, after_select, "SelectText")
+            if self.tracing:
+                after_select = self._track_cursor("SELECT", f"SelectText({para_id}, {start_pos}, {para_id}, {end_pos}) 후")
+                self._log_cursor_change(actual_pos, after_select, "SelectText")
 
             # 선택된 텍스트 가져오기
-            self._log(f"   [5] GetTextFile('TEXT', 'saveblock') 호출")
             text = self.hwp.GetTextFile("TEXT", "saveblock")
             self._log_selection("GetTextFile", para_id, start_pos, para_id, end_pos, text)
+            self.block.cache_text(para_id, start_pos, end_pos, text)
 
             # 선택 해제
-            self._log(f"   [7] 선택 해제: Cancel")
-            before_cancel = self.hwp.GetPos()
             self.hwp.HAction.Run("Cancel")
-            after_cancel = self._track_cursor("CANCEL", "HAction.Run('Cancel') 후")
-            self._log_cursor_change(before_cancel, after_cancel, "Cancel")
-
-            # 원래 위치 복원
-            self._log(f"   [8] 원래 위치 복원: SetPos({saved_pos[0]}, {saved_pos[1]}, {saved_pos[2]})")
-            self.hwp.SetPos(saved_pos[0], saved_pos[1], saved_pos[2])
-            restored_pos = self._track_cursor("RESTORE", "원래 위치 복원 후")
-            self._log_cursor_change(after_cancel, restored_pos, "SetPos (복원)")
-
-            # 복원 검증
-            if restored_pos != saved_pos:
-                self._log(f"   [WARNING] 위치 복원 불일치! 예상: {saved_pos}, 실제: {restored_pos}", "WARNING")
-
-            if text:
-                # 개행 문자만 제거 (공백은 유지)
-                self._log(f"   [10] 개행 문자 처리 전: {repr(text)}")
-                text = text.replace('\r\n', ' ').replace('\r', ' ').replace('\n', ' ')
-                # 연속된 공백을 하나로
-                text = re.sub(r' +', ' ', text)
-                self._log(f"   [11] 개행 문자 처리 후: {repr(text)}")
-            else:
-                self._log(f"   [10] 텍스트 없음 (None 또는 빈 문자열)")
-                text = ""
+            if self.tracing:
+                after_cancel = self._track_cursor("CANCEL", "HAction.Run('Cancel') 후")
+                self._log_cursor_change(after_select, after_cancel, "Cancel")
 
-            self._log(f"_get_line_text: 최종 텍스트 = '{text}' (길이: {len(text)})")
+            text = self._normalize_line_text(text)
+            if self.tracing:
+                self._log(f"_get_line_text: 최종 텍스트 = '{text}' (길이: {len(text)})")
             return text
         except Exception as e:
             self._log(f"_get_line_text: 텍스트 추출 실패 - {e}", "ERROR")
             self._log(f"_get_line_text: traceback = {traceback.format_exc()}", "ERROR")
-
-            # 원래 위치 복원 시도
+            return ""
+        finally:
+            # 원래 위치 복원
             try:
                 self.hwp.SetPos(saved_pos[0], saved_pos[1], saved_pos[2])
-                self._log(f"_get_line_text: 예외 후 위치 복원 완료")
             except Exception as restore_err:
-                self._log(f"_get_line_text: 예외 후 위치 복원 실패: {restore_err}", "ERROR")
-
+                self._log(f"_get_line_text: 위치 복원 실패: {restore_err}", "ERROR")
+            if self.tracing:
+                restored_pos = self._track_cursor("RESTORE", "원래 위치 복원 후")
+                if restored_pos != saved_pos:
+                    self._log(f"   [WARNING] 위치 복원 불일치! 예상: {saved_pos}, 실제: {restored_pos}", "WARNING")
+
+    def _normalize_line_text(self, text: str) -> str:
+        """개행 문자를 공백으로 바꾸고 연속된 공백을 하나로"""
+        if not text:
             return ""
+        text = text.replace('\r\n', ' ').replace('\r', ' ').replace('\n', ' ')
+        return re.sub(r' +', ' ', text)
 
     def _needs_alignment(self, text: str) -> bool:
         """
@@ -354,7 +372,9 @@ class SeparatedWord:
         self,
         para_id: int,
         line_index: int,
-        spacing: int
+        spacing: int,
+        settle: bool = True,
+        select_range: Tuple[int, int] = None
     ) -> bool:
         """
         특정 줄의 자간 조정
@@ -363,70 +383,66 @@ class SeparatedWord:
             para_id: 문단 ID
             line_index: 줄 번호
             spacing: 자간 값 (HWPUNIT, 음수 가능)
+            settle: 레이아웃 안정 대기 여부 (호출자가 바로 줄 정보를 다시 측정하면 False)
+            select_range: (시작 pos, 끝 pos) 지정 시 줄 대신 이 범위 선택
 
         Returns:
             True: 성공, False: 실패
         """
-        self._log(f"")
-        self._log(f"[_adjust_spacing] 자간 조정 시작")
-        self._log(f"   입력: para_id={para_id}, line_index={line_index}, spacing={spacing}")
+        if self.tracing:
+            self._log(f"")
+            self._log(f"[_adjust_spacing] 자간 조정 시작")
+            self._log(f"   입력: para_id={para_id}, line_index={line_index}, spacing={spacing}")
 
         try:
-            # 현재 커서 위치 저장
+            # 현재 커서 위치 (추적 로그용)
             saved_pos = self._track_cursor("SAVE", f"_adjust_spacing 시작 (line_index={line_index})")
 
             # 줄 선택
-            self._log(f"   [2] 블록 선택 시작: block.select_line_by_index({para_id}, {line_index})")
-            before_select = self.hwp.GetPos()
-            self.block.select_line_by_index(para_id, line_index)
-            after_select_pos = self._track_cursor("SELECT", f"block.select_line_by_index({para_id}, {line_index}) 후")
-            self._log_cursor_change(before_select, after_select_pos, "select_line_by_index")
-
-            # 선택된 텍스트 확인 (디버그용)
-            selected_text = self.hwp.GetTextFile("TEXT", "saveblock")
-            if selected_text:
-                preview = selected_text[:50] + "..." if len(selected_text) > 50 else selected_text
-                self._log(f"   [4] 선택된 텍스트 (미리보기): '{preview}'")
-                self._log(f"       선택된 텍스트 길이: {len(selected_text)}")
-                self._log(f"       선택된 텍스트 repr: {repr(selected_text[:80]) if len(selected_text) > 80 else repr(selected_text)}")
+            if select_range:
+                self.hwp.SelectText(para_id, select_range[0], para_id, select_range[1])
             else:
-                self._log(f"   [4] 선택된 텍스트: (없음 또는 빈 문자열)", "WARNING")
+                self.block.select_line_by_index(para_id, line_index)
+
+            if self.tracing:
+                after_select_pos = self._track_cursor("SELECT", f"선택 후 (line_index={line_index}, range={select_range})")
+                self._log_cursor_change(saved_pos, after_select_pos, "select_line_by_index")
+
+                # 선택된 텍스트 확인 (디버그용)
+                selected_text = self.hwp.GetTextFile("TEXT", "saveblock")
+                if selected_text:
+                    preview = selected_text[:50] + "..." if len(selected_text) > 50 else selected_text
+                    self._log(f"   선택된 텍스트 (미리보기): '{preview}' (길이: {len(selected_text)})")
+                else:
+                    self._log(f"   선택된 텍스트: (없음 또는 빈 문자열)", "WARNING")
 
             # 자간 설정
-            self._log(f"   [5] HParameterSet.HCharShape 가져오기")
             pset = self.hwp.HParameterSet.HCharShape
-
-            self._log(f"   [6] HAction.GetDefault('CharShape', pset.HSet) 호출")
             self.hwp.HAction.GetDefault("CharShape", pset.HSet)
-
-            self._log(f"   [7] 자간 값 설정:")
-            self._log(f"       - SpacingHangul = {spacing}")
-            self._log(f"       - SpacingLatin = {spacing}")
             pset.SpacingHangul = spacing
             pset.SpacingLatin = spacing
-
-            self._log(f"   [8] HAction.Execute('CharShape', pset.HSet) 호출")
-            before_execute = self.hwp.GetPos()
             self.hwp.HAction.Execute("CharShape", pset.HSet)
-            after_action_pos = self._track_cursor("EXECUTE", "HAction.Execute('CharShape') 후")
-            self._log_cursor_change(before_execute, after_action_pos, "CharShape Execute")
+            self.block.invalidate(para_id)
+
+            if self.tracing:
+                self._log(f"   CharShape 실행: SpacingHangul = SpacingLatin = {spacing}")
+                after_action_pos = self._track_cursor("EXECUTE", "HAction.Execute('CharShape') 후")
+                self._log_cursor_change(after_select_pos, after_action_pos, "CharShape Execute")
 
             # 선택 해제
-            self._log(f"   [10] 블록 선택 해제: block.cancel()")
-            before_cancel = self.hwp.GetPos()
             self.block.cancel()
-            after_cancel_pos = self._track_cursor("CANCEL", "block.cancel() 후")
-            self._log_cursor_change(before_cancel, after_cancel_pos, "block.cancel")
-
-            # 레이아웃 재계산 대기
-            self._log(f"   [12] 레이아웃 재계산 대기 (0.025초)")
-            time.sleep(0.025)
 
-            # 최종 위치 확인
-            final_pos = self._track_cursor("FINAL", "_adjust_spacing 완료")
-            self._log_cursor_change(saved_pos, final_pos, "_adjust_spacing 전체")
-
-            self._log(f"[_adjust_spacing] 완료: 성공")
+            # 레이아웃 재계산 대기 (문단 끝 페이지/줄이 연속으로 같으면 종료)
+            if settle:
+                settled = wait_for_layout(lambda: para_end_signature(self.hwp, para_id))
+                if self.tracing:
+                    self._log(f"   레이아웃 대기: settled={settled.settled}, "
+                              f"조회 {settled.polls}회, {settled.elapsed * 1000:.1f}ms")
+
+            if self.tracing:
+                final_pos = self._track_cursor("FINAL", "_adjust_spacing 완료")
+                self._log_cursor_change(saved_pos, final_pos, "_adjust_spacing 전체")
+                self._log(f"[_adjust_spacing] 완료: 성공")
             return True
 
         except Exception as e:
@@ -448,6 +464,7 @@ class SeparatedWord:
         # 로그 파일명
         log_filename = f"separated_word_{self.session_id}.json"
         log_filepath = self.log_dir / log_filename
+        self.log_dir.mkdir(parents=True, exist_ok=True)
 
         # 저장할 데이터
         log_data = {
@@ -492,6 +509,7 @@ class SeparatedWord:
         # 로그 파일명
         log_filename = f"separated_word_{self.session_id}.txt"
         log_filepath = self.log_dir / log_filename
+        self.log_dir.mkdir(parents=True, exist_ok=True)
 
         # 텍스트 로그 작성
         lines = []
@@ -583,7 +601,7 @@ class SeparatedWord:
                 'log': [...]                   # 로그 메시지
             }
         """
-        self.log_messages = []
+        self.trace.clear()
 
         # 파라미터 저장
         self.current_params = {
@@ -594,24 +612,26 @@ class SeparatedWord:
 
         # 현재 커서 위치 저장
         list_id, para_id, char_pos = self.hwp.GetPos()
-        self._log(f"=" * 60)
-        self._log(f"분리된 단어 처리 시작")
-        self._log(f"=" * 60)
-        self._log(f"위치: para_id={para_id}, char_pos={char_pos}")
-        self._log(f"파라미터:")
-        self._log(f"   - spacing_step: {spacing_step} (자간 감소 단위)")
-        self._log(f"   - min_spacing: {min_spacing} (최소 자간값)")
-        self._log(f"   - max_iterations: {max_iterations} (최대 반복)")
-        self._log(f"-" * 60)
+        if self.tracing:
+            self._log(f"=" * 60)
+            self._log(f"분리된 단어 처리 시작")
+            self._log(f"=" * 60)
+            self._log(f"위치: para_id={para_id}, char_pos={char_pos}")
+            self._log(f"파라미터:")
+            self._log(f"   - spacing_step: {spacing_step} (자간 감소 단위)")
+            self._log(f"   - min_spacing: {min_spacing} (최소 자간값)")
+            self._log(f"   - max_iterations: {max_iterations} (최대 반복)")
+            self._log(f"-" * 60)
 
         try:
             # 줄 정보 수집
             line_info = self._get_line_info(para_id)
             total_lines = line_info['line_count']
 
-            self._log(f"전체 줄 수: {total_lines}")
-            self._log(f"줄 시작 위치: {line_info['line_starts']}")
-            self._log(f"문단 끝 위치: {line_info['para_end']}")
+            if self.tracing:
+                self._log(f"전체 줄 수: {total_lines}")
+                self._log(f"줄 시작 위치: {line_info['line_starts']}")
+                self._log(f"문단 끝 위치: {line_info['para_end']}")
 
             if total_lines < 2:
                 return {
@@ -635,46 +655,52 @@ class SeparatedWord:
             while line_idx < total_lines and iteration_count < max_iterations:
                 iteration_count += 1
 
-                self._log(f"")
-                self._log(f"{'#' * 70}")
-                self._log(f"# 메인 루프 반복 #{iteration_count}")
-                self._log(f"# line_idx={line_idx}, total_lines={total_lines}")
-                self._log(f"{'#' * 70}")
+                if self.tracing:
+                    self._log(f"")
+                    self._log(f"{'#' * 70}")
+                    self._log(f"# 메인 루프 반복 #{iteration_count}")
+                    self._log(f"# line_idx={line_idx}, total_lines={total_lines}")
+                    self._log(f"{'#' * 70}")
 
                 # 현재 커서 위치 확인
-                loop_pos = self.hwp.GetPos()
-                self._log(f"[루프 시작] 현재 커서 위치: list={loop_pos[0]}, para={loop_pos[1]}, pos={loop_pos[2]}")
+                if self.tracing:
+                    loop_pos = self.hwp.GetPos()
+                    self._log(f"[루프 시작] 현재 커서 위치: list={loop_pos[0]}, para={loop_pos[1]}, pos={loop_pos[2]}")
 
                 # line_info는 이미 갱신되어 있음 (초기 또는 자간 조정 후)
                 current_total_lines = line_info['line_count']
-                self._log(f"[루프] 현재 줄 수: {current_total_lines}")
+                if self.tracing:
+                    self._log(f"[루프] 현재 줄 수: {current_total_lines}")
 
                 # 줄 수가 줄어든 경우 (처리 성공으로 인한 줄 병합)
                 if line_idx >= current_total_lines:
-                    self._log(f"[루프 종료] 줄 {line_idx}가 병합됨 (전체 줄 수: {current_total_lines})")
+                    if self.tracing:
+                        self._log(f"[루프 종료] 줄 {line_idx}가 병합됨 (전체 줄 수: {current_total_lines})")
                     break
 
                 # 현재 줄 텍스트
                 current_text = self._get_line_text(para_id, line_idx, line_info)
-                self._log(f"\n--- 줄 {line_idx + 1}/{current_total_lines} ---")
-                self._log(f"텍스트 전체: '{current_text}'")
-                self._log(f"텍스트 길이: {len(current_text)}")
+                if self.tracing:
+                    self._log(f"\n--- 줄 {line_idx + 1}/{current_total_lines} ---")
+                    self._log(f"텍스트 전체: '{current_text}'")
+                    self._log(f"텍스트 길이: {len(current_text)}")
 
                 # 공백 위치 디버깅
-                first_space_idx = current_text.find(' ')
-                if first_space_idx >= 0:
-                    self._log(f"첫 공백 위치: {first_space_idx}")
-                    self._log(f"   공백 앞 텍스트: '{current_text[:first_space_idx]}' (길이: {first_space_idx})")
-
-                    # 분리 패턴 분석 (공백 앞 글자 수 기준)
-                    if first_space_idx == 0:
-                        self._log(f"   패턴: 공백 앞 0글자 (처리 대상)")
-                    elif first_space_idx == 1:
-                        self._log(f"   패턴: 공백 앞 1글자 (처리 대상)")
+                if self.tracing:
+                    first_space_idx = current_text.find(' ')
+                    if first_space_idx >= 0:
+                        self._log(f"첫 공백 위치: {first_space_idx}")
+                        self._log(f"   공백 앞 텍스트: '{current_text[:first_space_idx]}' (길이: {first_space_idx})")
+
+                        # 분리 패턴 분석 (공백 앞 글자 수 기준)
+                        if first_space_idx == 0:
+                            self._log(f"   패턴: 공백 앞 0글자 (처리 대상)")
+                        elif first_space_idx == 1:
+                            self._log(f"   패턴: 공백 앞 1글자 (처리 대상)")
+                        else:
+                            self._log(f"   패턴: 공백 앞 {first_space_idx}글자 (처리 대상: 0~1글자만)")
                     else:
-                        self._log(f"   패턴: 공백 앞 {first_space_idx}글자 (처리 대상: 0~1글자만)")
-                else:
-                    self._log(f"공백 없음 (처리 불가)")
+                        self._log(f"공백 없음 (처리 불가)")
 
                 # 이전 줄 텍스트 (정렬 방식 판단에 필요)
                 prev_text = self._get_line_text(para_id, line_idx - 1, line_info)
@@ -689,7 +715,8 @@ class SeparatedWord:
 
                 # 정렬 방식 결정 (reduce: 자간 줄임, expand: 자간 늘림)
                 align_type = self._get_alignment_type(current_text, prev_text)
-                self._log(f"처리 대상으로 판단됨 (방식: {align_type})")
+                if self.tracing:
+                    self._log(f"처리 대상으로 판단됨 (방식: {align_type})")
 
                 if align_type == 'skip':
                     self._log(f"건너뜀: 처리 조건 미충족")
@@ -697,9 +724,10 @@ class SeparatedWord:
                     line_idx += 1
                     continue
 
-                self._log(f"이전 줄 텍스트: '{prev_text}'")
-                self._log(f"이전 줄 끝 문자: '{prev_text[-1] if prev_text else ''}'")
-                self._log(f"이전 줄 끝이 공백? {self._line_ends_with_space(prev_text)}")
+                if self.tracing:
+                    self._log(f"이전 줄 텍스트: '{prev_text}'")
+                    self._log(f"이전 줄 끝 문자: '{prev_text[-1] if prev_text else ''}'")
+                    self._log(f"이전 줄 끝이 공백? {self._line_ends_with_space(prev_text)}")
 
                 # 이미 이전 줄이 공백으로 끝나면 성공 (reduce 케이스)
                 if align_type == 'reduce' and self._line_ends_with_space(prev_text):
@@ -707,128 +735,133 @@ class SeparatedWord:
                     line_idx += 1
                     continue
 
-                self._log(f"처리 시작")
-                self._log(f"   이전 줄 끝 10자: '{prev_text[-10:] if len(prev_text) >= 10 else prev_text}'")
+                if self.tracing:
+                    self._log(f"처리 시작")
+                    self._log(f"   이전 줄 끝 10자: '{prev_text[-10:] if len(prev_text) >= 10 else prev_text}'")
 
                 # 현재 줄의 처음 단어 길이 확인 (몇 글자를 올려야 하는지)
                 first_space_idx = current_text.find(' ')
                 target_chars = first_space_idx  # 공백 전 글자 수
-                self._log(f"공백 전 글자 수: {target_chars}글자")
+                if self.tracing:
+                    self._log(f"공백 전 글자 수: {target_chars}글자")
 
                 # 자간 조정 시작
                 line_adjusted = False
-                same_line_attempts = 0
-                max_same_line_attempts = 10
 
+                # 자간 후보 (약한 값 → 강한 값)를 두 배 간격 + 이분 탐색 (적용 횟수는 후보 수의 로그)
                 if align_type == 'reduce':
                     # 자간 줄이기: 1글자는 -2, 2글자는 -3으로 시작
                     if target_chars == 1:
-                        current_spacing = -2
+                        start_spacing = -2
                     else:  # target_chars == 2
-                        current_spacing = -3
-
-                    self._log(f"-" * 60)
-                    self._log(f"자간 줄이기 (reduce) 시작:")
-                    self._log(f"   초기 자간: {current_spacing} ({target_chars}글자 기준)")
-                    self._log(f"   자간 감소 단위: {spacing_step}")
-                    self._log(f"   최소 자간: {min_spacing}")
-                    self._log(f"-" * 60)
-
-                    # 첫 시도
-                    if not self._adjust_spacing(para_id, line_idx - 1, current_spacing):
-                        self._log("자간 조정 실패", "ERROR")
-                    else:
-                        same_line_attempts += 1
-                        line_info = self._get_line_info(para_id)
-                        prev_text = self._get_line_text(para_id, line_idx - 1, line_info)
-
-                        if self._line_ends_with_space(prev_text):
-                            self._log(f"성공: 이전 줄 끝이 공백 (시도 1회, 자간 {current_spacing})")
-                            line_adjusted = True
-                            adjusted_count += 1
-
-                    # 추가 시도 (필요시)
-                    while not line_adjusted and current_spacing > min_spacing and same_line_attempts < max_same_line_attempts:
-                        same_line_attempts += 1
-                        current_spacing += spacing_step
-
-                        self._log(f"시도 #{same_line_attempts}, 자간: {current_spacing}")
-
-                        if not self._adjust_spacing(para_id, line_idx - 1, current_spacing):
-                            self._log("자간 조정 실패", "ERROR")
-                            break
-
-                        line_info = self._get_line_info(para_id)
-
-                        # 줄 수 변경 확인
-                        new_total_lines = line_info['line_count']
-                        if line_idx >= new_total_lines:
-                            self._log("성공: 줄 병합됨")
-                            line_adjusted = True
-                            break
-
-                        if line_idx - 1 >= len(line_info['line_starts']):
-                            break
-
-                        prev_text = self._get_line_text(para_id, line_idx - 1, line_info)
-
-                        if self._line_ends_with_space(prev_text):
-                            self._log(f"성공: 이전 줄 끝이 공백")
-                            line_adjusted = True
-                            adjusted_count += 1
-                            break
+                        start_spacing = -3
+                    candidates = spacing_candidates(start_spacing, spacing_step, min_spacing)
+
+                    if self.tracing:
+                        self._log(f"-" * 60)
+                        self._log(f"자간 줄이기 (reduce) 시작:")
+                        self._log(f"   초기 자간: {start_spacing} ({target_chars}글자 기준)")
+                        self._log(f"   자간 감소 단위: {spacing_step}")
+                        self._log(f"   최소 자간: {min_spacing}")
+                        self._log(f"   후보: {candidates[0]} ~ {candidates[-1]} ({len(candidates)}개)")
+                        self._log(f"-" * 60)
 
                 else:  # align_type == 'expand'
                     # 자간 늘리기: 이전 줄 끝 1글자를 다음 줄로 내림
-                    current_spacing = 1  # 양수로 시작
                     max_spacing = 10  # 최대 자간
+                    candidates = spacing_candidates(1, 1, max_spacing)
+
+                    if self.tracing:
+                        self._log(f"-" * 60)
+                        self._log(f"자간 늘리기 (expand) 시작:")
+                        self._log(f"   목표: 이전 줄 끝 1글자를 다음 줄로 내림")
+                        self._log(f"   초기 자간: +{candidates[0]}")
+                        self._log(f"   최대 자간: +{max_spacing}")
+                        self._log(f"-" * 60)
+
+                prev_start = line_info['line_starts'][line_idx - 1]
+                current_start = line_info['line_starts'][line_idx]
+                # 현재 줄 시작이 옮겨가야 할 위치
+                # 줄이기: 앞 단어(target_chars)가 올라와야 함, 늘리기: 이전 줄 끝의 잘린 조각이 내려가야 함
+                if align_type == 'reduce':
+                    boundary = current_start + target_chars
+                else:
+                    boundary = current_start - (len(prev_text) - (prev_text.rfind(' ') + 1))
+                # 시도마다 같은 범위(이전 줄 + 올릴 단어)에 자간을 덮어써서 시도끼리 독립적으로 만듦
+                select_end = max(current_start, boundary)
+
+                def apply_spacing(spacing):
+                    if self.tracing:
+                        self._log(f"시도 자간: {spacing}")
+                    # 적용 직후 check_aligned가 줄 정보를 다시 측정하므로 고정 대기 생략
+                    ok = self._adjust_spacing(para_id, line_idx - 1, spacing, settle=False,
+                                              select_range=(prev_start, select_end))
+                    if not ok:
+                        self._log("자간 조정 실패", "ERROR")
+                    return ok
+
+                def check_aligned(spacing):
+                    """글자가 충분히 이동했으면 'merged'/'space'/'over', 아니면 False (자간에 단조)"""
+                    nonlocal line_info, prev_text
+                    line_info = self._get_line_info(para_id)
+
+                    # 줄 수 변경 확인 (줄이기: 병합, 늘리기: 줄이 늘어날 수 있음)
+                    new_total_lines = line_info['line_count']
+                    if self.tracing and new_total_lines != current_total_lines:
+                        self._log(f"줄 수 변경: {current_total_lines} -> {new_total_lines}")
+                    if align_type == 'reduce' and line_idx >= new_total_lines:
+                        self._log("성공: 줄 병합됨")
+                        return 'merged'
+
+                    if line_idx >= len(line_info['line_starts']):
+                        return False
+
+                    # 줄 경계가 boundary까지 옮겨졌는지 (자간이 강할수록 만족: 단조)
+                    new_start = line_info['line_starts'][line_idx]
+                    if (new_start < boundary) if align_type == 'reduce' else (new_start > boundary):
+                        return False
+
+                    prev_text = self._get_line_text(para_id, line_idx - 1, line_info)
+                    if self.tracing:
+                        self._log(f"   이전 줄 끝: '{prev_text[-1] if prev_text else ''}'")
+
+                    # 이전 줄이 공백으로 끝나면 성공, 아니면 단어 중간까지 넘어감
+                    if self._line_ends_with_space(prev_text):
+                        return 'space'
+                    return 'over'
 
-                    self._log(f"-" * 60)
-                    self._log(f"자간 늘리기 (expand) 시작:")
-                    self._log(f"   목표: 이전 줄 끝 1글자를 다음 줄로 내림")
-                    self._log(f"   초기 자간: +{current_spacing}")
-                    self._log(f"   최대 자간: +{max_spacing}")
-                    self._log(f"-" * 60)
-
-                    # 이전 줄 끝 글자 저장 (성공 여부 판단용)
-                    original_prev_last_char = prev_text[-1] if prev_text else ''
-
-                    while current_spacing <= max_spacing and same_line_attempts < max_same_line_attempts:
-                        same_line_attempts += 1
-
-                        self._log(f"시도 #{same_line_attempts}, 자간: +{current_spacing}")
-
-                        if not self._adjust_spacing(para_id, line_idx - 1, current_spacing):
-                            self._log("자간 조정 실패", "ERROR")
-                            break
-
-                        line_info = self._get_line_info(para_id)
-
-                        # 줄 수 변경 확인 (줄이 늘어날 수 있음)
-                        new_total_lines = line_info['line_count']
-                        if new_total_lines != current_total_lines:
-                            self._log(f"줄 수 변경: {current_total_lines} -> {new_total_lines}")
-
-                        if line_idx - 1 >= len(line_info['line_starts']):
-                            break
-
-                        # 이전 줄 다시 확인
-                        prev_text = self._get_line_text(para_id, line_idx - 1, line_info)
-                        new_prev_last_char = prev_text[-1] if prev_text else ''
-
-                        self._log(f"   이전 줄 끝: '{original_prev_last_char}' -> '{new_prev_last_char}'")
-
-                        # 이전 줄이 공백으로 끝나면 성공 (1글자가 내려감)
-                        if self._line_ends_with_space(prev_text):
-                            self._log(f"성공: 이전 줄 끝이 공백 (1글자 내림)")
-                            line_adjusted = True
-                            adjusted_count += 1
+                same_line_attempts = 0
+                while True:
+                    search = search_spacing(candidates, apply_spacing, check_aligned)
+                    current_spacing = search.value
+                    same_line_attempts += search.probes
+                    if self.tracing:
+                        self._log(f"자간 탐색: 시도 {search.tried}, 결과 {current_spacing}, {search.outcome}")
+
+                    # 다음 단어 중간까지 넘어갔으면 잘린 조각까지 옮기도록 더 강한 후보에서 다시 탐색
+                    candidates = candidates[candidates.index(current_spacing) + 1:]
+                    if search.outcome != 'over' or not candidates:
+                        break
+                    new_start = line_info['line_starts'][line_idx]
+                    if align_type == 'reduce':
+                        fragment = self._get_line_text(para_id, line_idx, line_info).find(' ')
+                        if fragment < 0:
                             break
+                        boundary = new_start + fragment
+                        select_end = boundary
+                    else:
+                        boundary = new_start - (len(prev_text) - (prev_text.rfind(' ') + 1))
 
-                        current_spacing += 1
+                if search.outcome in ('space', 'merged'):
+                    line_adjusted = True
+                    if search.outcome == 'space':
+                        if self.tracing:
+                            self._log(f"성공: 이전 줄 끝이 공백 (자간 {current_spacing})")
+                        adjusted_count += 1
 
                 if line_adjusted:
-                    self._log(f"줄 {line_idx + 1} 처리 성공! (방식: {align_type}, 자간: {current_spacing}, 시도: {same_line_attempts})")
+                    if self.tracing:
+                        self._log(f"줄 {line_idx + 1} 처리 성공! (방식: {align_type}, 자간: {current_spacing}, 시도: {same_line_attempts})")
                     total_lines = line_info['line_count']
                     continue
                 else:
@@ -838,10 +871,12 @@ class SeparatedWord:
 
             # 커서를 문단 끝으로 이동
             para_end_pos = line_info['para_end']
-            before_final = self.hwp.GetPos()
+            if self.tracing:
+                before_final = self.hwp.GetPos()
             self.hwp.SetPos(list_id, para_id, para_end_pos)
-            after_final = self._track_cursor("FINAL_MOVE", f"문단 끝으로 이동: SetPos({list_id}, {para_id}, {para_end_pos})")
-            self._log_cursor_change(before_final, after_final, "문단 끝으로 커서 이동")
+            if self.tracing:
+                after_final = self._track_cursor("FINAL_MOVE", f"문단 끝으로 이동: SetPos({list_id}, {para_id}, {para_end_pos})")
+                self._log_cursor_change(before_final, after_final, "문단 끝으로 커서 이동")
 
             result = {
                 'success': failed_count == 0,
@@ -853,16 +888,17 @@ class SeparatedWord:
                 'log': self.log_messages
             }
 
-            self._log(f"")
-            self._log(f"=" * 60)
-            self._log(f"작업 완료")
-            self._log(f"=" * 60)
-            self._log(f"결과 요약:")
-            self._log(f"   전체 줄 수: {total_lines}")
-            self._log(f"   조정 성공: {adjusted_count} 줄")
-            self._log(f"   건너뜀: {skipped_count} 줄")
-            self._log(f"   실패: {failed_count} 줄")
-            self._log(f"   반복 횟수: {iteration_count}/{max_iterations}")
+            if self.tracing:
+                self._log(f"")
+                self._log(f"=" * 60)
+                self._log(f"작업 완료")
+                self._log(f"=" * 60)
+                self._log(f"결과 요약:")
+                self._log(f"   전체 줄 수: {total_lines}")
+                self._log(f"   조정 성공: {adjusted_count} 줄")
+                self._log(f"   건너뜀: {skipped_count} 줄")
+                self._log(f"   실패: {failed_count} 줄")
+                self._log(f"   반복 횟수: {iteration_count}/{max_iterations}")
             if failed_count == 0:
                 self._log(f"모든 줄 처리 완료!")
             else:
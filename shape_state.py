@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+글자/문단 모양 상태 추적 - 마지막으로 적용한 CharShape/ParaShape 값을 기억해 중복 실행 생략
+
+같은 값을 다시 설정하면 GetDefault/Execute를 호출하지 않고, batch() 안에서 모은 변경은
+글자 모양 1회 + 문단 모양 1회 Execute로 합쳐서 적용합니다.
+
+추적 범위:
+- 이 객체로 적용한 항목만 기억 (처음 설정하는 항목은 항상 실행)
+- remember=True(기본)면 설정 호출 사이에도 기억을 유지 - 커서 이동을 직접 관리하는 곳
+  (md_to_hwp처럼 이어서 입력)에서만 사용
+- remember=False면 기억은 batch() 하나 안에서만 유지 - 설정 호출마다 항상 실행하고,
+  batch 안에서 모은 변경만 합쳐서 실행 (StylePara/StyleFormat 기본값)
+- 이 객체를 거치지 않고 모양을 바꾸는 코드(HAction.Execute/Run 직접 호출, 모양 붙여넣기,
+  실행 취소)나 다른 리스트로 커서를 옮기는 코드는 그 뒤에 반드시 invalidate() 호출
+
+사용법:
+    from shape_state import ShapeState
+
+    shapes = ShapeState(hwp)
+    shapes.set_para(LeftMargin=0, Indentation=-3000)   # 실행
+    shapes.set_para(LeftMargin=0, Indentation=-3000)   # 같은 값 → 생략
+
+    hwp.HAction.Run("ParagraphShapeIndentPositive")    # 직접 바꾼 뒤에는
+    shapes.invalidate(char=False)                      # 기억 버림
+
+    with shapes.batch():                               # 모아서 CharShape 1회
+        shapes.set_char(Bold=1)
+        shapes.set_char(Height=1200, TextColor=0)
+"""
+
+from contextlib import contextmanager
+from typing import Any, Dict
+
+
+# 종류 → (액션 이름, HParameterSet 이름)
+SHAPE_ACTIONS = {
+    'char': ("CharShape", "HCharShape"),
+    'para': ("ParagraphShape", "HParaShape"),
+}
+
+_MISSING = object()
+
+
+class ShapeState:
+    """커서 위치의 글자/문단 모양 그림자 상태"""
+
+    def __init__(self, hwp, remember: bool = True):
+        """
+        Args:
+            hwp: 한글 인스턴스
+            remember: False면 설정 호출(batch는 블록 전체)이 끝날 때마다 기억을 버려 항상 실행
+        """
+        self.hwp = hwp
+        self.remember = remember
+        self.char: Dict[str, Any] = {}      # 마지막으로 적용한 글자 모양 항목
+        self.para: Dict[str, Any] = {}      # 마지막으로 적용한 문단 모양 항목
+        self._pending: Dict[str, Dict[str, Any]] = {'char': {}, 'para': {}}
+        self._depth = 0
+        self.executed = 0                   # Execute 횟수
+        self.skipped = 0                    # 값이 같아 생략한 설정 호출 수
+
+    # ------------------------------------------------------------------
+    # 설정
+    # ------------------------------------------------------------------
+
+    def set_char(self, **values) -> bool:
+        """글자 모양 항목 설정 (HCharShape 속성 이름=값), 바뀐 항목이 없으면 False"""
+        return self._set('char', values)
+
+    def set_para(self, **values) -> bool:
+        """문단 모양 항목 설정 (HParaShape 속성 이름=값), 바뀐 항목이 없으면 False"""
+        return self._set('para', values)
+
+    @contextmanager
+    def batch(self):
+        """블록 안의 설정을 모았다가 끝날 때 종류별로 Execute 1회 (중첩 가능)"""
+        if self._depth == 0:
+            self._begin()
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self.flush()
+
+    def flush(self):
+        """모아 둔 변경 적용"""
+        for kind, pending in self._pending.items():
+            if not pending:
+                continue
+            values = dict(pending)
+            pending.clear()
+            action, pset_name = SHAPE_ACTIONS[kind]
+            pset = getattr(self.hwp.HParameterSet, pset_name)
+            self.hwp.HAction.GetDefault(action, pset.HSet)
+            for name, value in values.items():
+                setattr(pset, name, value)
+            ok = self.hwp.HAction.Execute(action, pset.HSet)
+            self.executed += 1
+            shadow = self._shadow(kind)
+            if ok is False:
+                # 적용 여부를 모르므로 해당 항목은 다음에 다시 실행
+                for name in values:
+                    shadow.pop(name, None)
+            else:
+                shadow.update(values)
+
+    def invalidate(self, char: bool = True, para: bool = True):
+        """기억한 모양 버리기 (다른 경로로 모양이 바뀌었거나 커서를 옮긴 뒤)"""
+        if char:
+            self.char.clear()
+        if para:
+            self.para.clear()
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+
+    def _shadow(self, kind: str) -> Dict[str, Any]:
+        return self.char if kind == 'char' else self.para
+
+    def _set(self, kind: str, values: Dict[str, Any]) -> bool:
+        if self._depth == 0:
+            self._begin()
+        shadow = self._shadow(kind)
+        pending = self._pending[kind]
+        changed = False
+        for name, value in values.items():
+            if pending.get(name, shadow.get(name, _MISSING)) == value:
+                continue
+            changed = True
+            if shadow.get(name, _MISSING) == value:
+                pending.pop(name)       # 모아 둔 변경을 되돌림 (이미 적용된 값)
+            else:
+                pending[name] = value
+        if not changed:
+            self.skipped += 1
+            return False
+        if self._depth == 0:
+            self.flush()
+        return True
+
+    def _begin(self):
+        """설정(또는 batch) 시작 - remember=False면 이전 호출의 기억 버림"""
+        if not self.remember:
+            self.invalidate()
@@ -0,0 +1,122 @@
+"""
+자간 탐색 - 자간 후보를 이분 탐색하여 조건을 만족하는 가장 약한 값을 찾음
+
+자간을 한 단계씩 바꾸며 매번 적용/측정하는 대신, 후보 목록(약한 값 → 강한 값)에서
+간격을 두 배씩 늘려 만족하는 값을 찾은 뒤 그 사이를 이분 탐색합니다.
+조건(예: 이전 줄 끝이 공백)은 자간이 강할수록 만족하기 쉬운(단조) 것으로 가정합니다.
+
+사용법:
+    from spacing_search import search_spacing, spacing_candidates
+
+    candidates = spacing_candidates(-2, -1, -100)   # [-2, -3, ..., -100]
+    result = search_spacing(candidates, apply=set_spacing, check=is_aligned)
+    print(result.value, result.success, result.probes)
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Sequence
+
+
+@dataclass
+class SpacingSearchResult:
+    """자간 탐색 결과"""
+    value: Any = None            # 최종 적용된 자간 (성공 시 조건을 만족하는 가장 약한 후보)
+    success: bool = False
+    outcome: Any = None          # 최종 값에서의 check() 반환값
+    probes: int = 0              # 적용+측정 횟수
+    tried: List[Any] = field(default_factory=list)   # 시도한 값 (순서대로)
+
+
+def spacing_candidates(start: float, step: float, limit: float, max_steps: int = None) -> List[float]:
+    """
+    start부터 step 간격으로 limit까지의 자간 후보 (limit을 넘는 첫 값까지 포함)
+
+    한 단계씩 줄이던 루프(while current > limit: current += step)가 도달할 수 있는 값과 같습니다.
+
+    Args:
+        start: 첫 자간
+        step: 자간 변화 단위 (0이 아님, 음수면 줄이기)
+        limit: 자간 한계 (이 값을 넘으면 더 진행하지 않음)
+        max_steps: 최대 후보 수 (None이면 제한 없음)
+    """
+    if not step:
+        return [start]
+    values = [start]
+    current = start
+    while (current > limit if step < 0 else current < limit):
+        if max_steps is not None and len(values) >= max_steps:
+            break
+        current += step
+        values.append(current)
+    return values
+
+
+def search_spacing(candidates: Sequence[Any],
+                   apply: Callable[[Any], bool],
+                   check: Callable[[Any], Any]) -> SpacingSearchResult:
+    """
+    조건을 만족하는 가장 약한 자간 찾기
+
+    1. 가장 약한 값 적용 → 만족하면 종료 (대부분의 경우)
+    2. 1, 3, 7, 15...번째 후보로 간격을 두 배씩 늘려 만족하는 값이 나올 때까지 적용
+       (마지막 후보까지 만족하지 않으면 실패, 마지막 후보가 적용된 채로 종료)
+    3. 마지막 불만족 값과 만족 값 사이를 이분 탐색
+    4. 찾은 값이 마지막 적용 값이 아니면 한 번 더 적용
+
+    답이 k번째 후보이면 약 2*log2(k)번 적용하므로 후보가 많아도(0 ~ min_spacing) 적용 횟수가 작습니다.
+
+    Args:
+        candidates: 자간 후보 (약한 값 → 강한 값 순서)
+        apply: 값 적용 함수 (실패 시 False 반환)
+        check: 적용 후 측정 함수 (만족하면 참인 값 반환, 예: 'space', 'merged')
+
+    Returns:
+        SpacingSearchResult
+    """
+    result = SpacingSearchResult()
+    if not candidates:
+        return result
+
+    def probe(index: int) -> Any:
+        value = candidates[index]
+        result.probes += 1
+        result.tried.append(value)
+        result.value = value
+        if not apply(value):
+            return None
+        return check(value)
+
+    # candidates[lo] 불만족, candidates[hi] 만족이 되도록 범위 찾기
+    lo, hi = -1, None
+    best = None
+    index = 0
+    last = len(candidates) - 1
+    while True:
+        outcome = probe(index)
+        if outcome is None:           # 적용 실패
+            return result
+        if outcome:
+            hi, best = index, outcome
+            break
+        result.outcome = outcome
+        if index == last:
+            return result
+        lo = index
+        index = min(index * 2 + 1, last)
+
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        mid_outcome = probe(mid)
+        if mid_outcome is None:
+            break
+        if mid_outcome:
+            hi, best = mid, mid_outcome
+        else:
+            lo = mid
+
+    if result.value != candidates[hi]:
+        best = probe(hi) or best
+    result.value = candidates[hi]
+    result.success = True
+    result.outcome = best
+    return result
@@ -9,12 +9,14 @@
 4. 스타일 적용/제거
 """
 
-import pythoncom
-import win32com.client as win32
+from shape_state import ShapeState
 
 
 def get_hwp_instance():
     """실행 중인 한글 인스턴스에 연결"""
+    import pythoncom
+    import win32com.client as win32
+
     try:
         context = pythoncom.CreateBindCtx(0)
         rot = pythoncom.GetRunningObjectTable()
@@ -181,11 +183,29 @@ COLORS = {
 }
 
 
+# 문단 서식 초기화 값 (양쪽 정렬, 여백 0, 줄간격 160%)
+DEFAULT_PARA_SHAPE = {
+    'AlignType': 0,
+    'LeftMargin': 0,
+    'RightMargin': 0,
+    'Indentation': 0,
+    'PrevSpacing': 0,
+    'NextSpacing': 0,
+    'LineSpacingType': 0,
+    'LineSpacing': 160,
+}
+
+
 class StyleFormat:
-    """한글 서식/스타일 관리 클래스"""
+    """한글 서식/스타일 관리 클래스
 
-    def __init__(self, hwp):
+    글자/문단 모양 설정은 ShapeState를 거쳐 실행 (apply_* 안의 설정은 한 번의 Execute로 합침).
+    Run 액션이나 현재 값 기준 증감처럼 결과 값을 모르는 변경 뒤에는 기억한 모양을 버립니다.
+    """
+
+    def __init__(self, hwp, shapes=None):
         self.hwp = hwp
+        self.shapes = shapes if shapes is not None else ShapeState(hwp, remember=False)
         self._saved_styles = {}  # 스타일 저장소 {이름: {char: {...}, para: {...}}}
 
     # ========== 스타일 저장/불러오기 ==========
@@ -236,10 +256,11 @@ class StyleFormat:
 
         style = self._saved_styles[name]
 
-        if apply_char and 'char' in style:
-            self._apply_char_style(style['char'])
-        if apply_para and 'para' in style:
-            self._apply_para_style(style['para'])
+        with self.shapes.batch():
+            if apply_char and 'char' in style:
+                self._apply_char_style(style['char'])
+            if apply_para and 'para' in style:
+                self._apply_para_style(style['para'])
 
         return True
 
@@ -252,44 +273,38 @@ class StyleFormat:
         return self.load_style(name, apply_char=False, apply_para=True)
 
     def _apply_char_style(self, char_info):
-        """글자 모양 정보를 적용"""
-        self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
-        pset = self.hwp.HParameterSet.HCharShape
-
-        pset.FaceNameHangul = char_info.get('font_hangul', '맑은 고딕')
-        pset.FaceNameLatin = char_info.get('font_latin', '맑은 고딕')
-        pset.FaceNameHanja = char_info.get('font_hanja', '맑은 고딕')
-        pset.Height = int(char_info.get('size_pt', 10) * 100)
-        pset.Bold = int(char_info.get('bold', False))
-        pset.Italic = int(char_info.get('italic', False))
-        pset.UnderlineType = char_info.get('underline', 0)
-        pset.StrikeOutType = char_info.get('strikeout', 0)
-        pset.TextColor = char_info.get('text_color', 0)
-        pset.ShadeColor = char_info.get('shade_color', -1)
-        pset.SpacingHangul = char_info.get('spacing', 0)
-        pset.SpacingLatin = char_info.get('spacing', 0)
-        pset.RatioHangul = char_info.get('ratio', 100)
-        pset.RatioLatin = char_info.get('ratio', 100)
-        pset.SuperScript = int(char_info.get('superscript', False))
-        pset.SubScript = int(char_info.get('subscript', False))
-
-        self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+        """글자 모양 정보를 적용 (바뀐 항목만)"""
+        self.shapes.set_char(
+            FaceNameHangul=char_info.get('font_hangul', '맑은 고딕'),
+            FaceNameLatin=char_info.get('font_latin', '맑은 고딕'),
+            FaceNameHanja=char_info.get('font_hanja', '맑은 고딕'),
+            Height=int(char_info.get('size_pt', 10) * 100),
+            Bold=int(char_info.get('bold', False)),
+            Italic=int(char_info.get('italic', False)),
+            UnderlineType=char_info.get('underline', 0),
+            StrikeOutType=char_info.get('strikeout', 0),
+            TextColor=char_info.get('text_color', 0),
+            ShadeColor=char_info.get('shade_color', -1),
+            SpacingHangul=char_info.get('spacing', 0),
+            SpacingLatin=char_info.get('spacing', 0),
+            RatioHangul=char_info.get('ratio', 100),
+            RatioLatin=char_info.get('ratio', 100),
+            SuperScript=int(char_info.get('superscript', False)),
+            SubScript=int(char_info.get('subscript', False)),
+        )
 
     def _apply_para_style(self, para_info):
-        """문단 모양 정보를 적용"""
-        self.hwp.HAction.GetDefault("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
-        pset = self.hwp.HParameterSet.HParaShape
-
-        pset.AlignType = para_info.get('align', 0)
-        pset.LineSpacing = para_info.get('line_spacing', 160)
-        pset.LineSpacingType = para_info.get('line_spacing_type', 0)
-        pset.PrevSpacing = int(para_info.get('prev_spacing_pt', 0) * 100)
-        pset.NextSpacing = int(para_info.get('next_spacing_pt', 0) * 100)
-        pset.LeftMargin = int(para_info.get('left_margin_pt', 0) * 100)
-        pset.RightMargin = int(para_info.get('right_margin_pt', 0) * 100)
-        pset.Indentation = int(para_info.get('indent_pt', 0) * 100)
-
-        self.hwp.HAction.Execute("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
+        """문단 모양 정보를 적용 (바뀐 항목만)"""
+        self.shapes.set_para(
+            AlignType=para_info.get('align', 0),
+            LineSpacing=para_info.get('line_spacing', 160),
+            LineSpacingType=para_info.get('line_spacing_type', 0),
+            PrevSpacing=int(para_info.get('prev_spacing_pt', 0) * 100),
+            NextSpacing=int(para_info.get('next_spacing_pt', 0) * 100),
+            LeftMargin=int(para_info.get('left_margin_pt', 0) * 100),
+            RightMargin=int(para_info.get('right_margin_pt', 0) * 100),
+            Indentation=int(para_info.get('indent_pt', 0) * 100),
+        )
 
     def get_saved_style(self, name):
         """저장된 스타일 정보 조회"""
@@ -365,20 +380,18 @@ class StyleFormat:
         """굵게 설정 (선택 영역에 적용)"""
         if enable:
             self.hwp.HAction.Run("CharShapeBold")
+            self.shapes.invalidate(para=False)
         else:
             # 굵게 해제: CharShape에서 Bold=0 설정
-            self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
-            self.hwp.HParameterSet.HCharShape.Bold = 0
-            self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+            self.shapes.set_char(Bold=0)
 
     def set_italic(self, enable=True):
         """기울임 설정"""
         if enable:
             self.hwp.HAction.Run("CharShapeItalic")
+            self.shapes.invalidate(para=False)
         else:
-            self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
-            self.hwp.HParameterSet.HCharShape.Italic = 0
-            self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+            self.shapes.set_char(Italic=0)
 
     def set_underline(self, underline_type=1, shape=0, color=None):
         """
@@ -389,12 +402,10 @@ class StyleFormat:
             shape: 0=실선, 1=점선, 2=굵은실선 등
             color: BGR 색상값 또는 None(글자색)
         """
-        self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
-        self.hwp.HParameterSet.HCharShape.UnderlineType = underline_type
-        self.hwp.HParameterSet.HCharShape.UnderlineShape = shape
+        values = {'UnderlineType': underline_type, 'UnderlineShape': shape}
         if color is not None:
-            self.hwp.HParameterSet.HCharShape.UnderlineColor = color
-        self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+            values['UnderlineColor'] = color
+        self.shapes.set_char(**values)
 
     def set_strikeout(self, strikeout_type=1):
         """
@@ -403,9 +414,7 @@ class StyleFormat:
         Args:
             strikeout_type: 0=없음, 1~7=다양한 스타일
         """
-        self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
-        self.hwp.HParameterSet.HCharShape.StrikeOutType = strikeout_type
-        self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+        self.shapes.set_char(StrikeOutType=strikeout_type)
 
     def set_text_color(self, color):
         """
@@ -417,15 +426,11 @@ class StyleFormat:
         if isinstance(color, str):
             color = COLORS.get(color, 0x000000)
 
-        self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
-        self.hwp.HParameterSet.HCharShape.TextColor = color
-        self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+        self.shapes.set_char(TextColor=color)
 
     def set_font_size(self, pt):
         """글자 크기 설정 (포인트)"""
-        self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
-        self.hwp.HParameterSet.HCharShape.Height = pt_to_hwpunit(pt)
-        self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+        self.shapes.set_char(Height=pt_to_hwpunit(pt))
 
     def set_font(self, hangul=None, latin=None, hanja=None):
         """
@@ -436,14 +441,14 @@ class StyleFormat:
             latin: 영문 글꼴명
             hanja: 한자 글꼴명
         """
-        self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+        values = {}
         if hangul:
-            self.hwp.HParameterSet.HCharShape.FaceNameHangul = hangul
+            values['FaceNameHangul'] = hangul
         if latin:
-            self.hwp.HParameterSet.HCharShape.FaceNameLatin = latin
+            values['FaceNameLatin'] = latin
         if hanja:
-            self.hwp.HParameterSet.HCharShape.FaceNameHanja = hanja
-        self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+            values['FaceNameHanja'] = hanja
+        self.shapes.set_char(**values)
 
     def set_char_shape(self, **kwargs):
         """
@@ -463,44 +468,44 @@ class StyleFormat:
             spacing: 자간 (-50~50)
             ratio: 장평 (50~200)
         """
-        self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
-        pset = self.hwp.HParameterSet.HCharShape
+        values = {}
 
         if 'bold' in kwargs:
-            pset.Bold = kwargs['bold']
+            values['Bold'] = kwargs['bold']
         if 'italic' in kwargs:
-            pset.Italic = kwargs['italic']
+            values['Italic'] = kwargs['italic']
         if 'underline' in kwargs:
-            pset.UnderlineType = kwargs['underline']
+            values['UnderlineType'] = kwargs['underline']
         if 'strikeout' in kwargs:
-            pset.StrikeOutType = kwargs['strikeout']
+            values['StrikeOutType'] = kwargs['strikeout']
         if 'color' in kwargs:
             color = kwargs['color']
             if isinstance(color, str):
                 color = COLORS.get(color, 0x000000)
-            pset.TextColor = color
+            values['TextColor'] = color
         if 'size' in kwargs:
-            pset.Height = pt_to_hwpunit(kwargs['size'])
+            values['Height'] = pt_to_hwpunit(kwargs['size'])
         if 'font_hangul' in kwargs:
-            pset.FaceNameHangul = kwargs['font_hangul']
+            values['FaceNameHangul'] = kwargs['font_hangul']
         if 'font_latin' in kwargs:
-            pset.FaceNameLatin = kwargs['font_latin']
+            values['FaceNameLatin'] = kwargs['font_latin']
         if 'superscript' in kwargs:
-            pset.SuperScript = kwargs['superscript']
+            values['SuperScript'] = kwargs['superscript']
         if 'subscript' in kwargs:
-            pset.SubScript = kwargs['subscript']
+            values['SubScript'] = kwargs['subscript']
         if 'spacing' in kwargs:
-            pset.SpacingHangul = kwargs['spacing']
-            pset.SpacingLatin = kwargs['spacing']
+            values['SpacingHangul'] = kwargs['spacing']
+            values['SpacingLatin'] = kwargs['spacing']
         if 'ratio' in kwargs:
-            pset.RatioHangul = kwargs['ratio']
-            pset.RatioLatin = kwargs['ratio']
+            values['RatioHangul'] = kwargs['ratio']
+            values['RatioLatin'] = kwargs['ratio']
 
-        self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+        self.shapes.set_char(**values)
 
     def reset_char_shape(self):
         """글자 모양 초기화 (보통 모양)"""
         self.hwp.HAction.Run("CharShapeNormal")
+        self.shapes.invalidate(para=False)
 
     # ========== 문단 모양 (ParaShape) ==========
 
@@ -528,10 +533,9 @@ class StyleFormat:
 
         if align_type in action_map:
             self.hwp.HAction.Run(action_map[align_type])
+            self.shapes.invalidate(char=False)
         else:
-            self.hwp.HAction.GetDefault("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
-            self.hwp.HParameterSet.HParaShape.AlignType = align_type
-            self.hwp.HAction.Execute("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
+            self.shapes.set_para(AlignType=align_type)
 
     def set_line_spacing(self, value, spacing_type=0):
         """
@@ -541,10 +545,7 @@ class StyleFormat:
             value: 줄간격 값 (%, pt 등)
             spacing_type: 0=글자에따라(%), 1=고정값, 2=여백만지정, 3=최소
         """
-        self.hwp.HAction.GetDefault("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
-        self.hwp.HParameterSet.HParaShape.LineSpacingType = spacing_type
-        self.hwp.HParameterSet.HParaShape.LineSpacing = value
-        self.hwp.HAction.Execute("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
+        self.shapes.set_para(LineSpacingType=spacing_type, LineSpacing=value)
 
     def set_para_margin(self, left=None, right=None, indent=None, before=None, after=None):
         """
@@ -557,21 +558,20 @@ class StyleFormat:
             before: 문단 위 간격
             after: 문단 아래 간격
         """
-        self.hwp.HAction.GetDefault("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
-        pset = self.hwp.HParameterSet.HParaShape
+        values = {}
 
         if left is not None:
-            pset.LeftMargin = pt_to_hwpunit(left)
+            values['LeftMargin'] = pt_to_hwpunit(left)
         if right is not None:
-            pset.RightMargin = pt_to_hwpunit(right)
+            values['RightMargin'] = pt_to_hwpunit(right)
         if indent is not None:
-            pset.Indentation = pt_to_hwpunit(indent)
+            values['Indentation'] = pt_to_hwpunit(indent)
         if before is not None:
-            pset.PrevSpacing = pt_to_hwpunit(before)
+            values['PrevSpacing'] = pt_to_hwpunit(before)
         if after is not None:
-            pset.NextSpacing = pt_to_hwpunit(after)
+            values['NextSpacing'] = pt_to_hwpunit(after)
 
-        self.hwp.HAction.Execute("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
+        self.shapes.set_para(**values)
 
     def set_para_shape(self, **kwargs):
         """
@@ -587,32 +587,31 @@ class StyleFormat:
             before: 문단 위 간격 (pt)
             after: 문단 아래 간격 (pt)
         """
-        self.hwp.HAction.GetDefault("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
-        pset = self.hwp.HParameterSet.HParaShape
+        values = {}
 
         if 'align' in kwargs:
             align = kwargs['align']
             align_map = {'justify': 0, 'left': 1, 'right': 2, 'center': 3, 'distribute': 4}
             if isinstance(align, str):
                 align = align_map.get(align, 0)
-            pset.AlignType = align
+            values['AlignType'] = align
 
         if 'line_spacing' in kwargs:
-            pset.LineSpacing = kwargs['line_spacing']
+            values['LineSpacing'] = kwargs['line_spacing']
         if 'line_spacing_type' in kwargs:
-            pset.LineSpacingType = kwargs['line_spacing_type']
+            values['LineSpacingType'] = kwargs['line_spacing_type']
         if 'left_margin' in kwargs:
-            pset.LeftMargin = pt_to_hwpunit(kwargs['left_margin'])
+            values['LeftMargin'] = pt_to_hwpunit(kwargs['left_margin'])
         if 'right_margin' in kwargs:
-            pset.RightMargin = pt_to_hwpunit(kwargs['right_margin'])
+            values['RightMargin'] = pt_to_hwpunit(kwargs['right_margin'])
         if 'indent' in kwargs:
-            pset.Indentation = pt_to_hwpunit(kwargs['indent'])
+            values['Indentation'] = pt_to_hwpunit(kwargs['indent'])
         if 'before' in kwargs:
-            pset.PrevSpacing = pt_to_hwpunit(kwargs['before'])
+            values['PrevSpacing'] = pt_to_hwpunit(kwargs['before'])
         if 'after' in kwargs:
-            pset.NextSpacing = pt_to_hwpunit(kwargs['after'])
+            values['NextSpacing'] = pt_to_hwpunit(kwargs['after'])
 
-        self.hwp.HAction.Execute("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
+        self.shapes.set_para(**values)
 
     # ========== 서식 복사/붙여넣기 ==========
 
@@ -644,6 +643,7 @@ class StyleFormat:
         self.hwp.HAction.GetDefault("ShapeCopyPaste", self.hwp.HParameterSet.HShapeCopyPaste.HSet)
         self.hwp.HParameterSet.HShapeCopyPaste.Type = shape_type
         self.hwp.HAction.Execute("ShapeCopyPaste", self.hwp.HParameterSet.HShapeCopyPaste.HSet)
+        self.shapes.invalidate()
 
     # ========== 스타일 관리 ==========
 
@@ -657,6 +657,7 @@ class StyleFormat:
         self.hwp.HAction.GetDefault("Style", self.hwp.HParameterSet.HStyle.HSet)
         self.hwp.HParameterSet.HStyle.Apply = style_index
         self.hwp.HAction.Execute("Style", self.hwp.HParameterSet.HStyle.HSet)
+        self.shapes.invalidate()
 
     def apply_style_shortcut(self, num):
         """
@@ -667,10 +668,12 @@ class StyleFormat:
         """
         if 1 <= num <= 10:
             self.hwp.HAction.Run(f"StyleShortcut{num}")
+            self.shapes.invalidate()
 
     def clear_char_style(self):
         """글자 스타일 해제"""
         self.hwp.HAction.Run("StyleClearCharStyle")
+        self.shapes.invalidate(para=False)
 
     def clear_all_formatting(self):
         """
@@ -678,40 +681,26 @@ class StyleFormat:
         """
         # 글자 모양 초기화
         self.hwp.HAction.Run("CharShapeNormal")
+        self.shapes.invalidate(para=False)
 
         # 문단 모양 초기화
-        self.hwp.HAction.GetDefault("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
-        pset = self.hwp.HParameterSet.HParaShape
-        pset.AlignType = 0  # 양쪽 정렬
-        pset.LeftMargin = 0
-        pset.RightMargin = 0
-        pset.Indentation = 0
-        pset.PrevSpacing = 0
-        pset.NextSpacing = 0
-        pset.LineSpacingType = 0
-        pset.LineSpacing = 160  # 기본 160%
-        self.hwp.HAction.Execute("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
+        self.shapes.set_para(**DEFAULT_PARA_SHAPE)
 
     def clear_char_formatting(self):
         """글자 서식만 제거 (보통 모양으로)"""
         self.hwp.HAction.Run("CharShapeNormal")
+        self.shapes.invalidate(para=False)
 
     def clear_para_formatting(self):
         """문단 서식만 제거 (기본값으로)"""
-        self.hwp.HAction.GetDefault("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
-        pset = self.hwp.HParameterSet.HParaShape
-        pset.AlignType = 0
-        pset.LeftMargin = 0
-        pset.RightMargin = 0
-        pset.Indentation = 0
-        pset.PrevSpacing = 0
-        pset.NextSpacing = 0
-        pset.LineSpacingType = 0
-        pset.LineSpacing = 160
-        self.hwp.HAction.Execute("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
+        self.shapes.set_para(**DEFAULT_PARA_SHAPE)
 
     # ========== 줄간격 / 문단 여백 증감 ==========
 
+    def _after_relative_para_change(self):
+        """현재 값 기준 증감 뒤 호출 - 결과가 선택 영역(문단)마다 다르므로 기억한 문단 모양을 버림"""
+        self.shapes.invalidate(char=False)
+
     def _get_current_para_shape(self):
         """현재 커서 위치의 문단 모양 정보 가져오기"""
         self.hwp.HAction.GetDefault("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
@@ -736,6 +725,7 @@ class StyleFormat:
         new_value = max(50, current + delta_percent)  # 최소 50%
         pset.LineSpacing = new_value
         self.hwp.HAction.Execute("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
+        self._after_relative_para_change()
         return new_value
 
     def increase_line_spacing(self, percent=5):
@@ -759,6 +749,7 @@ class StyleFormat:
         new_value = max(0, current + pt_to_hwpunit(delta_pt))
         pset.PrevSpacing = new_value
         self.hwp.HAction.Execute("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
+        self._after_relative_para_change()
         return hwpunit_to_pt(new_value)
 
     def adjust_para_next_spacing(self, delta_pt):
@@ -774,6 +765,7 @@ class StyleFormat:
         new_value = max(0, current + pt_to_hwpunit(delta_pt))
         pset.NextSpacing = new_value
         self.hwp.HAction.Execute("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
+        self._after_relative_para_change()
         return hwpunit_to_pt(new_value)
 
     def adjust_para_both_spacing(self, delta_pt):
@@ -792,6 +784,7 @@ class StyleFormat:
         pset.PrevSpacing = new_prev
         pset.NextSpacing = new_next
         self.hwp.HAction.Execute("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
+        self._after_relative_para_change()
         return (hwpunit_to_pt(new_prev), hwpunit_to_pt(new_next))
 
     def increase_para_prev_spacing(self, pt=0.5):
@@ -834,6 +827,7 @@ class StyleFormat:
         new_value = max(50, int(current + delta))
         pset.LineSpacing = new_value
         self.hwp.HAction.Execute("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
+        self._after_relative_para_change()
         return new_value
 
     def increase_line_spacing_5percent(self):
@@ -864,6 +858,7 @@ class StyleFormat:
         new_value = max(0, int(current + delta))
         pset.PrevSpacing = new_value
         self.hwp.HAction.Execute("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
+        self._after_relative_para_change()
         return hwpunit_to_pt(new_value)
 
     def adjust_para_next_spacing_by_percent(self, ratio_percent, min_value_pt=0.5):
@@ -886,6 +881,7 @@ class StyleFormat:
         new_value = max(0, int(current + delta))
         pset.NextSpacing = new_value
         self.hwp.HAction.Execute("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
+        self._after_relative_para_change()
         return hwpunit_to_pt(new_value)
 
     def adjust_para_both_spacing_by_percent(self, ratio_percent, min_value_pt=0.5):
@@ -922,6 +918,7 @@ class StyleFormat:
         pset.PrevSpacing = new_prev
         pset.NextSpacing = new_next
         self.hwp.HAction.Execute("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
+        self._after_relative_para_change()
         return (hwpunit_to_pt(new_prev), hwpunit_to_pt(new_next))
 
     def increase_para_prev_spacing_5percent(self):
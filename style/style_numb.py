@@ -31,6 +31,7 @@ try:
 except ImportError:
     HAS_YAML = False
 from cursor import get_hwp_instance
+from document_snapshot import DocumentSnapshot
 
 DEFAULT_STYLES_PATH = os.path.join(os.path.dirname(__file__), 'styles.yaml')
 
@@ -237,32 +238,24 @@ class StyleNumb:
 
         return level, clean_text
 
-    def scan_headings(self, debug=False):
+    def scan_headings(self, debug=False, snapshot=None):
         """
-        문서 전체에서 마크다운 헤딩 스캔
+        문서 전체(본문)에서 마크다운 헤딩 스캔
+
+        Args:
+            snapshot: 문서 스냅샷 (None이면 새로 수집 - 본문 텍스트를 한 번에 내보냄, 커서 위치 유지)
 
         Returns:
             list: 헤딩 정보 리스트 (list_id, para_id 포함)
         """
         headings = []
         counters = [0, 0, 0, 0, 0]
-        processed_paras = set()
-        max_iterations = 10000
-
-        self.hwp.HAction.Run("MoveDocBegin")
 
-        for _ in range(max_iterations):
-            self.hwp.HAction.Run("MoveParaBegin")
-            pos = self.hwp.GetPos()
-            list_id, para_id = pos[0], pos[1]
+        if snapshot is None:
+            snapshot = DocumentSnapshot(self.hwp)
 
-            if para_id in processed_paras:
-                break
-            processed_paras.add(para_id)
-
-            self.hwp.HAction.Run("MoveSelParaEnd")
-            text = self.hwp.GetTextFile("TEXT", "saveblock")
-            self.hwp.HAction.Run("Cancel")
+        for para in snapshot.paragraphs(0):
+            list_id, para_id, text = para.list_id, para.para_id, para.text
 
             if text:
                 text = text.strip()
@@ -285,13 +278,6 @@ class StyleNumb:
                     if debug:
                         print(f"  [{para_id}] lv={level} {counters}")
 
-            self.hwp.HAction.Run("MoveParaEnd")
-            self.hwp.HAction.Run("MoveRight")
-
-            new_pos = self.hwp.GetPos()
-            if new_pos[1] == para_id:
-                break
-
         if debug:
             print(f"[스캔] {len(headings)}개 헤딩 발견")
 
@@ -10,6 +10,9 @@
 3. 모양 복사/붙여넣기
 4. 유틸리티: RGB-BGR 변환, pt-HWPUNIT 변환
 
+설정 함수는 ShapeState를 거쳐 항상 실행하고,
+apply_*_style은 여러 항목을 모아 CharShape/ParagraphShape를 한 번씩만 실행합니다.
+
 사용 예:
     from style_para import StylePara
     from cursor import get_hwp_instance
@@ -31,6 +34,7 @@ import os
 import yaml
 
 from cursor import get_hwp_instance
+from shape_state import ShapeState
 
 # 기본 스타일 파일 경로
 DEFAULT_STYLES_PATH = os.path.join(os.path.dirname(__file__), 'styles.yaml')
@@ -57,16 +61,18 @@ class StylePara:
         'minimum': 3    # 최소
     }
 
-    def __init__(self, hwp=None):
+    def __init__(self, hwp=None, shapes=None):
         """
         StylePara 초기화
 
         Args:
             hwp: 한글 인스턴스 (None이면 get_hwp_instance() 호출)
+            shapes: ShapeState (None이면 호출마다 실행하는 remember=False 상태 생성)
         """
         self.hwp = hwp if hwp else get_hwp_instance()
         if not self.hwp:
             raise RuntimeError("한글 인스턴스에 연결할 수 없습니다.")
+        self.shapes = shapes if shapes is not None else ShapeState(self.hwp, remember=False)
 
     # ========== 유틸리티 함수 ==========
 
@@ -107,9 +113,7 @@ class StylePara:
         Args:
             enabled: True=굵게, False=보통
         """
-        self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
-        self.hwp.HParameterSet.HCharShape.Bold = 1 if enabled else 0
-        self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+        self.shapes.set_char(Bold=1 if enabled else 0)
 
     def set_italic(self, enabled=True):
         """
@@ -118,9 +122,7 @@ class StylePara:
         Args:
             enabled: True=기울임, False=보통
         """
-        self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
-        self.hwp.HParameterSet.HCharShape.Italic = 1 if enabled else 0
-        self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+        self.shapes.set_char(Italic=1 if enabled else 0)
 
     def set_underline(self, enabled=True, line_type=1, shape=0, color=None):
         """
@@ -132,13 +134,12 @@ class StylePara:
             shape: 밑줄 모양 (0=실선, 1=점선, 2=굵은실선 등)
             color: (r, g, b) 튜플 또는 None(글자색)
         """
-        self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
-        self.hwp.HParameterSet.HCharShape.UnderlineType = line_type if enabled else 0
+        values = {'UnderlineType': line_type if enabled else 0}
         if enabled:
-            self.hwp.HParameterSet.HCharShape.UnderlineShape = shape
+            values['UnderlineShape'] = shape
             if color:
-                self.hwp.HParameterSet.HCharShape.UnderlineColor = self.rgb_to_bgr(*color)
-        self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+                values['UnderlineColor'] = self.rgb_to_bgr(*color)
+        self.shapes.set_char(**values)
 
     def set_font_size(self, pt):
         """
@@ -147,9 +148,7 @@ class StylePara:
         Args:
             pt: 포인트 크기 (예: 10, 12, 14)
         """
-        self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
-        self.hwp.HParameterSet.HCharShape.Height = self.pt_to_hwpunit(pt)
-        self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+        self.shapes.set_char(Height=self.pt_to_hwpunit(pt))
 
     def set_font(self, hangul=None, latin=None):
         """
@@ -159,12 +158,12 @@ class StylePara:
             hangul: 한글 글꼴명 (예: "맑은 고딕")
             latin: 영문 글꼴명 (예: "Arial")
         """
-        self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+        values = {}
         if hangul:
-            self.hwp.HParameterSet.HCharShape.FaceNameHangul = hangul
+            values['FaceNameHangul'] = hangul
         if latin:
-            self.hwp.HParameterSet.HCharShape.FaceNameLatin = latin
-        self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+            values['FaceNameLatin'] = latin
+        self.shapes.set_char(**values)
 
     def set_text_color(self, r, g, b):
         """
@@ -175,9 +174,7 @@ class StylePara:
             g: 초록 (0-255)
             b: 파랑 (0-255)
         """
-        self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
-        self.hwp.HParameterSet.HCharShape.TextColor = self.rgb_to_bgr(r, g, b)
-        self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+        self.shapes.set_char(TextColor=self.rgb_to_bgr(r, g, b))
 
     def set_strikeout(self, enabled=True, strikeout_type=1, shape=0, color=None):
         """
@@ -189,13 +186,12 @@ class StylePara:
             shape: 선 모양
             color: (r, g, b) 튜플 또는 None
         """
-        self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
-        self.hwp.HParameterSet.HCharShape.StrikeOutType = strikeout_type if enabled else 0
+        values = {'StrikeOutType': strikeout_type if enabled else 0}
         if enabled:
-            self.hwp.HParameterSet.HCharShape.StrikeOutShape = shape
+            values['StrikeOutShape'] = shape
             if color:
-                self.hwp.HParameterSet.HCharShape.StrikeOutColor = self.rgb_to_bgr(*color)
-        self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+                values['StrikeOutColor'] = self.rgb_to_bgr(*color)
+        self.shapes.set_char(**values)
 
     def set_outline(self, outline_type=0):
         """
@@ -204,9 +200,7 @@ class StylePara:
         Args:
             outline_type: 0=없음, 1=실선, 2=점선, 3=굵은실선
         """
-        self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
-        self.hwp.HParameterSet.HCharShape.OutlineType = outline_type
-        self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+        self.shapes.set_char(OutlineType=outline_type)
 
     def set_shadow(self, shadow_type=0, offset_x=10, offset_y=10, color=None):
         """
@@ -218,38 +212,29 @@ class StylePara:
             offset_y: Y 오프셋 (%)
             color: (r, g, b) 튜플 또는 None
         """
-        self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
-        self.hwp.HParameterSet.HCharShape.ShadowType = shadow_type
+        values = {'ShadowType': shadow_type}
         if shadow_type > 0:
-            self.hwp.HParameterSet.HCharShape.ShadowOffsetX = offset_x
-            self.hwp.HParameterSet.HCharShape.ShadowOffsetY = offset_y
+            values['ShadowOffsetX'] = offset_x
+            values['ShadowOffsetY'] = offset_y
             if color:
-                self.hwp.HParameterSet.HCharShape.ShadowColor = self.rgb_to_bgr(*color)
-        self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+                values['ShadowColor'] = self.rgb_to_bgr(*color)
+        self.shapes.set_char(**values)
 
     def set_emboss(self, enabled=True):
         """양각 설정"""
-        self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
-        self.hwp.HParameterSet.HCharShape.Emboss = 1 if enabled else 0
-        self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+        self.shapes.set_char(Emboss=1 if enabled else 0)
 
     def set_engrave(self, enabled=True):
         """음각 설정"""
-        self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
-        self.hwp.HParameterSet.HCharShape.Engrave = 1 if enabled else 0
-        self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+        self.shapes.set_char(Engrave=1 if enabled else 0)
 
     def set_superscript(self, enabled=True):
         """위첨자 설정"""
-        self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
-        self.hwp.HParameterSet.HCharShape.SuperScript = 1 if enabled else 0
-        self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+        self.shapes.set_char(SuperScript=1 if enabled else 0)
 
     def set_subscript(self, enabled=True):
         """아래첨자 설정"""
-        self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
-        self.hwp.HParameterSet.HCharShape.SubScript = 1 if enabled else 0
-        self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+        self.shapes.set_char(SubScript=1 if enabled else 0)
 
     def set_char_spacing(self, spacing):
         """
@@ -258,9 +243,7 @@ class StylePara:
         Args:
             spacing: 자간 (%, 음수=좁게, 양수=넓게)
         """
-        self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
-        self.hwp.HParameterSet.HCharShape.CharSpacing = spacing
-        self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+        self.shapes.set_char(CharSpacing=spacing)
 
     def set_char_ratio(self, ratio):
         """
@@ -269,9 +252,7 @@ class StylePara:
         Args:
             ratio: 장평 (%, 100=기본)
         """
-        self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
-        self.hwp.HParameterSet.HCharShape.CharRatio = ratio
-        self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+        self.shapes.set_char(CharRatio=ratio)
 
     def set_char_offset(self, offset):
         """
@@ -280,9 +261,7 @@ class StylePara:
         Args:
             offset: 오프셋 (%, 양수=위, 음수=아래)
         """
-        self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
-        self.hwp.HParameterSet.HCharShape.CharOffset = offset
-        self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+        self.shapes.set_char(CharOffset=offset)
 
     def set_all_fonts(self, hangul=None, latin=None, hanja=None, japanese=None, other=None, symbol=None):
         """
@@ -296,27 +275,19 @@ class StylePara:
             other: 기타 글꼴
             symbol: 기호 글꼴
         """
-        self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
-        cs = self.hwp.HParameterSet.HCharShape
-        if hangul:
-            cs.FaceNameHangul = hangul
-        if latin:
-            cs.FaceNameLatin = latin
-        if hanja:
-            cs.FaceNameHanja = hanja
-        if japanese:
-            cs.FaceNameJapanese = japanese
-        if other:
-            cs.FaceNameOther = other
-        if symbol:
-            cs.FaceNameSymbol = symbol
-        self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+        fonts = {
+            'FaceNameHangul': hangul,
+            'FaceNameLatin': latin,
+            'FaceNameHanja': hanja,
+            'FaceNameJapanese': japanese,
+            'FaceNameOther': other,
+            'FaceNameSymbol': symbol,
+        }
+        self.shapes.set_char(**{name: face for name, face in fonts.items() if face})
 
     def set_shade_color(self, r, g, b):
         """음영색 설정"""
-        self.hwp.HAction.GetDefault("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
-        self.hwp.HParameterSet.HCharShape.ShadeColor = self.rgb_to_bgr(r, g, b)
-        self.hwp.HAction.Execute("CharShape", self.hwp.HParameterSet.HCharShape.HSet)
+        self.shapes.set_char(ShadeColor=self.rgb_to_bgr(r, g, b))
 
     def get_char_shape(self):
         """
@@ -367,9 +338,7 @@ class StylePara:
             raise ValueError(f"잘못된 정렬 타입: {align_type}. "
                            f"가능한 값: {list(self.ALIGN_TYPES.keys())}")
 
-        self.hwp.HAction.GetDefault("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
-        self.hwp.HParameterSet.HParaShape.AlignType = self.ALIGN_TYPES[align_type]
-        self.hwp.HAction.Execute("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
+        self.shapes.set_para(AlignType=self.ALIGN_TYPES[align_type])
 
     def set_line_spacing(self, value, spacing_type='percent'):
         """
@@ -387,16 +356,10 @@ class StylePara:
             raise ValueError(f"잘못된 줄간격 타입: {spacing_type}. "
                            f"가능한 값: {list(self.LINE_SPACING_TYPES.keys())}")
 
-        self.hwp.HAction.GetDefault("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
-        self.hwp.HParameterSet.HParaShape.LineSpacingType = self.LINE_SPACING_TYPES[spacing_type]
-
         # fixed 타입이면 pt를 HWPUNIT으로 변환
         if spacing_type == 'fixed':
-            self.hwp.HParameterSet.HParaShape.LineSpacing = self.pt_to_hwpunit(value)
-        else:
-            self.hwp.HParameterSet.HParaShape.LineSpacing = value
-
-        self.hwp.HAction.Execute("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
+            value = self.pt_to_hwpunit(value)
+        self.shapes.set_para(LineSpacingType=self.LINE_SPACING_TYPES[spacing_type], LineSpacing=value)
 
     def set_para_margin(self, left=None, right=None, indent=None):
         """
@@ -407,16 +370,14 @@ class StylePara:
             right: 오른쪽 여백 (pt)
             indent: 첫줄 들여쓰기 (pt, 음수면 내어쓰기)
         """
-        self.hwp.HAction.GetDefault("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
-
+        values = {}
         if left is not None:
-            self.hwp.HParameterSet.HParaShape.LeftMargin = self.pt_to_hwpunit(left)
+            values['LeftMargin'] = self.pt_to_hwpunit(left)
         if right is not None:
-            self.hwp.HParameterSet.HParaShape.RightMargin = self.pt_to_hwpunit(right)
+            values['RightMargin'] = self.pt_to_hwpunit(right)
         if indent is not None:
-            self.hwp.HParameterSet.HParaShape.Indentation = self.pt_to_hwpunit(indent)
-
-        self.hwp.HAction.Execute("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
+            values['Indentation'] = self.pt_to_hwpunit(indent)
+        self.shapes.set_para(**values)
 
     def set_para_spacing(self, before=None, after=None):
         """
@@ -426,56 +387,40 @@ class StylePara:
             before: 문단 앞 간격 (pt)
             after: 문단 뒤 간격 (pt)
         """
-        self.hwp.HAction.GetDefault("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
-
+        values = {}
         if before is not None:
-            self.hwp.HParameterSet.HParaShape.SpaceBeforePara = self.pt_to_hwpunit(before)
+            values['SpaceBeforePara'] = self.pt_to_hwpunit(before)
         if after is not None:
-            self.hwp.HParameterSet.HParaShape.SpaceAfterPara = self.pt_to_hwpunit(after)
-
-        self.hwp.HAction.Execute("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
+            values['SpaceAfterPara'] = self.pt_to_hwpunit(after)
+        self.shapes.set_para(**values)
 
     def set_widow_orphan(self, enabled=True):
         """외톨이줄 보호 설정"""
-        self.hwp.HAction.GetDefault("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
-        self.hwp.HParameterSet.HParaShape.WidowOrphan = 1 if enabled else 0
-        self.hwp.HAction.Execute("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
+        self.shapes.set_para(WidowOrphan=1 if enabled else 0)
 
     def set_keep_with_next(self, enabled=True):
         """다음 문단과 함께 설정"""
-        self.hwp.HAction.GetDefault("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
-        self.hwp.HParameterSet.HParaShape.KeepWithNext = 1 if enabled else 0
-        self.hwp.HAction.Execute("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
+        self.shapes.set_para(KeepWithNext=1 if enabled else 0)
 
     def set_keep_lines(self, enabled=True):
         """문단 분리 금지 설정"""
-        self.hwp.HAction.GetDefault("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
-        self.hwp.HParameterSet.HParaShape.KeepLines = 1 if enabled else 0
-        self.hwp.HAction.Execute("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
+        self.shapes.set_para(KeepLines=1 if enabled else 0)
 
     def set_page_break_before(self, enabled=True):
         """문단 앞에서 페이지 나눔 설정"""
-        self.hwp.HAction.GetDefault("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
-        self.hwp.HParameterSet.HParaShape.PageBreakBefore = 1 if enabled else 0
-        self.hwp.HAction.Execute("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
+        self.shapes.set_para(PageBreakBefore=1 if enabled else 0)
 
     def set_snap_to_grid(self, enabled=True):
         """줄 격자에 맞춤 설정"""
-        self.hwp.HAction.GetDefault("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
-        self.hwp.HParameterSet.HParaShape.SnapToGrid = 1 if enabled else 0
-        self.hwp.HAction.Execute("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
+        self.shapes.set_para(SnapToGrid=1 if enabled else 0)
 
     def set_break_latin_word(self, enabled=True):
         """영어 단어 나눔 설정"""
-        self.hwp.HAction.GetDefault("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
-        self.hwp.HParameterSet.HParaShape.BreakLatinWord = 1 if enabled else 0
-        self.hwp.HAction.Execute("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
+        self.shapes.set_para(BreakLatinWord=1 if enabled else 0)
 
     def set_break_non_latin_word(self, enabled=True):
         """한글 단어 나눔 설정"""
-        self.hwp.HAction.GetDefault("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
-        self.hwp.HParameterSet.HParaShape.BreakNonLatinWord = 1 if enabled else 0
-        self.hwp.HAction.Execute("ParagraphShape", self.hwp.HParameterSet.HParaShape.HSet)
+        self.shapes.set_para(BreakNonLatinWord=1 if enabled else 0)
 
     def get_para_shape(self):
         """
@@ -530,6 +475,7 @@ class StylePara:
         """복사된 모양 붙여넣기 (선택 영역에 적용)"""
         self.hwp.HAction.GetDefault("ShapeCopyPaste", self.hwp.HParameterSet.HShapeCopyPaste.HSet)
         self.hwp.HAction.Execute("ShapeCopyPaste", self.hwp.HParameterSet.HShapeCopyPaste.HSet)
+        self.shapes.invalidate()
 
     # ========== YAML 스타일 로드/적용 ==========
 
@@ -583,86 +529,88 @@ class StylePara:
         if not style:
             raise ValueError(f"글자 스타일 '{style_name}'을 찾을 수 없습니다.")
 
-        # 글꼴 설정
-        self.set_all_fonts(
-            hangul=style.get('font_hangul'),
-            latin=style.get('font_latin'),
-            hanja=style.get('font_hanja'),
-            japanese=style.get('font_japanese'),
-            other=style.get('font_other'),
-            symbol=style.get('font_symbol')
-        )
-
-        # 크기 설정
-        if 'size_pt' in style:
-            self.set_font_size(style['size_pt'])
-
-        # 장평/자간/위치
-        if 'ratio' in style:
-            self.set_char_ratio(style['ratio'])
-        if 'spacing' in style:
-            self.set_char_spacing(style['spacing'])
-        if 'offset' in style:
-            self.set_char_offset(style['offset'])
-
-        # 굵게/기울임
-        if 'bold' in style:
-            self.set_bold(style['bold'])
-        if 'italic' in style:
-            self.set_italic(style['italic'])
-
-        # 밑줄
-        if 'underline' in style:
-            self.set_underline(
-                enabled=style['underline'],
-                line_type=style.get('underline_type', 1),
-                shape=style.get('underline_shape', 0),
-                color=style.get('underline_color_rgb')
-            )
-
-        # 취소선
-        if 'strikeout' in style:
-            self.set_strikeout(
-                enabled=style['strikeout'],
-                strikeout_type=style.get('strikeout_type', 1),
-                shape=style.get('strikeout_shape', 0),
-                color=style.get('strikeout_color_rgb')
+        # 바뀐 항목만 모아 CharShape 1회 실행
+        with self.shapes.batch():
+            # 글꼴 설정
+            self.set_all_fonts(
+                hangul=style.get('font_hangul'),
+                latin=style.get('font_latin'),
+                hanja=style.get('font_hanja'),
+                japanese=style.get('font_japanese'),
+                other=style.get('font_other'),
+                symbol=style.get('font_symbol')
             )
 
-        # 외곽선
-        if 'outline_type' in style:
-            self.set_outline(style['outline_type'])
-
-        # 그림자
-        if 'shadow_type' in style:
-            self.set_shadow(
-                shadow_type=style['shadow_type'],
-                offset_x=style.get('shadow_offset_x', 10),
-                offset_y=style.get('shadow_offset_y', 10),
-                color=style.get('shadow_color_rgb')
-            )
-
-        # 양각/음각
-        if 'emboss' in style:
-            self.set_emboss(style['emboss'])
-        if 'engrave' in style:
-            self.set_engrave(style['engrave'])
-
-        # 위첨자/아래첨자
-        if 'superscript' in style:
-            self.set_superscript(style['superscript'])
-        if 'subscript' in style:
-            self.set_subscript(style['subscript'])
-
-        # 색상
-        if 'color_rgb' in style:
-            r, g, b = style['color_rgb']
-            self.set_text_color(r, g, b)
-
-        # 음영색
-        if 'shade_color_rgb' in style and style['shade_color_rgb']:
-            r, g, b = style['shade_color_rgb']
-            self.set_shade_color(r, g, b)
+            # 크기 설정
+            if 'size_pt' in style:
+                self.set_font_size(style['size_pt'])
+
+            # 장평/자간/위치
+            if 'ratio' in style:
+                self.set_char_ratio(style['ratio'])
+            if 'spacing' in style:
+                self.set_char_spacing(style['spacing'])
+            if 'offset' in style:
+                self.set_char_offset(style['offset'])
+
+            # 굵게/기울임
+            if 'bold' in style:
+                self.set_bold(style['bold'])
+            if 'italic' in style:
+                self.set_italic(style['italic'])
+
+            # 밑줄
+            if 'underline' in style:
+                self.set_underline(
+                    enabled=style['underline'],
+                    line_type=style.get('underline_type', 1),
+                    shape=style.get('underline_shape', 0),
+                    color=style.get('underline_color_rgb')
+                )
+
+            # 취소선
+            if 'strikeout' in style:
+                self.set_strikeout(
+                    enabled=style['strikeout'],
+                    strikeout_type=style.get('strikeout_type', 1),
+                    shape=style.get('strikeout_shape', 0),
+                    color=style.get('strikeout_color_rgb')
+                )
+
+            # 외곽선
+            if 'outline_type' in style:
+                self.set_outline(style['outline_type'])
+
+            # 그림자
+            if 'shadow_type' in style:
+                self.set_shadow(
+                    shadow_type=style['shadow_type'],
+                    offset_x=style.get('shadow_offset_x', 10),
+                    offset_y=style.get('shadow_offset_y', 10),
+                    color=style.get('shadow_color_rgb')
+                )
+
+            # 양각/음각
+            if 'emboss' in style:
+                self.set_emboss(style['emboss'])
+            if 'engrave' in style:
+                self.set_engrave(style['engrave'])
+
+            # 위첨자/아래첨자
+            if 'superscript' in style:
+                self.set_superscript(style['superscript'])
+            if 'subscript' in style:
+                self.set_subscript(style['subscript'])
+
+            # 색상
+            if 'color_rgb' in style:
+                r, g, b = style['color_rgb']
+                self.set_text_color(r, g, b)
+
+            # 음영색
+            if 'shade_color_rgb' in style and style['shade_color_rgb']:
+                r, g, b = style['shade_color_rgb']
+                self.set_shade_color(r, g, b)
 
     def apply_para_style(self, style_name):
         """
@@ -678,45 +626,47 @@ class StylePara:
         if not style:
             raise ValueError(f"문단 스타일 '{style_name}'을 찾을 수 없습니다.")
 
-        # 정렬
-        if 'align' in style:
-            self.set_align(style['align'])
-
-        # 줄간격
-        if 'line_spacing' in style:
-            spacing_type = style.get('line_spacing_type', 'percent')
-            self.set_line_spacing(style['line_spacing'], spacing_type)
-
-        # 여백
-        left = style.get('left_margin_pt')
-        right = style.get('right_margin_pt')
-        indent = style.get('indent_pt')
-        if left is not None or right is not None or indent is not None:
-            self.set_para_margin(left, right, indent)
-
-        # 문단 간격
-        before = style.get('space_before_pt')
-        after = style.get('space_after_pt')
-        if before is not None or after is not None:
-            self.set_para_spacing(before, after)
-
-        # 편집 옵션
-        if 'widow_orphan' in style:
-            self.set_widow_orphan(style['widow_orphan'])
-        if 'keep_with_next' in style:
-            self.set_keep_with_next(style['keep_with_next'])
-        if 'keep_lines' in style:
-            self.set_keep_lines(style['keep_lines'])
-        if 'page_break_before' in style:
-            self.set_page_break_before(style['page_break_before'])
-
-        # 격자/단어 나눔
-        if 'snap_to_grid' in style:
-            self.set_snap_to_grid(style['snap_to_grid'])
-        if 'break_latin_word' in style:
-            self.set_break_latin_word(style['break_latin_word'])
-        if 'break_non_latin_word' in style:
-            self.set_break_non_latin_word(style['break_non_latin_word'])
+        # 바뀐 항목만 모아 ParagraphShape 1회 실행
+        with self.shapes.batch():
+            # 정렬
+            if 'align' in style:
+                self.set_align(style['align'])
+
+            # 줄간격
+            if 'line_spacing' in style:
+                spacing_type = style.get('line_spacing_type', 'percent')
+                self.set_line_spacing(style['line_spacing'], spacing_type)
+
+            # 여백
+            left = style.get('left_margin_pt')
+            right = style.get('right_margin_pt')
+            indent = style.get('indent_pt')
+            if left is not None or right is not None or indent is not None:
+                self.set_para_margin(left, right, indent)
+
+            # 문단 간격
+            before = style.get('space_before_pt')
+            after = style.get('space_after_pt')
+            if before is not None or after is not None:
+                self.set_para_spacing(before, after)
+
+            # 편집 옵션
+            if 'widow_orphan' in style:
+                self.set_widow_orphan(style['widow_orphan'])
+            if 'keep_with_next' in style:
+                self.set_keep_with_next(style['keep_with_next'])
+            if 'keep_lines' in style:
+                self.set_keep_lines(style['keep_lines'])
+            if 'page_break_before' in style:
+                self.set_page_break_before(style['page_break_before'])
+
+            # 격자/단어 나눔
+            if 'snap_to_grid' in style:
+                self.set_snap_to_grid(style['snap_to_grid'])
+            if 'break_latin_word' in style:
+                self.set_break_latin_word(style['break_latin_word'])
+            if 'break_non_latin_word' in style:
+                self.set_break_non_latin_word(style['break_non_latin_word'])
 
     def apply_style(self, style_name):
         """
@@ -732,13 +682,15 @@ class StylePara:
         if not style:
             raise ValueError(f"복합 스타일 '{style_name}'을 찾을 수 없습니다.")
 
-        # 글자 스타일 적용
-        if 'char' in style:
-            self.apply_char_style(style['char'])
+        # 글자/문단 모양을 각각 1회씩 실행
+        with self.shapes.batch():
+            # 글자 스타일 적용
+            if 'char' in style:
+                self.apply_char_style(style['char'])
 
-        # 문단 스타일 적용
-        if 'para' in style:
-            self.apply_para_style(style['para'])
+            # 문단 스타일 적용
+            if 'para' in style:
+                self.apply_para_style(style['para'])
 
     def get_color(self, color_name):
         """
@@ -2,6 +2,9 @@
 from .table_info import (
     TableInfo,
     CellInfo,
+    ScanStats,
+    SCAN_MODE_BFS,
+    SCAN_MODE_SINGLE,
     MOVE_LEFT_OF_CELL,
     MOVE_RIGHT_OF_CELL,
     MOVE_UP_OF_CELL,
@@ -26,3 +29,32 @@ from .table_grid import (
     ExcelStyleCell,
     ExcelStyleGrid,
 )  # 셀별 list_id, row, col, corners, lines + 엑셀 스타일 그리드
+from .cell_position import (
+    CellPositionCalculator,
+    CellPositionResult,
+    CellRange,
+)
+from .table_cache import (
+    TableStructureCache,
+    TableFingerprint,
+    TableCacheKey,
+    DEFAULT_CACHE_PATH,
+)
+from .table_hwpml import (
+    HwpmlCell,
+    HwpmlTable,
+    export_table_hwpml,
+    parse_table_hwpml,
+    read_table_hwpml,
+    read_table_texts,
+    align_cell_texts,
+)
+from .table_excel_stream import (
+    StyleCache,
+    RowStreamSheet,
+    GridStreamResult,
+    style_key,
+    stream_grid,
+    set_column_widths,
+    create_stream_workbook,
+)
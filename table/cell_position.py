@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+셀 위치 계산 모듈 (CellPositionCalculator)
+
+표의 모든 셀에 대해 물리 좌표(HWPUNIT)와 그리드 좌표(row, col, span)를 계산합니다.
+
+계산 순서:
+1. TableInfo 단일 순회 스캔(MOVE_RIGHT_OF_CELL)으로 셀 크기와 행별 방문 순서 수집
+   (커서 이동은 이 한 번뿐, 셀당 MovePos + GetPos + 크기 조회)
+2. 행마다 너비를 누적해 start_x, 행 경계(끝나는 셀의 하단)로 start_y 계산
+3. 모든 셀 경계를 모아 x_levels / y_levels 생성 (허용 오차 내 값은 하나로 병합)
+4. 정렬된 levels에서 이진 탐색으로 start/end row, col 결정
+
+셀 수 n에 대해 COM 호출 O(n), 계산 O(n log n)입니다.
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+try:
+    from .table_info import TableInfo, ScanStats, SCAN_MODE_SINGLE
+except ImportError:
+    from table_info import TableInfo, ScanStats, SCAN_MODE_SINGLE
+
+
+@dataclass
+class CellRange:
+    """셀 범위 (그리드 좌표 + 물리 좌표)"""
+    list_id: int
+    start_row: int = 0
+    start_col: int = 0
+    end_row: int = 0
+    end_col: int = 0
+    start_x: int = 0   # HWPUNIT
+    start_y: int = 0
+    end_x: int = 0
+    end_y: int = 0
+
+    @property
+    def rowspan(self) -> int:
+        return self.end_row - self.start_row + 1
+
+    @property
+    def colspan(self) -> int:
+        return self.end_col - self.start_col + 1
+
+    def contains(self, row: int, col: int) -> bool:
+        """(row, col) 좌표가 이 셀 범위에 포함되는지"""
+        return self.start_row <= row <= self.end_row and self.start_col <= col <= self.end_col
+
+    def is_merged(self) -> bool:
+        """병합 셀 여부"""
+        return self.rowspan > 1 or self.colspan > 1
+
+
+@dataclass
+class CellPositionResult:
+    """셀 위치 계산 결과"""
+    cells: Dict[int, CellRange] = field(default_factory=dict)  # list_id -> CellRange
+    max_row: int = -1                                          # 마지막 행 번호 (0부터)
+    max_col: int = -1                                          # 마지막 열 번호 (0부터)
+    x_levels: List[int] = field(default_factory=list)          # 열 경계 x좌표 (정렬됨)
+    y_levels: List[int] = field(default_factory=list)          # 행 경계 y좌표 (정렬됨)
+    stats: Optional[ScanStats] = None                          # 스캔 통계
+
+    def get_cell_at(self, row: int, col: int) -> Optional[CellRange]:
+        """(row, col) 좌표를 덮는 셀"""
+        for cell in self.cells.values():
+            if cell.contains(row, col):
+                return cell
+        return None
+
+
+def merge_levels(values: Iterable[int], tolerance: int) -> List[int]:
+    """정렬 후 허용 오차 이내의 값을 앞쪽 값으로 병합"""
+    levels: List[int] = []
+    for v in sorted(values):
+        if not levels or v - levels[-1] > tolerance:
+            levels.append(v)
+    return levels
+
+
+def level_index(levels: List[int], value: int, tolerance: int) -> int:
+    """value와 허용 오차 내로 일치하는 level의 인덱스 (이진 탐색)"""
+    i = bisect_left(levels, value - tolerance)
+    if i < len(levels) and abs(levels[i] - value) <= tolerance:
+        return i
+    # 일치하는 경계가 없으면 가장 가까운 경계
+    if i > 0 and (i == len(levels) or value - levels[i - 1] < levels[i] - value):
+        return i - 1
+    return min(i, len(levels) - 1)
+
+
+class CellPositionCalculator:
+    """표 셀 위치 계산기"""
+
+    def __init__(self, hwp=None, debug: bool = False, tolerance: int = 50):
+        """
+        Args:
+            hwp: HWP COM 객체
+            debug: 디버그 출력 여부
+            tolerance: 좌표 비교 허용 오차 (HWPUNIT)
+        """
+        self.hwp = hwp
+        self.debug = debug
+        self.tolerance = tolerance
+        self._table_info = TableInfo(hwp, debug, scan_mode=SCAN_MODE_SINGLE)
+
+    def _log(self, msg: str):
+        """디버그 메시지 출력"""
+        if self.debug:
+            print(f"[CellPositionCalculator] {msg}")
+
+    def calculate(self, max_cells: int = None) -> CellPositionResult:
+        """
+        현재 커서가 있는 표의 셀 위치 계산
+
+        Args:
+            max_cells: 최대 처리할 셀 수 (None이면 제한 없음, 지정하면 넘는 셀은 잘림)
+
+        Returns:
+            CellPositionResult (표 밖이면 빈 결과)
+        """
+        info = self._table_info
+        cells = info.collect_cells_scan(self.tolerance, max_cells=max_cells)
+        if not cells:
+            self._log("테이블 내부가 아닙니다")
+            return CellPositionResult()
+
+        rows = info._scan_rows
+        result = self.solve(rows, {k: (c.width, c.height) for k, c in cells.items()})
+        result.stats = info.last_scan_stats
+        self._log(f"계산 완료: {len(result.cells)}개 셀, "
+                  f"{result.max_row + 1}행 x {result.max_col + 1}열")
+        return result
+
+    def solve(self, rows: List[List[tuple]], sizes: Dict[int, tuple]) -> CellPositionResult:
+        """
+        행별 방문 순서와 셀 크기로 위치 계산 (COM 호출 없음)
+
+        Args:
+            rows: 행별 [(start_x, end_x, list_id), ...] (세로 병합 셀은 행마다 포함)
+            sizes: list_id -> (width, height)
+
+        Returns:
+            CellPositionResult
+        """
+        tol = self.tolerance
+
+        # 1. 셀별 시작 x, 처음/마지막으로 나타난 행
+        start_x: Dict[int, int] = {}
+        first_row: Dict[int, int] = {}
+        last_row: Dict[int, int] = {}
+        for r, row in enumerate(rows):
+            for x1, _, list_id in row:
+                if list_id not in first_row:
+                    first_row[list_id] = r
+                    start_x[list_id] = x1
+                last_row[list_id] = r
+
+        # 2. 행 상단 y: 다음 행 시작 = 이 행에서 끝나는 셀들의 하단 중 최소
+        ending: Dict[int, List[int]] = {}
+        for list_id, r in last_row.items():
+            ending.setdefault(r, []).append(list_id)
+
+        row_y = [0] * (len(rows) + 1)
+        start_y: Dict[int, int] = {}
+        for r, row in enumerate(rows):
+            for _, _, list_id in row:
+                if first_row[list_id] == r:
+                    start_y[list_id] = row_y[r]
+            bottoms = [start_y[k] + sizes[k][1] for k in ending.get(r, [])]
+            if not bottoms:
+                bottoms = [row_y[r] + min(sizes[k][1] for _, _, k in row)]
+            row_y[r + 1] = min(bottoms)
+
+        # 3. 경계 수집 및 병합
+        x_levels = merge_levels(
+            [start_x[k] for k in start_x] + [start_x[k] + sizes[k][0] for k in start_x], tol)
+        y_levels = merge_levels(
+            [start_y[k] for k in start_y] + [start_y[k] + sizes[k][1] for k in start_y], tol)
+
+        # 4. 이진 탐색으로 그리드 좌표
+        result = CellPositionResult(x_levels=x_levels, y_levels=y_levels)
+        for list_id in first_row:
+            x1 = start_x[list_id]
+            y1 = start_y[list_id]
+            x2 = x1 + sizes[list_id][0]
+            y2 = y1 + sizes[list_id][1]
+            start_col = level_index(x_levels, x1, tol)
+            start_row = level_index(y_levels, y1, tol)
+            result.cells[list_id] = CellRange(
+                list_id=list_id,
+                start_row=start_row,
+                start_col=start_col,
+                end_row=max(start_row, level_index(y_levels, y2, tol) - 1),
+                end_col=max(start_col, level_index(x_levels, x2, tol) - 1),
+                start_x=x1,
+                start_y=y1,
+                end_x=x2,
+                end_y=y2,
+            )
+
+        result.max_row = len(y_levels) - 2
+        result.max_col = len(x_levels) - 2
+        return result
+
+    def print_summary(self, result: CellPositionResult):
+        """계산 결과 요약 출력"""
+        print(f"=== 셀 위치 ({result.max_row + 1}행 x {result.max_col + 1}열, "
+              f"{len(result.cells)}개 셀) ===")
+        print(f"x_levels: {result.x_levels}")
+        print(f"y_levels: {result.y_levels}")
+        if result.stats:
+            print(f"COM 호출: {result.stats.com_calls}회 (방문 {result.stats.visits}회)")
+
+        merged = [c for c in result.cells.values() if c.is_merged()]
+        print(f"병합 셀: {len(merged)}개")
+        for cell in sorted(result.cells.values(), key=lambda c: (c.start_row, c.start_col)):
+            span = f" [{cell.rowspan}x{cell.colspan}]" if cell.is_merged() else ""
+            print(f"  list_id={cell.list_id}: ({cell.start_row},{cell.start_col})"
+                  f"~({cell.end_row},{cell.end_col}){span}")
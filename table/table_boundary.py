@@ -49,10 +49,11 @@ class TableBoundaryResult:
 class TableBoundary:
     """테이블 경계 판별 클래스"""
 
-    def __init__(self, hwp=None, debug: bool = False):
+    def __init__(self, hwp=None, debug: bool = False, cache=None):
         from cursor import get_hwp_instance
         self.hwp = hwp or get_hwp_instance()
         self.debug = debug
+        self.cache = cache  # TableStructureCache (선택)
         self._table_info = TableInfo(self.hwp, debug)
         self._current_tbl = None  # 현재 테이블의 tbl 컨트롤
 
@@ -270,13 +271,23 @@ class TableBoundary:
         3. left_border_cells, right_border_cells 계산 - 첫/마지막 열에 속한 셀들
         4. table_end 계산 - bottom_border_cells의 마지막 list_id
 
+        cache가 있으면 구조 지문이 같은 테이블은 순회 없이 저장된 결과를 반환합니다.
+
         Returns:
             TableBoundaryResult: 경계 분석 결과
         """
+        key = self.cache.bind(self.hwp) if self.cache else None
+        cached = self.cache.load_boundary(key) if key else None
+        if cached is not None:
+            self.cache.load_table_info(key, self._table_info)
+            self._current_tbl = self.hwp.ParentCtrl
+            self._log(f"캐시 사용: table_origin={cached.table_origin}, 셀 {cached.table_cell_counts}개")
+            return cached
+
         result = TableBoundaryResult()
 
         # 셀 정보 수집
-        cells = self._table_info.collect_cells_bfs()
+        cells = self._table_info.collect_cells()
         if not cells:
             self._log("셀 정보를 수집할 수 없습니다")
             return result
@@ -341,6 +352,9 @@ class TableBoundary:
         self._log(f"table_end: {result.table_end}")
         self._log(f"좌표 경계: ({result.start_x}, {result.start_y}) ~ ({result.end_x}, {result.end_y})")
 
+        if key:
+            self.cache.store_boundary(key, result)
+            self.cache.store_table_info(key, self._table_info)
         return result
 
     def print_boundary_info(self, result: TableBoundaryResult = None):
@@ -387,7 +401,7 @@ class TableBoundary:
         """
         # xend와 start_cell 자동 계산
         if xend is None or start_cell is None:
-            cells = self._table_info.collect_cells_bfs()
+            cells = self._table_info.collect_cells()
             if not cells:
                 return {'grid': {}, 'rowspan_positions': {}, 'col_positions': [],
                         'max_row': 0, 'max_col': 0, 'xend': 0}
@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+"""
+테이블 구조 캐시 모듈 (TableStructureCache)
+
+ListIdMapper / TableField / TableBoundary / TableGrid는 매번 커서로 셀을 순회해
+테이블 구조를 다시 계산합니다. 같은 문서의 같은 테이블을 반복해서 다루는 배치 작업을 위해
+계산 결과를 SQLite 파일에 저장하고, 구조가 바뀌지 않았으면 순회 없이 복원합니다.
+
+캐시 키:
+- 문서 경로 (hwp.Path, 저장되지 않은 문서는 캐시하지 않음)
+- 테이블 번호 (HeadCtrl 체인에서 몇 번째 tbl인지)
+- 구조 지문 (TableFingerprint): 행/열 수, 전체 너비/높이, 첫/마지막 셀 list_id
+  셀 순회 없이 컨트롤 속성 조회와 셀 이동 4회로 계산합니다.
+
+지문이 달라진 테이블만 무효화하고, 나머지 테이블의 캐시는 그대로 사용합니다.
+
+저장 항목 (kind):
+- 'table_info': CellInfo, 좌표 맵, 대표 좌표, 셀별 좌표, 테이블 크기, 스캔 행
+- 'boundary': TableBoundaryResult
+- 'grid': TableGridResult
+"""
+
+import os
+import json
+import sqlite3
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Optional
+
+try:
+    from .table_info import (
+        TableInfo, CellInfo,
+        MOVE_START_OF_CELL, MOVE_END_OF_CELL, MOVE_TOP_OF_CELL, MOVE_BOTTOM_OF_CELL,
+    )
+    from .table_boundary import TableBoundaryResult
+    from .table_grid import TableGridResult, GridCell, CellCorner, CellLine
+except ImportError:
+    from table_info import (
+        TableInfo, CellInfo,
+        MOVE_START_OF_CELL, MOVE_END_OF_CELL, MOVE_TOP_OF_CELL, MOVE_BOTTOM_OF_CELL,
+    )
+    from table_boundary import TableBoundaryResult
+    from table_grid import TableGridResult, GridCell, CellCorner, CellLine
+
+
+# 기본 캐시 파일 경로
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".win32hwp", "table_cache.sqlite")
+
+# 저장 형식 버전 (형식이 바뀌면 올려서 기존 캐시를 버림)
+CACHE_VERSION = 1
+
+# 저장 항목 종류
+KIND_TABLE_INFO = 'table_info'
+KIND_BOUNDARY = 'boundary'
+KIND_GRID = 'grid'
+
+
+@dataclass(frozen=True)
+class TableFingerprint:
+    """테이블 구조 지문 (셀 순회 없이 계산)"""
+    row_count: int = 0
+    col_count: int = 0
+    width: int = 0           # 테이블 전체 너비 (HWPUNIT)
+    height: int = 0          # 테이블 전체 높이 (HWPUNIT)
+    first_list_id: int = 0   # 첫 번째 셀 (0행 0열)
+    last_list_id: int = 0    # 마지막 셀 (마지막 행의 끝 셀)
+
+    @property
+    def cell_count(self) -> int:
+        """list_id 범위로 본 셀 수 (셀 list_id는 테이블 안에서 연속 할당)"""
+        return self.last_list_id - self.first_list_id + 1
+
+    def to_key(self) -> str:
+        return (f"{self.row_count}x{self.col_count}:{self.width}x{self.height}:"
+                f"{self.first_list_id}-{self.last_list_id}")
+
+
+@dataclass(frozen=True)
+class TableCacheKey:
+    """캐시 조회 키"""
+    doc_path: str
+    table_index: int
+    fingerprint: TableFingerprint
+
+
+def _get_table_fingerprint(hwp) -> Optional[TableFingerprint]:
+    """
+    현재 커서가 있는 테이블의 구조 지문 계산
+
+    컨트롤 속성(RowCount, ColCount, Width, Height) 조회 후
+    열 시작 → 행 시작으로 첫 셀, 열 끝 → 행 끝으로 마지막 셀 list_id를 얻고 커서를 복원합니다.
+
+    Returns:
+        TableFingerprint, 테이블 밖이면 None
+    """
+    ctrl = hwp.ParentCtrl
+    if not ctrl or ctrl.CtrlID != "tbl":
+        return None
+
+    props = ctrl.Properties
+    saved_pos = hwp.GetPos()
+    try:
+        hwp.MovePos(MOVE_TOP_OF_CELL, 0, 0)
+        hwp.MovePos(MOVE_START_OF_CELL, 0, 0)
+        first_list_id = hwp.GetPos()[0]
+        hwp.MovePos(MOVE_BOTTOM_OF_CELL, 0, 0)
+        hwp.MovePos(MOVE_END_OF_CELL, 0, 0)
+        last_list_id = hwp.GetPos()[0]
+    finally:
+        hwp.SetPos(saved_pos[0], saved_pos[1], saved_pos[2])
+
+    return TableFingerprint(
+        row_count=props.Item("RowCount") or 0,
+        col_count=props.Item("ColCount") or 0,
+        width=props.Item("Width") or 0,
+        height=props.Item("Height") or 0,
+        first_list_id=first_list_id,
+        last_list_id=last_list_id,
+    )
+
+
+def _anchor_of(ctrl) -> tuple:
+    """컨트롤 앵커 위치 (list, para, pos)"""
+    anchor = ctrl.GetAnchorPos(0)
+    return (anchor.Item("List"), anchor.Item("Para"), anchor.Item("Pos"))
+
+
+def _get_table_index(hwp) -> Optional[int]:
+    """
+    현재 커서가 있는 테이블이 HeadCtrl 체인에서 몇 번째 tbl인지 반환
+
+    ParentCtrl의 앵커 위치와 체인의 tbl 앵커 위치를 비교합니다.
+    (셀 안에 중첩된 테이블처럼 체인에 없으면 None)
+    """
+    parent = hwp.ParentCtrl
+    if not parent or parent.CtrlID != "tbl":
+        return None
+    target = _anchor_of(parent)
+
+    ctrl = hwp.HeadCtrl
+    index = 0
+    while ctrl:
+        if ctrl.CtrlID == "tbl":
+            if _anchor_of(ctrl) == target:
+                return index
+            index += 1
+        ctrl = ctrl.Next
+    return None
+
+
+# =============================================================================
+# 직렬화
+# =============================================================================
+
+def _int_keys(data: Dict[str, Any]) -> Dict[int, Any]:
+    """JSON 객체 키(str)를 int로 복원"""
+    return {int(k): v for k, v in data.items()}
+
+
+def _dump_table_info(info: TableInfo) -> Dict:
+    return {
+        'cells': {k: asdict(c) for k, c in info.cells.items()},
+        'coord_map': [[r, c, list_id] for (r, c), list_id in info._coord_map.items()],
+        'representative_coords': {k: list(v) for k, v in info._representative_coords.items()},
+        'cell_coords': {k: [list(rc) for rc in v] for k, v in info._cell_coords.items()},
+        'table_size': dict(info._table_size),
+        'scan_rows': [[list(t) for t in row] for row in info._scan_rows],
+    }
+
+
+def _load_table_info(info: TableInfo, data: Dict):
+    info.cells = {k: CellInfo(**v) for k, v in _int_keys(data['cells']).items()}
+    info._coord_map = {(r, c): list_id for r, c, list_id in data['coord_map']}
+    info._representative_coords = {k: tuple(v) for k, v in _int_keys(data['representative_coords']).items()}
+    info._cell_coords = {k: [tuple(rc) for rc in v] for k, v in _int_keys(data['cell_coords']).items()}
+    info._table_size = dict(data['table_size'])
+    info._scan_rows = [[tuple(t) for t in row] for row in data['scan_rows']]
+
+
+def _load_grid(data: Dict) -> TableGridResult:
+    cells = []
+    for c in data['cells']:
+        corners = CellCorner(**{k: tuple(v) for k, v in c['corners'].items()})
+        lines = CellLine(**{k: tuple(v) for k, v in c['lines'].items()})
+        cells.append(GridCell(list_id=c['list_id'], row=c['row'], col=c['col'],
+                              corners=corners, lines=lines))
+    return TableGridResult(cells=cells, row_count=data['row_count'], col_count=data['col_count'])
+
+
+class TableStructureCache:
+    """문서별 테이블 구조 캐시 (SQLite)"""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, debug: bool = False):
+        """
+        Args:
+            path: SQLite 파일 경로 (":memory:"면 프로세스 안에서만 유지)
+            debug: 디버그 출력 여부
+        """
+        self.path = path
+        self.debug = debug
+        self.hits = 0
+        self.misses = 0
+        self.invalidated = 0
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._init_schema()
+
+    def _log(self, msg: str):
+        """디버그 메시지 출력"""
+        if self.debug:
+            print(f"[TableStructureCache] {msg}")
+
+    def _init_schema(self):
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        with self._conn:
+            if version != CACHE_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS tables")
+                self._conn.execute("DROP TABLE IF EXISTS entries")
+                self._conn.execute(f"PRAGMA user_version = {CACHE_VERSION}")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS tables ("
+                " doc_path TEXT, table_index INTEGER, fingerprint TEXT, updated_at REAL,"
+                " PRIMARY KEY (doc_path, table_index))")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " doc_path TEXT, table_index INTEGER, kind TEXT, data TEXT,"
+                " PRIMARY KEY (doc_path, table_index, kind))")
+
+    def close(self):
+        """DB 연결 종료"""
+        self._conn.close()
+
+    # =========================================================================
+    # 키 계산 / 무효화
+    # =========================================================================
+
+    def bind(self, hwp, table_index: int = None, doc_path: str = None) -> Optional[TableCacheKey]:
+        """
+        현재 커서가 있는 테이블의 캐시 키 계산
+
+        저장된 지문과 다르면 해당 테이블의 캐시만 삭제합니다.
+
+        Args:
+            hwp: HWP COM 객체 (커서가 테이블 안에 있어야 함)
+            table_index: 테이블 번호 (None이면 HeadCtrl 체인에서 계산)
+            doc_path: 문서 경로 (None이면 hwp.Path)
+
+        Returns:
+            TableCacheKey, 캐시할 수 없으면 None (저장 안 된 문서, 테이블 밖)
+        """
+        doc_path = doc_path if doc_path is not None else hwp.Path
+        if not doc_path:
+            self._log("저장되지 않은 문서는 캐시하지 않습니다")
+            return None
+        doc_path = os.path.normcase(os.path.abspath(doc_path))
+
+        fingerprint = _get_table_fingerprint(hwp)
+        if fingerprint is None:
+            return None
+        if table_index is None:
+            table_index = _get_table_index(hwp)
+            if table_index is None:
+                self._log("HeadCtrl 체인에서 테이블을 찾을 수 없습니다")
+                return None
+
+        key = TableCacheKey(doc_path, table_index, fingerprint)
+        row = self._conn.execute(
+            "SELECT fingerprint FROM tables WHERE doc_path = ? AND table_index = ?",
+            (doc_path, table_index)).fetchone()
+
+        if row is None or row[0] != fingerprint.to_key():
+            with self._conn:
+                if row is not None:
+                    self._conn.execute(
+                        "DELETE FROM entries WHERE doc_path = ? AND table_index = ?",
+                        (doc_path, table_index))
+                    self.invalidated += 1
+                    self._log(f"테이블 {table_index} 구조 변경: {row[0]} → {fingerprint.to_key()}")
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO tables VALUES (?, ?, ?, ?)",
+                    (doc_path, table_index, fingerprint.to_key(), time.time()))
+        return key
+
+    def invalidate(self, doc_path: str = None, table_index: int = None):
+        """
+        캐시 삭제
+
+        Args:
+            doc_path: 문서 경로 (None이면 전체)
+            table_index: 테이블 번호 (None이면 문서의 모든 테이블)
+        """
+        where, params = "", ()
+        if doc_path is not None:
+            where, params = " WHERE doc_path = ?", (os.path.normcase(os.path.abspath(doc_path)),)
+            if table_index is not None:
+                where += " AND table_index = ?"
+                params += (table_index,)
+        with self._conn:
+            self._conn.execute("DELETE FROM tables" + where, params)
+            self._conn.execute("DELETE FROM entries" + where, params)
+
+    # =========================================================================
+    # 조회 / 저장
+    # =========================================================================
+
+    def get(self, key: Optional[TableCacheKey], kind: str) -> Optional[Dict]:
+        """저장된 항목 조회 (없으면 None)"""
+        if key is None:
+            return None
+        row = self._conn.execute(
+            "SELECT data FROM entries WHERE doc_path = ? AND table_index = ? AND kind = ?",
+            (key.doc_path, key.table_index, kind)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._log(f"캐시 적중: 테이블 {key.table_index} {kind}")
+        return json.loads(row[0])
+
+    def put(self, key: Optional[TableCacheKey], kind: str, data: Dict):
+        """항목 저장"""
+        if key is None:
+            return
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (key.doc_path, key.table_index, kind, json.dumps(data, ensure_ascii=False)))
+
+    def load_table_info(self, key: Optional[TableCacheKey], info: TableInfo,
+                        with_coords: bool = False) -> bool:
+        """
+        TableInfo에 셀 정보와 좌표 맵 복원
+
+        Args:
+            key: bind()로 얻은 키
+            info: 복원할 TableInfo
+            with_coords: True면 좌표 맵까지 저장된 경우에만 성공
+                         (TableBoundary는 셀 정보만 저장하므로 좌표 맵이 없을 수 있음)
+
+        Returns:
+            bool: 복원 성공 여부
+        """
+        data = self.get(key, KIND_TABLE_INFO)
+        if data is None or (with_coords and not data['coord_map']):
+            return False
+        _load_table_info(info, data)
+        return True
+
+    def store_table_info(self, key: Optional[TableCacheKey], info: TableInfo):
+        """TableInfo의 셀 정보와 좌표 맵 저장"""
+        if info.cells:
+            self.put(key, KIND_TABLE_INFO, _dump_table_info(info))
+
+    def load_boundary(self, key: Optional[TableCacheKey]) -> Optional[TableBoundaryResult]:
+        data = self.get(key, KIND_BOUNDARY)
+        return TableBoundaryResult(**data) if data is not None else None
+
+    def store_boundary(self, key: Optional[TableCacheKey], result: TableBoundaryResult):
+        self.put(key, KIND_BOUNDARY, asdict(result))
+
+    def load_grid(self, key: Optional[TableCacheKey]) -> Optional[TableGridResult]:
+        data = self.get(key, KIND_GRID)
+        return _load_grid(data) if data is not None else None
+
+    def store_grid(self, key: Optional[TableCacheKey], result: TableGridResult):
+        self.put(key, KIND_GRID, asdict(result))
@@ -8,6 +8,15 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Any
 from table.cell_position import CellPositionCalculator, CellPositionResult, CellRange
+from table.table_hwpml import read_table_texts
+from table.table_excel_stream import (
+    StyleCache,
+    RowStreamSheet,
+    create_stream_workbook,
+    set_column_widths,
+    stream_grid,
+    style_key,
+)
 
 try:
     from openpyxl import Workbook, load_workbook
@@ -93,6 +102,22 @@ class TableExcelConverter:
                 print(f"[경고] list_id={list_id} 텍스트 추출 실패: {e}")
             return ""
 
+    def _get_cell_texts(self, result: CellPositionResult) -> Dict[int, str]:
+        """표 전체 셀 텍스트 (HWPML 내보내기 1회, 실패 시 셀별 추출)"""
+        if not result.cells:
+            return {}
+
+        self.hwp.SetPos(next(iter(result.cells)), 0, 0)
+        widths = {list_id: c.end_x - c.start_x for list_id, c in result.cells.items()}
+        texts = read_table_texts(self.hwp, widths, self._calc.tolerance)
+        if texts is None:
+            if self.debug:
+                print("[경고] HWPML 셀 정렬 실패, 셀별 텍스트 추출")
+            return {list_id: self._get_cell_text(list_id) for list_id in result.cells}
+
+        return {list_id: text.strip().replace('\r\n', ' ').replace('\r', ' ').replace('\n', ' ')
+                for list_id, text in texts.items()}
+
     def validate_cell_positions(self, result: CellPositionResult = None) -> dict:
         """셀 위치 계산 결과 검증
 
@@ -248,6 +273,7 @@ class TableExcelConverter:
             extract_style: True면 배경색 등 스타일 정보도 추출
         """
         result = self._calc.calculate()
+        texts = self._get_cell_texts(result)
 
         cells_data = []
         count = 0
@@ -256,7 +282,7 @@ class TableExcelConverter:
                 print(f"[경고] 최대 셀 수({max_cells}) 도달, 중단")
                 break
 
-            text = self._get_cell_text(list_id)
+            text = texts[list_id]
 
             # 스타일 추출
             cell_style = None
@@ -313,7 +339,8 @@ class TableExcelConverter:
                 print(f"[경고] 페이지 여백 추출 실패: {e}")
             return None
 
-    def to_excel(self, filepath: str, sheet_name: str = "Sheet1", with_text: bool = True, show_cell_info: bool = False):
+    def to_excel(self, filepath: str, sheet_name: str = "Sheet1", with_text: bool = True,
+                 show_cell_info: bool = False, streaming: bool = False):
         """HWP 테이블을 엑셀 파일로 저장
 
         Args:
@@ -321,6 +348,7 @@ class TableExcelConverter:
             sheet_name: 시트 이름
             with_text: True면 셀 텍스트 포함, False면 셀 범위만 저장
             show_cell_info: True면 셀 속성 정보(list_id, 좌표, 병합정보) 표시
+            streaming: True면 write-only 모드로 행 순서대로 기록 (셀이 많은 표)
         """
         if not HAS_OPENPYXL:
             raise ImportError("openpyxl이 설치되어 있지 않습니다. pip install openpyxl")
@@ -351,45 +379,16 @@ class TableExcelConverter:
                 for cell in result.cells.values()
             ]
 
+        if streaming:
+            return self._to_excel_stream(filepath, sheet_name, cells_data, result, show_cell_info)
+
         # 워크북 생성
         wb = Workbook()
         ws = wb.active
         ws.title = sheet_name
 
-        # 한글 페이지 여백 가져오기
-        hwp_margins = self._get_hwp_page_margins()
-
-        # 인쇄 설정: 페이지에 맞춤
-        ws.page_setup.fitToPage = True
-        ws.page_setup.fitToWidth = 1  # 1페이지 너비에 맞춤
-        ws.page_setup.fitToHeight = 0  # 높이는 자동
-
-        if hwp_margins:
-            # 한글 페이지 방향 적용
-            ws.page_setup.orientation = hwp_margins['orientation']
-
-            # 한글 여백을 엑셀에 적용 (인치 단위)
-            ws.page_margins = PageMargins(
-                left=hwp_margins['left'],
-                right=hwp_margins['right'],
-                top=hwp_margins['top'],
-                bottom=hwp_margins['bottom'],
-                header=hwp_margins['header'],
-                footer=hwp_margins['footer']
-            )
-
-            if self.debug:
-                print(f"페이지 설정: {hwp_margins['orientation']}, "
-                      f"여백(인치) L={hwp_margins['left']:.2f}, R={hwp_margins['right']:.2f}, "
-                      f"T={hwp_margins['top']:.2f}, B={hwp_margins['bottom']:.2f}")
-        else:
-            # 기본값 사용
-            ws.page_setup.orientation = 'portrait'
-            ws.page_margins = PageMargins(
-                left=0.5, right=0.5,
-                top=0.5, bottom=0.5,
-                header=0.3, footer=0.3
-            )
+        # 한글 페이지 설정 적용
+        self._apply_page_setup(ws)
 
         # 테두리 스타일
         thin_border = Border(
@@ -469,18 +468,7 @@ class TableExcelConverter:
                 skipped_cells.append(cell_data)
                 continue
 
-            # 셀 내용 결정
-            if show_cell_info:
-                # 셀 속성 정보 표시
-                info_lines = [f"id={cell_data.list_id}"]
-                if cell_data.rowspan > 1 or cell_data.colspan > 1:
-                    info_lines.append(f"({cell_data.row},{cell_data.col})~({cell_data.end_row},{cell_data.end_col})")
-                    info_lines.append(f"span={cell_data.rowspan}x{cell_data.colspan}")
-                else:
-                    info_lines.append(f"({cell_data.row},{cell_data.col})")
-                cell.value = "\n".join(info_lines)
-            else:
-                cell.value = cell_data.text
+            cell.value = self._cell_value(cell_data, show_cell_info)
 
             cell.border = thin_border
             cell.alignment = Alignment(wrap_text=True, vertical='center')
@@ -516,34 +504,104 @@ class TableExcelConverter:
             if len(skipped_cells) > 10:
                 print(f"  ... 외 {len(skipped_cells) - 10}개")
 
-        # 열 너비 조정 (HWP 실제 너비 기준)
-        # 엑셀 열 너비는 "문자 수" 단위 (기본 폰트 기준 약 7pt = 1문자)
-        # 1 pt = 100 HWPUNIT, 1 문자 ≈ 7 pt = 700 HWPUNIT
+        # 열 너비 / 행 높이 조정 (HWP 실제 크기 기준)
         x_levels = result.x_levels
-        if len(x_levels) > 1:
-            HWPUNIT_PER_CHAR = 700  # 약 7pt per character
-            for col_idx in range(len(x_levels) - 1):
-                col_width_hwp = x_levels[col_idx + 1] - x_levels[col_idx]
-                col_width_chars = col_width_hwp / HWPUNIT_PER_CHAR
-                column_letter = get_column_letter(col_idx + 1)
-                ws.column_dimensions[column_letter].width = max(col_width_chars, 2)
-
-        # 행 높이 조정 (HWP 실제 높이 기준)
-        # 엑셀 행 높이는 포인트(pt) 단위
-        # 1 pt = 100 HWPUNIT
         y_levels = result.y_levels
-        if len(y_levels) > 1:
-            HWPUNIT_PER_PT = 100
-            for row_idx in range(len(y_levels) - 1):
-                row_height_hwp = y_levels[row_idx + 1] - y_levels[row_idx]
-                row_height_pt = row_height_hwp / HWPUNIT_PER_PT
-                ws.row_dimensions[row_idx + 1].height = max(row_height_pt, 12)
+        for col_idx, width in enumerate(self._excel_col_widths(x_levels), 1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = width
+        for row_idx, height in enumerate(self._excel_row_heights(y_levels), 1):
+            ws.row_dimensions[row_idx].height = height
 
         if self.debug:
             print(f"\n크기 설정: {len(x_levels)-1}열, {len(y_levels)-1}행")
 
-        # _meta 시트 생성 (셀 속성 정보)
-        ws_meta = wb.create_sheet(title="_meta")
+        # _meta 시트 (셀 속성 정보), _page 시트 (페이지 설정 정보)
+        self._write_meta_sheet(wb.create_sheet(title="_meta"), cells_data,
+                               skipped_cells, [c['cell'] for c in merge_conflicts])
+        self._write_page_sheet(wb.create_sheet(title="_page"), cells_data, x_levels, y_levels)
+
+        wb.save(filepath)
+        print(f"\n엑셀 파일 저장: {filepath}")
+        print(f"  - 메인 시트: {sheet_name}")
+        print(f"  - 메타 시트: _meta ({len(cells_data)}개 셀 정보)")
+        print(f"  - 페이지 시트: _page (페이지/여백 설정)")
+        return filepath
+
+    def _apply_page_setup(self, ws):
+        """메인 시트 인쇄 설정 (한글 페이지 방향/여백, 1페이지 너비 맞춤)"""
+        hwp_margins = self._get_hwp_page_margins()
+
+        # 인쇄 설정: 페이지에 맞춤
+        ws.page_setup.fitToPage = True
+        ws.page_setup.fitToWidth = 1  # 1페이지 너비에 맞춤
+        ws.page_setup.fitToHeight = 0  # 높이는 자동
+
+        if hwp_margins:
+            # 한글 페이지 방향 적용
+            ws.page_setup.orientation = hwp_margins['orientation']
+
+            # 한글 여백을 엑셀에 적용 (인치 단위)
+            ws.page_margins = PageMargins(
+                left=hwp_margins['left'],
+                right=hwp_margins['right'],
+                top=hwp_margins['top'],
+                bottom=hwp_margins['bottom'],
+                header=hwp_margins['header'],
+                footer=hwp_margins['footer']
+            )
+
+            if self.debug:
+                print(f"페이지 설정: {hwp_margins['orientation']}, "
+                      f"여백(인치) L={hwp_margins['left']:.2f}, R={hwp_margins['right']:.2f}, "
+                      f"T={hwp_margins['top']:.2f}, B={hwp_margins['bottom']:.2f}")
+        else:
+            # 기본값 사용
+            ws.page_setup.orientation = 'portrait'
+            ws.page_margins = PageMargins(
+                left=0.5, right=0.5,
+                top=0.5, bottom=0.5,
+                header=0.3, footer=0.3
+            )
+
+    @staticmethod
+    def _cell_value(cell_data: CellData, show_cell_info: bool = False) -> str:
+        """메인 시트에 쓸 셀 값 (show_cell_info면 list_id와 좌표/병합 정보)"""
+        if not show_cell_info:
+            return cell_data.text
+        info_lines = [f"id={cell_data.list_id}"]
+        if cell_data.rowspan > 1 or cell_data.colspan > 1:
+            info_lines.append(f"({cell_data.row},{cell_data.col})~({cell_data.end_row},{cell_data.end_col})")
+            info_lines.append(f"span={cell_data.rowspan}x{cell_data.colspan}")
+        else:
+            info_lines.append(f"({cell_data.row},{cell_data.col})")
+        return "\n".join(info_lines)
+
+    @staticmethod
+    def _excel_col_widths(x_levels: List[int]) -> List[float]:
+        """열 경계 -> 엑셀 열 너비
+
+        엑셀 열 너비는 "문자 수" 단위 (기본 폰트 기준 약 7pt = 1문자)
+        1 pt = 100 HWPUNIT, 1 문자 ≈ 7 pt = 700 HWPUNIT
+        """
+        HWPUNIT_PER_CHAR = 700  # 약 7pt per character
+        return [max((x_levels[i + 1] - x_levels[i]) / HWPUNIT_PER_CHAR, 2)
+                for i in range(len(x_levels) - 1)]
+
+    @staticmethod
+    def _excel_row_heights(y_levels: List[int]) -> List[float]:
+        """행 경계 -> 엑셀 행 높이 (pt, 1 pt = 100 HWPUNIT)"""
+        HWPUNIT_PER_PT = 100
+        return [max((y_levels[i + 1] - y_levels[i]) / HWPUNIT_PER_PT, 12)
+                for i in range(len(y_levels) - 1)]
+
+    def _write_meta_sheet(self, ws_meta, cells_data: List[CellData],
+                          skipped_cells: List[CellData], conflict_cells: List[CellData]):
+        """_meta 시트: 셀별 위치/병합 상태/스타일 (행 순서대로 기록)"""
+        # _meta 열 너비 조정 (write-only 시트는 행보다 먼저 설정)
+        col_widths = [8, 5, 5, 7, 7, 7, 7, 8, 8, 8, 8, 9, 9,
+                      10, 8, 8, 8, 8, 12, 8, 8, 8, 8]
+        for col_idx, width in enumerate(col_widths, 1):
+            ws_meta.column_dimensions[get_column_letter(col_idx)].width = width
 
         # 헤더 (위치 + 스타일 정보)
         headers = [
@@ -558,12 +616,14 @@ class TableExcelConverter:
             ws_meta.cell(row=1, column=col_idx).font = Font(bold=True)
 
         # 셀 데이터 작성
+        skipped_ids = {id(c) for c in skipped_cells}
+        conflict_ids = {id(c) for c in conflict_cells}
         sorted_cells = sorted(cells_data, key=lambda c: (c.row, c.col))
         for row_idx, cell_data in enumerate(sorted_cells, 2):
             # 상태 결정
-            if cell_data in skipped_cells:
+            if id(cell_data) in skipped_ids:
                 status = "SKIPPED"
-            elif any(c['cell'] == cell_data for c in merge_conflicts):
+            elif id(cell_data) in conflict_ids:
                 status = "CONFLICT"
             else:
                 status = "OK"
@@ -602,12 +662,6 @@ class TableExcelConverter:
                 ws_meta.cell(row=row_idx, column=22, value="Y" if style.font_italic else "")
                 ws_meta.cell(row=row_idx, column=23, value=style.align_horizontal)
 
-        # _meta 열 너비 조정
-        col_widths = [8, 5, 5, 7, 7, 7, 7, 8, 8, 8, 8, 9, 9,
-                      10, 8, 8, 8, 8, 12, 8, 8, 8, 8]
-        for col_idx, width in enumerate(col_widths, 1):
-            ws_meta.column_dimensions[get_column_letter(col_idx)].width = width
-
         # _meta 시트 인쇄 설정 (세로, 1페이지 너비 맞춤)
         ws_meta.page_setup.orientation = 'portrait'
         ws_meta.page_setup.fitToPage = True
@@ -618,8 +672,14 @@ class TableExcelConverter:
             header=0.3, footer=0.3
         )
 
-        # _page 시트 생성 (페이지 설정 정보)
-        ws_page = wb.create_sheet(title="_page")
+    def _write_page_sheet(self, ws_page, cells_data: List[CellData],
+                          x_levels: List[int], y_levels: List[int]):
+        """_page 시트: 한글 페이지/여백 설정과 표 크기"""
+        # _page 열 너비 조정
+        ws_page.column_dimensions['A'].width = 15
+        ws_page.column_dimensions['B'].width = 15
+        ws_page.column_dimensions['C'].width = 12
+        ws_page.column_dimensions['D'].width = 12
 
         # 페이지 정보 헤더 스타일
         header_font = Font(bold=True)
@@ -688,12 +748,6 @@ class TableExcelConverter:
                 if row_idx == 1:
                     cell.font = header_font
 
-        # _page 열 너비 조정
-        ws_page.column_dimensions['A'].width = 15
-        ws_page.column_dimensions['B'].width = 15
-        ws_page.column_dimensions['C'].width = 12
-        ws_page.column_dimensions['D'].width = 12
-
         # _page 시트 인쇄 설정 (세로, 1페이지에 맞춤)
         ws_page.page_setup.orientation = 'portrait'
         ws_page.page_setup.fitToPage = True
@@ -704,8 +758,54 @@ class TableExcelConverter:
             header=0.3, footer=0.3
         )
 
+    def _to_excel_stream(self, filepath: str, sheet_name: str, cells_data: List[CellData],
+                         result: CellPositionResult, show_cell_info: bool = False):
+        """write-only 워크북으로 저장 (to_excel(streaming=True))
+
+        열 너비/인쇄 설정을 먼저 기록한 뒤 행 순서대로 셀을 쓰고, 병합은 시트 끝에 기록합니다.
+        테두리/정렬/배경색 조합은 배경색별로 한 번만 만들어 재사용합니다.
+        """
+        wb = create_stream_workbook()
+        ws = wb.create_sheet(title=sheet_name)
+        self._apply_page_setup(ws)
+        set_column_widths(ws, self._excel_col_widths(result.x_levels))
+        row_heights = self._excel_row_heights(result.y_levels)
+
+        styles = StyleCache(ws)
+        alignment = {'wrap_text': True, 'vertical': 'center'}
+        grid = stream_grid(
+            ws, sorted(cells_data, key=lambda c: (c.row, c.col)),
+            anchor_cell=lambda c: styles.cell(self._cell_value(c, show_cell_info),
+                                              style_key('thin', c.bg_color_rgb, alignment=alignment)),
+            covered_cell=lambda c: styles.cell(None, style_key('thin', c.bg_color_rgb)),
+            row_count=len(row_heights),
+            row_heights=lambda r: row_heights[r] if r < len(row_heights) else None,
+        )
+
+        if grid.conflicts:
+            print(f"\n=== 병합 충돌 감지: {len(grid.conflicts)}개 ===")
+            for cell in grid.conflicts[:10]:
+                print(f"  list_id={cell.list_id}: ({cell.row},{cell.col})~({cell.end_row},{cell.end_col})")
+        if grid.skipped:
+            print(f"\n=== 스킵된 셀 (충돌): {len(grid.skipped)}개 ===")
+            for cell in grid.skipped[:10]:
+                print(f"  list_id={cell.list_id}: ({cell.row},{cell.col})~({cell.end_row},{cell.end_col})")
+        if self.debug:
+            print(f"\n병합 성공: {grid.merged}개, 충돌: {len(grid.conflicts)}개, "
+                  f"스타일 {len(styles)}종 ({grid.rows}행, {grid.cells}칸)")
+
+        ws_meta = wb.create_sheet(title="_meta")
+        ws_meta.page_setup.fitToPage = True   # sheetPr는 첫 행보다 먼저 기록됨
+        ws_meta = RowStreamSheet(ws_meta, eager=True)
+        self._write_meta_sheet(ws_meta, cells_data, grid.skipped, grid.conflicts)
+        ws_meta.flush()
+
+        ws_page = RowStreamSheet(wb.create_sheet(title="_page"))
+        self._write_page_sheet(ws_page, cells_data, result.x_levels, result.y_levels)
+        ws_page.flush()
+
         wb.save(filepath)
-        print(f"\n엑셀 파일 저장: {filepath}")
+        print(f"\n엑셀 파일 저장 (스트리밍): {filepath}")
         print(f"  - 메인 시트: {sheet_name}")
         print(f"  - 메타 시트: _meta ({len(cells_data)}개 셀 정보)")
         print(f"  - 페이지 시트: _page (페이지/여백 설정)")
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+"""
+엑셀 스트리밍 쓰기 모듈 (openpyxl write-only)
+
+큰 표나 여러 표를 한 워크북으로 내보낼 때 Workbook(write_only=True)로 행을 순서대로 기록합니다.
+- 셀 객체를 메모리에 쌓지 않고 행 단위로 임시 파일에 기록
+- Font/Fill/Border/Alignment/Protection 조합을 스타일 키별로 한 번만 만들어 재사용
+- 병합 범위는 모아 두었다가 시트 끝(mergeCells)에 한 번에 기록
+
+write-only 시트 제약:
+- 열 너비(column_dimensions), 페이지 맞춤(fitToPage)은 첫 행을 쓰기 전에 설정해야 함
+- 행 높이(row_dimensions)는 해당 행을 쓰기 전에 설정해야 함
+- 셀을 임의 위치에 쓸 수 없으므로 행 번호 순서대로 append
+"""
+
+from copy import copy
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Border, Font, PatternFill, Protection, Side
+    from openpyxl.utils import get_column_letter
+    HAS_OPENPYXL = True
+except ImportError:
+    HAS_OPENPYXL = False
+
+
+def create_stream_workbook() -> 'Workbook':
+    """시트가 없는 write-only 워크북 생성"""
+    if not HAS_OPENPYXL:
+        raise ImportError("openpyxl이 필요합니다: pip install openpyxl")
+    return Workbook(write_only=True)
+
+
+def style_key(border: str = None, fill_rgb: tuple = None, font: Dict[str, Any] = None,
+              alignment: Dict[str, Any] = None, locked: bool = None) -> tuple:
+    """
+    셀 스타일 키 (같은 키 = 같은 스타일)
+
+    Args:
+        border: 네 변 테두리 스타일 ('thin' 등), None이면 테두리 없음
+        fill_rgb: 배경색 (R, G, B), None이면 채우기 없음
+        font: Font 인자 딕셔너리
+        alignment: Alignment 인자 딕셔너리
+        locked: 셀 잠금 여부, None이면 기본값
+    """
+    fill = f"{fill_rgb[0]:02X}{fill_rgb[1]:02X}{fill_rgb[2]:02X}" if fill_rgb else None
+    return (border or None, fill,
+            tuple(sorted(font.items())) if font else None,
+            tuple(sorted(alignment.items())) if alignment else None,
+            locked)
+
+
+def _style_objects(key: tuple) -> Dict[str, Any]:
+    """스타일 키 -> 셀 속성 객체"""
+    border, fill, font, alignment, locked = key
+    side = Side(style=border) if border else None
+    return {
+        'border': Border(left=side, right=side, top=side, bottom=side) if side else None,
+        'fill': PatternFill(start_color=fill, end_color=fill, fill_type="solid") if fill else None,
+        'font': Font(**dict(font)) if font else None,
+        'alignment': Alignment(**dict(alignment)) if alignment else None,
+        'protection': Protection(locked=locked) if locked is not None else None,
+    }
+
+
+class StyleCache:
+    """스타일 키별 셀 스타일 캐시
+
+    style_key()로 만든 키마다 Font/Fill/Border/Alignment/Protection을 한 번만 만들어
+    워크북 스타일 목록에 등록하고, 같은 키의 셀은 등록된 스타일 인덱스를 복사해 씁니다.
+    """
+
+    def __init__(self, ws):
+        self.ws = ws
+        self._styles: Dict[tuple, Any] = {}   # key -> StyleArray
+        self.hits = 0
+        self.misses = 0
+
+    def cell(self, value, key: tuple = None) -> 'WriteOnlyCell':
+        """스타일이 적용된 WriteOnlyCell 생성 (key가 None이면 스타일 없음)"""
+        cell = WriteOnlyCell(self.ws, value=value)
+        if key is None:
+            return cell
+
+        style = self._styles.get(key)
+        if style is None:
+            self.misses += 1
+            for name, obj in _style_objects(key).items():
+                if obj is not None:
+                    setattr(cell, name, obj)
+            self._styles[key] = copy(cell._style)
+        else:
+            self.hits += 1
+            cell._style = copy(style)
+        return cell
+
+    def __len__(self) -> int:
+        return len(self._styles)
+
+
+class RowStreamSheet:
+    """write-only 시트에 ws.cell(row, column) 방식으로 쓰기 위한 행 버퍼
+
+    기존 write_*_to_sheet 함수를 그대로 쓰기 위한 어댑터입니다.
+    - eager=True: 더 큰 행 번호가 요청되면 앞 행들을 바로 기록 (행 순서대로 쓰는 함수용)
+    - eager=False: flush() 때 모든 행을 기록 (행 순서가 섞이는 작은 시트용)
+    그 밖의 속성(column_dimensions, page_setup, page_margins 등)은 원래 시트로 전달합니다.
+    """
+
+    def __init__(self, ws, eager: bool = False):
+        object.__setattr__(self, '_ws', ws)
+        object.__setattr__(self, '_eager', eager)
+        object.__setattr__(self, '_rows', {})      # row -> {col: WriteOnlyCell}
+        object.__setattr__(self, '_next_row', 1)   # 다음에 기록할 행 번호
+
+    def cell(self, row: int, column: int, value=None) -> 'WriteOnlyCell':
+        if row < self._next_row:
+            raise ValueError(f"이미 기록된 행입니다: {row}")
+        if self._eager and row > self._next_row:
+            self._flush_until(row)
+
+        cells = self._rows.setdefault(row, {})
+        cell = cells.get(column)
+        if cell is None:
+            cell = cells[column] = WriteOnlyCell(self._ws)
+        if value is not None:
+            cell.value = value
+        return cell
+
+    def _flush_until(self, stop: int):
+        """stop 직전 행까지 기록"""
+        while self._next_row < stop:
+            cells = self._rows.pop(self._next_row, {})
+            values: List[Any] = [None] * max(cells, default=0)
+            for col, cell in cells.items():
+                values[col - 1] = cell
+            self._ws.append(values)
+            object.__setattr__(self, '_next_row', self._next_row + 1)
+
+    def flush(self):
+        """남은 행 모두 기록"""
+        if self._rows:
+            self._flush_until(max(self._rows) + 1)
+
+    def __getattr__(self, name):
+        return getattr(self._ws, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._ws, name, value)
+
+
+@dataclass
+class GridStreamResult:
+    """격자 스트리밍 결과"""
+    rows: int = 0                                      # 기록한 행 수
+    cells: int = 0                                     # 기록한 셀 수 (병합 영역 포함)
+    merged: int = 0                                    # 병합 범위 수
+    conflicts: List[Any] = field(default_factory=list)  # 다른 병합과 겹쳐 병합하지 않은 셀
+    skipped: List[Any] = field(default_factory=list)    # 다른 병합 영역 안에 있어 건너뛴 셀
+
+
+def set_column_widths(ws, widths: Iterable[float], fit_to_page: bool = False):
+    """
+    열 너비 설정 (write-only 시트는 첫 행 기록 전에 호출해야 함)
+
+    Args:
+        ws: 워크시트
+        widths: 열 너비 목록 (문자 단위, None이면 건너뜀)
+        fit_to_page: 페이지 맞춤 사용 여부 (sheetPr에 기록되므로 열 너비와 함께 미리 설정)
+    """
+    for col_idx, width in enumerate(widths, 1):
+        if width is not None:
+            ws.column_dimensions[get_column_letter(col_idx)].width = width
+    if fit_to_page:
+        ws.page_setup.fitToPage = True
+
+
+def stream_grid(ws, cells: Iterable[Any],
+                anchor_cell: Callable[[Any], 'WriteOnlyCell'],
+                covered_cell: Callable[[Any], Optional['WriteOnlyCell']] = None,
+                row_count: int = 0,
+                row_heights: Callable[[int], Optional[float]] = None) -> GridStreamResult:
+    """
+    병합 셀이 있는 표를 행 순서대로 write-only 시트에 기록
+
+    cells는 row, col, end_row, end_col(0부터) 속성을 가진 객체(CellStyleData, CellData 등)입니다.
+    (row, col) 순서로 처리하며, 앞서 병합된 영역 안에 있는 셀은 건너뛰고(skipped),
+    영역 일부만 겹치는 셀은 값만 쓰고 병합하지 않습니다(conflicts).
+
+    Args:
+        ws: write-only 워크시트 (열 너비는 미리 설정)
+        cells: 셀 목록
+        anchor_cell: 셀 -> 좌상단에 쓸 WriteOnlyCell
+        covered_cell: 셀 -> 병합 영역 나머지 칸에 쓸 WriteOnlyCell (None이면 비워 둠)
+        row_count: 최소 행 수 (셀이 없는 마지막 행까지 높이를 쓰려면 지정)
+        row_heights: 0부터 시작하는 행 번호 -> 행 높이(pt), None이면 기본 높이
+
+    Returns:
+        GridStreamResult
+    """
+    result = GridStreamResult()
+
+    by_row: Dict[int, List[Any]] = {}
+    last_row = row_count - 1
+    for cell in cells:
+        by_row.setdefault(cell.row, []).append(cell)
+        last_row = max(last_row, cell.end_row)
+
+    active: List[Tuple[int, int, int, Any]] = []   # (end_row, start_col, end_col, cell) 진행 중인 병합
+    merges: List[str] = []
+
+    for r in range(last_row + 1):
+        active = [span for span in active if span[0] >= r]
+        row: Dict[int, Any] = {}
+
+        # 이전 행에서 시작된 병합 영역
+        for end_row, c1, c2, owner in active:
+            if covered_cell:
+                for c in range(c1, c2 + 1):
+                    row[c] = covered_cell(owner)
+
+        for cell in sorted(by_row.pop(r, []), key=lambda c: c.col):
+            if any(c1 <= cell.col <= c2 for _, c1, c2, _ in active):
+                result.skipped.append(cell)
+                continue
+
+            row[cell.col] = anchor_cell(cell)
+            if cell.end_row == cell.row and cell.end_col == cell.col:
+                continue
+
+            if any(cell.col <= c2 and c1 <= cell.end_col for _, c1, c2, _ in active):
+                result.conflicts.append(cell)
+                continue
+
+            active.append((cell.end_row, cell.col, cell.end_col, cell))
+            merges.append(f"{get_column_letter(cell.col + 1)}{r + 1}:"
+                          f"{get_column_letter(cell.end_col + 1)}{cell.end_row + 1}")
+            if covered_cell:
+                for c in range(cell.col + 1, cell.end_col + 1):
+                    row[c] = covered_cell(cell)
+
+        # 행 높이는 행을 기록하는 순간 읽히므로 기록 직후 제거
+        height = row_heights(r) if row_heights else None
+        if height is not None:
+            ws.row_dimensions[r + 1].height = height
+
+        values: List[Any] = [None] * (max(row) + 1 if row else 0)
+        for c, value in row.items():
+            values[c] = value
+        ws.append(values)
+        ws.row_dimensions.pop(r + 1, None)
+
+        result.rows += 1
+        result.cells += len(row)
+
+    for ref in merges:
+        ws.merged_cells.add(ref)
+    result.merged = len(merges)
+    return result
@@ -43,9 +43,10 @@ class TableField:
     FIELD_NUMBER = 1        # {{#}} 형식 일련번호
     FIELD_COUNT = 2         # {{#}} 형식 개수
 
-    def __init__(self, hwp=None, debug: bool = False):
+    def __init__(self, hwp=None, debug: bool = False, cache=None):
         self.hwp = hwp or get_hwp_instance()
         self.debug = debug
+        self.cache = cache  # TableStructureCache (선택)
         self.table_info = TableInfo(self.hwp, debug=debug)
         self._fields: Dict[str, List[FieldInfo]] = {}  # 필드명 → FieldInfo 리스트
         self._coord_map: Dict[Tuple[int, int], int] = {}  # (row, col) → list_id
@@ -66,9 +67,15 @@ class TableField:
             self._log(f"테이블 {table_index} 진입 실패")
             return False
 
-        # 셀 정보 수집 및 좌표 맵 생성
-        self.table_info.collect_cells_bfs()
-        self._coord_map = self.table_info.build_coordinate_map()
+        # 셀 정보 수집 및 좌표 맵 생성 (캐시에 같은 구조가 있으면 복원)
+        key = self.cache.bind(self.hwp, table_index) if self.cache else None
+        if key and self.cache.load_table_info(key, self.table_info, with_coords=True):
+            self._coord_map = dict(self.table_info._coord_map)
+        else:
+            self.table_info.collect_cells()
+            self._coord_map = self.table_info.build_coordinate_map()
+            if key:
+                self.cache.store_table_info(key, self.table_info)
 
         # 역방향 맵 = 대표 좌표 사용 (병합 셀의 경우 가장 위-왼쪽 좌표)
         self._list_id_to_coord = dict(self.table_info._representative_coords)
@@ -176,12 +176,13 @@ class TableGrid:
     - 우측으로 가면서 셀 너비를 누적하고 right_border_cell을 만나면 행을 바꿉니다.
     """
 
-    def __init__(self, hwp=None, debug: bool = False):
+    def __init__(self, hwp=None, debug: bool = False, cache=None):
         from cursor import get_hwp_instance
         self.hwp = hwp or get_hwp_instance()
         self.debug = debug
+        self.cache = cache  # TableStructureCache (선택)
         self._table_info = TableInfo(self.hwp, debug)
-        self._boundary = TableBoundary(self.hwp, debug)
+        self._boundary = TableBoundary(self.hwp, debug, cache=cache)
 
     def _log(self, msg: str):
         if self.debug:
@@ -194,9 +195,21 @@ class TableGrid:
         - 셀 방문 여부를 추적하여 중첩 셀(세로 병합 등)을 처리합니다.
         - 중첩 셀: x는 기존 corners에서, y는 현재 행의 상단 y좌표 기준으로 계산
 
+        - cache가 있으면 구조 지문이 같은 테이블은 순회 없이 저장된 결과를 반환합니다.
+
         Returns:
             TableGridResult: 셀별 list_id, row, col, corners, lines 정보
         """
+        key = None
+        if self.cache is not None:
+            if boundary_result is not None:
+                self.hwp.SetPos(boundary_result.table_origin, 0, 0)
+            key = self.cache.bind(self.hwp)
+            cached = self.cache.load_grid(key)
+            if cached is not None:
+                self._log(f"캐시 사용: {cached.row_count}행 x {cached.col_count}열")
+                return cached
+
         if boundary_result is None:
             boundary_result = self._boundary.check_boundary_table()
 
@@ -329,6 +342,8 @@ class TableGrid:
 
         self._log(f"완료: {result.row_count}행 x {result.col_count}열, 총 {len(result.cells)}셀")
 
+        if key:
+            self.cache.store_grid(key, result)
         return result
 
     def build_grid_lines(self, grid_result: TableGridResult = None,
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+테이블 HWPML 내보내기/파싱 모듈
+
+현재 커서가 있는 표를 컨트롤 선택 후 GetTextFile("HWPML2X", "saveblock") 한 번으로 내보내고,
+XML에서 셀별 주소(RowAddr, ColAddr), 모양 Id(BorderFill, ParaShape, CharShape), 텍스트를 읽습니다.
+
+셀마다 커서를 옮겨 파라미터셋/텍스트를 조회하는 대신 사용합니다.
+- 모양 Id가 같은 셀끼리 묶어 스타일을 한 번만 조회
+- 셀 텍스트를 {list_id: text}로 분리 (셀 list_id는 표 안에서 HWPML 셀 순서대로 할당됨)
+"""
+
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+
+# XML 선언 (GetTextFile은 str을 반환하므로 encoding="UTF-16" 선언을 제거하고 파싱)
+_XML_DECL = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+# CHAR 안의 특수 문자 요소 → GetTextFile("TEXT")에 나오는 글자
+_CHAR_ELEMENTS = {
+    'TAB': "\t",
+    'LINEBREAK': "\n",
+    'NBSPACE': " ",     # 묶음 빈칸
+    'FWSPACE': " ",     # 고정폭 빈칸
+    'HYPEN': "-",       # 하이픈 (HWPML 표기 그대로)
+}
+
+
+@dataclass
+class HwpmlCell:
+    """HWPML CELL 요소 정보"""
+    row: int                 # RowAddr
+    col: int                 # ColAddr
+    rowspan: int = 1
+    colspan: int = 1
+    width: int = 0           # HWPUNIT
+    height: int = 0
+    border_fill: int = 0     # BorderFill Id
+    margin: Tuple[int, int, int, int] = (0, 0, 0, 0)  # left, right, top, bottom
+    para_shape: int = -1     # 첫 문단 ParaShape Id
+    char_shape: int = -1     # 첫 글자 CharShape Id
+    text: str = ""           # 셀 텍스트 (문단 구분 \r\n, GetTextFile("TEXT")와 같은 형식)
+
+    @property
+    def style_key(self) -> tuple:
+        """셀 스타일을 결정하는 Id 조합 (같으면 같은 스타일)"""
+        return (self.border_fill, self.margin, self.para_shape, self.char_shape)
+
+
+@dataclass
+class HwpmlTable:
+    """HWPML TABLE 요소 정보"""
+    cells: List[HwpmlCell] = field(default_factory=list)  # 문서 순서 (행 우선)
+    row_count: int = 0
+    col_count: int = 0
+
+    def by_addr(self) -> Dict[Tuple[int, int], HwpmlCell]:
+        """(row, col) -> HwpmlCell"""
+        return {(c.row, c.col): c for c in self.cells}
+
+
+def _int(elem, name: str, default: int = 0) -> int:
+    value = elem.get(name)
+    try:
+        return int(value) if value is not None else default
+    except ValueError:
+        return default
+
+
+def _para_text(para) -> str:
+    """P 요소의 글자 (중첩 표 등 컨트롤 내부는 제외)"""
+    out = []
+    for text in para.findall('TEXT'):
+        for char in text.findall('CHAR'):
+            out.append(char.text or "")
+            for child in char:
+                out.append(_CHAR_ELEMENTS.get(child.tag, ""))
+                out.append(child.tail or "")
+    return "".join(out)
+
+
+def _parse_cell(elem) -> HwpmlCell:
+    cell = HwpmlCell(
+        row=_int(elem, 'RowAddr'),
+        col=_int(elem, 'ColAddr'),
+        rowspan=_int(elem, 'RowSpan', 1),
+        colspan=_int(elem, 'ColSpan', 1),
+        width=_int(elem, 'Width'),
+        height=_int(elem, 'Height'),
+        border_fill=_int(elem, 'BorderFill'),
+    )
+    margin = elem.find('CELLMARGIN')
+    if margin is not None:
+        cell.margin = (_int(margin, 'Left'), _int(margin, 'Right'),
+                       _int(margin, 'Top'), _int(margin, 'Bottom'))
+
+    paras = elem.findall('PARALIST/P')
+    cell.text = "\r\n".join(_para_text(p) for p in paras)
+
+    para = paras[0] if paras else None
+    if para is not None:
+        cell.para_shape = _int(para, 'ParaShape', -1)
+        text = para.find('TEXT')
+        if text is not None:
+            cell.char_shape = _int(text, 'CharShape', -1)
+    return cell
+
+
+def parse_table_hwpml(xml: str, table_index: int = 0) -> Optional[HwpmlTable]:
+    """
+    HWPML 문자열에서 표 정보 파싱
+
+    Args:
+        xml: GetTextFile("HWPML2X", ...) 결과
+        table_index: 최상위 표 중 몇 번째 표인지 (셀 안의 중첩 표는 세지 않음)
+
+    Returns:
+        HwpmlTable, 표가 없거나 파싱 실패 시 None
+    """
+    if not xml:
+        return None
+    try:
+        root = ET.fromstring(_XML_DECL.sub('', xml, count=1))
+    except ET.ParseError:
+        return None
+
+    # 중첩 표 제외: CELL 안에 있는 TABLE은 건너뜀
+    nested = {id(t) for cell in root.iter('CELL') for t in cell.iter('TABLE')}
+    tables = [t for t in root.iter('TABLE') if id(t) not in nested]
+    if table_index >= len(tables):
+        return None
+
+    elem = tables[table_index]
+    result = HwpmlTable(row_count=_int(elem, 'RowCount'), col_count=_int(elem, 'ColCount'))
+    for row in elem.findall('ROW'):
+        for cell in row.findall('CELL'):
+            result.cells.append(_parse_cell(cell))
+    return result
+
+
+def export_table_hwpml(hwp) -> str:
+    """
+    현재 커서가 있는 표를 HWPML로 내보내기 (커서 위치는 복원)
+
+    Returns:
+        str: HWPML 문자열, 표 밖이거나 실패하면 빈 문자열
+    """
+    ctrl = hwp.ParentCtrl
+    if not ctrl or ctrl.CtrlID != "tbl":
+        return ""
+
+    saved_pos = hwp.GetPos()
+    try:
+        hwp.SetPosBySet(ctrl.GetAnchorPos(0))
+        if not hwp.HAction.Run("SelectCtrlFront"):
+            hwp.HAction.Run("SelectCtrlReverse")
+        return hwp.GetTextFile("HWPML2X", "saveblock") or ""
+    except Exception:
+        return ""
+    finally:
+        hwp.HAction.Run("Cancel")
+        hwp.SetPos(saved_pos[0], saved_pos[1], saved_pos[2])
+
+
+def read_table_hwpml(hwp) -> Optional[HwpmlTable]:
+    """현재 커서가 있는 표를 내보내고 파싱 (실패 시 None)"""
+    return parse_table_hwpml(export_table_hwpml(hwp))
+
+
+def align_cell_texts(table: HwpmlTable, widths: Dict[int, int],
+                     tolerance: int = 50) -> Optional[Dict[int, str]]:
+    """
+    HWPML 셀을 list_id 순서에 맞춰 {list_id: text}로 변환
+
+    셀 list_id는 표 안에서 HWPML 셀 순서(행 우선)대로 할당되므로 정렬한 list_id와 짝지은 뒤,
+    셀 수와 셀별 너비가 모두 일치할 때만 결과를 반환합니다.
+
+    Args:
+        table: parse_table_hwpml() 결과
+        widths: list_id -> 셀 너비 (TableInfo.cells 또는 CellPositionResult에서)
+        tolerance: 너비 비교 허용 오차 (HWPUNIT)
+
+    Returns:
+        {list_id: text}, 정렬이 맞지 않으면 None
+    """
+    list_ids = sorted(widths)
+    if len(list_ids) != len(table.cells):
+        return None
+    texts = {}
+    for list_id, cell in zip(list_ids, table.cells):
+        if abs(cell.width - widths[list_id]) > tolerance:
+            return None
+        texts[list_id] = cell.text
+    return texts
+
+
+def read_table_texts(hwp, widths: Dict[int, int] = None,
+                     tolerance: int = 50) -> Optional[Dict[int, str]]:
+    """
+    현재 커서가 있는 표의 셀 텍스트를 GetTextFile 한 번으로 추출
+
+    Args:
+        hwp: HWP COM 객체 (커서가 표 안에 있어야 함)
+        widths: list_id -> 셀 너비 (None이면 TableInfo로 셀 수집)
+        tolerance: 너비 비교 허용 오차 (HWPUNIT)
+
+    Returns:
+        {list_id: text}, 표 밖이거나 셀 정렬이 맞지 않으면 None
+    """
+    if widths is None:
+        try:
+            from .table_info import TableInfo, SCAN_MODE_SINGLE
+        except ImportError:
+            from table_info import TableInfo, SCAN_MODE_SINGLE
+        cells = TableInfo(hwp, scan_mode=SCAN_MODE_SINGLE).collect_cells()
+        widths = {list_id: c.width for list_id, c in cells.items()}
+
+    table = read_table_hwpml(hwp)
+    if table is None:
+        return None
+    return align_cell_texts(table, widths, tolerance)
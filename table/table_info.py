@@ -9,6 +9,7 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from typing import Dict, List, Tuple, Optional
 from cursor import get_hwp_instance
@@ -24,6 +25,18 @@ MOVE_END_OF_CELL = 105    # 행의 끝 셀
 MOVE_TOP_OF_CELL = 106    # 열의 시작 셀
 MOVE_BOTTOM_OF_CELL = 107 # 열의 끝 셀
 
+# 셀 수집 모드
+SCAN_MODE_BFS = 'bfs'      # 셀마다 4방향 이동으로 이웃 탐색 (collect_cells_bfs)
+SCAN_MODE_SINGLE = 'scan'  # 우측 이동 1회 순회로 이웃 유도 (collect_cells_scan)
+
+# 4방향 탐색 시 셀 1개당 COM 호출 수
+# GetPos 1 + CellShape/Item 4 + 방향별 (MovePos, GetPos, SetPos) 3 x 4
+PROBE_CALLS_PER_CELL = 17
+# get_cell_dimensions() 1회당 COM 호출 수 (CellShape, Item x 3)
+DIMENSION_CALLS = 4
+# move_to_first_cell() COM 호출 수 (표 확인 3 + 시작/맨 위 2 + 왼쪽 확인 3, 왼쪽으로 이동했으면 +1)
+FIRST_CELL_CALLS = 8
+
 
 @dataclass
 class CellInfo:
@@ -37,17 +50,37 @@ class CellInfo:
     height: int = 0  # 셀 높이 (HWPUNIT)
 
 
+@dataclass
+class ScanStats:
+    """단일 순회 스캔 통계"""
+    visits: int = 0           # 우측 이동 방문 수 (세로 병합 셀 재방문 포함)
+    cells: int = 0            # 고유 셀 수
+    rows: int = 0             # 순회 중 분리된 행 수
+    com_calls: int = 0        # 스캔에 사용한 COM 호출 수 (첫 셀 이동 포함)
+    probe_com_calls: int = 0  # 같은 테이블을 4방향 탐색했을 때의 COM 호출 수 (하한 추정)
+    fallback: str = ""        # 행 분리 검사 실패로 4방향 탐색을 사용한 이유 (성공이면 빈 문자열)
+
+    @property
+    def saved_com_calls(self) -> int:
+        """4방향 탐색 대비 절약한 COM 호출 수"""
+        return max(0, self.probe_com_calls - self.com_calls)
+
+
 class TableInfo:
     """BFS로 테이블 구조를 탐지하는 클래스"""
 
-    def __init__(self, hwp=None, debug: bool = False):
+    def __init__(self, hwp=None, debug: bool = False, scan_mode: str = SCAN_MODE_BFS):
         self.hwp = hwp or get_hwp_instance()
         self.debug = debug
+        self.scan_mode = scan_mode
         self.cells: Dict[int, CellInfo] = {}  # list_id -> CellInfo
         self._coord_map: Dict[Tuple[int, int], int] = {}  # (row, col) -> list_id
         self._representative_coords: Dict[int, Tuple[int, int]] = {}  # list_id -> 대표 좌표
         self._cell_coords: Dict[int, List[Tuple[int, int]]] = {}  # list_id -> 해당 셀의 모든 좌표
         self._table_size: Dict[str, int] = {}  # 캐시된 테이블 크기
+        self._scan_rows: List[List[Tuple[int, int, int]]] = []  # 스캔 행별 (start_x, end_x, list_id) (재방문 포함)
+        self.last_scan_stats: Optional[ScanStats] = None
+        self._first_cell_calls = 0  # 마지막 move_to_first_cell()의 COM 호출 수
 
     def _log(self, msg: str):
         """디버그 메시지 출력"""
@@ -83,11 +116,19 @@ class TableInfo:
         result = self.hwp.MovePos(MOVE_LEFT_OF_CELL, 0, 0)
         after = self._get_list_id()
 
+        self._first_cell_calls = FIRST_CELL_CALLS
         if result and after != before:
             self.hwp.MovePos(MOVE_START_OF_CELL, 0, 0)
+            self._first_cell_calls += 1
 
         return True
 
+    def collect_cells(self) -> Dict[int, CellInfo]:
+        """scan_mode에 따라 셀 수집 (bfs 또는 scan)"""
+        if self.scan_mode == SCAN_MODE_SINGLE:
+            return self.collect_cells_scan()
+        return self.collect_cells_bfs()
+
     def collect_cells_bfs(self) -> Dict[int, CellInfo]:
         """
         행 우선 순회로 모든 셀을 탐색하고 이웃 정보 수집
@@ -138,6 +179,205 @@ class TableInfo:
         self._log(f"셀 수집 완료: {len(self.cells)}개")
         return self.cells
 
+    def collect_cells_scan(self, tolerance: int = 50, max_cells: int = None) -> Dict[int, CellInfo]:
+        """
+        우측 이동 1회 순회로 모든 셀과 이웃 정보 수집
+
+        MOVE_RIGHT_OF_CELL은 행 끝에서 다음 행으로 넘어가며, 세로 병합 셀은
+        걸쳐 있는 행마다 다시 방문합니다. 이 순서를 이용하여:
+        1. 셀마다 MovePos + GetPos 한 번으로 이동하고, 처음 방문한 셀만 크기 조회
+        2. 첫 행의 너비 합(xend)으로 방문 순서를 행 단위로 분리
+        3. left/right는 방문 순서의 앞/뒤 셀, up/down은 인접 행에서
+           셀 시작 x좌표를 포함하는 셀로 계산 (COM 호출 없음)
+
+        collect_cells_bfs()와 같은 CellInfo 맵을 반환하며,
+        절약한 COM 호출 수는 last_scan_stats에 기록합니다.
+
+        분리한 행이 표를 빈틈없이 채우지 않으면 (_check_scan_rows: 행 너비 합, 세로 병합 셀의
+        행/높이, 좌우 연결) 순회 순서가 가정과 다른 것이므로 collect_cells_bfs()로 다시 수집하고,
+        행 정보는 좌표 매핑에서 만듭니다 (last_scan_stats.fallback에 이유 기록).
+
+        Args:
+            tolerance: 행 분리 시 너비 합 허용 오차 (HWPUNIT)
+            max_cells: 최대 수집 셀 수 (None이면 제한 없음)
+
+        Returns:
+            Dict[int, CellInfo]: list_id -> CellInfo 매핑
+        """
+        if not self.move_to_first_cell():
+            return {}
+
+        self.cells.clear()
+        self._scan_rows = []
+        stats = ScanStats(com_calls=self._first_cell_calls)
+
+        # 1. 첫 행의 마지막 셀 (행 분리 기준)
+        start_pos = self.hwp.GetPos()
+        self.hwp.MovePos(MOVE_END_OF_CELL, 0, 0)
+        first_row_end = self._get_list_id()
+        self.hwp.SetPos(start_pos[0], start_pos[1], start_pos[2])
+        stats.com_calls += 4
+
+        # 2. 우측 이동 순회 (방문 순서 기록, 처음 방문한 셀만 크기 조회)
+        visits = []
+        current_id = start_pos[0]
+        while True:
+            visits.append(current_id)
+            if current_id not in self.cells:
+                width, height = self.get_cell_dimensions()
+                self.cells[current_id] = CellInfo(list_id=current_id, width=width, height=height)
+                stats.com_calls += DIMENSION_CALLS
+
+            result = self.hwp.MovePos(MOVE_RIGHT_OF_CELL, 0, 0)
+            after = self._get_list_id()
+            stats.com_calls += 2
+
+            if not result or after == current_id:
+                break
+            if max_cells is not None and after not in self.cells and len(self.cells) >= max_cells:
+                self._log(f"최대 셀 수 도달: {max_cells}개")
+                break
+            current_id = after
+
+        # 3. xend 기준 행 분리
+        xend = 0
+        for list_id in visits:
+            xend += self.cells[list_id].width
+            if list_id == first_row_end:
+                break
+
+        rows: List[List[Tuple[int, int, int]]] = [[]]  # 행별 (start_x, end_x, list_id)
+        cumulative_x = 0
+        for list_id in visits:
+            w = self.cells[list_id].width
+            if cumulative_x > 0 and cumulative_x + w > xend + tolerance:
+                rows.append([])
+                cumulative_x = 0
+            rows[-1].append((cumulative_x, cumulative_x + w, list_id))
+            cumulative_x += w
+            if abs(cumulative_x - xend) <= tolerance:
+                rows.append([])
+                cumulative_x = 0
+        if not rows[-1]:
+            rows.pop()
+
+        # 4. 방문 순서로 left/right 유도
+        first_visit = {}
+        for i, list_id in enumerate(visits):
+            if list_id not in first_visit:
+                first_visit[list_id] = i
+        for list_id, i in first_visit.items():
+            cell = self.cells[list_id]
+            cell.left = visits[i - 1] if i > 0 and visits[i - 1] != list_id else 0
+            cell.right = visits[i + 1] if i + 1 < len(visits) and visits[i + 1] != list_id else 0
+
+        # 5. 인접 행에서 시작 x좌표를 포함하는 셀로 up/down 유도
+        first_row = {}   # list_id -> (처음 나타난 행, 시작 x)
+        last_row = {}    # list_id -> 마지막으로 나타난 행
+        for r, row in enumerate(rows):
+            for x1, _, list_id in row:
+                if list_id not in first_row:
+                    first_row[list_id] = (r, x1)
+                last_row[list_id] = r
+        row_starts = [[x1 for x1, _, _ in row] for row in rows]
+
+        def cell_at(r: int, x: int) -> int:
+            if r < 0 or r >= len(rows):
+                return 0
+            i = bisect_right(row_starts[r], x + tolerance) - 1
+            if i < 0:
+                return 0
+            x1, x2, list_id = rows[r][i]
+            return list_id if x < x2 else 0
+
+        for list_id, (r, x) in first_row.items():
+            cell = self.cells[list_id]
+            cell.up = cell_at(r - 1, x)
+            cell.down = cell_at(last_row[list_id] + 1, x)
+
+        stats.visits = len(visits)
+        stats.cells = len(self.cells)
+        stats.rows = len(rows)
+        stats.probe_com_calls = PROBE_CALLS_PER_CELL * stats.cells + 3 * stats.visits
+        self.last_scan_stats = stats
+
+        reason = self._check_scan_rows(rows, xend, tolerance)
+        if reason:
+            # 순회 순서 가정이 맞지 않음 (세로 병합 셀을 재방문하지 않는 등) → 4방향 탐색
+            self._log(f"행 분리 검사 실패 ({reason}), 4방향 탐색으로 다시 수집")
+            stats.fallback = reason
+            cells = self.collect_cells_bfs()
+            self._scan_rows = self._rows_from_coordinate_map()
+            return cells
+
+        self._scan_rows = rows
+        self._log(f"셀 스캔 완료: {stats.cells}개 ({stats.rows}행, 방문 {stats.visits}회)")
+        self._log(f"COM 호출: {stats.com_calls}회 (4방향 탐색 대비 {stats.saved_com_calls}회 절약)")
+        return self.cells
+
+    def _check_scan_rows(self, rows: List[List[Tuple[int, int, int]]], xend: int,
+                         tolerance: int) -> str:
+        """
+        분리한 행이 표를 빈틈없이 채우는지 검사 (COM 호출 없음)
+
+        - 모든 행의 너비 합 = 첫 행 너비(xend)
+        - 여러 행에 나타난 셀은 연속된 행에서 같은 x 범위
+        - 셀 높이 = 나타난 행들의 높이 합 (행 높이 = 그 행에서 가장 낮은 셀)
+        - 같은 행 안의 좌우 이웃은 서로를 가리킴 (a.right == b 이면 b.left == a)
+
+        Returns:
+            실패 이유 (통과하면 빈 문자열)
+        """
+        if not rows or xend <= 0:
+            return "행 없음"
+
+        spans: Dict[int, Tuple[int, int]] = {}      # list_id -> (start_x, end_x)
+        row_ids: Dict[int, List[int]] = {}          # list_id -> 나타난 행 번호
+        for r, row in enumerate(rows):
+            if abs(row[-1][1] - xend) > tolerance:
+                return f"{r}행 너비 {row[-1][1]} != {xend}"
+            for x1, x2, list_id in row:
+                if list_id in row_ids:
+                    if row_ids[list_id][-1] != r - 1 or spans[list_id] != (x1, x2):
+                        return f"셀 {list_id} 재방문 위치 불일치"
+                    row_ids[list_id].append(r)
+                else:
+                    row_ids[list_id] = [r]
+                    spans[list_id] = (x1, x2)
+
+        row_heights = [min(self.cells[list_id].height for _, _, list_id in row) for row in rows]
+        for list_id, covered in row_ids.items():
+            expected = sum(row_heights[r] for r in covered)
+            if abs(self.cells[list_id].height - expected) > tolerance * len(covered):
+                return f"셀 {list_id} 높이 {self.cells[list_id].height} != 행 높이 합 {expected}"
+
+        for row in rows:
+            for (_, _, a), (_, _, b) in zip(row, row[1:]):
+                if len(row_ids[a]) == 1 and len(row_ids[b]) == 1 and self.cells[a].right == b \
+                        and self.cells[b].left != a:
+                    return f"셀 {a}, {b} 좌우 연결 불일치"
+        return ""
+
+    def _rows_from_coordinate_map(self) -> List[List[Tuple[int, int, int]]]:
+        """좌표 매핑에서 스캔 행 형식 [(start_x, end_x, list_id), ...] 생성 (세로 병합 셀은 행마다 포함)"""
+        coord_map = self.build_coordinate_map()
+        if not coord_map:
+            return []
+        total_rows = max(r for r, _ in coord_map) + 1
+        total_cols = max(c for _, c in coord_map) + 1
+        rows = []
+        for r in range(total_rows):
+            row, x = [], 0
+            for c in range(total_cols):
+                list_id = coord_map.get((r, c))
+                if list_id is None or (row and row[-1][2] == list_id):
+                    continue
+                w = self.cells[list_id].width
+                row.append((x, x + w, list_id))
+                x += w
+            rows.append(row)
+        return rows
+
     def _collect_neighbors(self, current_id: int) -> CellInfo:
         """현재 셀의 이웃 정보 및 크기 수집 (이동 후 복귀)"""
         cell_info = CellInfo(list_id=current_id)
@@ -213,7 +453,7 @@ class TableInfo:
             return self._table_size
 
         if not self.cells:
-            self.collect_cells_bfs()
+            self.collect_cells()
 
         if not self.cells:
             return {'rows': 0, 'cols': 0}
@@ -298,7 +538,7 @@ class TableInfo:
             Dict[tuple, int]: {(row, col): list_id} 매핑
         """
         if not self.cells:
-            self.collect_cells_bfs()
+            self.collect_cells()
 
         if not self.cells:
             return {}
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""table_hwpml 파싱 테스트 (한글 없이 실행)
+
+실행: python -m pytest -q table
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from table.table_hwpml import parse_table_hwpml
+
+
+def _table_xml(*cells: str) -> str:
+    """한 행짜리 표 HWPML (셀마다 P 하나, 인자는 CHAR 내용)"""
+    row = ''.join(
+        f'<CELL BorderFill="1" ColAddr="{col}" ColSpan="1" Height="1000" RowAddr="0" RowSpan="1" Width="4000">'
+        f'<PARALIST><P ParaShape="0" Style="0"><TEXT CharShape="0"><CHAR>{chars}</CHAR></TEXT></P>'
+        f'</PARALIST></CELL>'
+        for col, chars in enumerate(cells))
+    return ('<?xml version="1.0" encoding="UTF-16" standalone="no" ?>'
+            f'<HWPML><BODY><SECTION><P><TEXT><TABLE ColCount="{len(cells)}" RowCount="1">'
+            f'<ROW>{row}</ROW></TABLE></TEXT></P></SECTION></BODY></HWPML>')
+
+
+def test_special_char_elements():
+    table = parse_table_hwpml(_table_xml(
+        'A<NBSPACE/>B',
+        'C<FWSPACE/>D',
+        '2024<HYPEN/>01',
+        '가<TAB/>나<LINEBREAK/>다',
+    ))
+
+    assert [cell.text for cell in table.cells] == ['A B', 'C D', '2024-01', '가\t나\n다']
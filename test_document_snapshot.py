@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""document_snapshot 테스트 (FakeHwp)
+
+실행: python -m pytest -q test_document_snapshot.py
+"""
+
+import pytest
+
+from block_selector import BlockSelector
+from document_snapshot import DocumentSnapshot
+from hwp_fake import FakeHwp, document_from_dict
+
+
+BODY = ['첫 문단입니다. 둘째 문장!', '', '가나다라마바사 ' * 30, '마지막']
+
+
+@pytest.fixture
+def hwp():
+    hwp = FakeHwp(document_from_dict({'body': list(BODY)}))
+    hwp.SetPos(0, 2, 3)
+    return hwp
+
+
+def _insert_text(hwp, para_id, text):
+    """스냅샷을 거치지 않은 편집"""
+    hwp.SetPos(0, para_id, 0)
+    hwp.HAction.GetDefault("InsertText", hwp.HParameterSet.HInsertText.HSet)
+    hwp.HParameterSet.HInsertText.Text = text
+    hwp.HAction.Execute("InsertText", hwp.HParameterSet.HInsertText.HSet)
+
+
+def test_build_reads_text_once_and_restores_cursor(hwp):
+    snapshot = DocumentSnapshot(hwp)
+
+    assert [p.text for p in snapshot.paragraphs()] == BODY
+    assert hwp.stats.count('GetTextFile') == 1
+    assert hwp.GetPos() == (0, 2, 3)
+    assert snapshot.full_text == '\n'.join(BODY)
+    assert snapshot.locate(len(BODY[0]) + 3) == (0, 2, 1)
+    assert snapshot.para(0, len(BODY)) is None
+
+
+def test_para_end_and_empty_match_document(hwp):
+    snapshot = DocumentSnapshot(hwp)
+
+    for para_id, text in enumerate(BODY):
+        assert snapshot.para_end(0, para_id) == len(text)   # 컨트롤 문단은 측정
+    assert snapshot.is_empty(0, 1) and not snapshot.is_empty(0, 0)
+    assert hwp.GetPos() == (0, 2, 3)
+
+
+def test_line_starts_measured_once(hwp):
+    snapshot = DocumentSnapshot(hwp)
+    expected, _ = BlockSelector(hwp, cache=False)._measure_line_starts(2)
+
+    assert snapshot.line_starts(0, 2) == expected and len(expected) > 1
+    moves = hwp.stats.count('Run')
+    assert snapshot.line_starts(0, 2) == expected
+    assert hwp.stats.count('Run') == moves
+
+    version = snapshot.version
+    snapshot.invalidate_layout(2)
+    assert snapshot.para(0, 2).line_starts is None and snapshot.version == version + 1
+
+
+def test_sentences(hwp):
+    snapshot = DocumentSnapshot(hwp)
+    assert [(s['start'], s['end']) for s in snapshot.sentences(0, 0)] == [(0, 7), (9, 14)]
+
+
+def test_outside_edit_is_stale_until_rebuilt(hwp):
+    snapshot = DocumentSnapshot(hwp)
+    stamp = snapshot.stamp
+    assert not snapshot.is_stale() and not snapshot.ensure_fresh()
+
+    _insert_text(hwp, 3, '추가 ')
+    assert snapshot.is_stale()
+    assert not snapshot.ensure_fresh(check=False)       # invalidate()만 확인
+    assert snapshot.ensure_fresh()
+
+    assert snapshot.text(0, 3) == '추가 마지막'
+    assert snapshot.stamp != stamp and not snapshot.is_stale()
+
+
+def test_refresh_para_and_invalidate(hwp):
+    snapshot = DocumentSnapshot(hwp)
+    version = snapshot.version
+
+    _insert_text(hwp, 0, '앞 ')
+    snapshot.refresh_para(0)
+    assert snapshot.text(0, 0) == '앞 ' + BODY[0]
+    assert snapshot.para(0, 1).offset == len(BODY[0]) + 3
+    assert snapshot.version == version + 1 and not snapshot.is_stale()
+
+    _insert_text(hwp, 1, '\r\n')                         # 문단 수가 바뀌는 편집
+    snapshot.invalidate()
+    assert snapshot.ensure_fresh(check=False)
+    assert len(snapshot.paragraphs()) == len(BODY) + 1
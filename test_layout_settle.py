@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""layout_settle 테스트 (대기 함수를 바꿔서 실행, 시그니처는 FakeHwp)
+
+실행: python -m pytest -q test_layout_settle.py
+"""
+
+import itertools
+import time
+
+from layout_settle import para_end_signature, wait_for_layout
+
+
+def _reader(values):
+    """values를 차례로 돌려주고 끝나면 마지막 값 반복 (Exception 인스턴스는 raise)"""
+    values = iter(values)
+    last = [None]
+
+    def read():
+        value = next(values, last[0])
+        if isinstance(value, Exception):
+            raise value
+        last[0] = value
+        return value
+    return read
+
+
+def test_returns_after_two_equal_reads():
+    delays = []
+    result = wait_for_layout(_reader([7]), sleep=delays.append)
+
+    assert result.settled and result.signature == 7
+    assert result.polls == 2 and delays == [0.001]
+
+
+def test_backs_off_while_layout_changes():
+    delays = []
+    result = wait_for_layout(_reader([1, 2, 3, 3]), initial_delay=0.001, max_delay=0.003,
+                             sleep=delays.append)
+
+    assert result.settled and result.signature == 3
+    assert result.polls == 4
+    assert delays == [0.001, 0.002, 0.003]       # 바뀔 때마다 두 배, max_delay까지
+
+
+def test_read_errors_count_as_unsettled():
+    delays = []
+    result = wait_for_layout(_reader([RuntimeError('COM'), 5, 5]), sleep=delays.append)
+
+    assert result.settled and result.signature == 5
+    assert result.polls == 3
+
+
+def test_stable_reads():
+    result = wait_for_layout(_reader([4]), stable_reads=3, sleep=lambda s: None)
+    assert result.settled and result.polls == 3
+
+
+def test_timeout_returns_last_signature():
+    counter = itertools.count()
+    started = time.perf_counter()
+    result = wait_for_layout(lambda: next(counter), timeout=0.02, max_delay=0.004)
+
+    assert not result.settled
+    assert result.signature == result.polls - 1
+    assert result.elapsed >= 0.02 and time.perf_counter() - started < 1
+
+
+def test_para_end_signature_restores_cursor():
+    from hwp_fake import FakeHwp, document_from_dict
+
+    hwp = FakeHwp(document_from_dict({'body': ['짧은 문단', '가나다라마바사 ' * 30]}))
+    hwp.SetPos(0, 0, 2)
+
+    page, line, para_end = para_end_signature(hwp, 1)
+
+    assert page == 1 and line > 2
+    assert para_end == len('가나다라마바사 ' * 30)
+    assert hwp.GetPos() == (0, 0, 2)
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""sentence_segmenter 테스트 (순수 파이썬 + FakeHwp 일괄 분리)
+
+실행: python -m pytest -q test_sentence_segmenter.py
+"""
+
+import pytest
+
+from sentence_segmenter import segment_paragraphs, split_sentences
+
+
+def _texts(text):
+    return [text[s['start']:s['end'] + 1] for s in split_sentences(text)]
+
+
+@pytest.mark.parametrize('text, expected', [
+    # 한국어 문장 끝
+    ('첫 문장입니다. 둘째 문장이에요! 셋째인가? 넷째', ['첫 문장입니다.', '둘째 문장이에요!', '셋째인가?', '넷째']),
+    ('정말요?! 그렇구나… 끝...', ['정말요?!', '그렇구나…', '끝...']),
+    ('전각 부호입니다。 다음？ 끝！', ['전각 부호입니다。', '다음？', '끝！']),
+    # 소수점, 버전 번호
+    ('값은 3.5였다. 버전 v1.2.3을 쓴다.', ['값은 3.5였다.', '버전 v1.2.3을 쓴다.']),
+    ('비율 0.25 와 1.5 배', ['비율 0.25 와 1.5 배']),
+    # 닫는 따옴표/괄호
+    ('그가 "그랬다." 다음 문장.', ['그가 "그랬다."', '다음 문장.']),
+    ('"…했다."라고 말했다.', ['"…했다."라고 말했다.']),
+    ('됐어요!』 (참고.) [끝.]', ['됐어요!』', '(참고.)', '[끝.]']),
+    # 약어
+    ('Dr. Kim 교수가 발표했다. 다음.', ['Dr. Kim 교수가 발표했다.', '다음.']),
+    ('e.g. 예시다. 비교 vs. 대조. 결과는 Fig. 3에 있다.', ['e.g. 예시다.', '비교 vs. 대조.', '결과는 Fig. 3에 있다.']),
+    ('마지막은 etc.', ['마지막은 etc.']),
+    # 목록 번호
+    ('1. 첫째 항목입니다. 가. 둘째 항목. iv. 셋째.', ['1. 첫째 항목입니다.', '가. 둘째 항목.', 'iv. 셋째.']),
+])
+def test_split_sentences(text, expected):
+    assert _texts(text) == expected
+
+
+def test_split_sentences_indices():
+    result = split_sentences('가다.  나다.')
+    assert result == [{'index': 1, 'start': 0, 'end': 2}, {'index': 2, 'start': 5, 'end': 7}]
+    assert split_sentences('') == [] and split_sentences('   ') == []
+
+
+def test_segment_paragraphs_matches_split():
+    from hwp_fake import FakeHwp, document_from_dict
+
+    body = ['첫 문단입니다. 둘째 문장!', '', 'Dr. Lee가 말했다. 값은 3.5다.']
+    hwp = FakeHwp(document_from_dict({'body': body}))
+    hwp.SetPos(0, 1, 0)
+
+    index = segment_paragraphs(hwp, chunk_size=2)
+
+    assert sorted(index) == [0, 1, 2]
+    assert [index[p].text for p in index] == body
+    assert all(index[p].sentences == split_sentences(body[p]) for p in index)
+    assert hwp.GetPos() == (0, 1, 0)
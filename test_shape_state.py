@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""shape_state 테스트 (FakeHwp)
+
+실행: python -m pytest -q test_shape_state.py
+"""
+
+import pytest
+
+from hwp_fake import FakeHwp, document_from_dict
+from shape_state import ShapeState
+
+
+@pytest.fixture
+def hwp():
+    hwp = FakeHwp(document_from_dict({'body': ['첫 문단', '둘째 문단']}))
+    hwp.SetPos(0, 0, 0)
+    return hwp
+
+
+def _executes(hwp, action):
+    return hwp.stats.count(f'HAction.Execute:{action}')
+
+
+def test_same_value_is_skipped(hwp):
+    shapes = ShapeState(hwp)
+    assert shapes.set_para(LeftMargin=0, Indentation=-3000)
+    assert not shapes.set_para(Indentation=-3000, LeftMargin=0)
+    assert shapes.set_para(Indentation=-5000)
+
+    assert _executes(hwp, 'ParagraphShape') == 2
+    assert (shapes.executed, shapes.skipped) == (2, 1)
+    assert hwp.ParaShape.Item('Indentation') == -5000
+
+
+def test_without_remember_always_executes(hwp):
+    shapes = ShapeState(hwp, remember=False)
+    shapes.set_char(Bold=1)
+    shapes.set_char(Bold=1)
+
+    assert _executes(hwp, 'CharShape') == 2 and shapes.skipped == 0
+
+
+def test_batch_merges_into_one_execute_per_kind(hwp):
+    shapes = ShapeState(hwp, remember=False)
+    with shapes.batch():
+        shapes.set_char(Bold=1)
+        with shapes.batch():                        # 중첩은 바깥 블록이 끝날 때 적용
+            shapes.set_char(Height=1200, TextColor=0)
+            shapes.set_para(Indentation=-3000)
+        shapes.set_char(Bold=1)                     # 모아 둔 값과 같음
+        assert _executes(hwp, 'CharShape') == 0
+
+    assert _executes(hwp, 'CharShape') == 1 and _executes(hwp, 'ParagraphShape') == 1
+    assert shapes.skipped == 1
+    assert hwp.ParaShape.Item('Indentation') == -3000
+
+
+def test_batch_drops_change_reverted_to_applied_value(hwp):
+    shapes = ShapeState(hwp)
+    shapes.set_char(Bold=0)
+    with shapes.batch():
+        shapes.set_char(Bold=1)
+        shapes.set_char(Bold=0)                     # 이미 적용된 값으로 되돌림
+
+    assert _executes(hwp, 'CharShape') == 1
+
+
+def test_failed_execute_is_retried(hwp, monkeypatch):
+    shapes = ShapeState(hwp)
+    execute = hwp._execute
+    monkeypatch.setattr(hwp, '_execute', lambda action, pset: False)
+    shapes.set_para(LeftMargin=1000)
+    monkeypatch.setattr(hwp, '_execute', execute)
+
+    assert shapes.set_para(LeftMargin=1000)         # 적용 여부를 모르므로 다시 실행
+    assert _executes(hwp, 'ParagraphShape') == 2
+    assert hwp.ParaShape.Item('LeftMargin') == 1000
+
+
+def test_invalidate_forgets_only_requested_kind(hwp):
+    shapes = ShapeState(hwp)
+    shapes.set_char(Bold=1)
+    shapes.set_para(Indentation=-3000)
+
+    hwp.HAction.Run("ParagraphShapeIndentPositive")   # 이 객체를 거치지 않은 변경
+    shapes.invalidate(char=False)
+
+    assert not shapes.set_char(Bold=1)
+    assert shapes.set_para(Indentation=-3000)
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""spacing_search 테스트 (순수 파이썬)
+
+실행: python -m pytest -q test_spacing_search.py
+"""
+
+from spacing_search import search_spacing, spacing_candidates
+
+
+class FakeLine:
+    """자간을 적용하면 check가 현재 값으로 만족 여부를 돌려주는 줄"""
+
+    def __init__(self, satisfied, fail_on=()):
+        self.satisfied = satisfied     # 자간 -> 만족 여부
+        self.fail_on = set(fail_on)    # 적용이 실패하는 자간
+        self.applied = []
+
+    def apply(self, value):
+        if value in self.fail_on:
+            return False
+        self.applied.append(value)
+        return True
+
+    def check(self, value):
+        assert self.applied[-1] == value
+        return 'space' if self.satisfied(value) else ''
+
+
+def test_candidates_match_step_loop():
+    expected = [-2]
+    current = -2
+    while current > -10:
+        current += -3
+        expected.append(current)
+    assert spacing_candidates(-2, -3, -10) == expected == [-2, -5, -8, -11]
+    assert spacing_candidates(0, 2, 5) == [0, 2, 4, 6]
+    assert spacing_candidates(-1, -1, -100, max_steps=3) == [-1, -2, -3]
+    assert spacing_candidates(-1, 0, -100) == [-1]
+
+
+def test_already_aligned_applies_once():
+    line = FakeLine(lambda v: True)
+    result = search_spacing(spacing_candidates(-1, -1, -50), line.apply, line.check)
+
+    assert result.success and result.value == -1
+    assert result.probes == 1 and line.applied == [-1]
+    assert result.outcome == 'space'
+
+
+def test_finds_weakest_value_with_log_probes():
+    candidates = spacing_candidates(-1, -1, -100)
+    line = FakeLine(lambda v: v <= -37)
+    result = search_spacing(candidates, line.apply, line.check)
+
+    assert result.success and result.value == -37
+    assert line.applied[-1] == -37                   # 찾은 값이 적용된 채로 끝남
+    assert result.probes <= 2 * 7 + 1                # 한 단계씩이면 37번
+    assert result.tried == line.applied
+
+
+def test_no_fit_within_limit_leaves_last_candidate():
+    candidates = spacing_candidates(-1, -1, -100, max_steps=5)
+    line = FakeLine(lambda v: v <= -20)
+    result = search_spacing(candidates, line.apply, line.check)
+
+    assert not result.success
+    assert result.value == line.applied[-1] == -5
+    assert result.outcome == ''
+    assert result.probes == 4                        # 1, 2, 4, 5번째 후보
+
+
+def test_non_monotone_check_ends_on_satisfying_value():
+    # -4에서만 잠깐 만족하고 -5, -6은 다시 불만족 (단조 가정이 깨진 경우)
+    candidates = spacing_candidates(-1, -1, -10)
+    line = FakeLine(lambda v: v == -4 or v <= -8)
+    result = search_spacing(candidates, line.apply, line.check)
+
+    assert result.success
+    assert line.satisfied(result.value)
+    assert line.applied[-1] == result.value          # 마지막으로 적용한 값이 결과와 같음
+
+
+def test_apply_failure_stops_search():
+    candidates = spacing_candidates(-1, -1, -10)
+    line = FakeLine(lambda v: v <= -6, fail_on=[-4])
+    result = search_spacing(candidates, line.apply, line.check)
+
+    assert not result.success
+    assert result.value == -4 and result.tried == [-1, -2, -4]
+
+
+def test_empty_candidates():
+    result = search_spacing([], lambda v: True, lambda v: True)
+    assert not result.success and result.probes == 0
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""trace_log 테스트 (순수 파이썬)
+
+실행: python -m pytest -q test_trace_log.py
+"""
+
+from trace_log import LEVELS, TraceLog, level_no
+
+
+def test_level_no():
+    assert level_no('warning') == LEVELS['WARNING']
+    assert level_no(15) == 15
+    assert level_no('모름') == LEVELS['INFO']
+
+
+def test_disabled_levels_are_not_recorded():
+    log = TraceLog(level='WARNING')
+    assert not log.enabled('INFO') and not log.enabled('CURSOR')
+    assert log.enabled('WARNING') and log.enabled('ERROR')
+
+    log.log('상세', 'INFO')
+    log.log('커서', 'CURSOR')
+    log.log('경고', 'WARNING')
+    assert [(r['level'], r['message']) for r in log.messages()] == [('WARNING', '경고')]
+
+
+def test_ring_buffer_keeps_latest(capsys):
+    log = TraceLog(level='DEBUG', capacity=3, echo=True)
+    for i in range(5):
+        log.log(f'줄 {i}', 'DEBUG')
+
+    assert [r['message'] for r in log.messages()] == ['줄 2', '줄 3', '줄 4']
+    assert log.dropped == 2
+    assert capsys.readouterr().out.count('[DEBUG] 줄') == 5
+
+    log.clear()
+    assert log.messages() == [] and log.dropped == 0
+
+
+def test_file_sink_writes_all_lines_on_close(tmp_path):
+    path = tmp_path / 'trace.log'
+    log = TraceLog(level='INFO', capacity=10, file_path=str(path))
+    for i in range(100):
+        log.log(f'기록 {i}')
+    log.log('버림', 'DEBUG')
+    log.close()
+    log.close()                                   # 두 번 닫아도 됨
+
+    lines = path.read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 100                      # 버퍼 크기와 관계없이 모두 기록
+    assert lines[0].endswith('[INFO] 기록 0') and lines[-1].endswith('[INFO] 기록 99')
+    assert len(log.messages()) == 10
@@ -0,0 +1,137 @@
+"""
+추적 로그 - 레벨별로 걸러서 기록하는 가벼운 로그 버퍼
+
+꺼진 레벨의 로그는 시간 포맷/기록 없이 바로 반환하고, 켜진 레벨만
+최대 capacity개를 보관하는 링 버퍼에 저장합니다. file_path를 주면
+별도 스레드가 로그 줄을 파일에 이어 씁니다 (HWP 작업 스레드는 파일 I/O를 기다리지 않음).
+
+레벨 (낮을수록 상세):
+    CURSOR, SELECT, DEBUG = 10 / INFO = 20 / WARNING = 30 / ERROR = 40
+
+사용법:
+    from trace_log import TraceLog
+
+    log = TraceLog(level="INFO", echo=True)
+    if log.enabled("INFO"):
+        log.log(f"줄 정보: {line_starts}")
+    print(log.messages()[-1])
+    log.close()
+"""
+
+import queue
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+LEVELS = {
+    'CURSOR': 10,
+    'SELECT': 10,
+    'DEBUG': 10,
+    'INFO': 20,
+    'WARNING': 30,
+    'ERROR': 40,
+}
+
+
+def level_no(level) -> int:
+    """레벨 이름 또는 숫자 -> 숫자 (모르는 이름은 INFO)"""
+    if isinstance(level, int):
+        return level
+    return LEVELS.get(str(level).upper(), LEVELS['INFO'])
+
+
+class AsyncFileSink:
+    """로그 줄을 백그라운드 스레드에서 파일에 이어 쓰기"""
+
+    def __init__(self, file_path: str, encoding: str = 'utf-8'):
+        self.file_path = file_path
+        self._queue: 'queue.Queue[Optional[str]]' = queue.Queue()
+        self._file = open(file_path, 'a', encoding=encoding)
+        self._thread = threading.Thread(target=self._run, name='TraceLogSink', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            line = self._queue.get()
+            if line is None:
+                break
+            self._file.write(line + '\n')
+            # 쌓인 줄을 모아서 쓰고 한 번만 flush
+            while True:
+                try:
+                    line = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if line is None:
+                    self._file.flush()
+                    return
+                self._file.write(line + '\n')
+            self._file.flush()
+
+    def write(self, line: str):
+        self._queue.put(line)
+
+    def close(self):
+        """남은 줄을 모두 쓰고 종료"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._file.close()
+
+
+class TraceLog:
+    """레벨 필터 + 링 버퍼 + 선택적 비동기 파일 기록"""
+
+    def __init__(self, level='WARNING', echo: bool = False, capacity: int = 5000,
+                 file_path: str = None):
+        """
+        Args:
+            level: 기록할 최소 레벨 (이름 또는 숫자)
+            echo: 기록한 로그를 print로도 출력
+            capacity: 버퍼에 보관할 최대 로그 수 (넘으면 오래된 것부터 버림)
+            file_path: 지정 시 비동기로 파일에 이어 씀
+        """
+        self.level = level_no(level)
+        self.echo = echo
+        self.records: deque = deque(maxlen=capacity)
+        self.dropped = 0
+        self._sink = AsyncFileSink(file_path) if file_path else None
+
+    def enabled(self, level='INFO') -> bool:
+        """해당 레벨이 기록되는지 (호출 전에 확인하면 메시지 포맷 비용을 건너뜀)"""
+        return level_no(level) >= self.level
+
+    def log(self, message: str, level: str = 'INFO'):
+        """로그 기록 (꺼진 레벨이면 아무것도 하지 않음)"""
+        if level_no(level) < self.level:
+            return
+        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        if len(self.records) == self.records.maxlen:
+            self.dropped += 1
+        self.records.append({
+            'timestamp': timestamp,
+            'level': level,
+            'message': message
+        })
+        if self.echo or self._sink:
+            line = f"[{timestamp}] [{level}] {message}"
+            if self.echo:
+                print(line)
+            if self._sink:
+                self._sink.write(line)
+
+    def messages(self) -> List[Dict]:
+        """버퍼에 남은 로그 (오래된 것부터)"""
+        return list(self.records)
+
+    def clear(self):
+        self.records.clear()
+        self.dropped = 0
+
+    def close(self):
+        """파일 기록 종료 (남은 줄은 모두 기록)"""
+        if self._sink:
+            self._sink.close()
+            self._sink = None